@@ -0,0 +1,64 @@
+"""Materialized membership for dynamic saved lists
+
+Adds snapshot bookkeeping columns to saved_lists and the
+saved_list_snapshot_members table with a keyset index on
+(list_id, sort_key, entity_id).
+
+Revision ID: j0k1l2m3n4o5
+Revises: i9j0k1l2m3n4
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = "j0k1l2m3n4o5"
+down_revision: Union[str, None] = "i9j0k1l2m3n4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "saved_lists",
+        sa.Column("materialized_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "saved_lists",
+        sa.Column("source_version", sa.String(100), nullable=True),
+    )
+
+    op.create_table(
+        "saved_list_snapshot_members",
+        sa.Column(
+            "list_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("saved_lists.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("entity_id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("sort_key", sa.String(255), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("email", sa.String(255), nullable=True),
+        sa.Column("extra", JSONB, nullable=True),
+    )
+    op.create_index(
+        "ix_saved_list_snapshot_members_keyset",
+        "saved_list_snapshot_members",
+        ["list_id", "sort_key", "entity_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_saved_list_snapshot_members_keyset",
+        table_name="saved_list_snapshot_members",
+    )
+    op.drop_table("saved_list_snapshot_members")
+    op.drop_column("saved_lists", "source_version")
+    op.drop_column("saved_lists", "materialized_at")
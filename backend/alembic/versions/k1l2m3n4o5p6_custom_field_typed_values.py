@@ -0,0 +1,92 @@
+"""Typed, indexed custom field values
+
+Adds value_key / value_number / value_date / value_bool projections to
+custom_field_values, backfills them from the definitions' field_type, and
+indexes them per field definition so saved-list filters and sorts on
+custom fields are index lookups instead of scans.
+
+Revision ID: k1l2m3n4o5p6
+Revises: j0k1l2m3n4o5
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "k1l2m3n4o5p6"
+down_revision: Union[str, None] = "j0k1l2m3n4o5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_INDEXES = [
+    ("ix_custom_field_values_entity", "organization_id, entity_type, entity_id"),
+    ("ix_custom_field_values_def_entity", "field_definition_id, entity_id"),
+    ("ix_custom_field_values_def_key", "field_definition_id, value_key"),
+    ("ix_custom_field_values_def_number", "field_definition_id, value_number"),
+    ("ix_custom_field_values_def_date", "field_definition_id, value_date"),
+    ("ix_custom_field_values_def_bool", "field_definition_id, value_bool"),
+]
+
+
+def _table_exists(name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT 1 FROM information_schema.tables "
+            "WHERE table_schema = 'public' AND table_name = :name"
+        ),
+        {"name": name},
+    )
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    # custom_field_values was created outside Alembic on some deployments
+    if not _table_exists("custom_field_values"):
+        return
+
+    op.execute("""
+    ALTER TABLE custom_field_values
+        ADD COLUMN IF NOT EXISTS value_key VARCHAR(255),
+        ADD COLUMN IF NOT EXISTS value_number NUMERIC,
+        ADD COLUMN IF NOT EXISTS value_date DATE,
+        ADD COLUMN IF NOT EXISTS value_bool BOOLEAN
+    """)
+
+    op.execute("""
+    UPDATE custom_field_values v SET
+        value_key = CASE WHEN length(v.value) <= 255 THEN v.value END,
+        value_number = CASE WHEN d.field_type = 'number'
+            AND v.value ~ '^\\s*-?[0-9]+(\\.[0-9]+)?\\s*$' THEN trim(v.value)::numeric END,
+        value_date = CASE WHEN d.field_type = 'date'
+            AND v.value ~ '^[0-9]{4}-[0-9]{2}-[0-9]{2}' THEN left(v.value, 10)::date END,
+        value_bool = CASE WHEN d.field_type <> 'boolean' THEN NULL
+            WHEN lower(trim(v.value)) IN ('true', '1', 'yes') THEN TRUE
+            WHEN lower(trim(v.value)) IN ('false', '0', 'no') THEN FALSE END
+    FROM custom_field_definitions d
+    WHERE d.id = v.field_definition_id
+    """)
+
+    for name, columns in _INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON custom_field_values ({columns})")
+
+
+def downgrade() -> None:
+    if not _table_exists("custom_field_values"):
+        return
+
+    for name, _ in _INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.execute("""
+    ALTER TABLE custom_field_values
+        DROP COLUMN IF EXISTS value_bool,
+        DROP COLUMN IF EXISTS value_date,
+        DROP COLUMN IF EXISTS value_number,
+        DROP COLUMN IF EXISTS value_key
+    """)
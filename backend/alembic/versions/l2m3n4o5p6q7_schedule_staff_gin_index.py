@@ -0,0 +1,37 @@
+"""GIN index on schedules.staff_user_ids for staff lookups
+
+Staff "my week" views filter schedules with JSONB containment
+(staff_user_ids @> '["<uuid>"]'), served by a jsonb_path_ops GIN index.
+Also adds an (event_id, date) index for the week-range scans.
+
+Revision ID: l2m3n4o5p6q7
+Revises: k1l2m3n4o5p6
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "l2m3n4o5p6q7"
+down_revision: Union[str, None] = "k1l2m3n4o5p6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_schedules_staff_user_ids",
+        "schedules",
+        ["staff_user_ids"],
+        postgresql_using="gin",
+        postgresql_ops={"staff_user_ids": "jsonb_path_ops"},
+    )
+    op.create_index("ix_schedules_event_date", "schedules", ["event_id", "date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedules_event_date", table_name="schedules")
+    op.drop_index("ix_schedules_staff_user_ids", table_name="schedules")
@@ -0,0 +1,114 @@
+"""tstzrange periods and overlap exclusion for resource and room bookings
+
+Adds a generated ``period tstzrange`` column to resource_bookings and
+room_bookings and a GiST exclusion constraint on (resource/room, period)
+for live bookings, so overlapping reservations are rejected by the
+database. Requires the btree_gist extension for the UUID equality part.
+
+Existing overlapping bookings must be resolved before upgrading; the
+migration reports how many there are instead of silently cancelling any.
+
+Revision ID: m3n4o5p6q7r8
+Revises: l2m3n4o5p6q7
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "m3n4o5p6q7r8"
+down_revision: Union[str, None] = "l2m3n4o5p6q7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table, owner column, live-booking predicate ({p} = alias prefix), constraint
+_TABLES = [
+    (
+        "resource_bookings",
+        "resource_id",
+        "{p}status <> 'cancelled' AND {p}deleted_at IS NULL",
+        "ex_resource_bookings_no_overlap",
+    ),
+    (
+        "room_bookings",
+        "room_id",
+        "{p}status <> 'cancelled'",
+        "ex_room_bookings_no_overlap",
+    ),
+]
+
+
+def _table_exists(name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT 1 FROM information_schema.tables "
+            "WHERE table_schema = 'public' AND table_name = :name"
+        ),
+        {"name": name},
+    )
+    return result.fetchone() is not None
+
+
+def _column_exists(table: str, column: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_schema = 'public' AND table_name = :table "
+            "AND column_name = :column"
+        ),
+        {"table": table, "column": column},
+    )
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    conn = op.get_bind()
+    for table, owner, live, constraint in _TABLES:
+        # room_bookings may have been created on demand outside Alembic
+        if not _table_exists(table):
+            continue
+
+        if not _column_exists(table, "period"):
+            op.execute(f"""
+            ALTER TABLE {table}
+                ADD COLUMN period TSTZRANGE
+                GENERATED ALWAYS AS (tstzrange(start_time, end_time, '[)')) STORED
+            """)
+
+        overlaps = conn.execute(sa.text(f"""
+            SELECT count(*) FROM {table} a
+            JOIN {table} b
+              ON a.{owner} = b.{owner}
+             AND a.id < b.id
+             AND a.period && b.period
+            WHERE {live.format(p="a.")} AND {live.format(p="b.")}
+        """)).scalar()
+        if overlaps:
+            raise RuntimeError(
+                f"{table} has {overlaps} overlapping live booking pair(s); "
+                f"cancel or reschedule them before adding {constraint}."
+            )
+
+        op.execute(f"""
+        ALTER TABLE {table}
+            ADD CONSTRAINT {constraint}
+            EXCLUDE USING gist ({owner} WITH =, period WITH &&)
+            WHERE ({live.format(p="")})
+        """)
+
+
+def downgrade() -> None:
+    for table, _, _, constraint in reversed(_TABLES):
+        if not _table_exists(table):
+            continue
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {constraint}")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS period")
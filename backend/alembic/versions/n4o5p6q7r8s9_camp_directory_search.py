@@ -0,0 +1,85 @@
+"""Full-text, geo and keyset indexes for the public camp directory
+
+Adds a weighted, generated ``search_vector tsvector`` to camp_profiles
+(name A; tagline, city and state B; description C) with a GIN index, a
+GIN index on camp_type for the type filter, a (latitude, longitude) index
+for radius bounding boxes and a (is_featured, name, id) index for the
+default keyset order. All but the vector index are partial on published
+profiles.
+
+Revision ID: n4o5p6q7r8s9
+Revises: m3n4o5p6q7r8
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "n4o5p6q7r8s9"
+down_revision: Union[str, None] = "m3n4o5p6q7r8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match CampProfile.search_vector in app/models/camp_profile.py
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(tagline, '')), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(city, '') || ' ' || coalesce(state, '')), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C')"
+)
+
+
+def _table_exists(name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT 1 FROM information_schema.tables "
+            "WHERE table_schema = 'public' AND table_name = :name"
+        ),
+        {"name": name},
+    )
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    # camp_profiles predates the Alembic history on some environments
+    if not _table_exists("camp_profiles"):
+        return
+
+    op.execute(f"""
+    ALTER TABLE camp_profiles
+        ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+        GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_camp_profiles_search_vector "
+        "ON camp_profiles USING gin (search_vector)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_camp_profiles_camp_type "
+        "ON camp_profiles USING gin (camp_type) WHERE is_published"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_camp_profiles_lat_lon "
+        "ON camp_profiles (latitude, longitude) "
+        "WHERE is_published AND latitude IS NOT NULL AND longitude IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_camp_profiles_published_order "
+        "ON camp_profiles (coalesce(is_featured, false) DESC, name, id) WHERE is_published"
+    )
+
+
+def downgrade() -> None:
+    if not _table_exists("camp_profiles"):
+        return
+    op.execute("DROP INDEX IF EXISTS ix_camp_profiles_published_order")
+    op.execute("DROP INDEX IF EXISTS ix_camp_profiles_lat_lon")
+    op.execute("DROP INDEX IF EXISTS ix_camp_profiles_camp_type")
+    op.execute("DROP INDEX IF EXISTS ix_camp_profiles_search_vector")
+    op.execute("ALTER TABLE camp_profiles DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,117 @@
+"""Monthly-partitioned audit_logs table
+
+Creates ``audit_logs`` partitioned by RANGE (created_at), one partition per
+month named ``audit_logs_YYYY_MM``. Indexes are declared on the parent so
+every partition gets them:
+
+- (organization_id, created_at DESC, id DESC): tenant listing and keyset
+  pagination, pruned to the months in the requested date range
+- (organization_id, resource_type, resource_id, created_at DESC): history
+  of one resource
+
+Partitions are created from the oldest legacy ``audit_log`` row through two
+months ahead; the audit flusher creates later months on demand (see
+app.services.audit_service). Legacy rows are copied across; the old table
+is left in place.
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "o5p6q7r8s9t0"
+down_revision: Union[str, None] = "n4o5p6q7r8s9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT 1 FROM information_schema.tables "
+            "WHERE table_schema = 'public' AND table_name = :name"
+        ),
+        {"name": name},
+    )
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS audit_logs (
+        id UUID NOT NULL,
+        organization_id UUID NOT NULL,
+        user_id UUID,
+        user_name VARCHAR(255),
+        action VARCHAR(100) NOT NULL,
+        resource_type VARCHAR(100) NOT NULL,
+        resource_id VARCHAR(255),
+        resource_name VARCHAR(255),
+        details JSONB,
+        ip_address VARCHAR(45),
+        user_agent VARCHAR(500),
+        created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_org_created "
+        "ON audit_logs (organization_id, created_at DESC, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_org_resource "
+        "ON audit_logs (organization_id, resource_type, resource_id, created_at DESC)"
+    )
+
+    has_legacy = _table_exists("audit_log")
+    first_month = (
+        "date_trunc('month', COALESCE((SELECT min(created_at) FROM audit_log), now()))"
+        if has_legacy
+        else "date_trunc('month', now())"
+    )
+    op.execute(f"""
+    DO $$
+    DECLARE m date;
+    BEGIN
+        FOR m IN
+            SELECT generate_series(
+                {first_month},
+                date_trunc('month', now()) + interval '2 months',
+                interval '1 month'
+            )::date
+        LOOP
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                'audit_logs_' || to_char(m, 'YYYY_MM'),
+                m,
+                (m + interval '1 month')::date
+            );
+        END LOOP;
+    END
+    $$
+    """)
+
+    if has_legacy:
+        op.execute("""
+        INSERT INTO audit_logs (
+            id, organization_id, user_id, action, resource_type, resource_id,
+            details, ip_address, user_agent, created_at
+        )
+        SELECT id, organization_id, user_id, action, resource_type, resource_id,
+               details, ip_address, user_agent, created_at
+        FROM audit_log
+        ON CONFLICT DO NOTHING
+        """)
+
+
+def downgrade() -> None:
+    # Dropping the parent drops every partition
+    op.execute("DROP TABLE IF EXISTS audit_logs")
@@ -0,0 +1,49 @@
+"""Trigram name search and keyset order indexes for the camper list
+
+- GIN trigram index on ``first_name || ' ' || last_name`` for the list's
+  substring name search (requires the pg_trgm extension)
+- (organization_id, last_name, first_name, id) for keyset pagination
+- registrations (camper_id) for the per-row active registration count
+
+All partial on live rows.
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "p6q7r8s9t0u1"
+down_revision: Union[str, None] = "o5p6q7r8s9t0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_campers_full_name_trgm "
+        "ON campers USING gin ((first_name || ' ' || last_name) gin_trgm_ops) "
+        "WHERE deleted_at IS NULL"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_campers_org_name_order "
+        "ON campers (organization_id, last_name, first_name, id) "
+        "WHERE deleted_at IS NULL"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_registrations_camper_active "
+        "ON registrations (camper_id) "
+        "WHERE deleted_at IS NULL AND status <> 'cancelled'"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_registrations_camper_active")
+    op.execute("DROP INDEX IF EXISTS ix_campers_org_name_order")
+    op.execute("DROP INDEX IF EXISTS ix_campers_full_name_trgm")
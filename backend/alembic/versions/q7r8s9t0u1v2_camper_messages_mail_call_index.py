@@ -0,0 +1,32 @@
+"""Composite index for the daily mail-call view
+
+(organization_id, scheduled_date, event_id) on camper_messages backs the
+per-day mail-call query and its printable export. The bunk join uses the
+existing uq_bunk_assignment_camper_event index.
+
+Revision ID: q7r8s9t0u1v2
+Revises: p6q7r8s9t0u1
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "q7r8s9t0u1v2"
+down_revision: Union[str, None] = "p6q7r8s9t0u1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_camper_messages_org_date_event "
+        "ON camper_messages (organization_id, scheduled_date, event_id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_camper_messages_org_date_event")
@@ -0,0 +1,45 @@
+"""Provider sync support for background_checks
+
+- provider_updated_at: provider timestamp of the last applied status, so
+  webhook retries and out-of-order reports are ignored
+- (provider, external_id): webhook and batch updates match on it
+- (id) partial on open (pending/processing), unarchived checks: the
+  poller's batch scan
+
+Revision ID: r8s9t0u1v2w3
+Revises: q7r8s9t0u1v2
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "r8s9t0u1v2w3"
+down_revision: Union[str, None] = "q7r8s9t0u1v2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE background_checks "
+        "ADD COLUMN IF NOT EXISTS provider_updated_at TIMESTAMPTZ"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_background_checks_provider_external "
+        "ON background_checks (provider, external_id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_background_checks_open "
+        "ON background_checks (id) "
+        "WHERE status IN ('pending', 'processing') AND is_archived = false"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_background_checks_open")
+    op.execute("DROP INDEX IF EXISTS ix_background_checks_provider_external")
+    op.execute("ALTER TABLE background_checks DROP COLUMN IF EXISTS provider_updated_at")
@@ -0,0 +1,108 @@
+"""Compliance summaries and expiry indexes for the expiry scanner
+
+- compliance_summaries: one precomputed row per organization
+- contact_alerts.dedupe_key with a unique partial index on
+  (user_id, dedupe_key), so generated alerts are inserted at most once
+- expiry range indexes on staff_certification_records.expiry_date,
+  staff_certifications.expiry_date and background_checks.expires_at
+
+Revision ID: s9t0u1v2w3x4
+Revises: r8s9t0u1v2w3
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = "s9t0u1v2w3x4"
+down_revision: Union[str, None] = "r8s9t0u1v2w3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_COUNTS = (
+    "staff_total",
+    "staff_non_compliant",
+    "certifications_total",
+    "certifications_valid",
+    "certifications_expiring",
+    "certifications_expired",
+    "required_missing",
+    "background_checks_total",
+    "background_checks_clear",
+    "background_checks_open",
+    "background_checks_flagged",
+    "background_checks_expiring",
+    "background_checks_expired",
+)
+
+
+def _table_exists(name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT 1 FROM information_schema.tables "
+            "WHERE table_schema = 'public' AND table_name = :name"
+        ),
+        {"name": name},
+    )
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    if not _table_exists("compliance_summaries"):
+        op.create_table(
+            "compliance_summaries",
+            sa.Column(
+                "organization_id",
+                UUID(as_uuid=True),
+                sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            *(
+                sa.Column(name, sa.Integer, nullable=False, server_default="0")
+                for name in _COUNTS
+            ),
+            sa.Column("upcoming", JSONB, nullable=True),
+            sa.Column("window_days", sa.Integer, nullable=False, server_default="30"),
+            sa.Column(
+                "computed_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=False,
+            ),
+        )
+
+    op.execute("ALTER TABLE contact_alerts ADD COLUMN IF NOT EXISTS dedupe_key VARCHAR(255)")
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_contact_alerts_user_dedupe "
+        "ON contact_alerts (user_id, dedupe_key) WHERE dedupe_key IS NOT NULL"
+    )
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_staff_certification_records_expiry "
+        "ON staff_certification_records (expiry_date) WHERE expiry_date IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_staff_certifications_expiry "
+        "ON staff_certifications (expiry_date) WHERE expiry_date IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_background_checks_expires "
+        "ON background_checks (expires_at) "
+        "WHERE expires_at IS NOT NULL AND is_archived = false"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_background_checks_expires")
+    op.execute("DROP INDEX IF EXISTS ix_staff_certifications_expiry")
+    op.execute("DROP INDEX IF EXISTS ix_staff_certification_records_expiry")
+    op.execute("DROP INDEX IF EXISTS uq_contact_alerts_user_dedupe")
+    op.execute("ALTER TABLE contact_alerts DROP COLUMN IF EXISTS dedupe_key")
+    op.execute("DROP TABLE IF EXISTS compliance_summaries")
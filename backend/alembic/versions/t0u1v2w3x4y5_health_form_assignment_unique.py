@@ -0,0 +1,52 @@
+"""Unique live assignment per (template, camper, event) for health forms
+
+Bulk assignment inserts with ``ON CONFLICT DO NOTHING`` and needs an
+arbiter index. ``event_id`` is nullable, so it is folded through COALESCE
+to make "no event" a single key. Existing duplicate live assignments are
+soft-deleted first, keeping the most progressed (non-pending) row and
+otherwise the oldest.
+
+Revision ID: t0u1v2w3x4y5
+Revises: s9t0u1v2w3x4
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "t0u1v2w3x4y5"
+down_revision: Union[str, None] = "s9t0u1v2w3x4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE health_forms AS hf
+        SET is_deleted = true, deleted_at = now()
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY template_id, camper_id,
+                    COALESCE(event_id, '00000000-0000-0000-0000-000000000000'::uuid)
+                ORDER BY (status = 'pending'), created_at, id
+            ) AS rn
+            FROM health_forms
+            WHERE deleted_at IS NULL
+        ) AS dup
+        WHERE hf.id = dup.id AND dup.rn > 1
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_health_forms_live_assignment "
+        "ON health_forms (template_id, camper_id, "
+        "(COALESCE(event_id, '00000000-0000-0000-0000-000000000000'::uuid))) "
+        "WHERE deleted_at IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS uq_health_forms_live_assignment")
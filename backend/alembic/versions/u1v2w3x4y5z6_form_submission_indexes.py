@@ -0,0 +1,42 @@
+"""Answer search and keyset order indexes for form-builder submissions
+
+- GIN (jsonb_path_ops) on ``answers`` for ``answers @> {...}`` filters
+- (organization_id, created_at DESC, id DESC) for the keyset-paginated list
+- (template_id, created_at, id) for per-template lists, stats and export
+
+Revision ID: u1v2w3x4y5z6
+Revises: t0u1v2w3x4y5
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "u1v2w3x4y5z6"
+down_revision: Union[str, None] = "t0u1v2w3x4y5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_form_submissions_answers_gin "
+        "ON form_submissions USING gin (answers jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_form_submissions_org_created "
+        "ON form_submissions (organization_id, created_at DESC, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_form_submissions_template_created "
+        "ON form_submissions (template_id, created_at, id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_form_submissions_template_created")
+    op.execute("DROP INDEX IF EXISTS ix_form_submissions_org_created")
+    op.execute("DROP INDEX IF EXISTS ix_form_submissions_answers_gin")
@@ -0,0 +1,85 @@
+"""Precomputed portal photo visibility index
+
+- portal_photo_visibility: one row per (camper, photo) a parent of the
+  camper may see (face tag or photo filed under the camper), with the
+  photo's created_at for keyset feeds
+- (camper_id, photo_created_at, photo_id) for the per-camper range read
+- photo_id for re-syncing a photo's rows
+- backfilled from live photos and photo_face_tags
+
+Revision ID: v2w3x4y5z6a7
+Revises: u1v2w3x4y5z6
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = "v2w3x4y5z6a7"
+down_revision: Union[str, None] = "u1v2w3x4y5z6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT 1 FROM information_schema.tables "
+            "WHERE table_schema = 'public' AND table_name = :name"
+        ),
+        {"name": name},
+    )
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    if not _table_exists("portal_photo_visibility"):
+        op.create_table(
+            "portal_photo_visibility",
+            sa.Column("camper_id", UUID(as_uuid=True), sa.ForeignKey("campers.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("photo_id", UUID(as_uuid=True), sa.ForeignKey("photos.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("organization_id", UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
+            sa.Column("photo_created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("camper_id", "photo_id"),
+        )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_portal_photo_visibility_feed "
+        "ON portal_photo_visibility (camper_id, photo_created_at, photo_id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_portal_photo_visibility_photo "
+        "ON portal_photo_visibility (photo_id)"
+    )
+    op.execute(
+        """
+        INSERT INTO portal_photo_visibility (
+            organization_id, camper_id, photo_id, photo_created_at
+        )
+        SELECT p.organization_id, v.camper_id, p.id, p.created_at
+        FROM photos p
+        CROSS JOIN LATERAL (
+            SELECT t.camper_id
+            FROM photo_face_tags t
+            WHERE t.photo_id = p.id AND t.camper_id IS NOT NULL
+            UNION
+            SELECT p.entity_id
+            WHERE p.category = 'camper' AND p.entity_id IS NOT NULL
+        ) AS v
+        JOIN campers c ON c.id = v.camper_id
+        WHERE p.deleted_at IS NULL
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_portal_photo_visibility_photo")
+    op.execute("DROP INDEX IF EXISTS ix_portal_photo_visibility_feed")
+    if _table_exists("portal_photo_visibility"):
+        op.drop_table("portal_photo_visibility")
@@ -0,0 +1,338 @@
+"""
+Camp Connect - API Router Registry
+Ordered list of the v1 routers and how they are mounted.
+
+Most routers are imported and included at startup. Routers whose import
+chain pulls in a third-party SDK client (Twilio, SendGrid, boto3, Stripe,
+Anthropic, Supabase admin) or that serve rarely used admin screens carry a
+``lazy_path``: a placeholder route claims that URL prefix and imports the
+module on the first request under it, swapping in the real routes at the
+same position. Registration order is preserved, so route precedence is
+identical to eager loading.
+
+Set ``LAZY_ROUTERS=false`` to import everything up front (the OpenAPI
+schema always loads deferred routers before it is generated).
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from fastapi import FastAPI
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+_PACKAGE = "app.api.v1"
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    """One router: module under app.api.v1, attribute, optional lazy prefix."""
+
+    module: str
+    attr: str = "router"
+    # URL prefix (below the API prefix) that triggers a deferred import
+    lazy_path: Optional[str] = None
+
+
+ROUTERS: List[RouterSpec] = [
+    RouterSpec("auth"),
+    RouterSpec("organizations"),
+    RouterSpec("locations"),
+    RouterSpec("roles"),
+    RouterSpec("users"),
+    RouterSpec("settings"),
+    RouterSpec("permissions"),
+
+    # Phase 2: Core Registration
+    RouterSpec("events"),
+    RouterSpec("contacts"),
+    RouterSpec("campers"),
+    RouterSpec("registrations"),
+    RouterSpec("dashboard"),
+
+    # Phase 3: Photos, Communications, Health & Safety
+    RouterSpec("photos"),
+    RouterSpec("communications", lazy_path="/communications"),
+    RouterSpec("health_forms"),
+
+    # Phase 4: Staff Onboarding, Staff Directory, Facial Recognition
+    RouterSpec("onboarding", lazy_path="/onboarding"),
+    RouterSpec("staff"),
+    RouterSpec("face_recognition", lazy_path="/recognition"),
+
+    # Phase 5: Analytics, Activities, Bunks, Families
+    RouterSpec("analytics"),
+    RouterSpec("activities"),
+    RouterSpec("bunks"),
+    RouterSpec("cabins"),
+    RouterSpec("families"),
+
+    # Phase 6: Parent Portal
+    RouterSpec("portal"),
+    RouterSpec("portal_documents"),
+    RouterSpec("portal_dashboard"),
+
+    # Phase 7: Scheduling, Payments, Notifications, Reports, Store
+    RouterSpec("schedules"),
+    RouterSpec("payments", lazy_path="/payments"),
+    RouterSpec("notifications", lazy_path="/notifications"),
+    RouterSpec("reports"),
+    RouterSpec("store"),
+
+    # Phase 8: Form Builder, Workflows, Contact Associations
+    RouterSpec("forms"),
+    RouterSpec("workflows"),
+    RouterSpec("workflows", attr="assoc_router"),
+
+    # Phase 9: Staff Certifications, Saved Lists
+    RouterSpec("staff_certifications"),
+    RouterSpec("lists"),
+
+    # Phase 10: Job Titles, Bunk Buddy Requests, AI Insights
+    RouterSpec("job_titles"),
+    RouterSpec("bunk_buddies"),
+    RouterSpec("portal_bunk_buddies"),
+    RouterSpec("ai", lazy_path="/ai"),
+
+    # Phase 11: Camper Messaging, Medicine, Schools, Alerts, Photo Albums
+    RouterSpec("camper_messages"),
+    RouterSpec("medicine"),
+    RouterSpec("schools"),
+    RouterSpec("alerts"),
+    RouterSpec("photo_albums"),
+
+    # Phase 12: Financial Features
+    RouterSpec("quotes"),
+    RouterSpec("payment_plans"),
+
+    # Phase 13: CRM / Deals
+    RouterSpec("deals"),
+
+    # Phase 14: Camp Directory
+    RouterSpec("camp_directory"),
+
+    # Phase 14: Custom Fields
+    RouterSpec("custom_fields"),
+    # Phase 15: Staff Marketplace / Job Board
+    RouterSpec("job_listings"),
+
+    # Phase 14: Background Checks
+    RouterSpec("background_checks", lazy_path="/background-checks"),
+
+    # Waitlist Management
+    RouterSpec("waitlist"),
+
+    # Phase 16: Lead Enrichment
+    RouterSpec("lead_enrichment", lazy_path="/lead-enrichment"),
+
+    # Branding / Theme
+    RouterSpec("branding"),
+
+    # Awards & Achievements (Gamification)
+    RouterSpec("awards"),
+
+    # Phase 17: Inventory & Equipment
+    RouterSpec("inventory"),
+
+    # Transportation
+    RouterSpec("transportation"),
+
+    # Meal Planning
+    RouterSpec("meals"),
+
+    # Incident & Safety Reporting
+    RouterSpec("incidents"),
+
+    # Emergency Action Plans & Drills
+    RouterSpec("emergency"),
+
+    # Facility Maintenance
+    RouterSpec("maintenance"),
+
+    # Weather Monitoring
+    RouterSpec("weather"),
+
+    # Document Management
+    RouterSpec("documents"),
+
+    # Parent Communication Log & Check-Ins
+    RouterSpec("parent_logs"),
+
+    # Visitor Management
+    RouterSpec("visitors"),
+
+    # Skill Tracking
+    RouterSpec("skill_tracking"),
+
+    # Team Chat
+    RouterSpec("team_chat"),
+
+    # Attendance Tracking
+    RouterSpec("attendance"),
+
+    # Volunteer Management
+    RouterSpec("volunteers"),
+
+    # Notification Preferences
+    RouterSpec("notification_preferences"),
+
+    # Global Search
+    RouterSpec("search"),
+
+    # Medical Dashboard
+    RouterSpec("medical_dashboard"),
+
+    # Medical Logs
+    RouterSpec("medical_logs"),
+
+    # Audit Logs
+    RouterSpec("audit_logs"),
+
+    # Packing Lists
+    RouterSpec("packing_lists"),
+
+    # Spending Accounts
+    RouterSpec("spending_accounts"),
+
+    # Permission Slips
+    RouterSpec("permission_slips"),
+
+    # Camp Sessions
+    RouterSpec("camp_sessions"),
+
+    # Phase 23: Budget, Alumni, Surveys, Resource Booking, Supply Requests
+    RouterSpec("budget"),
+    RouterSpec("alumni"),
+    RouterSpec("surveys"),
+    RouterSpec("resource_bookings"),
+    RouterSpec("supply_requests"),
+
+    # Phase 24: Carpool, Lost & Found, Allergy Matrix, Group Notes, Check-In/Out
+    RouterSpec("carpools"),
+    RouterSpec("lost_found"),
+    RouterSpec("allergy_matrix"),
+    RouterSpec("group_notes"),
+    RouterSpec("checkin"),
+
+    # Staff Scheduling
+    RouterSpec("staff_schedule"),
+    RouterSpec("dietary"),
+
+    # Task Assignments
+    RouterSpec("tasks"),
+
+    # Referral Tracking
+    RouterSpec("referrals"),
+
+    # Behavior Tracking
+    RouterSpec("behavior"),
+
+    # Program Evaluation
+    RouterSpec("program_eval"),
+
+    # Announcement Board
+    RouterSpec("announcements"),
+
+    # Feedback Collection
+    RouterSpec("feedback"),
+
+    # Goal Setting
+    RouterSpec("goals"),
+
+    # Room Booking
+    RouterSpec("room_booking"),
+
+    # Super Admin Portal
+    RouterSpec("admin", lazy_path="/admin"),
+    RouterSpec("admin_settings", lazy_path="/admin/settings"),
+]
+
+
+def _load(spec: RouterSpec):
+    return getattr(importlib.import_module(f"{_PACKAGE}.{spec.module}"), spec.attr)
+
+
+class LazyRouter(BaseRoute):
+    """
+    Placeholder for a deferred router. Matches every request under its
+    prefix, imports the module, replaces itself with the router's routes
+    and re-dispatches the request through the application router.
+    """
+
+    def __init__(self, app: FastAPI, spec: RouterSpec, prefix: str) -> None:
+        self.app = app
+        self.spec = spec
+        self.prefix = prefix
+        self.path = prefix + (spec.lazy_path or "")
+
+    def matches(self, scope: Scope) -> Tuple[Match, Scope]:
+        if scope["type"] in ("http", "websocket"):
+            path = scope["path"]
+            root_path = scope.get("root_path", "")
+            if root_path and path.startswith(root_path):
+                path = path[len(root_path):]
+            if path == self.path or path.startswith(self.path + "/"):
+                return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params):
+        raise NoMatchFound(name, path_params)
+
+    def load(self) -> None:
+        """Import the router and splice its routes in at this position."""
+        routes = self.app.router.routes
+        if self not in routes:
+            return
+        started = time.perf_counter()
+        router = _load(self.spec)
+        before = len(routes)
+        self.app.include_router(router, prefix=self.prefix)
+        added = routes[before:]
+        del routes[before:]
+        index = routes.index(self)
+        routes[index:index + 1] = added
+        self.app.openapi_schema = None
+        logger.info(
+            "Loaded deferred router %s (%d routes) in %.1fms",
+            self.spec.module,
+            len(added),
+            (time.perf_counter() - started) * 1000,
+        )
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.load()
+        await self.app.router(scope, receive, send)
+
+
+def load_deferred(app: FastAPI) -> int:
+    """Import every router still deferred; returns how many were loaded."""
+    pending = [r for r in app.router.routes if isinstance(r, LazyRouter)]
+    for route in pending:
+        route.load()
+    return len(pending)
+
+
+def include_routers(app: FastAPI, prefix: str, *, lazy: bool = True) -> None:
+    """Register all routers in ``ROUTERS`` order on ``app``."""
+    for spec in ROUTERS:
+        if lazy and spec.lazy_path:
+            app.router.routes.append(LazyRouter(app, spec, prefix))
+        else:
+            app.include_router(_load(spec), prefix=prefix)
+
+    if lazy:
+        generate_openapi = app.openapi
+
+        def openapi():
+            if load_deferred(app):
+                app.openapi_schema = None
+            return generate_openapi()
+
+        app.openapi = openapi
@@ -36,6 +36,7 @@ class ChatResponse(BaseModel):
     data: Optional[List[Dict[str, Any]]] = None
     row_count: Optional[int] = None
     entity_links: Optional[Dict[str, str]] = None
+    metrics: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 
@@ -9,13 +9,17 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import realtime
 from app.api.deps import get_current_user
 from app.database import get_db
+from app.middleware.auth import security_scheme, verify_supabase_token
 from app.models.contact_alert import ContactAlert
 
 router = APIRouter(prefix="/alerts", tags=["Alerts"])
@@ -49,6 +53,46 @@ class AlertCreate(BaseModel):
     metadata_json: Optional[dict] = None
 
 
+# ─── Unread counts ────────────────────────────────────────
+
+def _unread_counts_query(user_id: Any, organization_id: Any = None):
+    query = (
+        select(ContactAlert.alert_type, func.count(ContactAlert.id))
+        .where(ContactAlert.user_id == user_id)
+        .where(ContactAlert.is_read == False)
+        .where(ContactAlert.is_dismissed == False)
+        .group_by(ContactAlert.alert_type)
+    )
+    if organization_id is not None:
+        query = query.where(ContactAlert.organization_id == organization_id)
+    return query
+
+
+async def _load_unread_counts(user_id: str) -> Dict[str, int]:
+    """Count loader for the push channel; runs outside any request session."""
+    from app.database import async_session_factory
+
+    async with async_session_factory() as session:
+        result = await session.execute(_unread_counts_query(uuid.UUID(user_id)))
+        return {row[0]: row[1] for row in result.all()}
+
+
+realtime.set_count_loader(_load_unread_counts)
+
+
+async def _stream_user(
+    request: Request,
+    access_token: Optional[str] = Query(None, description="For EventSource, which cannot send headers"),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
+    """Authenticate a stream by Authorization header or ``access_token``."""
+    if credentials is None and access_token:
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=access_token)
+    payload = await verify_supabase_token(credentials)
+    return await get_current_user(request, payload, db)
+
+
 # ─── Endpoints ────────────────────────────────────────────
 
 @router.get("", response_model=List[AlertResponse])
@@ -100,15 +144,14 @@ async def alert_counts(
     db: AsyncSession = Depends(get_db),
 ):
     """Get unread alert counts by type for the sidebar badges."""
-    query = (
-        select(ContactAlert.alert_type, func.count(ContactAlert.id))
-        .where(ContactAlert.organization_id == current_user["organization_id"])
-        .where(ContactAlert.user_id == current_user["id"])
-        .where(ContactAlert.is_read == False)
-        .where(ContactAlert.is_dismissed == False)
-        .group_by(ContactAlert.alert_type)
+    # Served from memory while this user has a live stream on this worker
+    live = realtime.counts_snapshot(current_user["id"])
+    if live is not None:
+        return live
+
+    result = await db.execute(
+        _unread_counts_query(current_user["id"], current_user["organization_id"])
     )
-    result = await db.execute(query)
     rows = result.all()
 
     counts = {row[0]: row[1] for row in rows}
@@ -117,6 +160,33 @@ async def alert_counts(
     return {"total": total, "by_type": counts}
 
 
+@router.get("/stream")
+async def stream_alerts(
+    request: Request,
+    current_user: Dict[str, Any] = Depends(_stream_user),
+):
+    """
+    Server-sent events for the current user's alerts. The first event
+    (``counts``) carries the unread counts; each ``alert`` event carries the
+    change (created/read/dismissed/read_all/resync) and the updated counts.
+    """
+    try:
+        sub = await realtime.subscribe(current_user["id"])
+    except realtime.RegistryFull as e:
+        raise HTTPException(
+            status_code=(
+                status.HTTP_429_TOO_MANY_REQUESTS if e.per_user
+                else status.HTTP_503_SERVICE_UNAVAILABLE
+            ),
+            detail=str(e),
+        )
+    return StreamingResponse(
+        realtime.stream(sub, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("", response_model=AlertResponse, status_code=status.HTTP_201_CREATED)
 async def create_alert(
     body: AlertCreate,
@@ -138,6 +208,14 @@ async def create_alert(
         metadata_json=body.metadata_json,
     )
     db.add(alert)
+    await realtime.publish_alert_event(
+        db,
+        event="created",
+        user_id=alert.user_id,
+        alert_type=alert.alert_type,
+        alert_id=alert.id,
+        was_unread=True,
+    )
     await db.commit()
     await db.refresh(alert)
 
@@ -172,8 +250,17 @@ async def mark_alert_read(
     if not alert:
         raise HTTPException(status_code=404, detail="Alert not found")
 
+    was_unread = not alert.is_read and not alert.is_dismissed
     alert.is_read = True
     alert.read_at = datetime.now(timezone.utc)
+    await realtime.publish_alert_event(
+        db,
+        event="read",
+        user_id=alert.user_id,
+        alert_type=alert.alert_type,
+        alert_id=alert.id,
+        was_unread=was_unread,
+    )
     await db.commit()
     return {"status": "read"}
 
@@ -192,6 +279,7 @@ async def mark_all_read(
         .where(ContactAlert.is_read == False)
         .values(is_read=True, read_at=datetime.now(timezone.utc))
     )
+    await realtime.publish_alert_event(db, event="read_all", user_id=current_user["id"])
     await db.commit()
     return {"status": "all_read"}
 
@@ -212,6 +300,15 @@ async def dismiss_alert(
     if not alert:
         raise HTTPException(status_code=404, detail="Alert not found")
 
+    was_unread = not alert.is_read and not alert.is_dismissed
     alert.is_dismissed = True
+    await realtime.publish_alert_event(
+        db,
+        event="dismissed",
+        user_id=alert.user_id,
+        alert_type=alert.alert_type,
+        alert_id=alert.id,
+        was_unread=was_unread,
+    )
     await db.commit()
     return {"status": "dismissed"}
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
@@ -35,21 +35,26 @@ async def list_audit_logs(
     date_from: Optional[str] = Query(default=None, description="Start date (YYYY-MM-DD)"),
     date_to: Optional[str] = Query(default=None, description="End date (YYYY-MM-DD)"),
     search: Optional[str] = Query(default=None, description="Search text"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
     current_user: Dict[str, Any] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """List audit logs with filters and pagination."""
-    return await audit_service.get_audit_logs(
-        org_id=current_user["organization_id"],
-        page=page,
-        per_page=per_page,
-        action_filter=action,
-        resource_type_filter=resource_type,
-        user_id_filter=user_id,
-        date_from=date_from,
-        date_to=date_to,
-        search=search,
-    )
+    try:
+        return await audit_service.get_audit_logs(
+            org_id=current_user["organization_id"],
+            page=page,
+            per_page=per_page,
+            action_filter=action,
+            resource_type_filter=resource_type,
+            user_id_filter=user_id,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get(
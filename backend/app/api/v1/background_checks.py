@@ -1,6 +1,7 @@
 """
 Camp Connect - Background Check API Endpoints
 Integration with Checkr for staff background screening.
+Status sync (batch poll + webhook) lives in app.services.background_check_service.
 """
 
 from __future__ import annotations
@@ -9,7 +10,7 @@ import uuid
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy import select, func as sqlfunc
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -23,6 +24,7 @@ from app.schemas.background_check import (
     BackgroundCheckSettingsUpdate,
     BackgroundCheckUpdate,
 )
+from app.services import background_check_service
 
 router = APIRouter(prefix="/background-checks", tags=["Background Checks"])
 
@@ -121,6 +123,46 @@ async def update_checkr_settings(
     }
 
 
+# ── Provider sync ────────────────────────────────────────────
+
+@router.post("/sync")
+async def sync_background_checks(
+    current_user: Dict[str, Any] = Depends(
+        require_permission("staff.employees.update")
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Refresh every pending/processing check in the organization from the
+    provider now, instead of waiting for the scheduled poll.
+    """
+    return await background_check_service.sync_open_checks(
+        db, organization_id=current_user["organization_id"],
+    )
+
+
+@router.post("/webhook", status_code=status.HTTP_200_OK)
+async def background_check_webhook(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Apply a status push from the provider. No authentication required —
+    verification is done via the X-Checkr-Signature header. Redeliveries
+    and out-of-order events are ignored.
+    """
+    payload = await request.body()
+    signature = request.headers.get("x-checkr-signature", "")
+    try:
+        changed = await background_check_service.apply_webhook(db, payload, signature)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return {"status": "ok", "changed": changed}
+
+
 # ── CRUD ─────────────────────────────────────────────────────
 
 @router.get("")
@@ -331,11 +373,7 @@ async def refresh_background_check(
     ),
     db: AsyncSession = Depends(get_db),
 ):
-    """
-    Refresh the status of a background check from the provider.
-    In production this would call the Checkr API.
-    For now it simulates a status progression.
-    """
+    """Refresh the status of a background check from the provider."""
     org_id = current_user["organization_id"]
 
     result = await db.execute(
@@ -350,41 +388,14 @@ async def refresh_background_check(
             detail="Background check not found",
         )
 
-    # Mock status progression: pending -> processing -> complete
-    progression = {
-        "pending": "processing",
-        "processing": "complete",
-    }
-
-    old_status = check.status
-    if old_status in progression:
-        check.status = progression[old_status]
-        if check.status == "complete":
-            check.result = "clear"
-            check.completed_at = datetime.utcnow()
-            check.expires_at = datetime.utcnow() + timedelta(days=365)
-            check.report_url = f"https://dashboard.checkr.com/reports/{check.external_id}"
-            check.details = {
-                **(check.details or {}),
-                "provider_status": "complete",
-                "completed_at": datetime.utcnow().isoformat(),
-                "result_summary": "All clear - no records found",
-                "checks_completed": [
-                    "ssn_trace",
-                    "sex_offender_search",
-                    "national_criminal_search",
-                    "county_criminal_search",
-                ],
-            }
-        else:
-            check.details = {
-                **(check.details or {}),
-                "provider_status": "processing",
-                "last_refreshed": datetime.utcnow().isoformat(),
-            }
-        check.updated_at = datetime.utcnow()
-        await db.commit()
-        await db.refresh(check)
+    if check.status in background_check_service.OPEN_STATUSES and check.external_id:
+        changed = await background_check_service.refresh_checks(
+            db,
+            [{"id": check.id, "external_id": check.external_id, "status": check.status}],
+            organization_id=org_id,
+        )
+        if changed:
+            await db.refresh(check)
 
     items = await _enrich_with_names(db, [check], org_id)
     return items[0]
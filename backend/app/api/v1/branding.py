@@ -7,12 +7,13 @@ from __future__ import annotations
 
 import os
 import uuid as uuid_mod
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import response_cache
 from app.api.deps import get_current_user, require_permission
 from app.database import get_db
 from app.models.organization import Organization
@@ -20,6 +21,19 @@ from app.schemas.branding import BrandingRead, BrandingUpdate
 
 router = APIRouter(prefix="/branding", tags=["Branding"])
 
+CACHE_NAMESPACE = "branding"
+
+
+async def _branding_version(db: AsyncSession, tenant: Optional[str]) -> tuple:
+    """Branding lives in organizations.settings; the row's updated_at versions it."""
+    result = await db.execute(
+        select(Organization.updated_at).where(Organization.id == uuid_mod.UUID(tenant))
+    )
+    return (result.scalar_one_or_none(),)
+
+
+response_cache.register_namespace(CACHE_NAMESPACE, _branding_version)
+
 ALLOWED_CONTENT_TYPES = {
     "image/png",
     "image/jpeg",
@@ -58,23 +72,34 @@ def _extract_branding(settings: dict) -> dict:
 
 @router.get("", response_model=BrandingRead)
 async def get_branding(
+    request: Request,
     current_user: Dict[str, Any] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get the current organization\'s branding settings."""
-    result = await db.execute(
-        select(Organization).where(
-            Organization.id == current_user["organization_id"]
+    """Get the current organization\'s branding settings (ETag-cached)."""
+
+    async def build():
+        result = await db.execute(
+            select(Organization).where(
+                Organization.id == current_user["organization_id"]
+            )
         )
+        org = result.scalar_one_or_none()
+        if org is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Organization not found",
+            )
+        return _extract_branding(org.settings or {})
+
+    return await response_cache.cached_response(
+        request,
+        db,
+        namespace=CACHE_NAMESPACE,
+        build=build,
+        tenant=current_user["organization_id"],
+        public=False,
     )
-    org = result.scalar_one_or_none()
-    if org is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Organization not found",
-        )
-
-    return _extract_branding(org.settings or {})
 
 
 @router.put("", response_model=BrandingRead)
@@ -131,6 +156,7 @@ async def update_branding(
 
     await db.commit()
     await db.refresh(org)
+    response_cache.invalidate(CACHE_NAMESPACE, tenant=org.id)
 
     return _extract_branding(org.settings or {})
 
@@ -8,10 +8,11 @@ from __future__ import annotations
 import uuid
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import require_permission
+from app.response_cache import cached_response
 from app.database import get_db
 from app.schemas.camp_profile import CampProfileCreate, CampProfileUpdate
 from app.services import camp_profile_service
@@ -86,19 +87,38 @@ async def publish_camp_profile(
 
 
 # ─── Public endpoints (no auth) ──────────────────────────────
+# Served through the response cache: ETag + Cache-Control, 304 on a
+# matching If-None-Match. Profile writes above invalidate the namespace.
+
+_DIRECTORY_MAX_AGE = 60
+
+
+async def _search_directory(db: AsyncSession, **filters: Any) -> Dict[str, Any]:
+    try:
+        return await camp_profile_service.list_published_profiles(db, **filters)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/directory/featured")
 async def get_featured_camps(
+    request: Request,
     limit: int = Query(default=6, le=20),
     db: AsyncSession = Depends(get_db),
 ):
     """Get featured camps for the directory homepage."""
-    return await camp_profile_service.get_featured_profiles(db, limit=limit)
+    return await cached_response(
+        request,
+        db,
+        namespace=camp_profile_service.CACHE_NAMESPACE,
+        build=lambda: camp_profile_service.get_featured_profiles(db, limit=limit),
+        max_age=_DIRECTORY_MAX_AGE,
+    )
 
 
 @router.get("/directory/search")
 async def search_camps(
+    request: Request,
     q: Optional[str] = Query(default=None),
     camp_type: Optional[str] = Query(default=None),
     state: Optional[str] = Query(default=None),
@@ -106,27 +126,46 @@ async def search_camps(
     age_max: Optional[int] = Query(default=None),
     price_min: Optional[float] = Query(default=None),
     price_max: Optional[float] = Query(default=None),
+    lat: Optional[float] = Query(default=None, ge=-90, le=90),
+    lon: Optional[float] = Query(default=None, ge=-180, le=180),
+    radius_miles: Optional[float] = Query(default=None, gt=0, le=500),
+    cursor: Optional[str] = Query(default=None),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=24, le=100),
     db: AsyncSession = Depends(get_db),
 ):
-    """Search camps in the public directory."""
-    return await camp_profile_service.list_published_profiles(
+    """
+    Search camps in the public directory. Results include facet counts;
+    page with ``next_cursor``. ``lat``/``lon`` sort by distance and
+    ``radius_miles`` limits to camps within that range.
+    """
+    return await cached_response(
+        request,
         db,
-        q=q,
-        camp_type=camp_type,
-        state=state,
-        age_min=age_min,
-        age_max=age_max,
-        price_min=price_min,
-        price_max=price_max,
-        skip=skip,
-        limit=limit,
+        namespace=camp_profile_service.CACHE_NAMESPACE,
+        build=lambda: _search_directory(
+            db,
+            q=q,
+            camp_type=camp_type,
+            state=state,
+            age_min=age_min,
+            age_max=age_max,
+            price_min=price_min,
+            price_max=price_max,
+            lat=lat,
+            lon=lon,
+            radius_miles=radius_miles,
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+        ),
+        max_age=_DIRECTORY_MAX_AGE,
     )
 
 
 @router.get("/directory")
 async def list_directory(
+    request: Request,
     q: Optional[str] = Query(default=None),
     camp_type: Optional[str] = Query(default=None),
     state: Optional[str] = Query(default=None),
@@ -134,35 +173,60 @@ async def list_directory(
     age_max: Optional[int] = Query(default=None),
     price_min: Optional[float] = Query(default=None),
     price_max: Optional[float] = Query(default=None),
+    lat: Optional[float] = Query(default=None, ge=-90, le=90),
+    lon: Optional[float] = Query(default=None, ge=-180, le=180),
+    radius_miles: Optional[float] = Query(default=None, gt=0, le=500),
+    cursor: Optional[str] = Query(default=None),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=24, le=100),
     db: AsyncSession = Depends(get_db),
 ):
     """List published camps in the directory with optional filters."""
-    return await camp_profile_service.list_published_profiles(
+    return await cached_response(
+        request,
         db,
-        q=q,
-        camp_type=camp_type,
-        state=state,
-        age_min=age_min,
-        age_max=age_max,
-        price_min=price_min,
-        price_max=price_max,
-        skip=skip,
-        limit=limit,
+        namespace=camp_profile_service.CACHE_NAMESPACE,
+        build=lambda: _search_directory(
+            db,
+            q=q,
+            camp_type=camp_type,
+            state=state,
+            age_min=age_min,
+            age_max=age_max,
+            price_min=price_min,
+            price_max=price_max,
+            lat=lat,
+            lon=lon,
+            radius_miles=radius_miles,
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+        ),
+        max_age=_DIRECTORY_MAX_AGE,
     )
 
 
 @router.get("/directory/{slug}")
 async def get_camp_by_slug(
+    request: Request,
     slug: str,
     db: AsyncSession = Depends(get_db),
 ):
     """Get a published camp profile by its URL slug."""
-    profile = await camp_profile_service.get_profile_by_slug(db, slug=slug)
-    if profile is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Camp not found",
-        )
-    return profile
+
+    async def build():
+        profile = await camp_profile_service.get_profile_by_slug(db, slug=slug)
+        if profile is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Camp not found",
+            )
+        return profile
+
+    return await cached_response(
+        request,
+        db,
+        namespace=camp_profile_service.CACHE_NAMESPACE,
+        build=build,
+        max_age=_DIRECTORY_MAX_AGE,
+    )
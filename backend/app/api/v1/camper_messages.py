@@ -5,18 +5,22 @@ Parent-to-camper messaging with daily scheduling.
 
 from __future__ import annotations
 
+import csv
+import io
 import uuid
 from datetime import date, datetime, timezone
+from html import escape
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import get_current_user
-from app.database import get_db
+from app.database import async_session_factory, get_db
 from app.models.camper_message import CamperMessage
 from app.models.camper import Camper
 from app.models.contact import Contact
@@ -71,7 +75,15 @@ async def list_camper_messages(
 ):
     """List camper messages with filters."""
     query = (
-        select(CamperMessage)
+        select(
+            CamperMessage,
+            Camper.first_name,
+            Camper.last_name,
+            Contact.first_name,
+            Contact.last_name,
+        )
+        .outerjoin(Camper, Camper.id == CamperMessage.camper_id)
+        .outerjoin(Contact, Contact.id == CamperMessage.contact_id)
         .where(CamperMessage.organization_id == current_user["organization_id"])
         .order_by(CamperMessage.scheduled_date.desc(), CamperMessage.created_at.desc())
     )
@@ -85,26 +97,9 @@ async def list_camper_messages(
         query = query.where(CamperMessage.is_read == is_read)
 
     result = await db.execute(query)
-    messages = result.scalars().all()
 
     responses = []
-    for msg in messages:
-        camper_name = None
-        contact_name = None
-        bunk_name = None
-
-        # Resolve camper name
-        cr = await db.execute(select(Camper.first_name, Camper.last_name).where(Camper.id == msg.camper_id))
-        row = cr.one_or_none()
-        if row:
-            camper_name = f"{row[0]} {row[1]}"
-
-        # Resolve contact name
-        cor = await db.execute(select(Contact.first_name, Contact.last_name).where(Contact.id == msg.contact_id))
-        row = cor.one_or_none()
-        if row:
-            contact_name = f"{row[0]} {row[1]}"
-
+    for msg, camper_first, camper_last, contact_first, contact_last in result.all():
         responses.append(CamperMessageResponse(
             id=str(msg.id),
             camper_id=str(msg.camper_id),
@@ -115,66 +110,199 @@ async def list_camper_messages(
             is_read=msg.is_read,
             read_at=msg.read_at.isoformat() if msg.read_at else None,
             read_by=str(msg.read_by) if msg.read_by else None,
-            camper_name=camper_name,
-            contact_name=contact_name,
-            bunk_name=bunk_name,
+            camper_name=f"{camper_first} {camper_last}" if camper_first is not None else None,
+            contact_name=f"{contact_first} {contact_last}" if contact_first is not None else None,
+            bunk_name=None,
             created_at=msg.created_at.isoformat() if msg.created_at else "",
         ))
     return responses
 
 
+# ─── Mail call ────────────────────────────────────────────
+# One joined query per day: message + camper + contact + the camper's bunk
+# for that event (at most one assignment per camper and event), ordered by
+# bunk then camper so rows group in a single pass.
+
+def _mail_call_query(
+    organization_id: Any,
+    target_date: date,
+    event_id: Optional[uuid.UUID] = None,
+    bunk_id: Optional[str] = None,
+):
+    query = (
+        select(
+            CamperMessage.id,
+            CamperMessage.camper_id,
+            CamperMessage.contact_id,
+            CamperMessage.message_text,
+            CamperMessage.is_read,
+            Camper.first_name.label("camper_first_name"),
+            Camper.last_name.label("camper_last_name"),
+            Contact.first_name.label("contact_first_name"),
+            Contact.last_name.label("contact_last_name"),
+            Bunk.id.label("bunk_id"),
+            Bunk.name.label("bunk_name"),
+        )
+        .outerjoin(Camper, Camper.id == CamperMessage.camper_id)
+        .outerjoin(Contact, Contact.id == CamperMessage.contact_id)
+        .outerjoin(
+            BunkAssignment,
+            and_(
+                BunkAssignment.camper_id == CamperMessage.camper_id,
+                BunkAssignment.event_id == CamperMessage.event_id,
+            ),
+        )
+        .outerjoin(Bunk, Bunk.id == BunkAssignment.bunk_id)
+        .where(CamperMessage.organization_id == organization_id)
+        .where(CamperMessage.scheduled_date == target_date)
+        .order_by(
+            Bunk.name.asc().nulls_last(),
+            Bunk.id,
+            Camper.last_name,
+            Camper.first_name,
+            CamperMessage.created_at,
+        )
+    )
+    if event_id:
+        query = query.where(CamperMessage.event_id == event_id)
+    if bunk_id == "unassigned":
+        query = query.where(Bunk.id.is_(None))
+    elif bunk_id:
+        query = query.where(Bunk.id == uuid.UUID(bunk_id))
+    return query
+
+
+def _mail_call_message(row: Any) -> Dict[str, Any]:
+    return {
+        "id": str(row.id),
+        "camper_id": str(row.camper_id),
+        "camper_name": (
+            f"{row.camper_first_name} {row.camper_last_name}"
+            if row.camper_first_name is not None else "Unknown"
+        ),
+        "message_text": row.message_text,
+        "is_read": row.is_read,
+        "contact_id": str(row.contact_id),
+        "contact_name": (
+            f"{row.contact_first_name} {row.contact_last_name}"
+            if row.contact_first_name is not None else None
+        ),
+    }
+
+
 @router.get("/daily/{target_date}")
 async def daily_messages(
     target_date: date,
-    event_id: Optional[str] = Query(None),
+    event_id: Optional[uuid.UUID] = Query(None),
     current_user: Dict[str, Any] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get all messages for a specific date, grouped by bunk."""
-    query = (
-        select(CamperMessage)
-        .where(CamperMessage.organization_id == current_user["organization_id"])
-        .where(CamperMessage.scheduled_date == target_date)
-        .order_by(CamperMessage.created_at)
+    result = await db.execute(
+        _mail_call_query(current_user["organization_id"], target_date, event_id)
     )
-    if event_id:
-        query = query.where(CamperMessage.event_id == event_id)
 
-    result = await db.execute(query)
-    messages = result.scalars().all()
-
-    # Group by bunk
-    bunk_groups: Dict[str, Any] = {}
-    for msg in messages:
-        # Find camper's bunk
-        bunk_query = (
-            select(BunkAssignment, Bunk)
-            .join(Bunk, BunkAssignment.bunk_id == Bunk.id)
-            .where(BunkAssignment.camper_id == msg.camper_id)
-            .where(BunkAssignment.event_id == msg.event_id)
+    bunk_groups: List[Dict[str, Any]] = []
+    for row in result.all():
+        bunk_id = str(row.bunk_id) if row.bunk_id else "unassigned"
+        if not bunk_groups or bunk_groups[-1]["bunk_id"] != bunk_id:
+            bunk_groups.append({
+                "bunk_name": row.bunk_name or "Unassigned",
+                "bunk_id": bunk_id,
+                "messages": [],
+            })
+        bunk_groups[-1]["messages"].append(_mail_call_message(row))
+
+    return {"date": target_date.isoformat(), "bunk_groups": bunk_groups}
+
+
+@router.get("/daily/{target_date}/print")
+async def print_daily_messages(
+    target_date: date,
+    event_id: Optional[uuid.UUID] = Query(None),
+    bunk_id: Optional[str] = Query(None, description='Bunk ID, or "unassigned"'),
+    format: str = Query("html", pattern="^(html|csv)$"),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+):
+    """
+    Stream a printable mail-call sheet for a day: one section (and printed
+    page) per bunk, or CSV. Rows are streamed from a server-side cursor.
+    """
+    if async_session_factory is None:
+        raise HTTPException(status_code=503, detail="Database not configured")
+    if bunk_id and bunk_id != "unassigned":
+        try:
+            uuid.UUID(bunk_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='bunk_id must be a bunk ID or "unassigned"',
+            )
+
+    query = _mail_call_query(current_user["organization_id"], target_date, event_id, bunk_id)
+    day = target_date.isoformat()
+
+    async def rows():
+        # Own session: the request-scoped one is closed before streaming starts
+        async with async_session_factory() as session:
+            result = await session.stream(query.execution_options(yield_per=200))
+            async for row in result:
+                yield row
+
+    async def html_body():
+        yield (
+            "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+            f"<title>Mail call {day}</title><style>"
+            "body{font-family:sans-serif;margin:2em}"
+            "section{page-break-after:always}section:last-of-type{page-break-after:auto}"
+            "article{border-bottom:1px dashed #999;padding:.75em 0;page-break-inside:avoid}"
+            "h1{font-size:1.4em}h2{font-size:1em;margin:.25em 0}.from{color:#555;font-size:.9em}"
+            "</style></head><body>"
+        )
+        current = None
+        async for row in rows():
+            bunk = str(row.bunk_id) if row.bunk_id else "unassigned"
+            if bunk != current:
+                if current is not None:
+                    yield "</section>"
+                current = bunk
+                yield f"<section><h1>{escape(row.bunk_name or 'Unassigned')} &middot; {day}</h1>"
+            msg = _mail_call_message(row)
+            yield (
+                f"<article><h2>{escape(msg['camper_name'])}</h2>"
+                f"<div class=\"from\">From {escape(msg['contact_name'] or 'Unknown')}</div>"
+                f"<p>{escape(msg['message_text']).replace(chr(10), '<br>')}</p></article>"
+            )
+        if current is None:
+            yield "<p>No messages for this day.</p>"
+        else:
+            yield "</section>"
+        yield "</body></html>"
+
+    async def csv_body():
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(["bunk", "camper", "from", "message"])
+        async for row in rows():
+            msg = _mail_call_message(row)
+            writer.writerow([
+                row.bunk_name or "Unassigned",
+                msg["camper_name"],
+                msg["contact_name"] or "",
+                msg["message_text"],
+            ])
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+        yield buf.getvalue()
+
+    if format == "csv":
+        return StreamingResponse(
+            csv_body(),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="mail-call-{day}.csv"'},
         )
-        br = await db.execute(bunk_query)
-        ba_row = br.one_or_none()
-        bunk_name = ba_row[1].name if ba_row else "Unassigned"
-        bunk_id = str(ba_row[1].id) if ba_row else "unassigned"
-
-        if bunk_id not in bunk_groups:
-            bunk_groups[bunk_id] = {"bunk_name": bunk_name, "bunk_id": bunk_id, "messages": []}
-
-        # Resolve names
-        cr = await db.execute(select(Camper.first_name, Camper.last_name).where(Camper.id == msg.camper_id))
-        camper_row = cr.one_or_none()
-
-        bunk_groups[bunk_id]["messages"].append({
-            "id": str(msg.id),
-            "camper_id": str(msg.camper_id),
-            "camper_name": f"{camper_row[0]} {camper_row[1]}" if camper_row else "Unknown",
-            "message_text": msg.message_text,
-            "is_read": msg.is_read,
-            "contact_id": str(msg.contact_id),
-        })
-
-    return {"date": target_date.isoformat(), "bunk_groups": list(bunk_groups.values())}
+    return StreamingResponse(html_body(), media_type="text/html; charset=utf-8")
 
 
 @router.post("", response_model=CamperMessageResponse, status_code=status.HTTP_201_CREATED)
@@ -30,24 +30,35 @@ async def list_campers(
     event_id: Optional[uuid.UUID] = Query(default=None, description="Filter by event"),
     age_min: Optional[int] = Query(default=None, description="Minimum age"),
     age_max: Optional[int] = Query(default=None, description="Maximum age"),
-    skip: int = Query(default=0, ge=0, description="Pagination offset"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    count: str = Query(
+        default="cached",
+        pattern="^(exact|cached|estimate|none)$",
+        description="How to compute total: exact, cached, estimate or none",
+    ),
+    skip: int = Query(default=0, ge=0, description="Pagination offset (ignored with cursor)"),
     limit: int = Query(default=50, ge=1, le=100, description="Page size"),
     current_user: Dict[str, Any] = Depends(
         require_permission("core.campers.read")
     ),
     db: AsyncSession = Depends(get_db),
 ):
-    """List campers with optional filters and pagination."""
-    return await camper_service.list_campers(
-        db,
-        organization_id=current_user["organization_id"],
-        search=search,
-        event_id=event_id,
-        age_min=age_min,
-        age_max=age_max,
-        skip=skip,
-        limit=limit,
-    )
+    """List campers with optional filters and keyset pagination."""
+    try:
+        return await camper_service.list_campers(
+            db,
+            organization_id=current_user["organization_id"],
+            search=search,
+            event_id=event_id,
+            age_min=age_min,
+            age_max=age_max,
+            cursor=cursor,
+            count=count,
+            skip=skip,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get(
@@ -18,6 +18,7 @@ from app.schemas.custom_field import (
     CustomFieldDefinitionUpdate,
     ReorderRequest,
     BulkSaveRequest,
+    BulkValuesRequest,
 )
 from app.services import custom_field_service
 
@@ -130,6 +131,25 @@ async def reorder_definitions(
 # ─── Values ─────────────────────────────────────────────────
 
 
+@router.post("/values/{entity_type}/bulk")
+async def get_values_bulk(
+    entity_type: str,
+    body: BulkValuesRequest,
+    current_user: Dict[str, Any] = Depends(
+        require_permission("core.settings.manage")
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get custom field values for a page of entities, keyed by entity ID."""
+    return await custom_field_service.get_values_bulk(
+        db,
+        organization_id=current_user["organization_id"],
+        entity_type=entity_type,
+        entity_ids=body.entity_ids,
+        list_only=body.list_only,
+    )
+
+
 @router.get("/values/{entity_type}/{entity_id}")
 async def get_values(
     entity_type: str,
@@ -20,7 +20,7 @@ from app.models.camper import Camper
 from app.models.photo import Photo
 from app.models.photo_face_tag import PhotoFaceTag
 from app.schemas.face_tag import CamperPhotoMatch, FaceTagResponse, PhotoFaceTagsResponse
-from app.services import rekognition_service
+from app.services import photo_visibility_service, rekognition_service
 from app.services.photo_service import get_public_url, _get_bucket
 
 router = APIRouter(prefix="/recognition", tags=["Face Recognition"])
@@ -351,6 +351,7 @@ async def reprocess_photo(
             "face_id": match.get("face_id"),
         })
 
+    await photo_visibility_service.sync_photos(db, [photo_id])
     await db.commit()
 
     return {
@@ -454,6 +455,7 @@ async def reprocess_photos_bulk(
                 db.add(new_tag)
                 matches_found += 1
 
+            await photo_visibility_service.sync_photos(db, [photo.id])
             processed += 1
             await db.commit()
         except Exception:
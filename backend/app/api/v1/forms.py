@@ -11,24 +11,31 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, require_permission
-from app.database import get_db
+from app.database import async_session_factory, get_db
 from app.models.form_builder import FormSubmission, FormTemplate
 from app.schemas.form_builder import (
+    FormRevalidateResponse,
     FormSubmissionCreate,
     FormSubmissionListResponse,
     FormSubmissionResponse,
     FormTemplateCreate,
     FormTemplateListItem,
     FormTemplateResponse,
+    FormTemplateStatsResponse,
     FormTemplateUpdate,
 )
+from app.services import form_submission_service, form_validation
 
 router = APIRouter(prefix="/forms", tags=["Form Builder"])
 
+# Submissions loaded per round trip when revalidating a template
+_REVALIDATE_BATCH = 1000
+
 
 # ─── Field Mappings ──────────────────────────────────────────
 
@@ -380,82 +387,223 @@ async def permanently_delete_form_template(
     await db.commit()
 
 
+@router.post("/templates/{template_id}/revalidate", response_model=FormRevalidateResponse)
+async def revalidate_form_submissions(
+    template_id: uuid.UUID,
+    max_results: int = Query(500, ge=1, le=5000),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Re-check existing (non-draft) submissions against the template's current fields."""
+    org_id = current_user["organization_id"]
+    tmpl_result = await db.execute(
+        select(FormTemplate.version, FormTemplate.fields)
+        .where(FormTemplate.id == template_id)
+        .where(FormTemplate.organization_id == org_id)
+        .where(FormTemplate.deleted_at.is_(None))
+    )
+    template = tmpl_result.one_or_none()
+    if not template:
+        raise HTTPException(status_code=404, detail="Form template not found")
+
+    validator = form_validation.get_validator(
+        "form_builder", template_id, template.version, template.fields
+    )
+    checked = 0
+    invalid = 0
+    results = []
+    after: Optional[uuid.UUID] = None
+    while True:
+        query = (
+            select(
+                FormSubmission.id,
+                FormSubmission.answers,
+                FormSubmission.signature_data,
+                FormSubmission.status,
+                FormSubmission.related_entity_type,
+                FormSubmission.related_entity_id,
+            )
+            .where(FormSubmission.template_id == template_id)
+            .where(FormSubmission.organization_id == org_id)
+            .where(FormSubmission.status != "draft")
+            .order_by(FormSubmission.id)
+            .limit(_REVALIDATE_BATCH)
+        )
+        if after is not None:
+            query = query.where(FormSubmission.id > after)
+        rows = (await db.execute(query)).all()
+        if not rows:
+            break
+        for row in rows:
+            checked += 1
+            errors = validator(row.answers or {}, signed=bool(row.signature_data))
+            if errors:
+                invalid += 1
+                if len(results) < max_results:
+                    results.append({
+                        "submission_id": row.id,
+                        "status": row.status,
+                        "related_entity_type": row.related_entity_type,
+                        "related_entity_id": row.related_entity_id,
+                        "errors": errors,
+                    })
+        after = rows[-1].id
+
+    return {
+        "template_id": template_id,
+        "version": template.version or 1,
+        "checked": checked,
+        "invalid": invalid,
+        "results": results,
+    }
+
+
+@router.get("/templates/{template_id}/stats", response_model=FormTemplateStatsResponse)
+async def get_form_template_stats(
+    template_id: uuid.UUID,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Per-option answer counts for the template's choice fields (drafts excluded)."""
+    stats = await form_submission_service.choice_field_stats(
+        db,
+        organization_id=current_user["organization_id"],
+        template_id=template_id,
+    )
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Form template not found")
+    return stats
+
+
 # ─── Submissions ─────────────────────────────────────────────
 
 
+def _submission_response(sub: FormSubmission, template_name: Optional[str]) -> FormSubmissionResponse:
+    return FormSubmissionResponse(
+        id=sub.id,
+        template_id=sub.template_id,
+        template_name=template_name,
+        submitted_by_user_id=sub.submitted_by_user_id,
+        submitted_by_contact_id=sub.submitted_by_contact_id,
+        submitted_by_email=sub.submitted_by_email,
+        related_entity_type=sub.related_entity_type,
+        related_entity_id=sub.related_entity_id,
+        answers=sub.answers,
+        signature_data=sub.signature_data,
+        status=sub.status,
+        ip_address=sub.ip_address,
+        submitted_at=sub.submitted_at,
+        created_at=sub.created_at,
+    )
+
+
+def _submission_filters(
+    current_user: Dict[str, Any],
+    template_id: Optional[uuid.UUID],
+    status_filter: Optional[str],
+    contact_id: Optional[uuid.UUID],
+    camper_id: Optional[uuid.UUID],
+    answer: List[str],
+) -> list:
+    try:
+        answers = form_submission_service.parse_answer_filters(answer)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return form_submission_service.submission_filters(
+        current_user["organization_id"],
+        template_id=template_id,
+        status=status_filter,
+        contact_id=contact_id,
+        camper_id=camper_id,
+        answers=answers,
+    )
+
+
 @router.get("/submissions", response_model=FormSubmissionListResponse)
 async def list_form_submissions(
     template_id: Optional[uuid.UUID] = Query(None),
     status_filter: Optional[str] = Query(None, alias="status"),
     contact_id: Optional[uuid.UUID] = Query(None),
     camper_id: Optional[uuid.UUID] = Query(None),
-    skip: int = Query(0, ge=0),
+    answer: List[str] = Query(
+        default=[],
+        description="Answer filter field_id:value (repeatable, all must match)",
+    ),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    count: str = Query(
+        "exact",
+        pattern="^(exact|estimate|none)$",
+        description="How to compute total: exact, estimate or none",
+    ),
+    skip: int = Query(0, ge=0, description="Pagination offset (ignored with cursor)"),
     limit: int = Query(50, ge=1, le=200),
     current_user: Dict[str, Any] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """List form submissions with filters."""
-    query = (
-        select(FormSubmission)
-        .where(FormSubmission.organization_id == current_user["organization_id"])
+    """List form submissions with filters and keyset pagination."""
+    filters = _submission_filters(
+        current_user, template_id, status_filter, contact_id, camper_id, answer
     )
-    count_query = (
-        select(func.count(FormSubmission.id))
-        .where(FormSubmission.organization_id == current_user["organization_id"])
-    )
-
-    if template_id:
-        query = query.where(FormSubmission.template_id == template_id)
-        count_query = count_query.where(FormSubmission.template_id == template_id)
-    if status_filter:
-        query = query.where(FormSubmission.status == status_filter)
-        count_query = count_query.where(FormSubmission.status == status_filter)
-    if contact_id:
-        query = query.where(FormSubmission.submitted_by_contact_id == contact_id)
-        count_query = count_query.where(FormSubmission.submitted_by_contact_id == contact_id)
-    if camper_id:
-        from sqlalchemy import or_
-        camper_filter = or_(
-            (FormSubmission.related_entity_type == "camper") & (FormSubmission.related_entity_id == str(camper_id)),
-            FormSubmission.submitted_by_contact_id == camper_id,
+    try:
+        page = await form_submission_service.list_submissions(
+            db,
+            filters=filters,
+            cursor=cursor,
+            count=count,
+            skip=skip,
+            limit=limit,
         )
-        query = query.where(camper_filter)
-        count_query = count_query.where(camper_filter)
-
-    total = (await db.execute(count_query)).scalar() or 0
-    result = await db.execute(
-        query.order_by(FormSubmission.created_at.desc()).offset(skip).limit(limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return FormSubmissionListResponse(
+        items=[_submission_response(sub, name) for sub, name in page["items"]],
+        total=page["total"],
+        total_is_estimate=page["total_is_estimate"],
+        next_cursor=page["next_cursor"],
     )
-    submissions = result.scalars().all()
 
-    items = []
-    for s in submissions:
-        # Get template name
-        tmpl_result = await db.execute(
-            select(FormTemplate.name).where(FormTemplate.id == s.template_id)
-        )
-        tmpl_name = tmpl_result.scalar_one_or_none()
 
-        items.append(
-            FormSubmissionResponse(
-                id=s.id,
-                template_id=s.template_id,
-                template_name=tmpl_name,
-                submitted_by_user_id=s.submitted_by_user_id,
-                submitted_by_contact_id=s.submitted_by_contact_id,
-                submitted_by_email=s.submitted_by_email,
-                related_entity_type=s.related_entity_type,
-                related_entity_id=s.related_entity_id,
-                answers=s.answers,
-                signature_data=s.signature_data,
-                status=s.status,
-                ip_address=s.ip_address,
-                submitted_at=s.submitted_at,
-                created_at=s.created_at,
-            )
-        )
+@router.get("/submissions/export")
+async def export_form_submissions(
+    template_id: uuid.UUID = Query(...),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    contact_id: Optional[uuid.UUID] = Query(None),
+    camper_id: Optional[uuid.UUID] = Query(None),
+    answer: List[str] = Query(
+        default=[],
+        description="Answer filter field_id:value (repeatable, all must match)",
+    ),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Stream a template's submissions as CSV, one column per form field."""
+    if async_session_factory is None:
+        raise HTTPException(status_code=503, detail="Database not configured")
 
-    return FormSubmissionListResponse(items=items, total=total)
+    tmpl_result = await db.execute(
+        select(FormTemplate.name, FormTemplate.fields)
+        .where(FormTemplate.id == template_id)
+        .where(FormTemplate.organization_id == current_user["organization_id"])
+        .where(FormTemplate.deleted_at.is_(None))
+    )
+    template = tmpl_result.one_or_none()
+    if not template:
+        raise HTTPException(status_code=404, detail="Form template not found")
+
+    filters = _submission_filters(
+        current_user, template_id, status_filter, contact_id, camper_id, answer
+    )
+    slug = "".join(c if c.isalnum() else "-" for c in template.name.lower()).strip("-")
+    return StreamingResponse(
+        form_submission_service.export_csv(
+            async_session_factory, fields=template.fields, filters=filters
+        ),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="{slug or "form"}-submissions.csv"'
+        },
+    )
 
 
 @router.get("/submissions/{submission_id}", response_model=FormSubmissionResponse)
@@ -477,24 +625,7 @@ async def get_form_submission(
     tmpl_result = await db.execute(
         select(FormTemplate.name).where(FormTemplate.id == sub.template_id)
     )
-    tmpl_name = tmpl_result.scalar_one_or_none()
-
-    return FormSubmissionResponse(
-        id=sub.id,
-        template_id=sub.template_id,
-        template_name=tmpl_name,
-        submitted_by_user_id=sub.submitted_by_user_id,
-        submitted_by_contact_id=sub.submitted_by_contact_id,
-        submitted_by_email=sub.submitted_by_email,
-        related_entity_type=sub.related_entity_type,
-        related_entity_id=sub.related_entity_id,
-        answers=sub.answers,
-        signature_data=sub.signature_data,
-        status=sub.status,
-        ip_address=sub.ip_address,
-        submitted_at=sub.submitted_at,
-        created_at=sub.created_at,
-    )
+    return _submission_response(sub, tmpl_result.scalar_one_or_none())
 
 
 @router.post(
@@ -520,6 +651,23 @@ async def create_form_submission(
     if not template:
         raise HTTPException(status_code=404, detail="Form template not found")
 
+    # Drafts may be incomplete; anything else must satisfy the template
+    if body.status != "draft":
+        try:
+            form_validation.validate_answers(
+                "form_builder",
+                template.id,
+                template.version,
+                template.fields,
+                body.answers,
+                signed=bool(body.signature_data),
+            )
+        except form_validation.FormValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail={"message": str(e), "errors": e.errors},
+            )
+
     # ── Process field mappings ────────────────────────────────
     # If the template has fields with mapping definitions, extract mapped
     # data from the submission answers to create or update Contact/Camper records.
@@ -8,13 +8,16 @@ from __future__ import annotations
 import uuid
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_client_ip, require_permission
 from app.database import get_db
 from app.schemas.health_form import (
     HealthFormAssign,
+    HealthFormBulkAssign,
+    HealthFormBulkAssignResponse,
+    HealthFormRevalidateResponse,
     HealthFormReview,
     HealthFormResponse,
     HealthFormSubmissionResponse,
@@ -24,6 +27,7 @@ from app.schemas.health_form import (
     HealthFormTemplateUpdate,
 )
 from app.services import health_form_service
+from app.services.form_validation import FormValidationError
 
 router = APIRouter(prefix="/health", tags=["Health & Safety"])
 
@@ -154,6 +158,33 @@ async def delete_template(
         )
 
 
+@router.post(
+    "/templates/{template_id}/revalidate",
+    response_model=HealthFormRevalidateResponse,
+)
+async def revalidate_template_submissions(
+    template_id: uuid.UUID,
+    max_results: int = Query(default=500, ge=1, le=5000),
+    current_user: Dict[str, Any] = Depends(
+        require_permission("health.forms.manage")
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Re-check existing submissions of a template against its current fields."""
+    result = await health_form_service.revalidate_submissions(
+        db,
+        organization_id=current_user["organization_id"],
+        template_id=template_id,
+        max_results=max_results,
+    )
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Template not found",
+        )
+    return result
+
+
 # ─── Form Instance Endpoints ──────────────────────────────────
 
 
@@ -183,6 +214,49 @@ async def assign_form(
         )
 
 
+@router.post(
+    "/forms/bulk-assign",
+    response_model=HealthFormBulkAssignResponse,
+)
+async def bulk_assign_forms(
+    body: HealthFormBulkAssign,
+    background_tasks: BackgroundTasks,
+    current_user: Dict[str, Any] = Depends(
+        require_permission("health.forms.manage")
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Assign templates to every camper on an event roster (or camper list).
+
+    Already-assigned forms are skipped. With ``send_reminders``, parents of
+    campers who received new forms are notified after the response.
+    """
+    organization_id = current_user["organization_id"]
+    try:
+        result = await health_form_service.bulk_assign_forms(
+            db,
+            organization_id=organization_id,
+            data=body.model_dump(exclude={"send_reminders"}),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    reminders = result.pop("reminders")
+    if body.send_reminders and reminders:
+        background_tasks.add_task(
+            health_form_service.send_assignment_reminders,
+            organization_id=organization_id,
+            reminders=reminders,
+            event_name=result["event_name"],
+            due_date=result["due_date"],
+        )
+        result["reminders_queued"] = len(reminders)
+    return result
+
+
 @router.get(
     "/forms",
     response_model=List[HealthFormResponse],
@@ -257,6 +331,11 @@ async def submit_form(
             submitted_by=current_user["id"],
             ip_address=ip_address,
         )
+    except FormValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={"message": str(e), "errors": e.errors},
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
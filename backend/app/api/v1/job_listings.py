@@ -8,11 +8,12 @@ from __future__ import annotations
 import uuid
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import require_permission
 from app.database import get_db
+from app.response_cache import cached_response
 from app.schemas.job_listing import (
     JobListingCreate,
     JobListingUpdate,
@@ -126,36 +127,52 @@ async def update_application_status(
 
 @router.get("/public")
 async def list_public_listings(
+    request: Request,
     search: Optional[str] = Query(default=None, description="Search by title"),
     department: Optional[str] = Query(default=None, description="Filter by department"),
     employment_type: Optional[str] = Query(default=None, description="Filter by employment type"),
     db: AsyncSession = Depends(get_db),
 ):
     """List all published job listings (public, no auth)."""
-    return await job_listing_service.list_public_listings(
+    return await cached_response(
+        request,
         db,
-        search=search,
-        department=department,
-        employment_type=employment_type,
+        namespace=job_listing_service.CACHE_NAMESPACE,
+        build=lambda: job_listing_service.list_public_listings(
+            db,
+            search=search,
+            department=department,
+            employment_type=employment_type,
+        ),
     )
 
 
 @router.get("/public/{listing_id}")
 async def get_public_listing(
+    request: Request,
     listing_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Get a single published listing detail (public, no auth)."""
-    result = await job_listing_service.get_public_listing(
+
+    async def build():
+        result = await job_listing_service.get_public_listing(
+            db,
+            listing_id=listing_id,
+        )
+        if result is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Listing not found",
+            )
+        return result
+
+    return await cached_response(
+        request,
         db,
-        listing_id=listing_id,
+        namespace=job_listing_service.CACHE_NAMESPACE,
+        build=build,
     )
-    if result is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Listing not found",
-        )
-    return result
 
 
 @router.post("/public/{listing_id}/apply", status_code=status.HTTP_201_CREATED)
@@ -12,8 +12,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import Boolean as SABoolean, Date as SADate, DateTime as SADateTime
 from sqlalchemy import Integer as SAInteger, Numeric as SANumeric
-from sqlalchemy import String as SAString, and_, cast, func, inspect, or_, select
-from sqlalchemy.dialects.postgresql import JSONB as SAJSONB
+from sqlalchemy import func, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
@@ -26,6 +25,7 @@ from app.schemas.saved_list import (
     PreviewRequest,
     PreviewResponse,
     PreviewResultItem,
+    RefreshListsResponse,
     SavedListCreate,
     SavedListDetailResponse,
     SavedListMemberCreate,
@@ -33,6 +33,7 @@ from app.schemas.saved_list import (
     SavedListResponse,
     SavedListUpdate,
 )
+from app.services import custom_field_service, saved_list_service
 
 router = APIRouter(prefix="/lists", tags=["Saved Lists"])
 
@@ -102,154 +103,56 @@ def _get_filterable_fields_for_model(model) -> list[dict]:
     return fields
 
 
-# ─── Allowed filterable fields per entity type ────────────────
-
-CONTACT_FIELDS = {
-    "first_name", "last_name", "email", "phone", "address",
-    "city", "state", "zip_code", "relationship_type",
-    "notification_preferences", "account_status",
-    "communication_preference", "family_id", "portal_access",
-    "created_at", "updated_at",
-}
-CAMPER_FIELDS = {
-    "first_name", "last_name", "date_of_birth", "gender",
-    "grade", "school", "city", "state",
-    "allergies", "dietary_restrictions", "custom_fields",
-    "family_id", "created_at", "updated_at",
-}
-
-
-def _get_model_and_fields(entity_type: str):
-    """Return the SQLAlchemy model and allowed field set for an entity type."""
-    if entity_type == "camper":
-        return Camper, CAMPER_FIELDS
-    return Contact, CONTACT_FIELDS
-
-
-def _build_filter_query(
-    entity_type: str,
-    criteria: FilterCriteria,
-    organization_id: uuid.UUID,
-):
-    """
-    Build a SQLAlchemy SELECT query from FilterCriteria.
-    Returns (query, model) so callers can execute and interpret results.
-    """
-    model, allowed_fields = _get_model_and_fields(entity_type)
-
-    base_query = (
-        select(model)
-        .where(model.organization_id == organization_id)
-        .where(model.deleted_at.is_(None))
-    )
-
-    if not criteria.groups:
-        return base_query, model
-
-    group_conditions = []
-    for group in criteria.groups:
-        if not group.filters:
-            continue
-        filter_conditions = []
-        for f in group.filters:
-            if f.field not in allowed_fields:
-                continue
-            col = getattr(model, f.field, None)
-            if col is None:
-                continue
-
-            cond = _build_single_condition(col, f.operator, f.value)
-            if cond is not None:
-                filter_conditions.append(cond)
-
-        if filter_conditions:
-            if group.operator.upper() == "OR":
-                group_conditions.append(or_(*filter_conditions))
-            else:
-                group_conditions.append(and_(*filter_conditions))
-
-    if group_conditions:
-        if criteria.group_operator.upper() == "AND":
-            base_query = base_query.where(and_(*group_conditions))
-        else:
-            base_query = base_query.where(or_(*group_conditions))
-
-    return base_query, model
-
-
-def _build_single_condition(col, operator: str, value):
-    """Translate a single filter operator into a SQLAlchemy condition."""
-    op = operator.lower()
-    if op == "equals":
-        return col == value
-    elif op == "not_equals":
-        return col != value
-    elif op == "contains":
-        return cast(col, SAString).ilike(f"%{value}%")
-    elif op == "not_contains":
-        return ~cast(col, SAString).ilike(f"%{value}%")
-    elif op == "starts_with":
-        return cast(col, SAString).ilike(f"{value}%")
-    elif op == "greater_than":
-        return col > value
-    elif op == "less_than":
-        return col < value
-    elif op == "after":
-        return col > value
-    elif op == "before":
-        return col < value
-    elif op == "is_empty":
-        return or_(col.is_(None), cast(col, SAString) == "")
-    elif op == "is_not_empty":
-        return and_(col.isnot(None), cast(col, SAString) != "")
-    elif op == "in_list":
-        if isinstance(value, list):
-            return col.in_(value)
-        return col.in_([v.strip() for v in str(value).split(",")])
-    return None
-
-
 async def _execute_preview(
     db: AsyncSession,
     entity_type: str,
     criteria: FilterCriteria,
     organization_id: uuid.UUID,
     limit: int = 100,
+    sort_field: Optional[str] = None,
+    sort_direction: str = "asc",
 ) -> PreviewResponse:
-    """Run the filter and return a PreviewResponse."""
-    query, model = _build_filter_query(entity_type, criteria, organization_id)
-
-    # Count
-    count_q = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_q)).scalar() or 0
-
-    # Fetch rows (limited)
-    rows_result = await db.execute(query.limit(limit))
-    rows = rows_result.scalars().all()
-
-    results = []
-    for row in rows:
-        name = f"{row.first_name} {row.last_name}"
-        email = getattr(row, "email", None)
-        extra_data: Dict[str, Any] = {}
-        if entity_type == "camper":
-            if row.grade:
-                extra_data["grade"] = row.grade
-            if row.gender:
-                extra_data["gender"] = row.gender
-        else:
-            if row.city:
-                extra_data["city"] = row.city
-            if row.state:
-                extra_data["state"] = row.state
-        results.append(
-            PreviewResultItem(
-                id=row.id,
-                name=name,
-                email=email,
-                extra=extra_data if extra_data else None,
-            )
+    """Run the filter once, with the total carried by a window count."""
+    custom_fields = await custom_field_service.get_definition_map(
+        db, organization_id=organization_id, entity_type=entity_type
+    )
+    query, model = saved_list_service.build_filter_query(
+        entity_type, criteria, organization_id, custom_fields
+    )
+    projection = saved_list_service.member_projection(entity_type, model)
+
+    # Default order is by name; sort_field may name a model column or "cf.<key>"
+    sort_expr = projection[1]
+    _, allowed_fields = saved_list_service.get_model_and_fields(entity_type)
+    prefix = saved_list_service.CUSTOM_FIELD_PREFIX
+    if sort_field and sort_field.startswith(prefix):
+        definition = custom_fields.get(sort_field[len(prefix):])
+        if definition is not None:
+            sort_expr = saved_list_service.custom_field_sort_expression(model, definition)
+    elif sort_field in allowed_fields:
+        sort_expr = getattr(model, sort_field)
+    if sort_direction.lower() == "desc":
+        sort_expr = sort_expr.desc().nulls_last()
+    else:
+        sort_expr = sort_expr.asc().nulls_last()
+
+    rows_result = await db.execute(
+        query.with_only_columns(*projection, func.count().over().label("total"))
+        .order_by(sort_expr, model.id)
+        .limit(limit)
+    )
+    rows = rows_result.all()
+
+    total = rows[0].total if rows else 0
+    results = [
+        PreviewResultItem(
+            id=row.entity_id,
+            name=row.name,
+            email=row.email,
+            extra=row.extra or None,
         )
+        for row in rows
+    ]
 
     return PreviewResponse(
         total_count=total,
@@ -279,6 +182,20 @@ async def get_filterable_fields(
         )
 
     fields = _get_filterable_fields_for_model(model)
+
+    # Custom fields are addressed as "cf.<field_key>"
+    custom_fields = await custom_field_service.get_definition_map(
+        db,
+        organization_id=current_user["organization_id"],
+        entity_type=entity_type,
+    )
+    for key, definition in custom_fields.items():
+        field_type = definition["field_type"]
+        fields.append({
+            "value": f"{saved_list_service.CUSTOM_FIELD_PREFIX}{key}",
+            "label": definition["field_name"],
+            "type": field_type if field_type in ("number", "date", "boolean") else "string",
+        })
     return fields
 
 
@@ -297,16 +214,39 @@ async def preview_filter(
         body.entity_type,
         body.filter_criteria,
         current_user["organization_id"],
+        sort_field=body.sort_field,
+        sort_direction=body.sort_direction,
+    )
+
+
+@router.post("/refresh", response_model=RefreshListsResponse)
+async def refresh_saved_lists(
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Re-materialize dynamic lists whose source campers/contacts changed."""
+    summary = await saved_list_service.refresh_stale_lists(
+        db, organization_id=current_user["organization_id"]
     )
+    return RefreshListsResponse(**summary)
 
 
 @router.post("/{list_id}/preview", response_model=PreviewResponse)
 async def preview_saved_list(
     list_id: uuid.UUID,
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=100, ge=1, le=500),
+    refresh: bool = Query(default=True),
     current_user: Dict[str, Any] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Execute the saved filter criteria of a dynamic list and return matches."""
+    """
+    Page through the materialized members of a dynamic list.
+
+    The snapshot is rebuilt first when the source table changed, unless
+    refresh=false, in which case the existing snapshot is served and
+    is_stale tells the caller whether it is behind.
+    """
     result = await db.execute(
         select(SavedList)
         .where(SavedList.id == list_id)
@@ -323,24 +263,14 @@ async def preview_saved_list(
             detail="Preview is only available for dynamic lists",
         )
 
-    if not saved_list.filter_criteria:
-        return PreviewResponse(
-            total_count=0, results=[], entity_type=saved_list.entity_type
+    try:
+        page = await saved_list_service.get_members_page(
+            db, saved_list, cursor=cursor, limit=limit, refresh=refresh
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    criteria = FilterCriteria(**saved_list.filter_criteria)
-    preview = await _execute_preview(
-        db,
-        saved_list.entity_type,
-        criteria,
-        current_user["organization_id"],
-    )
-
-    # Update the stored member_count to reflect the dynamic count
-    saved_list.member_count = preview.total_count
-    await db.commit()
-
-    return preview
+    return PreviewResponse(**page)
 
 
 @router.get("", response_model=List[SavedListResponse])
@@ -367,6 +297,7 @@ async def list_saved_lists(
             entity_type=sl.entity_type,
             filter_criteria=sl.filter_criteria,
             member_count=sl.member_count,
+            materialized_at=sl.materialized_at,
             created_by=sl.created_by,
             created_at=sl.created_at,
             updated_at=sl.updated_at,
@@ -396,6 +327,11 @@ async def create_saved_list(
     await db.commit()
     await db.refresh(saved_list)
 
+    # Materialize dynamic lists up front so the first view is a page read
+    if saved_list.list_type == "dynamic":
+        await saved_list_service.refresh_list(db, saved_list, force=True)
+        await db.refresh(saved_list)
+
     return SavedListResponse(
         id=saved_list.id,
         name=saved_list.name,
@@ -403,7 +339,8 @@ async def create_saved_list(
         list_type=saved_list.list_type,
         entity_type=saved_list.entity_type,
         filter_criteria=saved_list.filter_criteria,
-        member_count=0,
+        member_count=saved_list.member_count or 0,
+        materialized_at=saved_list.materialized_at,
         created_by=saved_list.created_by,
         created_at=saved_list.created_at,
         updated_at=saved_list.updated_at,
@@ -487,6 +424,11 @@ async def update_saved_list(
     for key, value in update_data.items():
         setattr(saved_list, key, value)
 
+    # A changed definition invalidates the snapshot regardless of source edits
+    if {"list_type", "entity_type", "filter_criteria"} & update_data.keys():
+        saved_list.source_version = None
+        saved_list.materialized_at = None
+
     await db.commit()
     await db.refresh(saved_list)
 
@@ -498,6 +440,7 @@ async def update_saved_list(
         entity_type=saved_list.entity_type,
         filter_criteria=saved_list.filter_criteria,
         member_count=saved_list.member_count,
+        materialized_at=saved_list.materialized_at,
         created_by=saved_list.created_by,
         created_at=saved_list.created_at,
         updated_at=saved_list.updated_at,
@@ -11,11 +11,11 @@ from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from supabase import create_client
 
 from app.api.deps import get_current_user, require_permission
 from app.config import settings
 from app.database import get_db
+from app.metrics import track_provider
 from app.schemas.organization import OrganizationResponse, OrganizationUpdate
 from app.services import org_service
 
@@ -38,6 +38,8 @@ def _get_supabase():
     """Lazy-init Supabase client for storage operations."""
     global _supabase_client
     if _supabase_client is None:
+        from supabase import create_client
+
         _supabase_client = create_client(
             settings.supabase_url,
             settings.supabase_service_role_key,
@@ -139,11 +141,12 @@ async def upload_organization_logo(
     # Upload to Supabase Storage
     try:
         supabase = _get_supabase()
-        supabase.storage.from_(LOGO_BUCKET).upload(
-            path=storage_path,
-            file=content,
-            file_options={"content-type": file.content_type, "upsert": "true"},
-        )
+        with track_provider("supabase_storage", "upload"):
+            supabase.storage.from_(LOGO_BUCKET).upload(
+                path=storage_path,
+                file=content,
+                file_options={"content-type": file.content_type, "upsert": "true"},
+            )
     except Exception as e:
         logger.error(f"Failed to upload logo to Supabase Storage: {e}")
         raise HTTPException(
@@ -165,7 +168,8 @@ async def upload_organization_logo(
         # Attempt to clean up the uploaded file
         try:
             supabase = _get_supabase()
-            supabase.storage.from_(LOGO_BUCKET).remove([storage_path])
+            with track_provider("supabase_storage", "remove"):
+                supabase.storage.from_(LOGO_BUCKET).remove([storage_path])
         except Exception:
             pass
         raise HTTPException(
@@ -9,7 +9,7 @@ from __future__ import annotations
 import uuid
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -194,15 +194,36 @@ async def create_portal_checkout(
 
 @router.get("/photos")
 async def list_my_photos(
+    camper_id: Optional[uuid.UUID] = Query(default=None, description="Only this linked camper"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    limit: int = Query(default=50, ge=1, le=200),
     portal_user: Dict[str, Any] = Depends(get_portal_user),
     db: AsyncSession = Depends(get_db),
-) -> List[Dict[str, Any]]:
-    """List photos for all campers linked to the authenticated parent."""
-    return await portal_service.list_my_photos(
-        db,
-        organization_id=portal_user["organization_id"],
-        camper_ids=portal_user["linked_camper_ids"],
-    )
+) -> Dict[str, Any]:
+    """
+    List photos of the campers linked to the authenticated parent, newest
+    first. Returns ``{"items", "next_cursor"}``; ``next_cursor`` is null on
+    the last page.
+    """
+    camper_ids = portal_user["linked_camper_ids"]
+    if camper_id is not None:
+        if camper_id not in camper_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Camper not found",
+            )
+        camper_ids = [camper_id]
+
+    try:
+        return await portal_service.list_my_photos(
+            db,
+            organization_id=portal_user["organization_id"],
+            camper_ids=camper_ids,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 # ---------------------------------------------------------------------------
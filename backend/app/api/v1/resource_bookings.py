@@ -6,7 +6,7 @@ Full CRUD for resources and bookings.
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import date, datetime, time
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -18,12 +18,16 @@ from app.schemas.resource_booking import (
     BookingCreate,
     BookingResponse,
     BookingUpdate,
+    BulkBookingCreate,
+    BulkBookingResult,
+    ResourceAvailability,
     ResourceCreate,
     ResourceResponse,
     ResourceStats,
     ResourceUpdate,
 )
 from app.services import resource_booking_service
+from app.services.booking_engine import expand_occurrences
 
 router = APIRouter(prefix="/resource-bookings", tags=["Resource Bookings"])
 
@@ -89,6 +93,49 @@ async def get_resource(
     return resource
 
 
+@router.get(
+    "/resources/{resource_id}/availability",
+    response_model=ResourceAvailability,
+)
+async def get_resource_availability(
+    resource_id: uuid.UUID,
+    day: date = Query(..., description="Day to check (any day of the week for span=week)"),
+    span: str = Query(default="day", pattern="^(day|week)$"),
+    tz: str = Query(default="UTC", description="IANA timezone for the day boundaries"),
+    day_start: time = Query(default=time(0, 0), description="Earliest bookable time"),
+    day_end: Optional[time] = Query(default=None, description="Latest bookable time (default midnight)"),
+    min_minutes: int = Query(default=0, ge=0, le=1440, description="Hide free slots shorter than this"),
+    current_user: Dict[str, Any] = Depends(
+        require_permission("core.resources.read")
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Compute free slots for a resource over a day or week."""
+    try:
+        availability = await resource_booking_service.get_availability(
+            db,
+            organization_id=current_user["organization_id"],
+            resource_id=resource_id,
+            day=day,
+            span=span,
+            tz=tz,
+            day_start=day_start,
+            day_end=day_end,
+            min_minutes=min_minutes,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    if availability is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resource not found",
+        )
+    return availability
+
+
 @router.post(
     "/resources",
     response_model=ResourceResponse,
@@ -234,6 +281,49 @@ async def create_booking(
         )
 
 
+@router.post("/bookings/bulk", response_model=BulkBookingResult)
+async def bulk_create_bookings(
+    body: BulkBookingCreate,
+    current_user: Dict[str, Any] = Depends(
+        require_permission("core.resources.update")
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Check and reserve many occurrences in one request.
+    Returns every conflict found; nothing is booked if any occurrence
+    conflicts unless allow_partial is set.
+    """
+    try:
+        slots = expand_occurrences(
+            [o.model_dump() for o in body.occurrences],
+            body.repeat.model_dump() if body.repeat else None,
+        )
+        result = await resource_booking_service.reserve_occurrences(
+            db,
+            organization_id=current_user["organization_id"],
+            booked_by=current_user["id"],
+            resource_id=body.resource_id,
+            title=body.title,
+            notes=body.notes,
+            status=body.status,
+            slots=slots,
+            allow_partial=body.allow_partial,
+            dry_run=body.dry_run,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    if result["conflicts"] and not result["created"] and not body.dry_run:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=BulkBookingResult(**result).model_dump(mode="json"),
+        )
+    return result
+
+
 @router.put("/bookings/{booking_id}", response_model=BookingResponse)
 async def update_booking(
     booking_id: uuid.UUID,
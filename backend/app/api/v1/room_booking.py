@@ -6,6 +6,7 @@ Full CRUD for rooms/spaces and their bookings.
 from __future__ import annotations
 
 import uuid
+from datetime import date, time
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -17,12 +18,16 @@ from app.schemas.room_booking import (
     BookingCreate,
     BookingResponse,
     BookingUpdate,
+    BulkBookingCreate,
+    BulkBookingResult,
+    RoomAvailability,
     RoomBookingStats,
     RoomCreate,
     RoomResponse,
     RoomUpdate,
 )
 from app.services import room_booking_service
+from app.services.booking_engine import expand_occurrences
 
 router = APIRouter(prefix="/room-booking", tags=["Room Booking"])
 
@@ -92,6 +97,46 @@ async def update_room(
     return result
 
 
+@router.get("/rooms/{room_id}/availability", response_model=RoomAvailability)
+async def get_room_availability(
+    room_id: uuid.UUID,
+    day: date = Query(..., description="Day to check (any day of the week for span=week)"),
+    span: str = Query(default="day", pattern="^(day|week)$"),
+    tz: str = Query(default="UTC", description="IANA timezone for the day boundaries"),
+    day_start: time = Query(default=time(0, 0), description="Earliest bookable time"),
+    day_end: Optional[time] = Query(default=None, description="Latest bookable time (default midnight)"),
+    min_minutes: int = Query(default=0, ge=0, le=1440, description="Hide free slots shorter than this"),
+    current_user: Dict[str, Any] = Depends(
+        require_permission("core.rooms.read")
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Compute free slots for a room over a day or week."""
+    try:
+        availability = await room_booking_service.get_availability(
+            db,
+            org_id=current_user["organization_id"],
+            room_id=room_id,
+            day=day,
+            span=span,
+            tz=tz,
+            day_start=day_start,
+            day_end=day_end,
+            min_minutes=min_minutes,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    if availability is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Room not found",
+        )
+    return availability
+
+
 @router.delete("/rooms/{room_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_room(
     room_id: uuid.UUID,
@@ -164,6 +209,47 @@ async def create_booking(
         )
 
 
+@router.post("/bookings/bulk", response_model=BulkBookingResult)
+async def bulk_create_bookings(
+    body: BulkBookingCreate,
+    current_user: Dict[str, Any] = Depends(
+        require_permission("core.rooms.update")
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Check and reserve many occurrences in one request.
+    Returns every conflict found; nothing is booked if any occurrence
+    conflicts unless allow_partial is set.
+    """
+    try:
+        slots = expand_occurrences(
+            [o.model_dump() for o in body.occurrences],
+            body.repeat.model_dump() if body.repeat else None,
+        )
+        result = await room_booking_service.reserve_occurrences(
+            db,
+            org_id=current_user["organization_id"],
+            data=body.model_dump(
+                exclude={"occurrences", "repeat", "allow_partial", "dry_run"}
+            ),
+            slots=slots,
+            allow_partial=body.allow_partial,
+            dry_run=body.dry_run,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    if result["conflicts"] and not result["created"] and not body.dry_run:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=BulkBookingResult(**result).model_dump(mode="json"),
+        )
+    return result
+
+
 @router.put("/bookings/{booking_id}", response_model=BookingResponse)
 async def update_booking(
     booking_id: uuid.UUID,
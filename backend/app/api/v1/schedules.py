@@ -27,6 +27,7 @@ from app.schemas.schedule_assignment import (
     CamperWeeklySchedule,
     StaffAssignmentCreate,
     StaffAssignmentResponse,
+    StaffWeeklyHours,
     StaffWeeklySchedule,
 )
 from app.services import schedule_service
@@ -189,6 +190,27 @@ async def assign_camper_to_activity(
         )
 
 
+@router.get(
+    "/staff-hours",
+    response_model=List[StaffWeeklyHours],
+)
+async def get_staff_weekly_hours(
+    event_id: uuid.UUID = Query(..., description="Event ID (required)"),
+    start_date: date = Query(..., description="Week start date (Monday)"),
+    current_user: Dict[str, Any] = Depends(
+        require_permission("scheduling.sessions.read")
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get scheduled hours per staff member for the week, aggregated in SQL."""
+    return await schedule_service.get_staff_weekly_hours(
+        db,
+        organization_id=current_user["organization_id"],
+        event_id=event_id,
+        start_date=start_date,
+    )
+
+
 @router.get(
     "/staff/{staff_id}/weekly",
     response_model=StaffWeeklySchedule,
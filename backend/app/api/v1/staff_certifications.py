@@ -6,7 +6,7 @@ Manage certification types and staff certification records.
 from __future__ import annotations
 
 import uuid
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
@@ -15,16 +15,19 @@ from sqlalchemy.orm import selectinload
 
 from app.api.deps import require_permission
 from app.database import get_db
+from app.models.compliance_summary import ComplianceSummary
 from app.models.staff_certification import CertificationType, StaffCertificationRecord
 from app.models.user import User
 from app.schemas.staff_certification import (
     CertificationTypeCreate,
     CertificationTypeResponse,
     CertificationTypeUpdate,
+    ComplianceSummaryResponse,
     StaffCertificationCreate,
     StaffCertificationResponse,
     StaffCertificationUpdate,
 )
+from app.services import compliance_service
 
 router = APIRouter(prefix="/staff", tags=["Staff Certifications"])
 
@@ -142,6 +145,62 @@ async def delete_certification_type(
     await db.commit()
 
 
+# ─── Compliance Summary ──────────────────────────────────────
+
+
+_NO_SUMMARY = "No compliance summary yet: the organization has no active staff"
+
+
+async def _load_summary(db: AsyncSession, org_id: uuid.UUID) -> Optional[ComplianceSummary]:
+    result = await db.execute(
+        select(ComplianceSummary).where(ComplianceSummary.organization_id == org_id)
+    )
+    return result.scalar_one_or_none()
+
+
+@router.get(
+    "/certifications/compliance-summary",
+    response_model=ComplianceSummaryResponse,
+)
+async def get_compliance_summary(
+    current_user: Dict[str, Any] = Depends(
+        require_permission("staff.employees.read")
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Staff compliance counts and the soonest upcoming expiries, as of the
+    last scan (see ``computed_at``). Scans the organization on first use.
+    """
+    org_id = current_user["organization_id"]
+    summary = await _load_summary(db, org_id)
+    if summary is None:
+        await compliance_service.run_scan(db, organization_id=org_id)
+        summary = await _load_summary(db, org_id)
+    if summary is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=_NO_SUMMARY)
+    return summary
+
+
+@router.post(
+    "/certifications/compliance-scan",
+    response_model=ComplianceSummaryResponse,
+)
+async def run_compliance_scan(
+    current_user: Dict[str, Any] = Depends(
+        require_permission("staff.employees.update")
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Re-scan the organization now (e.g. after bulk certification updates)."""
+    org_id = current_user["organization_id"]
+    await compliance_service.run_scan(db, organization_id=org_id)
+    summary = await _load_summary(db, org_id)
+    if summary is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=_NO_SUMMARY)
+    return summary
+
+
 # ─── Staff Certification Records ─────────────────────────────
 
 
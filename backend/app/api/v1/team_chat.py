@@ -1,6 +1,6 @@
 """
 Camp Connect - Team Chat API Endpoints
-Full CRUD for channels and messages.
+Full CRUD for channels and messages, plus a WebSocket for live updates.
 """
 
 from __future__ import annotations
@@ -8,11 +8,14 @@ from __future__ import annotations
 import uuid
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, WebSocket, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import require_permission
+from app import realtime
+from app.api.deps import get_current_user, require_permission
 from app.database import get_db
+from app.middleware.auth import verify_supabase_token
 from app.schemas.team_chat import (
     ChatChannelCreate,
     ChatChannelResponse,
@@ -40,7 +43,7 @@ async def list_channels(
     db: AsyncSession = Depends(get_db),
 ):
     """List all channels for the current organization."""
-    return await team_chat_service.list_channels(current_user["organization_id"])
+    return await team_chat_service.list_channels(db, current_user["organization_id"])
 
 
 @router.get(
@@ -54,7 +57,7 @@ async def get_channel(
 ):
     """Get a single channel by ID."""
     channel = await team_chat_service.get_channel(
-        current_user["organization_id"], channel_id,
+        db, current_user["organization_id"], channel_id,
     )
     if channel is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Channel not found")
@@ -73,9 +76,10 @@ async def create_channel(
 ):
     """Create a new chat channel."""
     return await team_chat_service.create_channel(
+        db,
         current_user["organization_id"],
         body.model_dump(),
-        created_by=str(current_user["user_id"]),
+        created_by=str(current_user["id"]),
     )
 
 
@@ -91,6 +95,7 @@ async def update_channel(
 ):
     """Update a channel."""
     channel = await team_chat_service.update_channel(
+        db,
         current_user["organization_id"],
         channel_id,
         body.model_dump(exclude_unset=True),
@@ -111,7 +116,7 @@ async def delete_channel(
 ):
     """Delete a channel and its messages."""
     deleted = await team_chat_service.delete_channel(
-        current_user["organization_id"], channel_id,
+        db, current_user["organization_id"], channel_id,
     )
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Channel not found")
@@ -129,13 +134,27 @@ async def delete_channel(
 )
 async def list_messages(
     channel_id: str,
+    response: Response,
     before: Optional[str] = Query(default=None, description="ISO timestamp cursor for pagination"),
+    cursor: Optional[str] = Query(default=None, description="X-Next-Cursor from the previous page"),
     limit: int = Query(default=50, ge=1, le=100),
     current_user: Dict[str, Any] = Depends(require_permission("comms.messages.read")),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get messages in a channel."""
-    return await team_chat_service.get_messages(channel_id, before=before, limit=limit)
+    """
+    Get messages in a channel, oldest first. When older messages exist the
+    cursor for the previous page is returned in the ``X-Next-Cursor`` header.
+    """
+    try:
+        messages, next_cursor = await team_chat_service.get_messages(
+            db, current_user["organization_id"], channel_id,
+            before=before, cursor=cursor, limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return messages
 
 
 @router.post(
@@ -151,14 +170,18 @@ async def send_message(
 ):
     """Send a message in a channel."""
     user = current_user
-    return await team_chat_service.send_message(
+    msg = await team_chat_service.send_message(
+        db,
         channel_id=channel_id,
         org_id=user["organization_id"],
-        sender_id=str(user["user_id"]),
+        sender_id=str(user["id"]),
         sender_name=f"{user.get('first_name', '')} {user.get('last_name', '')}".strip() or user.get("email", "User"),
         sender_avatar=user.get("avatar_url"),
         data=body.model_dump(),
     )
+    if msg is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Channel not found")
+    return msg
 
 
 # ---------------------------------------------------------------------------
@@ -178,7 +201,9 @@ async def pin_message(
     db: AsyncSession = Depends(get_db),
 ):
     """Pin or unpin a message."""
-    msg = await team_chat_service.pin_message(channel_id, message_id, pinned)
+    msg = await team_chat_service.pin_message(
+        db, current_user["organization_id"], channel_id, message_id, pinned,
+    )
     if msg is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Message not found")
     return msg
@@ -197,7 +222,7 @@ async def react_to_message(
 ):
     """Toggle a reaction on a message."""
     msg = await team_chat_service.add_reaction(
-        channel_id, message_id, emoji, str(current_user["user_id"]),
+        db, current_user["organization_id"], channel_id, message_id, emoji, str(current_user["id"]),
     )
     if msg is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Message not found")
@@ -214,7 +239,9 @@ async def get_pinned_messages(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all pinned messages in a channel."""
-    return await team_chat_service.get_pinned_messages(channel_id)
+    return await team_chat_service.get_pinned_messages(
+        db, current_user["organization_id"], channel_id,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -232,7 +259,8 @@ async def get_unread_counts(
 ):
     """Get unread message counts per channel for the current user."""
     return await team_chat_service.get_unread_counts(
-        str(current_user["user_id"]),
+        db,
+        str(current_user["id"]),
         current_user["organization_id"],
     )
 
@@ -247,7 +275,9 @@ async def mark_channel_read(
     db: AsyncSession = Depends(get_db),
 ):
     """Mark a channel as read for the current user."""
-    await team_chat_service.mark_as_read(str(current_user["user_id"]), channel_id)
+    await team_chat_service.mark_as_read(
+        db, str(current_user["id"]), current_user["organization_id"], channel_id,
+    )
     return None
 
 
@@ -268,5 +298,41 @@ async def search_messages(
 ):
     """Search messages across all channels."""
     return await team_chat_service.search_messages(
-        current_user["organization_id"], q, limit=limit,
+        db, current_user["organization_id"], q, limit=limit,
     )
+
+
+# ---------------------------------------------------------------------------
+# Live updates
+# ---------------------------------------------------------------------------
+
+
+@router.websocket("/ws")
+async def chat_socket(
+    websocket: WebSocket,
+    access_token: str = Query(..., description="Supabase access token"),
+):
+    """
+    Push new messages, pins and reactions for the organization's channels.
+    Each frame is JSON: ``{"event", "channel_id", "message"}``; ``message``
+    is omitted (with ``message_id`` set) when too large to push.
+    """
+    from app.database import async_session_factory
+
+    try:
+        payload = await verify_supabase_token(
+            HTTPAuthorizationCredentials(scheme="Bearer", credentials=access_token)
+        )
+        async with async_session_factory() as session:
+            user = await get_current_user(websocket, payload, session)
+        await require_permission("comms.messages.read")(user)
+        sub = realtime.subscribe_chat(user["organization_id"], user["id"])
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    except realtime.RegistryFull:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+
+    await websocket.accept()
+    await realtime.serve_socket(websocket, sub)
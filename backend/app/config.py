@@ -19,6 +19,8 @@ class Settings(BaseSettings):
 
     # Database (direct Postgres connection to Supabase)
     database_url: str = ""
+    # Optional read replica used for heavy read-only work (AI Insights queries)
+    database_replica_url: str = ""
 
     # Application
     app_name: str = "Camp Connect"
@@ -41,11 +43,78 @@ class Settings(BaseSettings):
     stripe_publishable_key: str = ""
     stripe_webhook_secret: str = ""
 
+    # Checkr (background checks). The API key also signs webhooks; without
+    # it there is no provider and checks are not synced
+    checkr_api_key: str = ""
+    # Development/tests only: simulate provider progression (every open
+    # check ends up complete/clear). Never enable in production
+    background_check_fake_provider: bool = False
+
     # Anthropic (Claude AI Insights)
     anthropic_api_key: str = ""
     ai_model: str = "claude-sonnet-4-5"
     ai_max_tokens: int = 4096
 
+    # AI Insights query sandbox (limits for model-generated SQL)
+    ai_query_timeout_ms: int = 15000
+    ai_query_work_mem: str = "16MB"
+    ai_query_max_cost: float = 500000.0
+    ai_query_row_limit: int = 500
+
+    # Per-request SQL instrumentation (query count, DB time, Server-Timing,
+    # N+1 warnings when one statement shape repeats more than the threshold)
+    sql_instrumentation_enabled: bool = False
+    sql_n_plus_one_threshold: int = 10
+
+    # Defer importing SDK-backed / admin routers until their first request
+    # (see app.api.registry); disable to import every router at startup
+    lazy_routers: bool = True
+
+    # Observability: /metrics (Prometheus text format; requires the bearer
+    # token, so it stays closed until METRICS_TOKEN is set)
+    # and the cache lifetime of the /api/v1/health probe
+    metrics_enabled: bool = True
+    metrics_token: str = ""
+    health_cache_seconds: int = 15
+
+    # Seconds a cached response version (ETag) is trusted before the cheap
+    # version query runs again (see app.response_cache)
+    response_cache_ttl: int = 30
+
+    # Seconds a resolved parent-portal context (contact, portal access,
+    # linked campers) is reused before it is looked up again
+    # (see app.services.portal_service)
+    portal_context_cache_ttl: int = 30
+
+    # Weather: background refresh of conditions/forecasts for orgs with a
+    # session in progress (see app.services.weather_service)
+    weather_prefetch_enabled: bool = True
+    weather_prefetch_interval: int = 600
+
+    # Audit log writer: buffered events are bulk-inserted every interval or
+    # once batch_size are waiting; beyond buffer_max the oldest are dropped
+    audit_flush_interval_ms: int = 500
+    audit_flush_batch_size: int = 500
+    audit_buffer_max: int = 20000
+
+    # Alert push (SSE over LISTEN/NOTIFY): open streams allowed per worker
+    # and per user, and the idle heartbeat interval
+    realtime_max_connections: int = 1000
+    realtime_max_connections_per_user: int = 5
+    realtime_heartbeat_seconds: int = 25
+
+    # Background-check sync: poll pending/processing checks every interval,
+    # this many provider calls at a time
+    background_check_sync_enabled: bool = True
+    background_check_sync_interval: int = 900
+    background_check_sync_concurrency: int = 8
+
+    # Compliance scanner: expiry scan of certifications and background checks;
+    # items within the window are "expiring" (see app.services.compliance_service)
+    compliance_scan_enabled: bool = True
+    compliance_scan_interval: int = 86400
+    compliance_expiry_window_days: int = 30
+
     # AWS Rekognition (facial recognition for camper photos)
     aws_access_key_id: str = ""
     aws_secret_access_key: str = ""
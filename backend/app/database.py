@@ -39,8 +39,24 @@ def create_engine() -> Optional[AsyncEngine]:
     )
 
 
+def create_replica_engine() -> Optional[AsyncEngine]:
+    """Create the read-replica engine if DATABASE_REPLICA_URL is configured."""
+    if not settings.database_replica_url:
+        return None
+    return create_async_engine(
+        _get_async_url(settings.database_replica_url),
+        echo=settings.debug,
+        pool_size=2,
+        max_overflow=3,
+        pool_pre_ping=True,
+    )
+
+
 engine: Optional[AsyncEngine] = create_engine()
 
+# Read replica — None when not configured; callers fall back to `engine`
+replica_engine: Optional[AsyncEngine] = create_replica_engine()
+
 # Session factory — will be None if no engine
 async_session_factory: Optional[async_sessionmaker] = None
 if engine is not None:
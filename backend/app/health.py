@@ -0,0 +1,92 @@
+"""
+Camp Connect - Health Probe
+Async, cached connectivity checks behind ``GET /api/v1/health``.
+
+The database and JWKS checks run concurrently with short timeouts, and the
+combined result is cached for ``settings.health_cache_seconds`` so frequent
+load-balancer probes neither block the event loop nor hammer Supabase.
+Concurrent callers during a refresh share a single in-flight probe.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import text
+
+from app.config import settings
+from app.database import engine
+from app.metrics import track_provider
+
+_DB_TIMEOUT = 3.0
+_JWKS_TIMEOUT = 5.0
+
+_cached: Optional[Dict[str, Any]] = None
+_cached_at: float = 0.0
+_lock = asyncio.Lock()
+
+
+async def _check_database() -> Tuple[bool, Optional[str]]:
+    if engine is None:
+        return False, None
+    try:
+        async with engine.connect() as conn:
+            await asyncio.wait_for(conn.execute(text("SELECT 1")), _DB_TIMEOUT)
+        return True, None
+    except Exception as e:
+        return False, f"DB: {type(e).__name__}: {str(e)}"
+
+
+async def _check_jwks() -> Tuple[bool, Optional[str]]:
+    if not settings.supabase_url:
+        return False, None
+    jwks_url = f"{settings.supabase_url}/auth/v1/.well-known/jwks.json"
+    try:
+        with track_provider("supabase_auth", "jwks"):
+            async with httpx.AsyncClient(timeout=_JWKS_TIMEOUT) as client:
+                resp = await client.get(jwks_url)
+                resp.raise_for_status()
+        return True, None
+    except Exception as e:
+        return False, f"JWKS: {type(e).__name__}: {str(e)}"
+
+
+async def _probe() -> Dict[str, Any]:
+    (db_live, db_error), (jwks_ok, jwks_error) = await asyncio.gather(
+        _check_database(), _check_jwks()
+    )
+    errors: List[str] = [e for e in (db_error, jwks_error) if e]
+    return {
+        "status": "healthy" if db_live else "degraded",
+        "database_configured": engine is not None,
+        "database_live": db_live,
+        "jwks_reachable": jwks_ok,
+        "supabase_url_set": bool(settings.supabase_url),
+        "jwt_secret_set": bool(settings.supabase_jwt_secret),
+        "aws_rekognition_configured": bool(settings.aws_access_key_id),
+        "errors": errors,
+    }
+
+
+async def get_health(max_age: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Return the latest health report, probing again when the cached one is
+    older than ``max_age`` seconds (default ``settings.health_cache_seconds``).
+    """
+    global _cached, _cached_at
+    ttl = settings.health_cache_seconds if max_age is None else max_age
+
+    if _cached is not None and time.monotonic() - _cached_at < ttl:
+        return {**_cached, "cached": True}
+
+    async with _lock:
+        # Another request may have refreshed it while we waited
+        if _cached is not None and time.monotonic() - _cached_at < ttl:
+            return {**_cached, "cached": True}
+        report = await _probe()
+        report["checked_at"] = time.time()
+        _cached, _cached_at = report, time.monotonic()
+    return {**report, "cached": False}
@@ -0,0 +1,331 @@
+"""
+Camp Connect - In-Process Metrics
+Minimal Prometheus-compatible registry, rendered at ``GET /metrics``.
+
+Instruments are plain Python objects: a labelled child is created once per
+label combination and cached in a dict, after which recording is an index
+lookup and an integer add. There are no locks; updates happen on the event
+loop thread (or, for boto3 calls run in worker threads, under the GIL), so
+a rare lost increment from a thread race is accepted in exchange for zero
+contention on the request path. Gauges are collected by callbacks at
+scrape time and cost nothing between scrapes.
+
+Instruments defined here:
+
+- ``http_requests_total`` / ``http_request_duration_seconds``: per route
+  template, filled by ``app.middleware.metrics.MetricsMiddleware``
+- ``db_pool_*``: connection pool gauges for the primary and replica engines
+- ``provider_request_duration_seconds`` / ``provider_errors_total``: calls
+  to external providers, via ``track_provider``
+- ``cache_requests_total`` / ``cache_hit_ratio``: in-process caches, via
+  ``record_cache``
+"""
+
+from __future__ import annotations
+
+import secrets
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+Labels = Tuple[str, ...]
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_str(names: Sequence[str], values: Labels, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _fmt(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    def render(self) -> List[str]:  # pragma: no cover - overridden
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter keyed by label values."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        values = self._values
+        values[labels] = values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def items(self) -> Iterable[Tuple[Labels, float]]:
+        return list(self._values.items())
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, value in self.items():
+            lines.append(f"{self.name}{_label_str(self.labelnames, labels)} {_fmt(value)}")
+        return lines
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram; ``labels(...)`` returns a cached child."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._children: Dict[Labels, _HistogramChild] = {}
+
+    def labels(self, *labels: str) -> _HistogramChild:
+        child = self._children.get(labels)
+        if child is None:
+            child = self._children.setdefault(labels, _HistogramChild(self.buckets))
+        return child
+
+    def observe(self, value: float, *labels: str) -> None:
+        self.labels(*labels).observe(value)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, child in list(self._children.items()):
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), list(child.counts)):
+                cumulative += n
+                le = f'le="{_fmt(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_label_str(self.labelnames, labels, le)} {cumulative}"
+                )
+            label_str = _label_str(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_fmt(round(child.sum, 6))}")
+            lines.append(f"{self.name}_count{label_str} {child.count}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Gauge whose samples are produced by a callback at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], Iterable[Tuple[Labels, float]]]] = None,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.collect = collect
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        if self.collect is None:
+            return lines
+        for labels, value in self.collect():
+            lines.append(f"{self.name}{_label_str(self.labelnames, labels)} {_fmt(value)}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render() -> str:
+    """Render every registered metric in the Prometheus text format."""
+    return REGISTRY.render()
+
+
+def scrape_authorized(authorization: str, token: str) -> bool:
+    """
+    Whether a scrape with this ``Authorization`` header may read metrics.
+    Without a configured token nobody may: the endpoint is closed by default.
+    """
+    if not token:
+        return False
+    return secrets.compare_digest(authorization or "", f"Bearer {token}")
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+http_requests_total = REGISTRY.register(Counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status code.",
+    ("method", "route", "status"),
+))
+http_request_duration_seconds = REGISTRY.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template.",
+    ("method", "route"),
+))
+
+
+# ---------------------------------------------------------------------------
+# Database pools
+# ---------------------------------------------------------------------------
+
+def _pool_samples(attr: str) -> Iterable[Tuple[Labels, float]]:
+    from app.database import engine, replica_engine
+
+    for name, eng in (("primary", engine), ("replica", replica_engine)):
+        if eng is None:
+            continue
+        fn = getattr(eng.sync_engine.pool, attr, None)
+        if callable(fn):
+            yield (name,), fn()
+
+
+for _attr, _doc in (
+    ("size", "Configured pool size."),
+    ("checkedout", "Connections currently checked out."),
+    ("checkedin", "Idle connections in the pool."),
+    ("overflow", "Connections open beyond pool size (negative while below it)."),
+):
+    REGISTRY.register(Gauge(
+        f"db_pool_{_attr}",
+        _doc,
+        ("engine",),
+        collect=lambda _attr=_attr: _pool_samples(_attr),
+    ))
+
+
+# ---------------------------------------------------------------------------
+# External providers
+# ---------------------------------------------------------------------------
+
+provider_request_duration_seconds = REGISTRY.register(Histogram(
+    "provider_request_duration_seconds",
+    "Latency of calls to external providers.",
+    ("provider", "operation"),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0),
+))
+provider_errors_total = REGISTRY.register(Counter(
+    "provider_errors_total",
+    "Failed calls to external providers.",
+    ("provider", "operation"),
+))
+
+
+@contextmanager
+def track_provider(provider: str, operation: str) -> Iterator[None]:
+    """
+    Time a call to an external provider; exceptions are counted as errors
+    and re-raised. Usable from sync and async code::
+
+        with track_provider("twilio", "send_sms"):
+            client.messages.create(...)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        provider_errors_total.inc(provider, operation)
+        raise
+    finally:
+        provider_request_duration_seconds.labels(provider, operation).observe(
+            time.perf_counter() - started
+        )
+
+
+# ---------------------------------------------------------------------------
+# Caches
+# ---------------------------------------------------------------------------
+
+cache_requests_total = REGISTRY.register(Counter(
+    "cache_requests_total",
+    "In-process cache lookups by cache and result (hit/miss).",
+    ("cache", "result"),
+))
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count one lookup against an in-process cache."""
+    cache_requests_total.inc(cache, "hit" if hit else "miss")
+
+
+def _hit_ratios() -> Iterable[Tuple[Labels, float]]:
+    totals: Dict[str, List[float]] = {}
+    for (cache, result), value in cache_requests_total.items():
+        hits_misses = totals.setdefault(cache, [0, 0])
+        hits_misses[0 if result == "hit" else 1] += value
+    for cache, (hits, misses) in totals.items():
+        yield (cache,), round(hits / (hits + misses), 4) if hits + misses else 0
+
+
+REGISTRY.register(Gauge(
+    "cache_hit_ratio",
+    "Hit ratio of in-process caches since process start.",
+    ("cache",),
+    collect=_hit_ratios,
+))
@@ -0,0 +1,48 @@
+"""
+Camp Connect - Request Metrics Middleware
+Records per-route request counts and latency into app.metrics.
+
+Pure ASGI, like QueryStatsMiddleware, so streaming responses pass through
+untouched. The route label is the matched route template (e.g.
+``/api/v1/campers/{camper_id}``), read from the scope after routing, so
+label cardinality is bounded by the number of routes. Requests that match
+no route are labelled ``unmatched``.
+"""
+
+from __future__ import annotations
+
+import time
+
+from app.metrics import http_request_duration_seconds, http_requests_total
+
+_UNMATCHED = "unmatched"
+
+
+class MetricsMiddleware:
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            template = getattr(route, "path_format", None) or getattr(route, "path", None) or _UNMATCHED
+            method = scope["method"]
+            http_requests_total.inc(method, template, str(status_code))
+            http_request_duration_seconds.labels(method, template).observe(
+                time.perf_counter() - started
+            )
@@ -0,0 +1,197 @@
+"""
+Camp Connect - Per-Request SQL Instrumentation
+Counts queries and database time per request, flags N+1 patterns and
+reports both in a ``Server-Timing`` response header.
+
+Enabled with ``SQL_INSTRUMENTATION_ENABLED=true``. ``install_query_stats``
+attaches ``before_cursor_execute`` / ``after_cursor_execute`` (and
+``handle_error``, for failed statements) listeners to an async engine;
+``QueryStatsMiddleware`` opens a fresh ``QueryStats`` in a context variable
+for each HTTP request. SQLAlchemy runs the listeners in a greenlet that
+inherits the caller's context, so they see the request's stats object.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PARAM = re.compile(r"\$\d+|%\([^)]+\)s|(?<![:\w]):\w+")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN \((?:\s*\?\s*,)*\s*\?\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES (\([^()]*\))(?:\s*,\s*\([^()]*\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """
+    Reduce a SQL statement to its shape: literals and bind parameters
+    become ``?``, IN lists and multi-row VALUES collapse, whitespace is
+    normalised. Two executions with the same fingerprint differ only in
+    their parameters.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PARAM.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _WHITESPACE.sub(" ", shape).strip()
+    shape = _IN_LIST.sub("IN (...)", shape)
+    shape = _VALUES_LIST.sub(r"VALUES \1, ...", shape)
+    return shape
+
+
+class QueryStats:
+    """Queries executed during one request (or any tracked block)."""
+
+    __slots__ = ("count", "db_time_ms", "shapes", "started")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.db_time_ms = 0.0
+        self.shapes: Counter[str] = Counter()
+        self.started = time.perf_counter()
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.db_time_ms += elapsed_ms
+        self.shapes[fingerprint(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed more than ``threshold`` times."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self) -> str:
+        """Render the ``Server-Timing`` header value."""
+        return (
+            f'db;dur={self.db_time_ms:.1f};desc="{self.count} queries", '
+            f"app;dur={self.elapsed_ms:.1f}"
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "query_count": self.count,
+            "db_time_ms": round(self.db_time_ms, 3),
+            "distinct_statements": len(self.shapes),
+        }
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_stats() -> Optional[QueryStats]:
+    """The QueryStats collecting for the current request, if any."""
+    return _current.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect query stats for the enclosed block (used by the bench suite)."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# Engine hooks
+# ---------------------------------------------------------------------------
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_stats_start")
+    if not starts:
+        return
+    stats.record(statement, (time.perf_counter() - starts.pop()) * 1000)
+
+
+def _handle_error(context) -> None:
+    # after_cursor_execute does not run for a failed statement; drop its start
+    conn = context.connection
+    if conn is None or context.execution_context is None:
+        return
+    starts = conn.info.get("query_stats_start")
+    if starts:
+        starts.pop()
+
+
+def install_query_stats(engine: Optional[AsyncEngine]) -> None:
+    """Attach the cursor listeners to an async engine (idempotent)."""
+    if engine is None:
+        return
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(sync_engine, "handle_error", _handle_error)
+
+
+# ---------------------------------------------------------------------------
+# ASGI middleware
+# ---------------------------------------------------------------------------
+
+class QueryStatsMiddleware:
+    """
+    Pure ASGI middleware (so streaming responses are untouched) that
+    tracks queries per HTTP request, adds a ``Server-Timing`` header and
+    logs a warning when one statement shape repeats more than
+    ``n_plus_one_threshold`` times.
+    """
+
+    def __init__(self, app, *, n_plus_one_threshold: int = 10) -> None:
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            for shape, n in stats.repeated(self.n_plus_one_threshold):
+                logger.warning(
+                    "Possible N+1 on %s %s: statement executed %d times (%d queries, %.1fms DB): %s",
+                    scope.get("method"),
+                    scope.get("path"),
+                    n,
+                    stats.count,
+                    stats.db_time_ms,
+                    shape[:300],
+                )
@@ -57,7 +57,7 @@ from app.models.workflow import (
 
 # Phase 9: Staff Certification Types, Saved Lists
 from app.models.staff_certification import CertificationType, StaffCertificationRecord
-from app.models.saved_list import SavedList, SavedListMember
+from app.models.saved_list import SavedList, SavedListMember, SavedListSnapshotMember
 
 # Phase 10: Job Titles, Bunk Buddy Requests
 from app.models.bunk_buddy import BunkBuddyRequest
@@ -94,6 +94,9 @@ from app.models.budget import Budget, BudgetCategory, BudgetExpense
 # Phase 16: Resource Bookings
 from app.models.resource_booking import Resource, ResourceBooking
 
+# Staff compliance (expiry scanner)
+from app.models.compliance_summary import ComplianceSummary
+
 __all__ = [
     "Base",
     "TimestampMixin",
@@ -154,6 +157,7 @@ __all__ = [
     "StaffCertificationRecord",
     "SavedList",
     "SavedListMember",
+    "SavedListSnapshotMember",
     # Phase 10
     "JobTitle",
     "BunkBuddyRequest",
@@ -186,4 +190,6 @@ __all__ = [
     # Phase 16: Resource Bookings
     "Resource",
     "ResourceBooking",
+    # Staff compliance
+    "ComplianceSummary",
 ]
@@ -1,6 +1,9 @@
 """
 Camp Connect - Audit Log Model
 Append-only audit trail for HIPAA compliance and security.
+
+Stored in ``audit_logs``, range-partitioned by month on ``created_at``
+(migration o5p6q7r8s9t0), so the primary key includes ``created_at``.
 """
 
 from __future__ import annotations
@@ -9,7 +12,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Index, String, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -22,7 +25,10 @@ class AuditLog(Base):
     Tracks all sensitive operations for HIPAA compliance.
     """
 
-    __tablename__ = "audit_log"
+    __tablename__ = "audit_logs"
+    __table_args__ = (
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -31,18 +37,19 @@ class AuditLog(Base):
     )
     organization_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        index=True,
         nullable=False,
     )
     user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         nullable=True,
     )
+    user_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # What happened
     action: Mapped[str] = mapped_column(String(100), nullable=False)
     resource_type: Mapped[str] = mapped_column(String(100), nullable=False)
     resource_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    resource_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     details: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # Context
@@ -52,9 +59,22 @@ class AuditLog(Base):
     # Timestamp
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         server_default=func.now(),
         nullable=False,
     )
 
     def __repr__(self) -> str:
         return f"<AuditLog(action='{self.action}', resource='{self.resource_type}/{self.resource_id}')>"
+
+
+# Newest-first, matching migration o5p6q7r8s9t0
+Index(
+    "ix_audit_logs_org_created",
+    AuditLog.organization_id, AuditLog.created_at.desc(), AuditLog.id.desc(),
+)
+Index(
+    "ix_audit_logs_org_resource",
+    AuditLog.organization_id, AuditLog.resource_type, AuditLog.resource_id,
+    AuditLog.created_at.desc(),
+)
@@ -24,6 +24,8 @@ class BackgroundCheck(Base):
     completed_at = Column(DateTime, nullable=True)
     expires_at = Column(DateTime, nullable=True)
     notes = Column(Text, nullable=True)
+    # Provider timestamp of the last applied status (older reports are ignored)
+    provider_updated_at = Column(DateTime(timezone=True), nullable=True)
     is_archived = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
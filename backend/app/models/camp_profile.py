@@ -4,8 +4,9 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, Text, DateTime, Boolean, Float, Integer
-from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy import Column, Computed, String, Text, DateTime, Boolean, Float, Integer
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred
 
 from app.models.base import Base
 
@@ -47,3 +48,16 @@ class CampProfile(Base):
     review_count = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Weighted full-text document (name A; tagline/city/state B; description C).
+    # Generated by Postgres and GIN-indexed; see migration n4o5p6q7r8s9.
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english'::regconfig, coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english'::regconfig, coalesce(tagline, '')), 'B') || "
+            "setweight(to_tsvector('english'::regconfig, coalesce(city, '') || ' ' || coalesce(state, '')), 'B') || "
+            "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C')",
+            persisted=True,
+        ),
+    ))
@@ -9,7 +9,7 @@ import uuid
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +23,10 @@ class CamperMessage(Base, TimestampMixin):
     """
 
     __tablename__ = "camper_messages"
+    __table_args__ = (
+        # Daily mail call: one org's messages for a day, optionally per event
+        Index("ix_camper_messages_org_date_event", "organization_id", "scheduled_date", "event_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
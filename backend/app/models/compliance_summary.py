@@ -0,0 +1,60 @@
+"""
+Camp Connect - Compliance Summary Model
+Per-organization staff compliance counts, precomputed by the expiry scanner
+(see app.services.compliance_service).
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Integer, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ComplianceSummary(Base):
+    """
+    One row per organization, replaced on every scan. The compliance
+    dashboard reads this row instead of aggregating certifications and
+    background checks on each request.
+    """
+
+    __tablename__ = "compliance_summaries"
+
+    organization_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Active staff, and those with anything expired, missing or flagged
+    staff_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    staff_non_compliant: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Certifications (typed records and onboarding certifications)
+    certifications_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    certifications_valid: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    certifications_expiring: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    certifications_expired: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # (staff member, required certification type) pairs with no valid record
+    required_missing: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Background checks (latest per staff member)
+    background_checks_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    background_checks_clear: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    background_checks_open: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    background_checks_flagged: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    background_checks_expiring: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    background_checks_expired: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Soonest upcoming expiries: [{entity_type, entity_id, user_id, staff_name, label, expires_on}]
+    upcoming: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    window_days: Mapped[int] = mapped_column(Integer, nullable=False, default=30)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
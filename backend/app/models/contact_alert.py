@@ -73,6 +73,8 @@ class ContactAlert(Base):
 
     # Metadata
     metadata_json: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    # Set by generated alerts so re-runs don't repeat them; unique per user
+    dedupe_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -4,7 +4,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, Text, DateTime, Boolean, Integer, ForeignKey
+from sqlalchemy import Column, String, Text, Date, DateTime, Boolean, Integer, Numeric, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 from app.models.base import Base
@@ -33,6 +33,14 @@ class CustomFieldDefinition(Base):
 
 class CustomFieldValue(Base):
     __tablename__ = "custom_field_values"
+    __table_args__ = (
+        Index("ix_custom_field_values_entity", "organization_id", "entity_type", "entity_id"),
+        Index("ix_custom_field_values_def_entity", "field_definition_id", "entity_id"),
+        Index("ix_custom_field_values_def_key", "field_definition_id", "value_key"),
+        Index("ix_custom_field_values_def_number", "field_definition_id", "value_number"),
+        Index("ix_custom_field_values_def_date", "field_definition_id", "value_date"),
+        Index("ix_custom_field_values_def_bool", "field_definition_id", "value_bool"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id = Column(UUID(as_uuid=True), nullable=False)
@@ -40,5 +48,11 @@ class CustomFieldValue(Base):
     entity_id = Column(UUID(as_uuid=True), nullable=False)
     entity_type = Column(String(50), nullable=False)
     value = Column(Text, nullable=True)
+    # Typed projections of `value`, maintained on save for indexed filter/sort.
+    # value_key holds short text values (<= 255 chars) for equality lookups.
+    value_key = Column(String(255), nullable=True)
+    value_number = Column(Numeric, nullable=True)
+    value_date = Column(Date, nullable=True)
+    value_bool = Column(Boolean, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -9,8 +9,8 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Computed, DateTime, ForeignKey, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import TSTZRANGE, UUID, ExcludeConstraint, Range
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, SoftDeleteMixin, TimestampMixin
@@ -58,9 +58,22 @@ class Resource(Base, TimestampMixin, SoftDeleteMixin):
 class ResourceBooking(Base, TimestampMixin, SoftDeleteMixin):
     """
     A booking/reservation for a resource.
+
+    ``period`` is a generated tstzrange over [start_time, end_time); the
+    exclusion constraint rejects overlapping live bookings on the same
+    resource, so double-booking is impossible even under concurrency.
     """
 
     __tablename__ = "resource_bookings"
+    __table_args__ = (
+        ExcludeConstraint(
+            ("resource_id", "="),
+            ("period", "&&"),
+            name="ex_resource_bookings_no_overlap",
+            using="gist",
+            where=text("status <> 'cancelled' AND deleted_at IS NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -93,6 +106,10 @@ class ResourceBooking(Base, TimestampMixin, SoftDeleteMixin):
     end_time: Mapped["datetime"] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
+    period: Mapped[Range[datetime]] = mapped_column(
+        TSTZRANGE,
+        Computed("tstzrange(start_time, end_time, '[)')", persisted=True),
+    )
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     status: Mapped[str] = mapped_column(
         String(50), nullable=False, default="pending"
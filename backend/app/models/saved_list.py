@@ -8,7 +8,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -44,6 +44,14 @@ class SavedList(Base, TimestampMixin, SoftDeleteMixin):
     )  # For dynamic lists
     member_count: Mapped[int] = mapped_column(Integer, default=0)
 
+    # Materialized membership (dynamic lists only)
+    materialized_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    source_version: Mapped[str | None] = mapped_column(
+        String(100), nullable=True
+    )  # Fingerprint of the source entity table at snapshot time
+
     created_by: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), nullable=True
     )
@@ -78,3 +86,31 @@ class SavedListMember(Base):
 
     # Relationships
     saved_list = relationship("SavedList", back_populates="members")
+
+
+class SavedListSnapshotMember(Base):
+    """
+    A materialized member of a dynamic saved list.
+    Rebuilt by saved_list_service.refresh_list when the source table changes.
+    """
+
+    __tablename__ = "saved_list_snapshot_members"
+    __table_args__ = (
+        Index(
+            "ix_saved_list_snapshot_members_keyset",
+            "list_id", "sort_key", "entity_id",
+        ),
+    )
+
+    list_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("saved_lists.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    entity_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True
+    )
+    sort_key: Mapped[str] = mapped_column(String(255))  # lower("last first")
+    name: Mapped[str] = mapped_column(String(255))
+    email: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    extra: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
@@ -4,7 +4,7 @@ import uuid
 from datetime import date, time
 from typing import Optional
 
-from sqlalchemy import Boolean, Date, ForeignKey, Integer, String, Text, Time, UniqueConstraint
+from sqlalchemy import Boolean, Date, ForeignKey, Index, Integer, String, Text, Time, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -16,6 +16,13 @@ class Schedule(Base, TimestampMixin, SoftDeleteMixin, TenantMixin):
     __tablename__ = "schedules"
     __table_args__ = (
         UniqueConstraint("event_id", "activity_id", "date", "start_time", name="uq_schedule_event_activity_date_time"),
+        Index("ix_schedules_event_date", "event_id", "date"),
+        Index(
+            "ix_schedules_staff_user_ids",
+            "staff_user_ids",
+            postgresql_using="gin",
+            postgresql_ops={"staff_user_ids": "jsonb_path_ops"},
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
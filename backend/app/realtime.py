@@ -0,0 +1,479 @@
+"""
+Camp Connect - Real-Time Push
+Server-sent events for alert badges and WebSockets for team chat, both fed
+by Postgres LISTEN/NOTIFY.
+
+Writers call ``publish_alert_event(db, ...)`` inside their transaction;
+``pg_notify`` is transactional, so the event is delivered only if the write
+commits. Every worker holds one LISTEN connection on ``CHANNEL`` and fans
+events out to the streams connected to it, so any number of uvicorn
+workers can serve streams regardless of which one handled the write.
+
+For each user with an open stream the worker keeps unread counts by alert
+type in memory: seeded from one aggregate query when the user's first
+stream connects, then adjusted by each event, and dropped when their last
+stream closes. Every pushed event carries the user's current counts, so
+clients replace their badge state rather than re-querying.
+
+The registry is bounded per worker (``settings.realtime_max_connections``)
+and per user (``settings.realtime_max_connections_per_user``). A stream
+whose queue fills up is closed; the client reconnects and gets a fresh
+snapshot. After the LISTEN connection is re-established, counts are
+re-seeded and pushed to every stream, since events may have been missed.
+
+Team chat events (``CHAT_CHANNEL``) go to every chat socket of the
+organization; the same registry limits apply. A ``resync`` event after a
+reconnect tells chat clients to refetch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple,
+)
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "contact_alerts"
+CHAT_CHANNEL = "team_chat"
+
+_QUEUE_SIZE = 100
+_LISTENER_CHECK_SECONDS = 30
+_RECONNECT_DELAY_SECONDS = 5
+# NOTIFY payloads are capped at 8000 bytes
+_NOTIFY_MAX_BYTES = 7900
+_COMPACT = (",", ":")
+
+# Loads {alert_type: unread_count} for one user
+CountLoader = Callable[[str], Awaitable[Dict[str, int]]]
+
+
+class RegistryFull(Exception):
+    """Raised when a stream cannot be registered; ``per_user`` tells which limit."""
+
+    def __init__(self, per_user: bool) -> None:
+        super().__init__("Too many streams for this user" if per_user else "Too many open streams")
+        self.per_user = per_user
+
+
+@dataclass(eq=False)
+class Subscription:
+    user_id: str
+    org_id: Optional[str] = None  # set for chat sockets
+    queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = field(
+        default_factory=lambda: asyncio.Queue(maxsize=_QUEUE_SIZE)
+    )
+
+
+_subscribers: Dict[str, Set[Subscription]] = {}
+_chat_subscribers: Dict[str, Set[Subscription]] = {}  # keyed by org
+_counts: Dict[str, Dict[str, int]] = {}
+_connections = 0
+
+_count_loader: Optional[CountLoader] = None
+_listener_task: Optional["asyncio.Task[None]"] = None
+
+
+def set_count_loader(loader: CountLoader) -> None:
+    """Register how unread counts are loaded (the alerts module does this)."""
+    global _count_loader
+    _count_loader = loader
+
+
+def counts_snapshot(user_id: Any) -> Optional[Dict[str, Any]]:
+    """The user's live unread counts if a stream in this worker tracks them."""
+    by_type = _counts.get(str(user_id))
+    if by_type is None:
+        return None
+    return {"total": sum(by_type.values()), "by_type": dict(by_type)}
+
+
+# ---------------------------------------------------------------------------
+# Publishing
+# ---------------------------------------------------------------------------
+
+async def publish_alert_event(
+    db: AsyncSession,
+    *,
+    event: str,
+    user_id: Any,
+    alert_type: Optional[str] = None,
+    alert_id: Any = None,
+    was_unread: bool = False,
+) -> None:
+    """
+    Queue a NOTIFY for an alert change; it is sent when ``db`` commits.
+
+    ``event`` is ``created``, ``read``, ``dismissed`` or ``read_all``;
+    ``was_unread`` says whether the change affects the unread count.
+    """
+    payload = {
+        "event": event,
+        "user_id": str(user_id),
+        "alert_type": alert_type,
+        "alert_id": str(alert_id) if alert_id else None,
+        "was_unread": was_unread,
+    }
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": CHANNEL, "payload": json.dumps(payload)},
+    )
+
+
+async def publish_alert_events(
+    db: AsyncSession,
+    *,
+    event: str,
+    alert_type: Optional[str],
+    alerts: Iterable[Tuple[Any, Any]],
+    was_unread: bool = False,
+) -> None:
+    """
+    Queue NOTIFYs for many alert changes of one kind; sent when ``db`` commits.
+
+    ``alerts`` is ``(user_id, alert_id)`` pairs. They are packed into as few
+    payloads as the NOTIFY size limit allows (usually one).
+    """
+    head = {"event": event, "alert_type": alert_type, "was_unread": was_unread}
+    base = len(json.dumps({**head, "alerts": []}, separators=_COMPACT).encode())
+    chunk: List[List[Optional[str]]] = []
+    size = base
+    for user_id, alert_id in alerts:
+        item = [str(user_id), str(alert_id) if alert_id else None]
+        item_size = len(json.dumps(item, separators=_COMPACT).encode()) + 1
+        if chunk and size + item_size > _NOTIFY_MAX_BYTES:
+            await _notify_alerts(db, head, chunk)
+            chunk, size = [], base
+        chunk.append(item)
+        size += item_size
+    if chunk:
+        await _notify_alerts(db, head, chunk)
+
+
+async def _notify_alerts(
+    db: AsyncSession, head: Dict[str, Any], alerts: List[List[Optional[str]]]
+) -> None:
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {
+            "channel": CHANNEL,
+            "payload": json.dumps({**head, "alerts": alerts}, separators=_COMPACT),
+        },
+    )
+
+
+def _apply(payload: Dict[str, Any]) -> None:
+    """Apply a single or batched alert event."""
+    batch = payload.pop("alerts", None)
+    if batch is None:
+        _apply_one(payload)
+        return
+    for user_id, alert_id in batch:
+        _apply_one({**payload, "user_id": user_id, "alert_id": alert_id})
+
+
+def _apply_one(payload: Dict[str, Any]) -> None:
+    """Update the user's counts and push the event to their streams."""
+    user_id = payload.get("user_id")
+    subs = _subscribers.get(user_id)
+    if not subs:
+        return
+
+    by_type = _counts.get(user_id)
+    if by_type is not None:
+        event, alert_type = payload.get("event"), payload.get("alert_type")
+        if event == "read_all":
+            by_type.clear()
+        elif event == "created" and alert_type:
+            by_type[alert_type] = by_type.get(alert_type, 0) + 1
+        elif event in ("read", "dismissed") and payload.get("was_unread") and alert_type:
+            remaining = by_type.get(alert_type, 0) - 1
+            if remaining > 0:
+                by_type[alert_type] = remaining
+            else:
+                by_type.pop(alert_type, None)
+
+    message = {**payload, "counts": counts_snapshot(user_id)}
+    for sub in list(subs):
+        try:
+            sub.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Slow consumer: close it; the client reconnects with a snapshot
+            _close(sub)
+
+
+async def publish_chat_event(
+    db: AsyncSession,
+    *,
+    event: str,
+    org_id: Any,
+    channel_id: Any,
+    message: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Queue a NOTIFY for a team chat change; it is sent when ``db`` commits.
+
+    The message travels in the payload unless that would exceed the NOTIFY
+    size limit, in which case only ``message_id`` is sent and clients fetch it.
+    """
+    payload: Dict[str, Any] = {
+        "event": event,
+        "org_id": str(org_id),
+        "channel_id": str(channel_id),
+        "message": message,
+    }
+    raw = json.dumps(payload, default=str)
+    if len(raw.encode()) > _NOTIFY_MAX_BYTES and message is not None:
+        payload["message"] = None
+        payload["message_id"] = str(message.get("id"))
+        raw = json.dumps(payload, default=str)
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": CHAT_CHANNEL, "payload": raw},
+    )
+
+
+def _apply_chat(payload: Dict[str, Any]) -> None:
+    """Push a chat event to every chat socket of the organization."""
+    for sub in list(_chat_subscribers.get(payload.get("org_id"), ())):
+        try:
+            sub.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            _close(sub)
+
+
+_HANDLERS: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    CHANNEL: _apply,
+    CHAT_CHANNEL: _apply_chat,
+}
+
+
+def _on_notify(_conn: Any, _pid: int, channel: str, raw: str) -> None:
+    try:
+        _HANDLERS[channel](json.loads(raw))
+    except Exception as e:
+        logger.warning(f"Bad {channel} notification: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Connection registry
+# ---------------------------------------------------------------------------
+
+async def subscribe(user_id: Any) -> Subscription:
+    """
+    Register a stream for ``user_id`` and make sure their counts are loaded.
+    Raises RegistryFull when a limit is reached.
+    """
+    global _connections
+    key = str(user_id)
+    if len(_subscribers.get(key, ())) >= settings.realtime_max_connections_per_user:
+        raise RegistryFull(per_user=True)
+    if _connections >= settings.realtime_max_connections:
+        raise RegistryFull(per_user=False)
+
+    sub = Subscription(user_id=key)
+    _subscribers.setdefault(key, set()).add(sub)
+    _connections += 1
+
+    # Subscribe first so no event is missed while the counts load
+    if key not in _counts and _count_loader is not None:
+        try:
+            _counts[key] = dict(await _count_loader(key))
+        except Exception:
+            unsubscribe(sub)
+            raise
+    return sub
+
+
+def subscribe_chat(org_id: Any, user_id: Any) -> Subscription:
+    """Register a chat socket for ``user_id``. Raises RegistryFull at a limit."""
+    global _connections
+    org_key, key = str(org_id), str(user_id)
+    subs = _chat_subscribers.get(org_key, ())
+    if sum(1 for s in subs if s.user_id == key) >= settings.realtime_max_connections_per_user:
+        raise RegistryFull(per_user=True)
+    if _connections >= settings.realtime_max_connections:
+        raise RegistryFull(per_user=False)
+
+    sub = Subscription(user_id=key, org_id=org_key)
+    _chat_subscribers.setdefault(org_key, set()).add(sub)
+    _connections += 1
+    return sub
+
+
+def unsubscribe(sub: Subscription) -> None:
+    global _connections
+    if sub.org_id is not None:
+        registry, key = _chat_subscribers, sub.org_id
+    else:
+        registry, key = _subscribers, sub.user_id
+    subs = registry.get(key)
+    if not subs or sub not in subs:
+        return
+    subs.discard(sub)
+    _connections -= 1
+    if not subs:
+        registry.pop(key, None)
+        if registry is _subscribers:
+            _counts.pop(key, None)
+
+
+def _close(sub: Subscription) -> None:
+    unsubscribe(sub)
+    try:
+        sub.queue.put_nowait(None)
+    except asyncio.QueueFull:
+        sub.queue.get_nowait()
+        sub.queue.put_nowait(None)
+
+
+async def _resync() -> None:
+    """Reload counts for every connected user and push them (after a reconnect)."""
+    if _count_loader is None:
+        return
+    for user_id in list(_subscribers):
+        try:
+            _counts[user_id] = dict(await _count_loader(user_id))
+        except Exception as e:
+            logger.warning(f"Alert count resync failed for {user_id}: {e}")
+            continue
+        message = {"event": "resync", "user_id": user_id, "counts": counts_snapshot(user_id)}
+        for sub in list(_subscribers.get(user_id, ())):
+            try:
+                sub.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                _close(sub)
+    for org_id in list(_chat_subscribers):
+        _apply_chat({"event": "resync", "org_id": org_id})
+
+
+async def stream(sub: Subscription, is_disconnected: Callable[[], Awaitable[bool]]) -> AsyncIterator[str]:
+    """SSE body for one subscription: snapshot, then events and heartbeats."""
+    try:
+        yield _sse("counts", {"event": "snapshot", "counts": counts_snapshot(sub.user_id)})
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    sub.queue.get(), timeout=settings.realtime_heartbeat_seconds
+                )
+            except asyncio.TimeoutError:
+                if await is_disconnected():
+                    return
+                yield ": ping\n\n"
+                continue
+            if message is None:
+                return
+            yield _sse("alert", message)
+    finally:
+        unsubscribe(sub)
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+async def serve_socket(websocket: Any, sub: Subscription) -> None:
+    """
+    Pump events to an accepted WebSocket until either side closes.
+    Incoming frames are read only to notice the client going away.
+    """
+
+    async def _send() -> None:
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    sub.queue.get(), timeout=settings.realtime_heartbeat_seconds
+                )
+            except asyncio.TimeoutError:
+                message = {"event": "ping"}
+            if message is None:
+                await websocket.close()
+                return
+            await websocket.send_text(json.dumps(message, default=str))
+
+    async def _receive() -> None:
+        while True:
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                return
+
+    tasks = [asyncio.create_task(_send()), asyncio.create_task(_receive())]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        unsubscribe(sub)
+
+
+# ---------------------------------------------------------------------------
+# LISTEN connection
+# ---------------------------------------------------------------------------
+
+async def _listen_loop() -> None:
+    from app.database import engine
+
+    first = True
+    while True:
+        try:
+            async with engine.connect() as conn:
+                raw = await conn.get_raw_connection()
+                driver = raw.driver_connection
+                for channel in _HANDLERS:
+                    await driver.add_listener(channel, _on_notify)
+                logger.info(f"Listening on {', '.join(_HANDLERS)}")
+                if not first:
+                    await _resync()
+                first = False
+                try:
+                    while True:
+                        await asyncio.sleep(_LISTENER_CHECK_SECONDS)
+                        await driver.execute("SELECT 1")
+                finally:
+                    for channel in _HANDLERS:
+                        try:
+                            await driver.remove_listener(channel, _on_notify)
+                        except Exception:
+                            pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"LISTEN connection lost: {e}; reconnecting")
+        await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+
+def start_listener() -> None:
+    """Start the LISTEN loop (application startup)."""
+    global _listener_task
+    from app.database import engine
+
+    if engine is None:
+        return
+    if _listener_task is None or _listener_task.done():
+        _listener_task = asyncio.create_task(_listen_loop())
+
+
+async def stop_listener() -> None:
+    """Stop listening and end every open stream and socket (shutdown)."""
+    global _listener_task
+    if _listener_task is not None:
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except asyncio.CancelledError:
+            pass
+        _listener_task = None
+    for registry in (_subscribers, _chat_subscribers):
+        for subs in list(registry.values()):
+            for sub in list(subs):
+                _close(sub)
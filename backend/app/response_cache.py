@@ -0,0 +1,163 @@
+"""
+Camp Connect - HTTP Response Cache
+ETag / conditional-GET caching for public and read-mostly endpoints.
+
+Each cached resource belongs to a *namespace* (``camp_directory``,
+``job_listings``, ``branding``) registered with a cheap version query,
+e.g. ``max(updated_at), count(*)`` over the published rows. A request is
+keyed by route path + normalised query string + tenant, and its strong ETag
+is derived from that key and the namespace version only, so every worker
+(and a restarted one) gives identical content the same ETag.
+
+Flow for ``cached_response(...)``:
+
+1. Look up the namespace version. It is trusted for
+   ``settings.response_cache_ttl`` seconds; after that the version query
+   runs again (one aggregate instead of the full listing).
+2. ``If-None-Match`` matching the ETag → ``304 Not Modified``; the handler
+   never runs.
+3. A stored body with the same ETag is served from memory.
+4. Otherwise the handler runs and its JSON body is stored.
+
+Writers call ``invalidate(namespace, tenant)`` after committing, which drops
+this process's version and bodies immediately. Other workers pick up the
+change when their version check next runs (at most ``response_cache_ttl``
+seconds later).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.metrics import record_cache
+
+VersionFn = Callable[[AsyncSession, Optional[str]], Awaitable[Tuple[Any, ...]]]
+
+_MAX_ENTRIES = 1024
+
+_version_fns: Dict[str, VersionFn] = {}
+# (namespace, tenant) -> (version, checked_at)
+_versions: Dict[Tuple[str, Optional[str]], Tuple[Tuple[Any, ...], float]] = {}
+# namespace -> generation, bumped by invalidate(); local only, never in ETags
+_generations: Dict[str, int] = {}
+# cache key -> (namespace, etag, body)
+_bodies: "OrderedDict[Hashable, Tuple[str, str, bytes]]" = OrderedDict()
+
+
+def register_namespace(namespace: str, version_fn: VersionFn) -> None:
+    """
+    Register the version query for a namespace. ``version_fn(db, tenant)``
+    must return a small tuple that changes whenever any response in the
+    namespace would change (typically ``(max(updated_at), count(*))``).
+    """
+    _version_fns[namespace] = version_fn
+
+
+def invalidate(namespace: str, tenant: Optional[Any] = None) -> None:
+    """
+    Drop cached versions and bodies for a namespace (optionally only for one
+    tenant's version). Call after committing a write that changes what the
+    namespace serves.
+    """
+    _generations[namespace] = _generations.get(namespace, 0) + 1
+    tenant_key = str(tenant) if tenant is not None else None
+    for key in [k for k in _versions if k[0] == namespace and (tenant is None or k[1] == tenant_key)]:
+        _versions.pop(key, None)
+    for key in [k for k, v in _bodies.items() if v[0] == namespace]:
+        _bodies.pop(key, None)
+
+
+def clear() -> None:
+    """Forget everything (tests and benchmarks)."""
+    _versions.clear()
+    _bodies.clear()
+    _generations.clear()
+
+
+def _normalized_query(request: Request) -> str:
+    return "&".join(
+        f"{k}={v}" for k, v in sorted(request.query_params.multi_items()) if v != ""
+    )
+
+
+async def _version(db: AsyncSession, namespace: str, tenant: Optional[str]) -> Tuple[Any, ...]:
+    key = (namespace, tenant)
+    cached = _versions.get(key)
+    now = time.monotonic()
+    if cached and now - cached[1] < settings.response_cache_ttl:
+        return cached[0]
+    version = tuple(await _version_fns[namespace](db, tenant))
+    _versions[key] = (version, now)
+    return version
+
+
+def _etag(namespace: str, cache_key: Hashable, version: Tuple[Any, ...]) -> str:
+    raw = repr((namespace, cache_key, version))
+    return '"' + hashlib.sha256(raw.encode()).hexdigest()[:32] + '"'
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [t.strip() for t in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+async def cached_response(
+    request: Request,
+    db: AsyncSession,
+    *,
+    namespace: str,
+    build: Callable[[], Awaitable[Any]],
+    tenant: Optional[Any] = None,
+    max_age: int = 60,
+    public: bool = True,
+) -> Response:
+    """
+    Serve a JSON response through the cache. ``build`` produces the payload
+    on a miss; exceptions (e.g. 404s) propagate and are never cached.
+    """
+    tenant_key = str(tenant) if tenant is not None else None
+    cache_key = (request.url.path, _normalized_query(request), tenant_key)
+    generation = _generations.get(namespace, 0)
+
+    version = await _version(db, namespace, tenant_key)
+    etag = _etag(namespace, cache_key, version)
+
+    if public:
+        cache_control = f"public, max-age={max_age}, stale-while-revalidate={max_age * 5}"
+    else:
+        cache_control = "private, no-cache"
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if tenant_key is not None:
+        headers["Vary"] = "Authorization"
+
+    if _matches(request.headers.get("if-none-match"), etag):
+        record_cache(f"response:{namespace}", True)
+        return Response(status_code=304, headers=headers)
+
+    stored = _bodies.get(cache_key)
+    if stored and stored[1] == etag:
+        _bodies.move_to_end(cache_key)
+        record_cache(f"response:{namespace}", True)
+        return Response(stored[2], media_type="application/json", headers=headers)
+
+    record_cache(f"response:{namespace}", False)
+    payload = await build()
+    body = json.dumps(jsonable_encoder(payload), separators=(",", ":")).encode()
+    # Don't keep a body built from data invalidated while it was being built
+    if _generations.get(namespace, 0) == generation:
+        _bodies[cache_key] = (namespace, etag, body)
+        _bodies.move_to_end(cache_key)
+        while len(_bodies) > _MAX_ENTRIES:
+            _bodies.popitem(last=False)
+    return Response(body, media_type="application/json", headers=headers)
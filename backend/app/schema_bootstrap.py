@@ -0,0 +1,144 @@
+"""
+Camp Connect - Raw-Table Schema Bootstrap
+Registry for the idempotent DDL of services backed by raw-SQL tables.
+
+Services call ``register_ddl`` at import time with their
+``CREATE TABLE IF NOT EXISTS`` / ``CREATE INDEX IF NOT EXISTS`` statements.
+``run_bootstrap`` applies everything once at startup (see the lifespan in
+app.main), and ``ensure_schema`` is the per-request guard: after the first
+run it is a single truthiness check, so no DDL (and no catalog lock) is
+issued on the hot path. Modules imported after startup have their DDL
+applied on first use.
+
+Each service's DDL runs in its own transaction and is memoized on success,
+so one bad statement only holds back its own service. A failed service is
+retried after a backoff (doubling up to ``_RETRY_MAX_SECONDS``) rather than
+on every request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# name -> ordered DDL statements
+_registry: Dict[str, Tuple[str, ...]] = {}
+
+# Names registered but not yet applied in this process ("done" memo)
+_pending: List[str] = []
+
+# name -> (consecutive failures, monotonic time of next attempt, last error)
+_failures: Dict[str, Tuple[int, float, str]] = {}
+
+_RETRY_BASE_SECONDS = 5.0
+_RETRY_MAX_SECONDS = 300.0
+
+_lock = asyncio.Lock()
+
+
+def register_ddl(name: str, *statements: str) -> None:
+    """
+    Register idempotent DDL for a raw-SQL service under ``name``.
+
+    Statements run in order, each on its own, so a table can be followed
+    by its indexes. Re-registering a name replaces its statements.
+    """
+    _registry[name] = tuple(statements)
+    _failures.pop(name, None)
+    if name not in _pending:
+        _pending.append(name)
+
+
+def registered() -> Dict[str, Tuple[str, ...]]:
+    """Return a copy of the registry (name -> statements)."""
+    return dict(_registry)
+
+
+def is_done() -> bool:
+    """True when every registered statement has been applied in this process."""
+    return not _pending
+
+
+def failures() -> Dict[str, str]:
+    """Services whose DDL last failed (name -> error), awaiting retry."""
+    return {name: error for name, (_, _, error) in _failures.items()}
+
+
+def _due(now: float) -> List[str]:
+    """Pending names not currently backing off after a failure."""
+    return [n for n in _pending if n not in _failures or _failures[n][1] <= now]
+
+
+async def _apply(bind: AsyncEngine, name: str) -> int:
+    """Run the DDL for ``name`` in its own transaction; return statement count."""
+    statements = _registry[name]
+    async with bind.begin() as conn:
+        for statement in statements:
+            await conn.execute(text(statement))
+    return len(statements)
+
+
+async def run_bootstrap(bind: Optional[AsyncEngine] = None) -> Dict[str, float]:
+    """
+    Apply pending DDL that is not backing off. Called once from the
+    application lifespan.
+
+    Returns a small report: number of services and statements applied,
+    number of services that failed, and the elapsed milliseconds.
+    """
+    empty = {"services": 0, "statements": 0, "failed": 0, "elapsed_ms": 0.0}
+    if bind is None:
+        from app.database import engine as bind
+    if bind is None or not _pending:
+        return empty
+
+    async with _lock:
+        now = time.monotonic()
+        names = _due(now)
+        if not names:
+            return empty
+        started = time.perf_counter()
+        applied = count = failed = 0
+        for name in names:
+            try:
+                count += await _apply(bind, name)
+            except Exception as e:
+                attempts = _failures.get(name, (0, 0.0, ""))[0] + 1
+                delay = min(_RETRY_BASE_SECONDS * 2 ** (attempts - 1), _RETRY_MAX_SECONDS)
+                _failures[name] = (attempts, time.monotonic() + delay, str(e))
+                logger.warning(
+                    f"Schema bootstrap for {name} failed (attempt {attempts}, "
+                    f"retry in {delay:.0f}s): {e}"
+                )
+                failed += 1
+                continue
+            _pending.remove(name)
+            _failures.pop(name, None)
+            applied += 1
+    return {
+        "services": applied,
+        "statements": count,
+        "failed": failed,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
+async def ensure_schema() -> None:
+    """
+    Request-path guard for raw-SQL services.
+
+    No-op once the bootstrap has run, and while the only pending services
+    are backing off after a failure. DDL is applied on a dedicated
+    connection so it never rides along with (or is rolled back by) the
+    caller's transaction.
+    """
+    if not _pending or not _due(time.monotonic()):
+        return
+    await run_bootstrap()
@@ -10,7 +10,7 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class AuditAction(str, Enum):
@@ -29,7 +29,7 @@ class AuditAction(str, Enum):
 class AuditLogEntry(BaseModel):
     id: UUID
     organization_id: UUID
-    user_id: UUID
+    user_id: Optional[UUID] = None
     user_name: str
     action: AuditAction
     resource_type: str
@@ -44,15 +44,17 @@ class AuditLogEntry(BaseModel):
 
 
 class AuditLogCreate(BaseModel):
+    # Lengths match the audit_logs columns
     action: AuditAction
-    resource_type: str
-    resource_id: Optional[str] = None
-    resource_name: Optional[str] = None
-    details: Optional[str] = None
+    resource_type: str = Field(..., min_length=1, max_length=100)
+    resource_id: Optional[str] = Field(None, max_length=255)
+    resource_name: Optional[str] = Field(None, max_length=255)
+    details: Optional[str] = Field(None, max_length=10000)
 
 
 class AuditLogListResponse(BaseModel):
     items: list[AuditLogEntry]
-    total: int
+    total: Optional[int] = None  # first page only
     page: int
     per_page: int
+    next_cursor: Optional[str] = None
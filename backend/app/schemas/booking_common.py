@@ -0,0 +1,56 @@
+"""
+Camp Connect - Booking Schemas (shared)
+Bulk reservation & availability models used by both room and resource bookings.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+BookingT = TypeVar("BookingT")
+
+
+class BookingSlot(BaseModel):
+    """A single [start_time, end_time) occurrence."""
+
+    start_time: datetime
+    end_time: datetime
+
+
+class RepeatRule(BaseModel):
+    """Repeat every occurrence ``count`` times at a daily or weekly interval."""
+
+    frequency: str = Field(default="weekly", pattern="^(daily|weekly)$")
+    interval: int = Field(default=1, ge=1, le=52)
+    count: int = Field(default=1, ge=1, le=366)
+
+
+class BookingConflict(BaseModel):
+    """An occurrence that overlaps an existing booking or another occurrence."""
+
+    occurrence_index: int
+    start_time: datetime
+    end_time: datetime
+    conflicting_booking_id: Optional[uuid.UUID] = None
+    conflicting_title: str = ""
+    conflicting_start_time: datetime
+    conflicting_end_time: datetime
+
+
+class BulkBookingResult(BaseModel, Generic[BookingT]):
+    """Outcome of a bulk reservation (``created`` holds the caller's booking model)."""
+
+    requested: int = 0
+    created: List[BookingT] = []
+    conflicts: List[BookingConflict] = []
+
+
+class TimeRange(BaseModel):
+    """A busy or free time range."""
+
+    start_time: datetime
+    end_time: datetime
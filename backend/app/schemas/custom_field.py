@@ -5,9 +5,10 @@ Pydantic models for custom field definitions and values.
 
 from __future__ import annotations
 
+import uuid
 from typing import Any, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class CustomFieldDefinitionCreate(BaseModel):
@@ -54,3 +55,8 @@ class CustomFieldValueSave(BaseModel):
 
 class BulkSaveRequest(BaseModel):
     values: List[CustomFieldValueSave]
+
+
+class BulkValuesRequest(BaseModel):
+    entity_ids: List[uuid.UUID] = Field(..., max_length=500)
+    list_only: bool = False
@@ -133,4 +133,50 @@ class FormSubmissionResponse(BaseModel):
 class FormSubmissionListResponse(BaseModel):
     """Paginated submission list."""
     items: List[FormSubmissionResponse]
-    total: int
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
+
+
+class FormChoiceOptionStats(BaseModel):
+    """Answer count for one option of a choice field."""
+    value: str
+    label: str
+    count: int
+
+
+class FormChoiceFieldStats(BaseModel):
+    """Answer distribution for one choice field."""
+    field_id: str
+    label: str
+    type: str
+    responses: int
+    options: List[FormChoiceOptionStats]
+
+
+class FormTemplateStatsResponse(BaseModel):
+    """Choice-field statistics across a template's submissions."""
+    template_id: uuid.UUID
+    template_name: str
+    submissions: int
+    fields: List[FormChoiceFieldStats]
+
+
+# ─── Submission Revalidation ─────────────────────────────────
+
+class FormSubmissionCheck(BaseModel):
+    """A stored submission that no longer satisfies its template."""
+    submission_id: uuid.UUID
+    status: str
+    related_entity_type: Optional[str] = None
+    related_entity_id: Optional[uuid.UUID] = None
+    errors: List[Dict[str, str]]
+
+
+class FormRevalidateResponse(BaseModel):
+    """Result of re-checking a template's submissions against its fields."""
+    template_id: uuid.UUID
+    version: int
+    checked: int
+    invalid: int
+    results: List[FormSubmissionCheck]
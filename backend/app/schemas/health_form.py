@@ -9,7 +9,7 @@ import uuid
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 # ─── Field Definition ─────────────────────────────────────────
@@ -86,6 +86,39 @@ class HealthFormAssign(BaseModel):
     due_date: Optional[date] = None
 
 
+class HealthFormBulkAssign(BaseModel):
+    """Request to assign several templates to an event roster or camper list.
+
+    With both ``event_id`` and ``camper_ids`` the roster is the campers in
+    the list who are registered for the event.
+    """
+
+    template_ids: List[uuid.UUID] = Field(..., min_length=1, max_length=50)
+    event_id: Optional[uuid.UUID] = None
+    camper_ids: Optional[List[uuid.UUID]] = Field(
+        default=None, min_length=1, max_length=10000
+    )
+    due_date: Optional[date] = None
+    send_reminders: bool = False
+
+    @model_validator(mode="after")
+    def _require_roster(self) -> "HealthFormBulkAssign":
+        if self.event_id is None and self.camper_ids is None:
+            raise ValueError("Provide event_id or camper_ids")
+        return self
+
+
+class HealthFormBulkAssignResponse(BaseModel):
+    """Outcome of a bulk assignment."""
+
+    campers: int
+    templates: int
+    requested: int
+    created: int
+    already_assigned: int
+    reminders_queued: int = 0
+
+
 class HealthFormResponse(BaseModel):
     """Health form instance details (assigned to a camper)."""
 
@@ -131,6 +164,26 @@ class HealthFormSubmissionResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class HealthFormSubmissionCheck(BaseModel):
+    """A stored submission that no longer satisfies its template."""
+
+    submission_id: uuid.UUID
+    form_id: uuid.UUID
+    camper_id: uuid.UUID
+    status: str
+    errors: List[Dict[str, str]]
+
+
+class HealthFormRevalidateResponse(BaseModel):
+    """Result of re-checking a template's submissions against its fields."""
+
+    template_id: uuid.UUID
+    version: int
+    checked: int
+    invalid: int
+    results: List[HealthFormSubmissionCheck]
+
+
 # ─── Review Schema ─────────────────────────────────────────────
 
 
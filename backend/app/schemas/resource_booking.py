@@ -7,10 +7,17 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.booking_common import (
+    BookingSlot,
+    BulkBookingResult as _BulkBookingResult,
+    RepeatRule,
+    TimeRange,
+)
+
 
 # ---------------------------------------------------------------------------
 # Resource schemas
@@ -110,6 +117,40 @@ class BookingResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# ---------------------------------------------------------------------------
+# Bulk reservation & availability schemas
+# ---------------------------------------------------------------------------
+
+class BulkBookingCreate(BaseModel):
+    """Request to check and reserve many occurrences of a resource."""
+
+    resource_id: uuid.UUID
+    title: str = Field(..., min_length=1, max_length=255)
+    notes: Optional[str] = None
+    status: str = Field(
+        default="pending",
+        pattern="^(pending|confirmed|cancelled)$",
+    )
+    occurrences: List[BookingSlot] = Field(..., min_length=1, max_length=500)
+    repeat: Optional[RepeatRule] = None
+    allow_partial: bool = False
+    dry_run: bool = False
+
+
+class BulkBookingResult(_BulkBookingResult[BookingResponse]):
+    """Outcome of a bulk resource reservation."""
+
+
+class ResourceAvailability(BaseModel):
+    """Busy and free slots for a resource over a day or week."""
+
+    resource_id: uuid.UUID
+    range_start: datetime
+    range_end: datetime
+    busy: List[TimeRange] = []
+    free: List[TimeRange] = []
+
+
 # ---------------------------------------------------------------------------
 # Stats
 # ---------------------------------------------------------------------------
@@ -11,6 +11,13 @@ from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.booking_common import (
+    BookingSlot,
+    BulkBookingResult as _BulkBookingResult,
+    RepeatRule,
+    TimeRange,
+)
+
 
 # ---------------------------------------------------------------------------
 # Room schemas
@@ -129,6 +136,43 @@ class BookingResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# ---------------------------------------------------------------------------
+# Bulk reservation & availability schemas
+# ---------------------------------------------------------------------------
+
+
+class BulkBookingCreate(BaseModel):
+    """Request to check and reserve many occurrences of a room."""
+
+    room_id: uuid.UUID
+    booked_by: str = Field(..., min_length=1, max_length=255)
+    purpose: str = Field(..., min_length=1, max_length=500)
+    recurrence_pattern: Optional[str] = Field(default=None, max_length=255)
+    status: str = Field(
+        default="confirmed",
+        pattern="^(confirmed|pending|cancelled)$",
+    )
+    notes: Optional[str] = None
+    occurrences: List[BookingSlot] = Field(..., min_length=1, max_length=500)
+    repeat: Optional[RepeatRule] = None
+    allow_partial: bool = False
+    dry_run: bool = False
+
+
+class BulkBookingResult(_BulkBookingResult[BookingResponse]):
+    """Outcome of a bulk room reservation."""
+
+
+class RoomAvailability(BaseModel):
+    """Busy and free slots for a room over a day or week."""
+
+    room_id: uuid.UUID
+    range_start: datetime
+    range_end: datetime
+    busy: List[TimeRange] = []
+    free: List[TimeRange] = []
+
+
 # ---------------------------------------------------------------------------
 # Stats
 # ---------------------------------------------------------------------------
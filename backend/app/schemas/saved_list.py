@@ -35,6 +35,7 @@ class SavedListResponse(BaseModel):
     entity_type: str
     filter_criteria: Optional[Dict[str, Any]] = None
     member_count: int = 0
+    materialized_at: Optional[datetime] = None
     created_by: Optional[uuid.UUID] = None
     created_at: datetime
     updated_at: datetime
@@ -91,6 +92,8 @@ class FilterCriteria(BaseModel):
 class PreviewRequest(BaseModel):
     entity_type: str = "contact"
     filter_criteria: FilterCriteria
+    sort_field: Optional[str] = None  # model column or "cf.<field_key>"
+    sort_direction: str = "asc"
 
 
 class PreviewResultItem(BaseModel):
@@ -104,3 +107,14 @@ class PreviewResponse(BaseModel):
     total_count: int
     results: List[PreviewResultItem] = []
     entity_type: str
+    # Keyset pagination + staleness metadata (materialized dynamic lists only)
+    next_cursor: Optional[str] = None
+    materialized_at: Optional[datetime] = None
+    age_seconds: Optional[int] = None
+    is_stale: Optional[bool] = None
+
+
+class RefreshListsResponse(BaseModel):
+    checked: int
+    refreshed: int
+    skipped: int
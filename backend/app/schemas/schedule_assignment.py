@@ -98,6 +98,18 @@ class StaffWeeklySchedule(BaseModel):
     total_hours: float = 0.0
 
 
+class StaffWeeklyHours(BaseModel):
+    """Scheduled hours for one staff member over a 7-day range."""
+
+    staff_user_id: uuid.UUID
+    first_name: str
+    last_name: str
+    week_start: date
+    week_end: date
+    total_hours: float = 0.0
+    session_count: int = 0
+
+
 class CamperWeeklySchedule(BaseModel):
     """A camper's full weekly schedule including bunk and activity assignments."""
 
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -81,3 +81,28 @@ class StaffCertificationResponse(BaseModel):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# ─── Compliance Summary ──────────────────────────────────────
+
+class ComplianceSummaryResponse(BaseModel):
+    """Precomputed staff compliance counts for the organization."""
+    organization_id: uuid.UUID
+    staff_total: int = 0
+    staff_non_compliant: int = 0
+    certifications_total: int = 0
+    certifications_valid: int = 0
+    certifications_expiring: int = 0
+    certifications_expired: int = 0
+    required_missing: int = 0
+    background_checks_total: int = 0
+    background_checks_clear: int = 0
+    background_checks_open: int = 0
+    background_checks_flagged: int = 0
+    background_checks_expiring: int = 0
+    background_checks_expired: int = 0
+    upcoming: List[Dict[str, Any]] = Field(default_factory=list)
+    window_days: int
+    computed_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
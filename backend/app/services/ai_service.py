@@ -16,6 +16,8 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.database import engine, replica_engine
+from app.metrics import record_cache, track_provider
 
 # ---------------------------------------------------------------------------
 # Schema cache — refreshed at most every 10 minutes
@@ -36,7 +38,9 @@ async def _introspect_schema(db: AsyncSession) -> str:
     global _schema_cache, _schema_cache_ts
 
     now = time.time()
-    if _schema_cache and (now - _schema_cache_ts) < _SCHEMA_TTL:
+    hit = bool(_schema_cache and (now - _schema_cache_ts) < _SCHEMA_TTL)
+    record_cache("ai_schema", hit)
+    if hit:
         return _schema_cache
 
     # 1. Columns
@@ -343,7 +347,8 @@ async def chat(
 
     Phase 0 — Introspect the live database schema.
     Phase 1 — Ask Claude to generate a SQL query from the user's question.
-    Phase 2 — Execute the query (read-only, scoped to org, row-limited).
+    Phase 2 — Execute the query in the sandbox (read-only transaction,
+              statement timeout, EXPLAIN cost cap, streamed row limit).
     Phase 2b — If query fails, retry once with the error message.
     Phase 3 — Ask Claude to summarise the results in natural language.
     """
@@ -448,10 +453,11 @@ Parameter placeholder: :org_id"""
             "error": "missing_org_filter",
         }
 
-    # Phase 2: Execute the SQL
-    exec_sql = sql if re.search(r"\bLIMIT\b", sql, re.IGNORECASE) else sql + "\nLIMIT 500"
+    # Phase 2: Execute the SQL in the guarded sandbox
+    row_limit = settings.ai_query_row_limit
+    exec_sql = sql if re.search(r"\bLIMIT\b", sql, re.IGNORECASE) else sql + f"\nLIMIT {row_limit}"
 
-    data, columns, exec_error = await _execute_query(db, exec_sql, org_id_str)
+    data, columns, exec_error, query_metrics = await _execute_query(exec_sql, org_id_str)
 
     # Phase 2b: If query failed, retry once — tell Claude the error and ask it to fix
     if exec_error:
@@ -478,8 +484,8 @@ Parameter placeholder: :org_id"""
         if sql2 and ":org_id" in sql2:
             is_valid2, _ = validate_sql(sql2)
             if is_valid2:
-                exec_sql2 = sql2 if re.search(r"\bLIMIT\b", sql2, re.IGNORECASE) else sql2 + "\nLIMIT 500"
-                data, columns, exec_error2 = await _execute_query(db, exec_sql2, org_id_str)
+                exec_sql2 = sql2 if re.search(r"\bLIMIT\b", sql2, re.IGNORECASE) else sql2 + f"\nLIMIT {row_limit}"
+                data, columns, exec_error2, query_metrics = await _execute_query(exec_sql2, org_id_str)
                 if not exec_error2:
                     sql = sql2
                     exec_error = None
@@ -492,6 +498,7 @@ Parameter placeholder: :org_id"""
             "response": f"I tried to query your data but encountered a database error. Please try rephrasing your question.\n\nTechnical detail: {exec_error[:300]}",
             "sql": sql,
             "data": None,
+            "metrics": query_metrics,
             "error": "query_execution_failed",
         }
 
@@ -522,12 +529,13 @@ RULES:
     ]
 
     try:
-        summary_response = client.messages.create(
-            model=settings.ai_model,
-            max_tokens=settings.ai_max_tokens,
-            system=system_prompt_summary,
-            messages=summary_messages,
-        )
+        with track_provider("anthropic", "summarize"):
+            summary_response = client.messages.create(
+                model=settings.ai_model,
+                max_tokens=settings.ai_max_tokens,
+                system=system_prompt_summary,
+                messages=summary_messages,
+            )
         response_text = summary_response.content[0].text
     except Exception:
         response_text = f"Here are the results ({row_count} rows). I wasn't able to generate a summary."
@@ -538,6 +546,7 @@ RULES:
         "data": data[:200],
         "row_count": row_count,
         "entity_links": entity_links,
+        "metrics": query_metrics,
         "error": None,
     }
 
@@ -553,14 +562,15 @@ async def _generate_sql(
 ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """Call Claude to generate SQL. Returns (raw_output, cleaned_sql, stop_reason)."""
     try:
-        resp = client.messages.create(
-            model=settings.ai_model,
-            max_tokens=2048,
-            system=system_prompt,
-            messages=messages,
-            # Use temperature 0 for deterministic SQL generation
-            temperature=0,
-        )
+        with track_provider("anthropic", "generate_sql"):
+            resp = client.messages.create(
+                model=settings.ai_model,
+                max_tokens=2048,
+                system=system_prompt,
+                messages=messages,
+                # Use temperature 0 for deterministic SQL generation
+                temperature=0,
+            )
         raw = resp.content[0].text.strip()
         stop_reason = resp.stop_reason
         print(f"[AI] SQL gen: stop_reason={stop_reason}, len={len(raw)}")
@@ -580,18 +590,90 @@ async def _generate_sql(
 
 
 async def _execute_query(
-    db: AsyncSession,
     sql: str,
     org_id_str: str,
-) -> Tuple[List[Dict[str, Any]], List[str], Optional[str]]:
-    """Execute a read-only SQL query. Returns (data, columns, error_str_or_None)."""
+) -> Tuple[List[Dict[str, Any]], List[str], Optional[str], Dict[str, Any]]:
+    """
+    Execute model-generated SQL inside a guarded sandbox.
+
+    The query never runs on the request session. It gets its own connection
+    (the read replica when configured) and a READ ONLY transaction with
+    SET LOCAL limits on statement_timeout and work_mem. The plan is costed
+    with EXPLAIN first and rejected above settings.ai_query_max_cost, then
+    rows are streamed through a server-side cursor and capped at
+    settings.ai_query_row_limit.
+
+    Returns (data, columns, error_str_or_None, metrics).
+    """
+    row_limit = settings.ai_query_row_limit
+    target = replica_engine or engine
+    metrics: Dict[str, Any] = {
+        "replica": replica_engine is not None,
+        "row_limit": row_limit,
+        "plan_cost": None,
+        "plan_ms": None,
+        "execution_ms": None,
+        "row_count": 0,
+        "truncated": False,
+    }
+
+    if target is None:
+        return [], [], "Database not configured", metrics
+
+    params = {"org_id": org_id_str}
+    started = time.perf_counter()
     try:
-        result = await db.execute(text(sql), {"org_id": org_id_str})
-        rows = result.fetchall()
-        columns = list(result.keys())
+        async with target.connect() as conn:
+            async with conn.begin():
+                await conn.execute(text("SET TRANSACTION READ ONLY"))
+                await conn.execute(
+                    text(
+                        "SELECT set_config('statement_timeout', :timeout, true), "
+                        "set_config('work_mem', :work_mem, true), "
+                        "set_config('app.current_org_id', :org_id, true)"
+                    ),
+                    {
+                        "timeout": f"{int(settings.ai_query_timeout_ms)}ms",
+                        "work_mem": settings.ai_query_work_mem,
+                        "org_id": org_id_str,
+                    },
+                )
+
+                # Cost the plan before running anything expensive
+                plan_result = await conn.execute(
+                    text(f"EXPLAIN (FORMAT JSON) {sql}"), params
+                )
+                plan = plan_result.scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                plan_cost = float(plan[0]["Plan"]["Total Cost"])
+                metrics["plan_cost"] = plan_cost
+                metrics["plan_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+                if plan_cost > settings.ai_query_max_cost:
+                    return [], [], (
+                        f"Query rejected: estimated cost {plan_cost:,.0f} exceeds "
+                        f"the limit of {settings.ai_query_max_cost:,.0f}. Narrow the "
+                        f"query with tighter filters or fewer joins."
+                    ), metrics
+
+                # Stream through a server-side cursor; fetch one extra row
+                # to detect truncation without pulling the full result set
+                exec_started = time.perf_counter()
+                result = await conn.stream(text(sql), params)
+                columns = list(result.keys())
+                rows = await result.fetchmany(row_limit + 1)
+                await result.close()
+                metrics["execution_ms"] = round(
+                    (time.perf_counter() - exec_started) * 1000, 2
+                )
+
+        if len(rows) > row_limit:
+            rows = rows[:row_limit]
+            metrics["truncated"] = True
 
         data = []
-        for row in rows[:500]:
+        for row in rows:
             row_dict = {}
             for i, col in enumerate(columns):
                 val = row[i]
@@ -606,12 +688,22 @@ async def _execute_query(
                 row_dict[col] = val
             data.append(row_dict)
 
-        return data, columns, None
+        metrics["row_count"] = len(data)
+        metrics["total_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        print(
+            f"[AI] Query ok: cost={metrics['plan_cost']}, rows={len(data)}, "
+            f"truncated={metrics['truncated']}, total={metrics['total_ms']}ms"
+        )
+        return data, columns, None, metrics
 
     except Exception as e:
-        # Rollback the failed transaction so the session is still usable
-        await db.rollback()
-        return [], [], str(e)
+        metrics["total_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        if "statement timeout" in str(e):
+            return [], [], (
+                f"Query cancelled after {settings.ai_query_timeout_ms}ms "
+                f"(statement timeout). Simplify the query."
+            ), metrics
+        return [], [], str(e), metrics
 
 
 def _detect_entity_links(columns: List[str]) -> Dict[str, str]:
@@ -647,14 +739,15 @@ async def _handle_non_sql(
 
     # NO_SQL_NEEDED — answer conversationally
     try:
-        conversational = client.messages.create(
-            model=settings.ai_model,
-            max_tokens=settings.ai_max_tokens,
-            system=f"""You are a helpful AI assistant for Camp Connect, a camp management platform.
-The user asked a question that doesn't require database queries.
-Answer helpfully and concisely. You are speaking to {user_name}.""",
-            messages=claude_messages,
-        )
+        with track_provider("anthropic", "chat"):
+            conversational = client.messages.create(
+                model=settings.ai_model,
+                max_tokens=settings.ai_max_tokens,
+                system=f"""You are a helpful AI assistant for Camp Connect, a camp management platform.
+    The user asked a question that doesn't require database queries.
+    Answer helpfully and concisely. You are speaking to {user_name}.""",
+                messages=claude_messages,
+            )
         return {
             "response": conversational.content[0].text,
             "sql": None,
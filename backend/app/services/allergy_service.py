@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+
 
 # ---------------------------------------------------------------------------
 # Table creation (idempotent, raw SQL — same pattern as award_service)
@@ -34,10 +36,17 @@ CREATE TABLE IF NOT EXISTS allergy_entries (
 """
 
 
+register_ddl(
+    "allergy",
+    _CREATE_ALLERGY_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_allergy_entries_org_id ON allergy_entries(org_id)",
+    "CREATE INDEX IF NOT EXISTS idx_allergy_entries_camper_id ON allergy_entries(camper_id)",
+)
+
+
 async def _ensure_tables(db: AsyncSession) -> None:
-    """Create the allergy_entries table if it does not exist."""
-    await db.execute(text(_CREATE_ALLERGY_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 # ---------------------------------------------------------------------------
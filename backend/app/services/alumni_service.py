@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+
 
 # ---------------------------------------------------------------------------
 # Table DDL (idempotent)
@@ -37,10 +39,16 @@ CREATE TABLE IF NOT EXISTS alumni (
 """
 
 
+register_ddl(
+    "alumni",
+    _CREATE_ALUMNI_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_alumni_organization_id ON alumni(organization_id)",
+)
+
+
 async def _ensure_table(db: AsyncSession) -> None:
-    """Create the alumni table if it does not exist (idempotent)."""
-    await db.execute(text(_CREATE_ALUMNI_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 # ---------------------------------------------------------------------------
@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+
 
 # ---------------------------------------------------------------------------
 # Table DDL (idempotent)
@@ -34,10 +36,16 @@ CREATE TABLE IF NOT EXISTS announcements (
 """
 
 
+register_ddl(
+    "announcement",
+    _CREATE_ANNOUNCEMENTS_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_announcements_org_id ON announcements(org_id)",
+)
+
+
 async def _ensure_table(db: AsyncSession) -> None:
-    """Create the announcements table if it does not exist (idempotent)."""
-    await db.execute(text(_CREATE_ANNOUNCEMENTS_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 # ---------------------------------------------------------------------------
@@ -1,25 +1,76 @@
 """
 Camp Connect - Audit Log Service
 Business logic for audit log CRUD operations.
-Uses in-memory store (same pattern as visitor/transportation services).
+
+Writes are buffered: ``log_action`` appends the event to an in-process
+buffer and returns immediately. A background flusher (``start_flusher``)
+bulk-inserts the buffer into the monthly-partitioned ``audit_logs`` table
+every ``settings.audit_flush_interval_ms`` or as soon as
+``settings.audit_flush_batch_size`` events are waiting, creating the month's
+partition first if needed. A failed flush keeps the events for the next
+attempt; only when the buffer exceeds ``settings.audit_buffer_max`` are the
+oldest events dropped (with an error log). Shutdown flushes what is left.
+
+Reads flush the buffer first, so a caller sees its own writes.
 """
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import json
+import logging
 import uuid
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
 
+from sqlalchemy import String, and_, cast, func, insert, or_, select, text
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
-_audit_store: Dict[str, List[Dict[str, Any]]] = {}
+from app.config import settings
+from app.models.audit_log import AuditLog
 
+logger = logging.getLogger(__name__)
 
-def _org_key(org_id: uuid.UUID) -> str:
-    return str(org_id)
+_buffer: List[Dict[str, Any]] = []
+_flush_wanted = asyncio.Event()
+_flush_lock = asyncio.Lock()
+_flusher_task: Optional["asyncio.Task[None]"] = None
+
+# First-of-month dates whose partition is known to exist in this process
+_partitions: Set[date] = set()
 
 
 # ---------------------------------------------------------------------------
-# Create
+# Partitions
+# ---------------------------------------------------------------------------
+
+def _month_start(value: datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+async def _ensure_partitions(conn: AsyncConnection, months: Iterable[date]) -> None:
+    """Create the monthly partitions for ``months`` (and the month after) if missing."""
+    wanted: Set[date] = set()
+    for month in months:
+        wanted.update((month, _next_month(month)))
+    for month in sorted(wanted - _partitions):
+        name = f"audit_logs_{month:%Y_%m}"
+        await conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+        ))
+        _partitions.add(month)
+
+
+# ---------------------------------------------------------------------------
+# Create (buffered)
 # ---------------------------------------------------------------------------
 
 async def log_action(
@@ -33,13 +84,12 @@ async def log_action(
     details: Optional[str] = None,
     ip_address: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Create a new audit log entry."""
-    key = _org_key(org_id)
-    now = datetime.utcnow().isoformat()
+    """Queue a new audit log entry for the flusher and return it."""
+    now = datetime.now(timezone.utc)
     entry = {
-        "id": str(uuid.uuid4()),
-        "organization_id": str(org_id),
-        "user_id": str(user_id),
+        "id": uuid.uuid4(),
+        "organization_id": uuid.UUID(str(org_id)),
+        "user_id": uuid.UUID(str(user_id)) if user_id else None,
         "user_name": user_name,
         "action": action,
         "resource_type": resource_type,
@@ -49,8 +99,179 @@ async def log_action(
         "ip_address": ip_address,
         "created_at": now,
     }
-    _audit_store.setdefault(key, []).append(entry)
-    return entry
+    _buffer.append(entry)
+
+    if len(_buffer) >= settings.audit_flush_batch_size:
+        _flush_wanted.set()
+    if len(_buffer) > settings.audit_buffer_max:
+        dropped = len(_buffer) - settings.audit_buffer_max
+        del _buffer[:dropped]
+        logger.error(f"Audit buffer full; dropped {dropped} oldest events")
+
+    return _entry_to_dict(entry)
+
+
+async def flush() -> int:
+    """Write every buffered event to audit_logs; return how many were written."""
+    from app.database import engine
+
+    if engine is None or not _buffer:
+        return 0
+
+    async with _flush_lock:
+        batch = _buffer[:]
+        if not batch:
+            return 0
+        del _buffer[:len(batch)]
+        try:
+            try:
+                return await _insert(engine, batch)
+            except (DataError, IntegrityError) as e:
+                # A bad row fails the whole statement; isolate it
+                _partitions.clear()
+                logger.warning(
+                    f"Audit flush of {len(batch)} events rejected ({e.orig}); "
+                    "retrying row by row"
+                )
+                return await _insert(engine, batch, each=True)
+        except Exception as e:
+            # Keep the events, oldest first, for the next attempt
+            _buffer[:0] = batch
+            _partitions.clear()
+            logger.warning(f"Audit flush of {len(batch)} events failed: {e}")
+            return 0
+
+
+async def _insert(
+    engine: AsyncEngine, batch: List[Dict[str, Any]], *, each: bool = False,
+) -> int:
+    """
+    Insert ``batch`` in one transaction; return how many rows were written.
+
+    With ``each``, every row gets its own savepoint and rows the database
+    rejects (too long, constraint violations) are logged and dropped, so one
+    bad event cannot block the rest. Other errors propagate.
+    """
+    table = AuditLog.__table__
+    async with engine.begin() as conn:
+        await _ensure_partitions(conn, {_month_start(e["created_at"]) for e in batch})
+        if not each:
+            # Multi-row INSERT ... VALUES (insertmanyvalues batching)
+            await conn.execute(insert(table), batch)
+            return len(batch)
+        written = 0
+        for entry in batch:
+            try:
+                async with conn.begin_nested():
+                    await conn.execute(insert(table), [entry])
+            except (DataError, IntegrityError) as e:
+                logger.error(
+                    f"Dropping audit event {entry['id']} ({entry['action']} "
+                    f"{entry['resource_type']}/{entry['resource_id']}, "
+                    f"org {entry['organization_id']}): {e.orig}"
+                )
+                continue
+            written += 1
+        return written
+
+
+async def _prepare_partitions(month: date) -> bool:
+    """
+    Make sure ``month``'s and the next month's partitions exist (for direct
+    ORM writers too). Returns False if the check failed.
+    """
+    from app.database import engine
+
+    if engine is None:
+        return True
+    try:
+        async with engine.begin() as conn:
+            await _ensure_partitions(conn, [month])
+    except Exception as e:
+        logger.warning(f"Audit partition check failed: {e}")
+        return False
+    return True
+
+
+async def _flush_loop() -> None:
+    interval = settings.audit_flush_interval_ms / 1000
+    prepared: Optional[date] = None
+    while True:
+        # At startup and on each month rollover (retried until it succeeds)
+        month = _month_start(datetime.now(timezone.utc))
+        if month != prepared and await _prepare_partitions(month):
+            prepared = month
+        try:
+            await asyncio.wait_for(_flush_wanted.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+        _flush_wanted.clear()
+        try:
+            await flush()
+        except Exception as e:
+            logger.warning(f"Audit flush loop error: {e}")
+
+
+def start_flusher() -> None:
+    """Start the background flusher (application startup)."""
+    global _flusher_task
+    if _flusher_task is None or _flusher_task.done():
+        _flusher_task = asyncio.create_task(_flush_loop())
+
+
+async def stop_flusher() -> None:
+    """Stop the flusher and write any remaining events (shutdown)."""
+    global _flusher_task
+    if _flusher_task is not None:
+        _flusher_task.cancel()
+        try:
+            await _flusher_task
+        except asyncio.CancelledError:
+            pass
+        _flusher_task = None
+    await flush()
+
+
+# ---------------------------------------------------------------------------
+# Read helpers
+# ---------------------------------------------------------------------------
+
+def _details_text(details: Any) -> Optional[str]:
+    if details is None or isinstance(details, str):
+        return details
+    return json.dumps(details)
+
+
+def _entry_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+    get = row.get
+    created_at = get("created_at")
+    return {
+        "id": str(get("id")),
+        "organization_id": str(get("organization_id")),
+        "user_id": str(get("user_id")) if get("user_id") else None,
+        "user_name": get("user_name") or "",
+        "action": get("action"),
+        "resource_type": get("resource_type"),
+        "resource_id": get("resource_id"),
+        "resource_name": get("resource_name"),
+        "details": _details_text(get("details")),
+        "ip_address": get("ip_address"),
+        "created_at": created_at.isoformat() if created_at else None,
+    }
+
+
+def _encode_cursor(created_at: datetime, entry_id: uuid.UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(entry_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, entry_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), uuid.UUID(entry_id)
+    except (ValueError, TypeError, binascii.Error):
+        raise ValueError("Invalid cursor")
 
 
 # ---------------------------------------------------------------------------
@@ -67,46 +288,82 @@ async def get_audit_logs(
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
     search: Optional[str] = None,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """List audit logs with filters and pagination."""
-    key = _org_key(org_id)
-    logs = list(_audit_store.get(key, []))
+    """
+    List audit logs newest first with filters.
+
+    Pass the returned ``next_cursor`` as ``cursor`` to page by keyset on
+    (created_at, id); ``total`` is only computed for the first page.
+    ``page`` (OFFSET) remains for older clients and is ignored with a cursor.
+    Raises ValueError for a malformed cursor or date.
+    """
+    from app.database import engine
+
+    await flush()
+    if engine is None:
+        return {"items": [], "total": 0, "page": page, "per_page": per_page, "next_cursor": None}
+
+    table = AuditLog.__table__
+    c = table.c
+    filters: List[Any] = [c.organization_id == uuid.UUID(str(org_id))]
 
-    # Apply filters
     if action_filter:
-        logs = [e for e in logs if e["action"] == action_filter]
+        filters.append(c.action == action_filter)
     if resource_type_filter:
-        logs = [e for e in logs if e["resource_type"] == resource_type_filter]
+        filters.append(c.resource_type == resource_type_filter)
     if user_id_filter:
-        logs = [e for e in logs if e["user_id"] == user_id_filter]
+        filters.append(c.user_id == uuid.UUID(user_id_filter))
+    # Date bounds on created_at let the planner prune partitions
     if date_from:
-        logs = [e for e in logs if e["created_at"][:10] >= date_from]
+        filters.append(c.created_at >= datetime.combine(
+            date.fromisoformat(date_from), datetime.min.time(), timezone.utc
+        ))
     if date_to:
-        logs = [e for e in logs if e["created_at"][:10] <= date_to]
+        filters.append(c.created_at < datetime.combine(
+            date.fromisoformat(date_to) + timedelta(days=1), datetime.min.time(), timezone.utc
+        ))
     if search:
-        q = search.lower()
-        logs = [
-            e for e in logs
-            if q in e.get("user_name", "").lower()
-            or q in e.get("resource_type", "").lower()
-            or q in e.get("resource_name", "").lower()
-            or q in e.get("details", "").lower()
-            or q in e.get("action", "").lower()
-        ]
-
-    # Sort newest first
-    logs.sort(key=lambda e: e["created_at"], reverse=True)
-
-    total = len(logs)
-    start = (page - 1) * per_page
-    end = start + per_page
-    items = logs[start:end]
+        pattern = f"%{search}%"
+        filters.append(or_(
+            c.user_name.ilike(pattern),
+            c.resource_type.ilike(pattern),
+            c.resource_name.ilike(pattern),
+            cast(c.details, String).ilike(pattern),
+            c.action.ilike(pattern),
+        ))
+
+    query = select(table).where(*filters)
+    if cursor:
+        after_at, after_id = _decode_cursor(cursor)
+        query = query.where(or_(
+            c.created_at < after_at,
+            and_(c.created_at == after_at, c.id < after_id),
+        ))
+    elif page > 1:
+        query = query.offset((page - 1) * per_page)
+    query = query.order_by(c.created_at.desc(), c.id.desc()).limit(per_page + 1)
+
+    async with engine.connect() as conn:
+        rows = (await conn.execute(query)).mappings().all()
+        total = None
+        if not cursor:
+            total = (await conn.execute(
+                select(func.count()).select_from(table).where(*filters)
+            )).scalar() or 0
+
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    next_cursor = None
+    if has_more and rows:
+        next_cursor = _encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
 
     return {
-        "items": items,
+        "items": [_entry_to_dict(dict(r)) for r in rows],
         "total": total,
         "page": page,
         "per_page": per_page,
+        "next_cursor": next_cursor,
     }
 
 
@@ -118,15 +375,18 @@ async def get_audit_stats(
     org_id: uuid.UUID,
 ) -> List[Dict[str, Any]]:
     """Return counts by action type for the last 30 days."""
-    key = _org_key(org_id)
-    logs = _audit_store.get(key, [])
-
-    cutoff = (datetime.utcnow() - timedelta(days=30)).isoformat()
-    recent = [e for e in logs if e["created_at"] >= cutoff]
+    from app.database import engine
 
-    counts: Dict[str, int] = {}
-    for entry in recent:
-        action = entry["action"]
-        counts[action] = counts.get(action, 0) + 1
+    await flush()
+    if engine is None:
+        return []
 
-    return [{"action": action, "count": count} for action, count in counts.items()]
+    c = AuditLog.__table__.c
+    cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(c.action, func.count())
+            .where(c.organization_id == uuid.UUID(str(org_id)), c.created_at >= cutoff)
+            .group_by(c.action)
+        )
+        return [{"action": action, "count": count} for action, count in result.all()]
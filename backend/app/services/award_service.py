@@ -13,6 +13,8 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import delete, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+
 
 # ---------------------------------------------------------------------------
 # In-memory store (no new DB tables required)
@@ -51,11 +53,20 @@ CREATE TABLE IF NOT EXISTS award_grants (
 """
 
 
+register_ddl(
+    "award",
+    _CREATE_BADGES_TABLE,
+    _CREATE_GRANTS_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_award_badges_org_id ON award_badges(org_id)",
+    "CREATE INDEX IF NOT EXISTS idx_award_grants_org_id ON award_grants(org_id)",
+    "CREATE INDEX IF NOT EXISTS idx_award_grants_badge_id ON award_grants(badge_id)",
+    "CREATE INDEX IF NOT EXISTS idx_award_grants_camper_id ON award_grants(camper_id)",
+)
+
+
 async def _ensure_tables(db: AsyncSession) -> None:
-    """Create tables if they don't exist (idempotent)."""
-    await db.execute(text(_CREATE_BADGES_TABLE))
-    await db.execute(text(_CREATE_GRANTS_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,492 @@
+"""
+Camp Connect - Background Check Sync Service
+Keeps BackgroundCheck rows in step with the screening provider.
+
+Status changes reach us two ways:
+
+- the poller (``start_poller``) refreshes every pending/processing check on
+  an interval, ``settings.background_check_sync_concurrency`` provider calls
+  at a time; one worker per cycle does the work (Postgres advisory lock)
+- the provider's webhook (``apply_webhook``) pushes changes as they happen
+
+Both end in ``apply_statuses``, which writes any number of changes in one
+UPDATE ... FROM (VALUES ...). Each change carries the provider's timestamp
+and is applied only if it is newer than the row's ``provider_updated_at``
+and changes the status or result, so webhook retries, unchanged polls and
+poll/webhook races are no-ops and an older status never overwrites a newer one.
+
+With ``settings.checkr_api_key`` set the Checkr API is used. A local fake
+provider that simulates pending -> processing -> complete is used only when
+``settings.background_check_fake_provider`` is on (development and tests);
+with neither, there is no provider, the poller does not start and checks
+are left as they are.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+from sqlalchemy import (
+    String, bindparam, column, false, func, literal_column, select, text, update, values,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import DateTime
+
+from app.config import settings
+from app.metrics import track_provider
+from app.models.background_check import BackgroundCheck
+
+logger = logging.getLogger(__name__)
+
+# Checks in these states are still moving on the provider's side
+OPEN_STATUSES = ("pending", "processing")
+
+# How long a completed check stays valid
+_VALIDITY = timedelta(days=365)
+
+_SYNC_LOCK_ID = 0x42474348  # "BGCH"
+_SYNC_BATCH = 500
+
+
+@dataclass
+class ProviderStatus:
+    """One status report for a check, from a poll or a webhook."""
+
+    external_id: str
+    status: str
+    occurred_at: datetime
+    result: Optional[str] = None
+    report_url: Optional[str] = None
+    completed_at: Optional[datetime] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------------
+# Providers
+# ---------------------------------------------------------------------------
+
+
+class BackgroundCheckProvider(ABC):
+    """
+    Interface to a screening provider. Subclasses implement ``fetch_status``;
+    webhook verification and parsing use Checkr's format (HMAC-SHA256 of the
+    body in ``X-Checkr-Signature``, report objects under ``data.object``).
+    """
+
+    name = "checkr"
+
+    @abstractmethod
+    async def fetch_status(self, check: Dict[str, Any]) -> Optional[ProviderStatus]:
+        """Current status of ``check`` (id, external_id, status, ...); None if unchanged."""
+
+    async def close(self) -> None:
+        pass
+
+    def parse_webhook(self, payload: bytes, signature: str) -> List[ProviderStatus]:
+        """Verify and decode a webhook body. Raises ValueError if it is not authentic."""
+        secret = settings.checkr_api_key
+        if not secret:
+            raise ValueError(
+                "Background check webhook secret not configured. "
+                "Set CHECKR_API_KEY in your environment."
+            )
+        expected = hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(expected, signature or ""):
+            raise ValueError("Invalid background check webhook signature")
+
+        try:
+            event = json.loads(payload)
+            report = event["data"]["object"]
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("Malformed background check webhook")
+        if report.get("object", "report") != "report" or not report.get("id"):
+            return []
+        occurred_at = _parse_time(event.get("created_at")) or datetime.now(timezone.utc)
+        return [_from_checkr_report(report, occurred_at, event_type=event.get("type"))]
+
+
+class CheckrProvider(BackgroundCheckProvider):
+    """Checkr REST API (reports are looked up by their ID)."""
+
+    _BASE_URL = "https://api.checkr.com/v1"
+
+    def __init__(self, api_key: str) -> None:
+        self._client = httpx.AsyncClient(
+            base_url=self._BASE_URL,
+            auth=(api_key, ""),
+            timeout=15.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+
+    async def fetch_status(self, check: Dict[str, Any]) -> Optional[ProviderStatus]:
+        with track_provider("checkr", "get_report"):
+            resp = await self._client.get(f"/reports/{check['external_id']}")
+            resp.raise_for_status()
+        report = resp.json()
+        occurred_at = _parse_time(report.get("completed_at")) or datetime.now(timezone.utc)
+        return _from_checkr_report(report, occurred_at)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class FakeProvider(BackgroundCheckProvider):
+    """
+    Local stand-in for development and tests: each poll advances a check
+    one step (pending -> processing -> complete, result clear). Never
+    selected unless ``settings.background_check_fake_provider`` is on.
+    """
+
+    async def fetch_status(self, check: Dict[str, Any]) -> Optional[ProviderStatus]:
+        now = datetime.now(timezone.utc)
+        if check["status"] == "pending":
+            return ProviderStatus(
+                external_id=check["external_id"],
+                status="processing",
+                occurred_at=now,
+                details={"provider_status": "processing", "last_refreshed": now.isoformat()},
+            )
+        if check["status"] == "processing":
+            return ProviderStatus(
+                external_id=check["external_id"],
+                status="complete",
+                occurred_at=now,
+                result="clear",
+                report_url=f"https://dashboard.checkr.com/reports/{check['external_id']}",
+                completed_at=now,
+                details={
+                    "provider_status": "complete",
+                    "completed_at": now.isoformat(),
+                    "result_summary": "All clear - no records found",
+                    "checks_completed": [
+                        "ssn_trace",
+                        "sex_offender_search",
+                        "national_criminal_search",
+                        "county_criminal_search",
+                    ],
+                },
+            )
+        return None
+
+
+_provider: Optional[BackgroundCheckProvider] = None
+
+
+def get_provider() -> Optional[BackgroundCheckProvider]:
+    """
+    Process-wide provider: Checkr when an API key is configured, the fake
+    when explicitly enabled, otherwise None.
+    """
+    global _provider
+    if _provider is None:
+        if settings.checkr_api_key:
+            _provider = CheckrProvider(settings.checkr_api_key)
+        elif settings.background_check_fake_provider:
+            _provider = FakeProvider()
+    return _provider
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _from_checkr_report(
+    report: Dict[str, Any], occurred_at: datetime, event_type: Optional[str] = None,
+) -> ProviderStatus:
+    """Map a Checkr report object onto our status vocabulary."""
+    provider_status = report.get("status") or "pending"
+    result = report.get("result")
+    if provider_status == "complete":
+        status = "flagged" if result == "consider" else "complete"
+    elif provider_status in ("suspended", "canceled"):
+        status, result = "failed", result or provider_status
+    elif provider_status == "dispute":
+        status = "flagged"
+    else:
+        status = "processing"
+
+    details: Dict[str, Any] = {"provider_status": provider_status}
+    if event_type:
+        details["last_event"] = event_type
+    return ProviderStatus(
+        external_id=str(report["id"]),
+        status=status,
+        occurred_at=occurred_at,
+        result=result,
+        report_url=f"https://dashboard.checkr.com/reports/{report['id']}",
+        completed_at=_parse_time(report.get("completed_at")) if status != "processing" else None,
+        details=details,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Bulk apply
+# ---------------------------------------------------------------------------
+
+
+async def apply_statuses(
+    db: AsyncSession,
+    statuses: Sequence[ProviderStatus],
+    *,
+    provider: str = "checkr",
+    organization_id: Optional[uuid.UUID] = None,
+) -> List[uuid.UUID]:
+    """
+    Apply status reports in one UPDATE; return the IDs of checks that changed.
+    Reports older than a check's ``provider_updated_at`` are skipped. The
+    caller commits.
+    """
+    # Keep the newest report per check
+    latest: Dict[str, ProviderStatus] = {}
+    for s in statuses:
+        if s.external_id not in latest or s.occurred_at > latest[s.external_id].occurred_at:
+            latest[s.external_id] = s
+    if not latest:
+        return []
+
+    incoming = values(
+        column("external_id", String),
+        column("status", String),
+        column("result", String),
+        column("report_url", String),
+        column("completed_at", DateTime),
+        column("expires_at", DateTime),
+        column("occurred_at", DateTime(timezone=True)),
+        column("details", JSONB),
+        name="incoming",
+    ).data([
+        (
+            s.external_id,
+            s.status,
+            s.result,
+            s.report_url,
+            _naive_utc(s.completed_at),
+            _naive_utc(s.completed_at + _VALIDITY) if s.completed_at else None,
+            s.occurred_at,
+            s.details,
+        )
+        for s in latest.values()
+    ])
+
+    bc = BackgroundCheck.__table__.c
+    stmt = (
+        update(BackgroundCheck.__table__)
+        .where(bc.provider == provider)
+        .where(bc.external_id == incoming.c.external_id)
+        .where(
+            (bc.provider_updated_at.is_(None))
+            | (bc.provider_updated_at < incoming.c.occurred_at)
+        )
+        .where(
+            bc.status.is_distinct_from(incoming.c.status)
+            | bc.result.is_distinct_from(func.coalesce(incoming.c.result, bc.result))
+        )
+        .values(
+            status=incoming.c.status,
+            result=func.coalesce(incoming.c.result, bc.result),
+            report_url=func.coalesce(incoming.c.report_url, bc.report_url),
+            completed_at=func.coalesce(bc.completed_at, incoming.c.completed_at),
+            expires_at=func.coalesce(bc.expires_at, incoming.c.expires_at),
+            details=func.coalesce(bc.details, literal_column("'{}'::jsonb")).op("||")(
+                incoming.c.details
+            ),
+            provider_updated_at=incoming.c.occurred_at,
+            updated_at=func.timezone("utc", func.now()),
+        )
+        .returning(bc.id)
+    )
+    if organization_id is not None:
+        stmt = stmt.where(bc.organization_id == organization_id)
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """The model's DateTime columns hold naive UTC."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+async def apply_webhook(db: AsyncSession, payload: bytes, signature: str) -> int:
+    """Verify, parse and apply a provider webhook; return how many checks changed."""
+    provider = get_provider()
+    if provider is None:
+        raise ValueError(
+            "Background check provider not configured. "
+            "Set CHECKR_API_KEY in your environment."
+        )
+    statuses = provider.parse_webhook(payload, signature)
+    changed = await apply_statuses(db, statuses, provider=provider.name)
+    await db.commit()
+    return len(changed)
+
+
+# ---------------------------------------------------------------------------
+# Batch poll
+# ---------------------------------------------------------------------------
+
+
+async def refresh_checks(
+    db: AsyncSession,
+    checks: Sequence[Dict[str, Any]],
+    *,
+    organization_id: Optional[uuid.UUID] = None,
+) -> List[uuid.UUID]:
+    """
+    Ask the provider about ``checks`` (dicts with id, external_id, status)
+    with bounded concurrency and apply the answers in one update.
+    A failed lookup is logged and leaves its check for the next cycle.
+    Without a configured provider nothing is refreshed.
+    """
+    provider = get_provider()
+    if provider is None:
+        return []
+    semaphore = asyncio.Semaphore(settings.background_check_sync_concurrency)
+
+    async def fetch(check: Dict[str, Any]) -> Optional[ProviderStatus]:
+        async with semaphore:
+            try:
+                return await provider.fetch_status(check)
+            except Exception as e:
+                logger.warning(f"Background check refresh failed for {check['id']}: {e}")
+                return None
+
+    answers = await asyncio.gather(*(fetch(c) for c in checks))
+    changed = await apply_statuses(
+        db,
+        [a for a in answers if a is not None],
+        provider=provider.name,
+        organization_id=organization_id,
+    )
+    await db.commit()
+    return changed
+
+
+async def _open_checks(
+    db: AsyncSession,
+    provider: BackgroundCheckProvider,
+    organization_id: Optional[uuid.UUID] = None,
+    after_id: Optional[uuid.UUID] = None,
+) -> List[Dict[str, Any]]:
+    query = (
+        select(BackgroundCheck.id, BackgroundCheck.external_id, BackgroundCheck.status)
+        # Rendered as literals so the partial ix_background_checks_open matches
+        .where(BackgroundCheck.status.in_(
+            bindparam("open_statuses", OPEN_STATUSES, expanding=True, literal_execute=True)
+        ))
+        .where(BackgroundCheck.is_archived == false())
+        .where(BackgroundCheck.provider == provider.name)
+        .where(BackgroundCheck.external_id.is_not(None))
+        .order_by(BackgroundCheck.id)
+        .limit(_SYNC_BATCH)
+    )
+    if organization_id is not None:
+        query = query.where(BackgroundCheck.organization_id == organization_id)
+    if after_id is not None:
+        query = query.where(BackgroundCheck.id > after_id)
+    return [dict(r._mapping) for r in (await db.execute(query)).all()]
+
+
+async def sync_open_checks(
+    db: AsyncSession, organization_id: Optional[uuid.UUID] = None,
+) -> Dict[str, int]:
+    """
+    Refresh every pending/processing check (optionally for one org) in
+    batches of ``_SYNC_BATCH``. Returns counts of checks polled and changed.
+    """
+    polled = changed = 0
+    provider = get_provider()
+    if provider is None:
+        return {"polled": polled, "changed": changed}
+    after_id: Optional[uuid.UUID] = None
+    while True:
+        batch = await _open_checks(db, provider, organization_id, after_id)
+        if not batch:
+            break
+        polled += len(batch)
+        changed += len(await refresh_checks(db, batch, organization_id=organization_id))
+        after_id = batch[-1]["id"]
+    return {"polled": polled, "changed": changed}
+
+
+_poller_task: Optional["asyncio.Task[None]"] = None
+
+
+async def _sync_all() -> Dict[str, int]:
+    from app.database import async_session_factory, engine
+
+    if engine is None or async_session_factory is None:
+        return {"polled": 0, "changed": 0}
+    async with engine.connect() as lock_conn:
+        locked = (await lock_conn.execute(
+            text("SELECT pg_try_advisory_lock(:id)"), {"id": _SYNC_LOCK_ID}
+        )).scalar()
+        if not locked:
+            return {"polled": 0, "changed": 0}
+        try:
+            async with async_session_factory() as db:
+                return await sync_open_checks(db)
+        finally:
+            await lock_conn.execute(
+                text("SELECT pg_advisory_unlock(:id)"), {"id": _SYNC_LOCK_ID}
+            )
+            await lock_conn.commit()
+
+
+async def _poll_loop() -> None:
+    while True:
+        try:
+            report = await _sync_all()
+            if report["polled"]:
+                logger.info(
+                    f"Background check sync: {report['changed']} of "
+                    f"{report['polled']} open checks changed"
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Background check sync cycle failed: {e}")
+        await asyncio.sleep(settings.background_check_sync_interval)
+
+
+def start_poller() -> None:
+    """Start the background sync loop (application startup) if a provider is configured."""
+    global _poller_task
+    if get_provider() is None:
+        logger.info("No background check provider configured; sync poller not started")
+        return
+    if _poller_task is None or _poller_task.done():
+        _poller_task = asyncio.create_task(_poll_loop())
+
+
+async def stop_poller() -> None:
+    """Cancel the sync loop and close the provider client (shutdown)."""
+    global _poller_task, _provider
+    if _poller_task is not None:
+        _poller_task.cancel()
+        try:
+            await _poller_task
+        except asyncio.CancelledError:
+            pass
+        _poller_task = None
+    if _provider is not None:
+        await _provider.close()
+        _provider = None
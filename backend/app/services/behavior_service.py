@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+
 
 # ---------------------------------------------------------------------------
 # Table creation (idempotent)
@@ -38,10 +40,17 @@ CREATE TABLE IF NOT EXISTS behavior_logs (
 """
 
 
+register_ddl(
+    "behavior",
+    _CREATE_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_behavior_logs_org_id ON behavior_logs(org_id)",
+    "CREATE INDEX IF NOT EXISTS idx_behavior_logs_camper_id ON behavior_logs(camper_id)",
+)
+
+
 async def _ensure_table(db: AsyncSession) -> None:
-    """Create the behavior_logs table if it does not exist."""
-    await db.execute(text(_CREATE_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,163 @@
+"""
+Camp Connect - Booking Engine
+Helpers shared by the resource and room booking services.
+
+Overlap detection itself lives in the database: resource_bookings and
+room_bookings both carry a generated ``period tstzrange`` column guarded by
+a GiST exclusion constraint, so concurrent requests cannot double-book.
+This module only expands recurring occurrences, checks a batch against
+itself, and turns busy ranges into free slots.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy.exc import IntegrityError
+
+Slot = Tuple[datetime, datetime]
+
+# Names of the exclusion constraints created by migration m3n4o5p6q7r8
+OVERLAP_CONSTRAINTS = (
+    "ex_resource_bookings_no_overlap",
+    "ex_room_bookings_no_overlap",
+)
+
+# SQLSTATE raised by PostgreSQL for exclusion constraint violations
+_EXCLUSION_VIOLATION = "23P01"
+
+MAX_OCCURRENCES = 500
+
+
+def expand_occurrences(
+    occurrences: Sequence[Dict[str, Any]],
+    repeat: Optional[Dict[str, Any]] = None,
+) -> List[Slot]:
+    """
+    Expand the requested occurrences into a flat list of (start, end) slots.
+
+    When ``repeat`` is given ({"frequency": "daily"|"weekly", "interval": n,
+    "count": n}), every occurrence is repeated ``count`` times in total.
+    Raises ValueError on inverted ranges or oversized batches.
+    """
+    step: Optional[timedelta] = None
+    count = 1
+    if repeat:
+        interval = repeat.get("interval") or 1
+        days = 7 if repeat.get("frequency") == "weekly" else 1
+        step = timedelta(days=days * interval)
+        count = repeat.get("count") or 1
+
+    slots: List[Slot] = []
+    for occ in occurrences:
+        start, end = occ["start_time"], occ["end_time"]
+        if end <= start:
+            raise ValueError("End time must be after start time.")
+        for i in range(count):
+            offset = step * i if step else timedelta(0)
+            slots.append((start + offset, end + offset))
+
+    if not slots:
+        raise ValueError("At least one occurrence is required.")
+    if len(slots) > MAX_OCCURRENCES:
+        raise ValueError(
+            f"A single request may reserve at most {MAX_OCCURRENCES} occurrences."
+        )
+    return slots
+
+
+def find_batch_overlaps(slots: Sequence[Slot]) -> List[Tuple[int, int]]:
+    """
+    Return (index, other_index) pairs for occurrences in the same batch
+    that overlap each other. Sort-and-sweep, O(n log n).
+    """
+    order = sorted(range(len(slots)), key=lambda i: slots[i][0])
+    overlaps: List[Tuple[int, int]] = []
+    latest_idx: Optional[int] = None
+    for idx in order:
+        if latest_idx is not None and slots[idx][0] < slots[latest_idx][1]:
+            overlaps.append((idx, latest_idx))
+        if latest_idx is None or slots[idx][1] > slots[latest_idx][1]:
+            latest_idx = idx
+    return overlaps
+
+
+def is_overlap_violation(exc: IntegrityError) -> bool:
+    """True if the IntegrityError came from one of the overlap constraints."""
+    orig = getattr(exc, "orig", None)
+    if getattr(orig, "sqlstate", None) == _EXCLUSION_VIOLATION:
+        return True
+    message = str(orig or exc)
+    return any(name in message for name in OVERLAP_CONSTRAINTS)
+
+
+def availability_windows(
+    *,
+    day: date,
+    span: str = "day",
+    tz: str = "UTC",
+    day_start: time = time(0, 0),
+    day_end: Optional[time] = None,
+) -> List[Slot]:
+    """
+    Build the bookable window for each day in the requested span.
+
+    ``day_end`` of None means midnight at the end of the day. Windows are
+    returned as aware UTC datetimes so they can be compared directly with
+    timestamptz values.
+    """
+    try:
+        zone = ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f"Unknown timezone: {tz}")
+
+    if span == "week":
+        first = day - timedelta(days=day.weekday())
+        days = [first + timedelta(days=i) for i in range(7)]
+    else:
+        days = [day]
+
+    windows: List[Slot] = []
+    for d in days:
+        start = datetime.combine(d, day_start, tzinfo=zone)
+        if day_end is None:
+            end = datetime.combine(d + timedelta(days=1), time(0, 0), tzinfo=zone)
+        else:
+            end = datetime.combine(d, day_end, tzinfo=zone)
+        if end <= start:
+            raise ValueError("day_end must be after day_start.")
+        windows.append((start.astimezone(timezone.utc), end.astimezone(timezone.utc)))
+    return windows
+
+
+def compute_free_slots(
+    windows: Sequence[Slot],
+    busy: Sequence[Slot],
+    *,
+    min_minutes: int = 0,
+) -> List[Dict[str, datetime]]:
+    """
+    Subtract busy ranges from each window and return the gaps that are at
+    least ``min_minutes`` long. ``busy`` must be sorted by start time.
+    """
+    min_length = timedelta(minutes=min_minutes)
+    free: List[Dict[str, datetime]] = []
+    i = 0
+    for win_start, win_end in windows:
+        # Skip busy ranges that end before this window opens
+        while i < len(busy) and busy[i][1] <= win_start:
+            i += 1
+        cursor = win_start
+        j = i
+        while j < len(busy) and busy[j][0] < win_end:
+            b_start, b_end = busy[j]
+            if b_start > cursor and b_start - cursor >= min_length:
+                free.append({"start_time": cursor, "end_time": b_start})
+            if b_end > cursor:
+                cursor = b_end
+            j += 1
+        if cursor < win_end and win_end - cursor >= min_length:
+            free.append({"start_time": cursor, "end_time": win_end})
+    return free
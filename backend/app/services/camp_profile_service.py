@@ -5,17 +5,36 @@ Business logic for camp directory profiles.
 
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+import math
 import re
 import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import select, func, or_, and_
+from sqlalchemy import Float, and_, case, cast, func, literal, literal_column, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import response_cache
 from app.models.camp_profile import CampProfile
 from app.models.organization import Organization
 
+CACHE_NAMESPACE = "camp_directory"
+
+
+async def _directory_version(db: AsyncSession, tenant: Optional[str]) -> tuple:
+    """Changes whenever a published profile is added, edited or removed."""
+    result = await db.execute(
+        select(func.max(CampProfile.updated_at), func.count())
+        .where(CampProfile.is_published == True)
+    )
+    return tuple(result.one())
+
+
+response_cache.register_namespace(CACHE_NAMESPACE, _directory_version)
+
 
 def _slugify(text: str) -> str:
     """Convert text to URL-friendly slug."""
@@ -131,6 +150,7 @@ async def upsert_profile(
 
     await db.commit()
     await db.refresh(profile)
+    response_cache.invalidate(CACHE_NAMESPACE)
     return _profile_to_dict(profile)
 
 
@@ -152,9 +172,145 @@ async def publish_profile(
     profile.updated_at = datetime.utcnow()
     await db.commit()
     await db.refresh(profile)
+    response_cache.invalidate(CACHE_NAMESPACE)
     return _profile_to_dict(profile)
 
 
+# ─── Directory search ────────────────────────────────────────
+# Text search uses the generated, GIN-indexed ``search_vector`` with
+# prefix matching so results update per keystroke. Radius search narrows
+# on a lat/lon bounding box (indexed) before the exact haversine distance.
+# Pages are keyset-paginated on the active sort order; ``next_cursor``
+# encodes the last row's sort values.
+
+_EARTH_RADIUS_MILES = 3958.8
+_MILES_PER_DEGREE_LAT = 69.0
+
+_PRICE_BANDS = (
+    ("under_500", None, 500),
+    ("500_1000", 500, 1000),
+    ("1000_2000", 1000, 2000),
+    ("2000_plus", 2000, None),
+)
+
+
+def _tsquery(q: Optional[str]):
+    """Prefix tsquery for free text, or None when it has no searchable words."""
+    tokens = re.findall(r"\w+", (q or "").lower())
+    if not tokens:
+        return None
+    return func.to_tsquery(
+        literal_column("'english'::regconfig"),
+        " & ".join(f"{token}:*" for token in tokens),
+    )
+
+
+def _distance_miles(lat: float, lon: float):
+    """Great-circle distance from (lat, lon) to the profile, in miles."""
+    dlat = func.radians(CampProfile.latitude - lat) / 2
+    dlon = func.radians(CampProfile.longitude - lon) / 2
+    a = (
+        func.power(func.sin(dlat), 2)
+        + math.cos(math.radians(lat))
+        * func.cos(func.radians(CampProfile.latitude))
+        * func.power(func.sin(dlon), 2)
+    )
+    return 2 * _EARTH_RADIUS_MILES * func.asin(func.least(1.0, func.sqrt(a)))
+
+
+def _price_band():
+    whens = []
+    for band, _low, high in _PRICE_BANDS:
+        if high is not None:
+            whens.append((CampProfile.price_range_min < high, band))
+    return case(
+        (CampProfile.price_range_min.is_(None), "unknown"),
+        *whens,
+        else_=_PRICE_BANDS[-1][0],
+    )
+
+
+def _encode_cursor(values: List[Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decode a cursor into its sort values; the last one is the profile id."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError
+        values[-1] = uuid.UUID(str(values[-1]))
+    except (ValueError, binascii.Error):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _after(sort_keys: List[Any], values: List[Any]):
+    """Row-value comparison "strictly after ``values``" for mixed sort directions."""
+    (expr, desc), value = sort_keys[-1], literal(values[-1], sort_keys[-1][0].type)
+    condition = expr < value if desc else expr > value
+    for (expr, desc), value in zip(reversed(sort_keys[:-1]), reversed(values[:-1])):
+        value = literal(value, expr.type)
+        beyond = expr < value if desc else expr > value
+        condition = or_(beyond, and_(expr == value, condition))
+    return condition
+
+
+async def _directory_facets(db: AsyncSession, filters: List[Any]) -> Dict[str, Any]:
+    """Total and facet counts (camp_type, state, price band) in one query."""
+    matched = (
+        select(
+            CampProfile.camp_type.label("camp_type"),
+            CampProfile.state.label("state"),
+            _price_band().label("price_band"),
+        )
+        .where(*filters)
+        .cte("matched")
+    )
+
+    def facet(values):
+        counts = (
+            select(values.c.k, func.count().label("n"))
+            .where(values.c.k.is_not(None))
+            .group_by(values.c.k)
+            .subquery()
+        )
+        return (
+            select(
+                func.coalesce(
+                    func.jsonb_object_agg(counts.c.k, counts.c.n),
+                    literal_column("'{}'::jsonb"),
+                )
+            )
+            .scalar_subquery()
+        )
+
+    camp_types = select(func.unnest(matched.c.camp_type).label("k")).subquery()
+    states = select(matched.c.state.label("k")).subquery()
+    bands = select(matched.c.price_band.label("k")).subquery()
+
+    result = await db.execute(
+        select(
+            select(func.count()).select_from(matched).scalar_subquery(),
+            facet(camp_types),
+            facet(states),
+            facet(bands),
+        )
+    )
+    total, by_type, by_state, by_band = result.one()
+    return {
+        "total": total or 0,
+        "facets": {
+            "camp_type": by_type or {},
+            "state": by_state or {},
+            "price_band": by_band or {},
+        },
+    }
+
+
 async def list_published_profiles(
     db: AsyncSession,
     *,
@@ -165,63 +321,119 @@ async def list_published_profiles(
     age_max: Optional[int] = None,
     price_min: Optional[float] = None,
     price_max: Optional[float] = None,
+    lat: Optional[float] = None,
+    lon: Optional[float] = None,
+    radius_miles: Optional[float] = None,
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 24,
 ) -> Dict[str, Any]:
-    """List published camp profiles with search and filters."""
-    query = select(CampProfile).where(CampProfile.is_published == True)
-
-    if q:
-        search_term = f"%{q}%"
-        query = query.where(
-            or_(
-                CampProfile.name.ilike(search_term),
-                CampProfile.tagline.ilike(search_term),
-                CampProfile.description.ilike(search_term),
-                CampProfile.city.ilike(search_term),
-                CampProfile.state.ilike(search_term),
-            )
-        )
+    """
+    List published camp profiles with search, filters and facet counts.
+
+    Ordered by relevance when ``q`` is given, by distance when ``lat``/``lon``
+    are, otherwise featured-first by name. Pass the returned ``next_cursor``
+    as ``cursor`` for the following page; ``skip`` remains for older clients
+    and is ignored when a cursor is given.
+
+    Raises ValueError for a malformed cursor or incomplete geo parameters.
+    """
+    filters: List[Any] = [CampProfile.is_published == True]
+
+    ts_query = _tsquery(q)
+    if ts_query is not None:
+        filters.append(CampProfile.search_vector.op("@@")(ts_query))
 
     if camp_type:
-        query = query.where(CampProfile.camp_type.any(camp_type))
+        filters.append(CampProfile.camp_type.contains([camp_type]))
 
     if state:
-        query = query.where(func.lower(CampProfile.state) == state.lower())
+        filters.append(func.lower(CampProfile.state) == state.lower())
 
     if age_min is not None:
-        query = query.where(
+        filters.append(
             or_(CampProfile.age_range_max.is_(None), CampProfile.age_range_max >= age_min)
         )
 
     if age_max is not None:
-        query = query.where(
+        filters.append(
             or_(CampProfile.age_range_min.is_(None), CampProfile.age_range_min <= age_max)
         )
 
     if price_min is not None:
-        query = query.where(
+        filters.append(
             or_(CampProfile.price_range_max.is_(None), CampProfile.price_range_max >= price_min)
         )
 
     if price_max is not None:
-        query = query.where(
+        filters.append(
             or_(CampProfile.price_range_min.is_(None), CampProfile.price_range_min <= price_max)
         )
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Fetch page
-    query = query.order_by(CampProfile.is_featured.desc(), CampProfile.name).offset(skip).limit(limit)
-    result = await db.execute(query)
-    profiles = result.scalars().all()
-
+    distance = None
+    if lat is not None or lon is not None:
+        if lat is None or lon is None:
+            raise ValueError("lat and lon must be given together")
+        distance = cast(_distance_miles(lat, lon), Float)
+        if radius_miles is not None:
+            dlat = radius_miles / _MILES_PER_DEGREE_LAT
+            dlon = radius_miles / (_MILES_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 0.01))
+            filters.extend([
+                CampProfile.latitude.between(lat - dlat, lat + dlat),
+                CampProfile.longitude.between(lon - dlon, lon + dlon),
+                distance <= radius_miles,
+            ])
+        else:
+            filters.extend([CampProfile.latitude.is_not(None), CampProfile.longitude.is_not(None)])
+
+    # Sort keys: (expression, descending) ending with id as the tiebreaker
+    if ts_query is not None:
+        rank = cast(func.ts_rank_cd(CampProfile.search_vector, ts_query), Float)
+        sort_keys = [(rank, True), (CampProfile.id, False)]
+    elif distance is not None:
+        sort_keys = [(distance, False), (CampProfile.id, False)]
+    else:
+        featured = func.coalesce(CampProfile.is_featured, False)
+        sort_keys = [(featured, True), (CampProfile.name, False), (CampProfile.id, False)]
+
+    page_filters = list(filters)
+    if cursor:
+        values = _decode_cursor(cursor, len(sort_keys))
+        page_filters.append(_after(sort_keys, values))
+
+    extra = [expr.label(f"_sort{i}") for i, (expr, _) in enumerate(sort_keys[:-1])]
+    query = (
+        select(CampProfile, *extra)
+        .where(*page_filters)
+        .order_by(*[expr.desc() if desc else expr.asc() for expr, desc in sort_keys])
+        .limit(limit + 1)
+    )
+    if not cursor and skip:
+        query = query.offset(skip)
+    rows = (await db.execute(query)).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    items = []
+    for row in rows:
+        item = _profile_to_dict(row[0])
+        if ts_query is not None:
+            item["rank"] = row[1]
+        elif distance is not None:
+            item["distance_miles"] = round(row[1], 1) if row[1] is not None else None
+        items.append(item)
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = _encode_cursor(list(last[1:]) + [str(last[0].id)])
+
+    summary = await _directory_facets(db, filters)
     return {
-        "items": [_profile_to_dict(p) for p in profiles],
-        "total": total,
+        "items": items,
+        "total": summary["total"],
+        "facets": summary["facets"],
+        "next_cursor": next_cursor,
         "skip": skip,
         "limit": limit,
     }
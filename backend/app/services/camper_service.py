@@ -5,18 +5,68 @@ Business logic for camper (child/participant) management.
 
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+import time
 import uuid
+from collections import OrderedDict
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import func, literal, literal_column, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.metrics import record_cache
 from app.models.camper import Camper
 from app.models.camper_contact import CamperContact
 from app.models.contact import Contact
 from app.models.registration import Registration
+from app.services.portal_service import invalidate_portal_context
+from app.utils.pagination import estimate_count
+
+
+# ─── List ───────────────────────────────────────────────────
+# The list endpoint reads a slim projection: only the columns the campers
+# table shows, the active registration count and the primary contact, each
+# as a correlated subquery (no per-page eager loading). Pages are keyset
+# paginated on (last_name, first_name, id). Name search is a substring
+# match on "first last", served by a trigram GIN index.
+
+_COUNT_TTL = 60  # seconds a cached total stays valid (writes invalidate it)
+_MAX_COUNTS = 1024
+# (org, search, age_min, age_max, today) -> (stored at, total); LRU
+_count_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, int]]" = OrderedDict()
+
+COUNT_MODES = ("exact", "cached", "estimate", "none")
+
+
+def _invalidate_counts(organization_id: uuid.UUID) -> None:
+    org = str(organization_id)
+    for key in [k for k in _count_cache if k[0] == org]:
+        _count_cache.pop(key, None)
+
+
+def _encode_cursor(last_name: str, first_name: str, camper_id: uuid.UUID) -> str:
+    raw = json.dumps([last_name, first_name, str(camper_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        last_name, first_name, camper_id = json.loads(raw)
+        return str(last_name), str(first_name), uuid.UUID(camper_id)
+    except (ValueError, TypeError, binascii.Error):
+        raise ValueError("Invalid cursor")
+
+
+def _years_ago(today: date, years: int) -> date:
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:  # Feb 29 in a non-leap year
+        return today.replace(year=today.year - years, day=28)
 
 
 async def list_campers(
@@ -27,29 +77,43 @@ async def list_campers(
     event_id: Optional[uuid.UUID] = None,
     age_min: Optional[int] = None,
     age_max: Optional[int] = None,
+    cursor: Optional[str] = None,
+    count: str = "cached",
     skip: int = 0,
     limit: int = 50,
 ) -> Dict[str, Any]:
-    """List campers with filters and pagination."""
-    query = (
-        select(Camper)
-        .options(
-            selectinload(Camper.camper_contacts).selectinload(CamperContact.contact),
-            selectinload(Camper.registrations),
-        )
-        .where(Camper.organization_id == organization_id)
-        .where(Camper.deleted_at.is_(None))
-    )
+    """
+    List campers with filters and keyset pagination.
+
+    Pass the returned ``next_cursor`` as ``cursor`` for the next page;
+    ``skip`` is kept for older clients and ignored with a cursor.
+
+    ``count`` selects how ``total`` is produced: ``exact`` (count query),
+    ``cached`` (exact, reused for up to a minute per filter set; camper
+    writes invalidate it; with ``event_id`` it is counted exactly, since
+    registration changes would not invalidate it), ``estimate`` (planner
+    estimate, flagged with ``total_is_estimate``) or ``none``.
+
+    Raises ValueError for a malformed cursor or unknown count mode.
+    """
+    if count not in COUNT_MODES:
+        raise ValueError(f"count must be one of {', '.join(COUNT_MODES)}")
+
+    filters: List[Any] = [
+        Camper.organization_id == organization_id,
+        Camper.deleted_at.is_(None),
+    ]
 
     if search:
-        search_pattern = f"%{search}%"
-        query = query.where(
-            (Camper.first_name.ilike(search_pattern))
-            | (Camper.last_name.ilike(search_pattern))
+        filters.append(
+            # Same expression as ix_campers_full_name_trgm
+            (Camper.first_name + literal_column("' '") + Camper.last_name).ilike(
+                f"%{search.strip()}%"
+            )
         )
 
     if event_id:
-        query = query.where(
+        filters.append(
             Camper.id.in_(
                 select(Registration.camper_id)
                 .where(Registration.event_id == event_id)
@@ -60,36 +124,130 @@ async def list_campers(
     # Age filtering based on date_of_birth
     today = date.today()
     if age_min is not None:
-        max_dob = date(today.year - age_min, today.month, today.day)
-        query = query.where(Camper.date_of_birth <= max_dob)
+        filters.append(Camper.date_of_birth <= _years_ago(today, age_min))
     if age_max is not None:
-        min_dob = date(today.year - age_max - 1, today.month, today.day)
-        query = query.where(Camper.date_of_birth > min_dob)
-
-    # Count total before pagination
-    from sqlalchemy import func as sqlfunc
-    count_query = (
-        select(sqlfunc.count())
-        .select_from(Camper)
-        .where(Camper.organization_id == organization_id)
-        .where(Camper.deleted_at.is_(None))
+        filters.append(Camper.date_of_birth > _years_ago(today, age_max + 1))
+
+    registration_count = (
+        select(func.count())
+        .select_from(Registration)
+        .where(
+            Registration.camper_id == Camper.id,
+            Registration.status != "cancelled",
+            Registration.deleted_at.is_(None),
+        )
+        .correlate(Camper)
+        .scalar_subquery()
     )
-    if search:
-        count_query = count_query.where(
-            (Camper.first_name.ilike(f"%{search}%"))
-            | (Camper.last_name.ilike(f"%{search}%"))
+    primary_contact = (
+        select(
+            func.json_build_object(
+                "contact_id", Contact.id,
+                "first_name", Contact.first_name,
+                "last_name", Contact.last_name,
+                "email", Contact.email,
+                "phone", Contact.phone,
+                "relationship_type", CamperContact.relationship_type,
+                "is_primary", CamperContact.is_primary,
+                "is_emergency", CamperContact.is_emergency,
+                "is_authorized_pickup", CamperContact.is_authorized_pickup,
+            )
         )
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+        .select_from(CamperContact)
+        .join(Contact, Contact.id == CamperContact.contact_id)
+        .where(CamperContact.camper_id == Camper.id, Contact.deleted_at.is_(None))
+        .order_by(CamperContact.is_primary.desc(), CamperContact.created_at)
+        .limit(1)
+        .correlate(Camper)
+        .scalar_subquery()
+    )
 
-    query = query.order_by(Camper.last_name, Camper.first_name)
-    query = query.offset(skip).limit(limit)
-    result = await db.execute(query)
-    campers = result.scalars().all()
+    query = select(
+        Camper.id,
+        Camper.first_name,
+        Camper.last_name,
+        Camper.date_of_birth,
+        Camper.gender,
+        Camper.school,
+        Camper.grade,
+        Camper.city,
+        Camper.state,
+        Camper.reference_photo_url,
+        Camper.created_at,
+        registration_count.label("registration_count"),
+        primary_contact.label("primary_contact"),
+    ).where(*filters)
+
+    if cursor:
+        last_name, first_name, camper_id = _decode_cursor(cursor)
+        query = query.where(
+            tuple_(Camper.last_name, Camper.first_name, Camper.id)
+            > tuple_(literal(last_name), literal(first_name), literal(camper_id, Camper.id.type))
+        )
+    elif skip:
+        query = query.offset(skip)
+
+    query = query.order_by(Camper.last_name, Camper.first_name, Camper.id).limit(limit + 1)
+    rows = (await db.execute(query)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    items = []
+    for row in rows:
+        items.append({
+            "id": row.id,
+            "first_name": row.first_name,
+            "last_name": row.last_name,
+            "date_of_birth": row.date_of_birth,
+            "age": _calculate_age(row.date_of_birth),
+            "gender": row.gender,
+            "school": row.school,
+            "grade": row.grade,
+            "city": row.city,
+            "state": row.state,
+            "reference_photo_url": row.reference_photo_url,
+            # Only the primary (or first) contact; full list via GET /campers/{id}
+            "contacts": [row.primary_contact] if row.primary_contact else [],
+            "registration_count": row.registration_count or 0,
+            "created_at": row.created_at,
+        })
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = _encode_cursor(last.last_name, last.first_name, last.id)
+
+    # Total, with the same filters as the page
+    total: Optional[int] = None
+    total_is_estimate = False
+    count_query = select(func.count()).select_from(Camper).where(*filters)
+    if count == "exact" or (count == "cached" and event_id):
+        total = (await db.execute(count_query)).scalar() or 0
+    elif count == "cached":
+        key = (str(organization_id), search, age_min, age_max, today)
+        cached = _count_cache.get(key)
+        now = time.monotonic()
+        hit = bool(cached and now - cached[0] < _COUNT_TTL)
+        record_cache("camper_list_total", hit)
+        if hit:
+            total = cached[1]
+            _count_cache.move_to_end(key)
+        else:
+            if cached:
+                del _count_cache[key]
+            total = (await db.execute(count_query)).scalar() or 0
+            _count_cache[key] = (now, total)
+            if len(_count_cache) > _MAX_COUNTS:
+                _count_cache.popitem(last=False)
+    elif count == "estimate":
+        total = await estimate_count(db, select(Camper.id).where(*filters))
+        total_is_estimate = True
 
     return {
-        "items": [_camper_to_dict(c) for c in campers],
+        "items": items,
         "total": total,
+        "total_is_estimate": total_is_estimate,
+        "next_cursor": next_cursor,
         "skip": skip,
         "limit": limit,
     }
@@ -148,6 +306,9 @@ async def create_camper(
             db.add(cc)
 
     await db.commit()
+    _invalidate_counts(organization_id)
+    if contacts:
+        invalidate_portal_context(c["contact_id"] for c in contacts)
 
     # Reload with relationships
     result = await db.execute(
@@ -188,6 +349,7 @@ async def update_camper(
         setattr(camper, key, value)
 
     await db.commit()
+    _invalidate_counts(organization_id)
     await db.refresh(camper)
     return _camper_to_dict(camper)
 
@@ -212,6 +374,7 @@ async def delete_camper(
     camper.is_deleted = True
     camper.deleted_at = datetime.utcnow()
     await db.commit()
+    _invalidate_counts(organization_id)
     return True
 
 
@@ -274,6 +437,7 @@ async def link_contact(
         db.add(cc)
 
     await db.commit()
+    invalidate_portal_context([contact_id])
     return {"status": "linked"}
 
 
@@ -305,6 +469,7 @@ async def unlink_contact(
 
     await db.delete(cc)
     await db.commit()
+    invalidate_portal_context([contact_id])
     return True
 
 
@@ -0,0 +1,434 @@
+"""
+Camp Connect - Staff Compliance Service
+Daily expiry scan over staff certifications and background checks.
+
+One scan (``run_scan``), for every organization or just one:
+
+1. Marks valid certifications whose expiry date has passed as ``expired``
+   (typed records and onboarding certifications), so list views show the
+   stored status.
+2. Bulk-inserts ContactAlert rows for items expiring within
+   ``settings.compliance_expiry_window_days`` or recently expired: one per
+   item for the staff member, plus one digest per day for each manager
+   (Camp Director or ``staff.employees.update``) when anything new was
+   found. Alerts carry a ``dedupe_key`` with a unique index, so re-running
+   the scan never repeats them; a renewed certification (new expiry date)
+   is alerted afresh.
+3. Recomputes each organization's ComplianceSummary row, which the
+   compliance dashboard reads instead of aggregating on every request.
+
+All three steps are range scans over the expiry indexes plus one
+aggregate pass per organization, in one transaction. The background loop
+(``start_scanner``) runs it every ``settings.compliance_scan_interval``
+seconds on one worker (Postgres advisory lock).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import realtime
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_SCAN_LOCK_ID = 0x434F4D50  # "COMP"
+_UPCOMING_LIMIT = 25
+
+# Matches every row when :org_id is NULL
+_ORG = "(CAST(:org_id AS uuid) IS NULL OR {col} = CAST(:org_id AS uuid))"
+
+
+# Certifications and cleared background checks expiring in [since, horizon]
+_ITEMS = f"""
+items AS (
+    SELECT r.organization_id, r.user_id,
+           'staff_certification_record' AS entity_type, r.id AS entity_id,
+           ct.name AS label, r.expiry_date AS expires_on
+    FROM staff_certification_records r
+    JOIN certification_types ct ON ct.id = r.certification_type_id
+    WHERE r.expiry_date BETWEEN CAST(:since AS date) AND CAST(:horizon AS date)
+      AND r.status IN ('valid', 'expired')
+      AND {_ORG.format(col="r.organization_id")}
+    UNION ALL
+    SELECT c.organization_id, o.user_id,
+           'staff_certification', c.id,
+           c.name, c.expiry_date
+    FROM staff_certifications c
+    JOIN staff_onboardings o ON o.id = c.onboarding_id
+    WHERE c.expiry_date BETWEEN CAST(:since AS date) AND CAST(:horizon AS date)
+      AND c.status IN ('valid', 'expired')
+      AND {_ORG.format(col="c.organization_id")}
+    UNION ALL
+    SELECT b.organization_id, b.staff_user_id,
+           'background_check', b.id,
+           'Background check', CAST(b.expires_at AS date)
+    FROM background_checks b
+    WHERE b.expires_at >= :since_ts AND b.expires_at < :horizon_end
+      AND b.is_archived = false
+      AND b.status = 'complete'
+      AND {_ORG.format(col="b.organization_id")}
+)
+"""
+
+_MARK_RECORDS_EXPIRED = f"""
+UPDATE staff_certification_records SET status = 'expired', updated_at = now()
+WHERE status = 'valid' AND expiry_date < CAST(:today AS date)
+  AND {_ORG.format(col="organization_id")}
+"""
+
+_MARK_ONBOARDING_EXPIRED = f"""
+UPDATE staff_certifications SET status = 'expired', updated_at = now()
+WHERE status = 'valid' AND expiry_date < CAST(:today AS date)
+  AND {_ORG.format(col="organization_id")}
+"""
+
+_ALERT_COLUMNS = """
+    id, organization_id, user_id, alert_type, title, message, severity,
+    entity_type, entity_id, is_read, is_dismissed, metadata_json, dedupe_key, created_at
+"""
+
+_INSERT_ALERTS = f"""
+WITH {_ITEMS},
+staff_items AS (
+    SELECT i.*,
+           CASE WHEN i.expires_on < CAST(:today AS date) THEN 'expired' ELSE 'expiring' END AS phase
+    FROM items i
+    JOIN users u ON u.id = i.user_id
+    WHERE u.is_active AND u.deleted_at IS NULL
+),
+inserted AS (
+    INSERT INTO contact_alerts ({_ALERT_COLUMNS})
+    SELECT gen_random_uuid(), organization_id, user_id, 'compliance',
+           label || CASE WHEN phase = 'expired' THEN ' has expired' ELSE ' expires soon' END,
+           label || CASE WHEN phase = 'expired' THEN ' expired on ' ELSE ' expires on ' END
+                 || to_char(expires_on, 'Mon DD, YYYY')
+                 || CASE WHEN phase = 'expired' THEN '. Please renew it.' ELSE '.' END,
+           CASE WHEN phase = 'expired' THEN 'urgent' ELSE 'warning' END,
+           entity_type, entity_id, false, false,
+           jsonb_build_object('phase', phase, 'label', label, 'expires_on', expires_on),
+           entity_type || ':' || entity_id || ':' || phase || ':' || expires_on,
+           now()
+    FROM staff_items
+    ON CONFLICT (user_id, dedupe_key) WHERE dedupe_key IS NOT NULL DO NOTHING
+    RETURNING organization_id, user_id, id, metadata_json->>'phase' AS phase
+),
+managers AS (
+    SELECT u.organization_id, u.id AS user_id
+    FROM users u
+    JOIN roles r ON r.id = u.role_id
+    WHERE u.is_active AND u.deleted_at IS NULL
+      AND {_ORG.format(col="u.organization_id")}
+      AND (
+          r.name = 'Camp Director'
+          OR EXISTS (
+              SELECT 1 FROM role_permissions rp
+              WHERE rp.role_id = r.id AND rp.permission = 'staff.employees.update'
+          )
+      )
+),
+new_counts AS (
+    SELECT organization_id,
+           count(*) FILTER (WHERE phase = 'expiring') AS expiring,
+           count(*) FILTER (WHERE phase = 'expired') AS expired
+    FROM inserted
+    GROUP BY organization_id
+),
+digests AS (
+    INSERT INTO contact_alerts ({_ALERT_COLUMNS})
+    SELECT gen_random_uuid(), n.organization_id, m.user_id, 'compliance',
+           'Staff compliance needs attention',
+           n.expiring || ' item(s) expiring within ' || CAST(:window_days AS text)
+                || ' days, ' || n.expired || ' expired.',
+           CASE WHEN n.expired > 0 THEN 'urgent' ELSE 'warning' END,
+           'compliance_summary', n.organization_id, false, false,
+           jsonb_build_object('expiring', n.expiring, 'expired', n.expired,
+                              'scan_date', CAST(:today AS date)),
+           'compliance_digest:' || CAST(:today AS date),
+           now()
+    FROM new_counts n
+    JOIN managers m ON m.organization_id = n.organization_id
+    ON CONFLICT (user_id, dedupe_key) WHERE dedupe_key IS NOT NULL DO NOTHING
+    RETURNING organization_id, user_id, id
+)
+SELECT organization_id, user_id, id FROM inserted
+UNION ALL
+SELECT organization_id, user_id, id FROM digests
+"""
+
+_UPSERT_SUMMARIES = f"""
+WITH {_ITEMS},
+staff AS (
+    SELECT organization_id, id AS user_id
+    FROM users
+    WHERE is_active AND deleted_at IS NULL
+      AND {_ORG.format(col="organization_id")}
+),
+certs AS (
+    SELECT r.organization_id, r.user_id, r.expiry_date
+    FROM staff_certification_records r
+    JOIN staff s ON s.user_id = r.user_id
+    WHERE r.status IN ('valid', 'expired')
+    UNION ALL
+    SELECT c.organization_id, o.user_id, c.expiry_date
+    FROM staff_certifications c
+    JOIN staff_onboardings o ON o.id = c.onboarding_id
+    JOIN staff s ON s.user_id = o.user_id
+    WHERE c.status IN ('valid', 'expired')
+),
+cert_counts AS (
+    SELECT organization_id,
+           count(*) AS total,
+           count(*) FILTER (
+               WHERE expiry_date IS NULL OR expiry_date >= CAST(:today AS date)
+           ) AS valid,
+           count(*) FILTER (
+               WHERE expiry_date BETWEEN CAST(:today AS date) AND CAST(:horizon AS date)
+           ) AS expiring,
+           count(*) FILTER (WHERE expiry_date < CAST(:today AS date)) AS expired
+    FROM certs
+    GROUP BY organization_id
+),
+missing AS (
+    SELECT s.organization_id, s.user_id
+    FROM staff s
+    JOIN certification_types ct
+      ON ct.organization_id = s.organization_id AND ct.is_required
+    WHERE NOT EXISTS (
+        SELECT 1 FROM staff_certification_records r
+        WHERE r.user_id = s.user_id
+          AND r.certification_type_id = ct.id
+          AND r.status = 'valid'
+          AND (r.expiry_date IS NULL OR r.expiry_date >= CAST(:today AS date))
+    )
+),
+missing_counts AS (
+    SELECT organization_id, count(*) AS missing
+    FROM missing
+    GROUP BY organization_id
+),
+bg AS (
+    SELECT DISTINCT ON (b.staff_user_id)
+           b.organization_id, b.staff_user_id AS user_id, b.status, b.result, b.expires_at
+    FROM background_checks b
+    JOIN staff s ON s.user_id = b.staff_user_id
+    WHERE b.is_archived = false
+    ORDER BY b.staff_user_id, b.created_at DESC
+),
+bg_counts AS (
+    SELECT organization_id,
+           count(*) AS total,
+           count(*) FILTER (
+               WHERE status = 'complete' AND result = 'clear'
+                 AND (expires_at IS NULL OR expires_at >= :now)
+           ) AS clear,
+           count(*) FILTER (WHERE status IN ('pending', 'processing')) AS open,
+           count(*) FILTER (WHERE status IN ('flagged', 'failed')) AS flagged,
+           count(*) FILTER (
+               WHERE status = 'complete' AND expires_at >= :now AND expires_at < :horizon_end
+           ) AS expiring,
+           count(*) FILTER (WHERE status = 'complete' AND expires_at < :now) AS expired
+    FROM bg
+    GROUP BY organization_id
+),
+non_compliant AS (
+    SELECT organization_id, count(DISTINCT user_id) AS staff
+    FROM (
+        SELECT organization_id, user_id FROM certs
+        WHERE expiry_date < CAST(:today AS date)
+        UNION ALL
+        SELECT organization_id, user_id FROM missing
+        UNION ALL
+        SELECT organization_id, user_id FROM bg
+        WHERE status IN ('flagged', 'failed') OR expires_at < :now
+    ) flagged_staff
+    GROUP BY organization_id
+),
+upcoming AS (
+    SELECT organization_id,
+           jsonb_agg(jsonb_build_object(
+               'entity_type', entity_type,
+               'entity_id', entity_id,
+               'user_id', user_id,
+               'staff_name', staff_name,
+               'label', label,
+               'expires_on', expires_on
+           ) ORDER BY expires_on, entity_id) AS items
+    FROM (
+        SELECT i.*,
+               trim(coalesce(u.first_name, '') || ' ' || coalesce(u.last_name, '')) AS staff_name,
+               row_number() OVER (
+                   PARTITION BY i.organization_id ORDER BY i.expires_on, i.entity_id
+               ) AS rn
+        FROM items i
+        JOIN staff s ON s.user_id = i.user_id
+        JOIN users u ON u.id = i.user_id
+        WHERE i.expires_on >= CAST(:today AS date)
+    ) ranked
+    WHERE rn <= {_UPCOMING_LIMIT}
+    GROUP BY organization_id
+),
+orgs AS (
+    SELECT organization_id, count(*) AS staff_total
+    FROM staff
+    GROUP BY organization_id
+)
+INSERT INTO compliance_summaries (
+    organization_id, staff_total, staff_non_compliant,
+    certifications_total, certifications_valid, certifications_expiring,
+    certifications_expired, required_missing,
+    background_checks_total, background_checks_clear, background_checks_open,
+    background_checks_flagged, background_checks_expiring, background_checks_expired,
+    upcoming, window_days, computed_at
+)
+SELECT o.organization_id, o.staff_total, coalesce(nc.staff, 0),
+       coalesce(cc.total, 0), coalesce(cc.valid, 0), coalesce(cc.expiring, 0),
+       coalesce(cc.expired, 0), coalesce(mc.missing, 0),
+       coalesce(bc.total, 0), coalesce(bc.clear, 0), coalesce(bc.open, 0),
+       coalesce(bc.flagged, 0), coalesce(bc.expiring, 0), coalesce(bc.expired, 0),
+       coalesce(up.items, '[]'::jsonb), CAST(:window_days AS integer), now()
+FROM orgs o
+LEFT JOIN cert_counts cc USING (organization_id)
+LEFT JOIN missing_counts mc USING (organization_id)
+LEFT JOIN bg_counts bc USING (organization_id)
+LEFT JOIN non_compliant nc USING (organization_id)
+LEFT JOIN upcoming up USING (organization_id)
+ON CONFLICT (organization_id) DO UPDATE SET
+    staff_total = EXCLUDED.staff_total,
+    staff_non_compliant = EXCLUDED.staff_non_compliant,
+    certifications_total = EXCLUDED.certifications_total,
+    certifications_valid = EXCLUDED.certifications_valid,
+    certifications_expiring = EXCLUDED.certifications_expiring,
+    certifications_expired = EXCLUDED.certifications_expired,
+    required_missing = EXCLUDED.required_missing,
+    background_checks_total = EXCLUDED.background_checks_total,
+    background_checks_clear = EXCLUDED.background_checks_clear,
+    background_checks_open = EXCLUDED.background_checks_open,
+    background_checks_flagged = EXCLUDED.background_checks_flagged,
+    background_checks_expiring = EXCLUDED.background_checks_expiring,
+    background_checks_expired = EXCLUDED.background_checks_expired,
+    upcoming = EXCLUDED.upcoming,
+    window_days = EXCLUDED.window_days,
+    computed_at = EXCLUDED.computed_at
+"""
+
+
+def _scan_params(organization_id: Optional[uuid.UUID], today: date) -> Dict[str, Any]:
+    window = settings.compliance_expiry_window_days
+    since = today - timedelta(days=window)
+    horizon = today + timedelta(days=window)
+    return {
+        "org_id": str(organization_id) if organization_id else None,
+        "today": today,
+        "since": since,
+        "horizon": horizon,
+        # background_checks timestamps are naive UTC
+        "now": datetime.utcnow(),
+        "since_ts": datetime.combine(since, time.min),
+        "horizon_end": datetime.combine(horizon + timedelta(days=1), time.min),
+        "window_days": str(window),
+    }
+
+
+async def run_scan(
+    db: AsyncSession,
+    organization_id: Optional[uuid.UUID] = None,
+    today: Optional[date] = None,
+) -> Dict[str, int]:
+    """
+    Run one expiry scan (all organizations, or just ``organization_id``)
+    and commit. Returns counts of certifications marked expired, alerts
+    created and summaries written.
+    """
+    params = _scan_params(organization_id, today or date.today())
+
+    expired = 0
+    for statement in (_MARK_RECORDS_EXPIRED, _MARK_ONBOARDING_EXPIRED):
+        expired += (await db.execute(text(statement), params)).rowcount or 0
+
+    alerts = (await db.execute(text(_INSERT_ALERTS), params)).all()
+    by_org: Dict[uuid.UUID, List[Tuple[uuid.UUID, uuid.UUID]]] = {}
+    for org_id, user_id, alert_id in alerts:
+        by_org.setdefault(org_id, []).append((user_id, alert_id))
+    for org_alerts in by_org.values():
+        await realtime.publish_alert_events(
+            db,
+            event="created",
+            alert_type="compliance",
+            alerts=org_alerts,
+            was_unread=True,
+        )
+
+    summaries = (await db.execute(text(_UPSERT_SUMMARIES), params)).rowcount or 0
+    await db.commit()
+    return {"expired": expired, "alerts": len(alerts), "summaries": summaries}
+
+
+# ---------------------------------------------------------------------------
+# Background loop
+# ---------------------------------------------------------------------------
+
+_scanner_task: Optional["asyncio.Task[None]"] = None
+
+
+async def _scan_all() -> Optional[Dict[str, int]]:
+    from app.database import async_session_factory, engine
+
+    if engine is None or async_session_factory is None:
+        return None
+    async with engine.connect() as lock_conn:
+        locked = (await lock_conn.execute(
+            text("SELECT pg_try_advisory_lock(:id)"), {"id": _SCAN_LOCK_ID}
+        )).scalar()
+        if not locked:
+            return None
+        try:
+            async with async_session_factory() as db:
+                return await run_scan(db)
+        finally:
+            await lock_conn.execute(
+                text("SELECT pg_advisory_unlock(:id)"), {"id": _SCAN_LOCK_ID}
+            )
+            await lock_conn.commit()
+
+
+async def _scan_loop() -> None:
+    while True:
+        try:
+            report = await _scan_all()
+            if report:
+                logger.info(
+                    f"Compliance scan: {report['expired']} certifications expired, "
+                    f"{report['alerts']} alerts, {report['summaries']} summaries"
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Compliance scan failed: {e}")
+        await asyncio.sleep(settings.compliance_scan_interval)
+
+
+def start_scanner() -> None:
+    """Start the background scan loop (application startup)."""
+    global _scanner_task
+    if _scanner_task is None or _scanner_task.done():
+        _scanner_task = asyncio.create_task(_scan_loop())
+
+
+async def stop_scanner() -> None:
+    """Cancel the scan loop (shutdown)."""
+    global _scanner_task
+    if _scanner_task is not None:
+        _scanner_task.cancel()
+        try:
+            await _scanner_task
+        except asyncio.CancelledError:
+            pass
+        _scanner_task = None
@@ -15,6 +15,7 @@ from sqlalchemy.orm import selectinload
 
 from app.models.contact import Contact
 from app.models.camper_contact import CamperContact
+from app.services.portal_service import invalidate_portal_context
 
 
 async def list_contacts(
@@ -113,6 +114,7 @@ async def update_contact(
         setattr(contact, key, value)
 
     await db.commit()
+    invalidate_portal_context([contact_id])
     await db.refresh(contact, ["camper_contacts"])
     return _contact_to_dict(contact)
 
@@ -137,6 +139,7 @@ async def delete_contact(
     contact.is_deleted = True
     contact.deleted_at = datetime.utcnow()
     await db.commit()
+    invalidate_portal_context([contact_id])
     return True
 
 
@@ -5,15 +5,71 @@ Business logic for custom field definitions and values.
 
 from __future__ import annotations
 
+import time
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select, and_, delete
+from sqlalchemy import select, and_, delete, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.metrics import record_cache
 from app.models.custom_field import CustomFieldDefinition, CustomFieldValue
 
+# ---------------------------------------------------------------------------
+# Definitions cache — per (org, entity_type), invalidated on definition writes.
+# The TTL bounds staleness for other worker processes that missed the write.
+# ---------------------------------------------------------------------------
+
+_definitions_cache: Dict[Tuple[uuid.UUID, str], Tuple[float, List[Dict[str, Any]]]] = {}
+_DEFINITIONS_TTL = 300  # seconds
+
+
+def invalidate_definitions(organization_id: uuid.UUID) -> None:
+    """Drop every cached definition list for an organization."""
+    for key in [k for k in _definitions_cache if k[0] == organization_id]:
+        _definitions_cache.pop(key, None)
+
+
+async def get_cached_definitions(
+    db: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    entity_type: str,
+) -> List[Dict[str, Any]]:
+    """All definitions (active and inactive) for an entity type, sort-ordered."""
+    key = (organization_id, entity_type)
+    cached = _definitions_cache.get(key)
+    now = time.monotonic()
+    hit = bool(cached and (now - cached[0]) < _DEFINITIONS_TTL)
+    record_cache("custom_field_definitions", hit)
+    if hit:
+        return cached[1]
+
+    result = await db.execute(
+        select(CustomFieldDefinition)
+        .where(CustomFieldDefinition.organization_id == organization_id)
+        .where(CustomFieldDefinition.entity_type == entity_type)
+        .order_by(CustomFieldDefinition.sort_order, CustomFieldDefinition.created_at)
+    )
+    definitions = [_definition_to_dict(d) for d in result.scalars().all()]
+    _definitions_cache[key] = (now, definitions)
+    return definitions
+
+
+async def get_definition_map(
+    db: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    entity_type: str,
+) -> Dict[str, Dict[str, Any]]:
+    """Active definitions keyed by field_key (used by saved-list filters)."""
+    definitions = await get_cached_definitions(
+        db, organization_id=organization_id, entity_type=entity_type
+    )
+    return {d["field_key"]: d for d in definitions if d["is_active"]}
+
 
 async def list_definitions(
     db: AsyncSession,
@@ -52,6 +108,7 @@ async def create_definition(
     db.add(definition)
     await db.commit()
     await db.refresh(definition)
+    invalidate_definitions(organization_id)
     return _definition_to_dict(definition)
 
 
@@ -75,8 +132,16 @@ async def update_definition(
     for key, value in data.items():
         setattr(definition, key, value)
 
+    # Typed projections depend on field_type; rebuild them when it changes
+    if "field_type" in data:
+        await db.execute(
+            _REPROJECT_SQL,
+            {"definition_id": definition_id, "field_type": definition.field_type},
+        )
+
     await db.commit()
     await db.refresh(definition)
+    invalidate_definitions(organization_id)
     return _definition_to_dict(definition)
 
 
@@ -105,6 +170,7 @@ async def delete_definition(
 
     await db.delete(definition)
     await db.commit()
+    invalidate_definitions(organization_id)
     return True
 
 
@@ -129,6 +195,7 @@ async def reorder_definitions(
             defn.sort_order = item["sort_order"]
 
     await db.commit()
+    invalidate_definitions(organization_id)
 
     # Return updated list
     return await list_definitions(db, organization_id=organization_id)
@@ -142,16 +209,12 @@ async def get_values(
     entity_id: uuid.UUID,
 ) -> List[Dict[str, Any]]:
     """Get all custom field values for a specific entity."""
-    # Get definitions for this entity type
-    def_result = await db.execute(
-        select(CustomFieldDefinition)
-        .where(CustomFieldDefinition.organization_id == organization_id)
-        .where(CustomFieldDefinition.entity_type == entity_type)
-        .where(CustomFieldDefinition.is_active == True)
-        .order_by(CustomFieldDefinition.sort_order)
-    )
-    definitions = def_result.scalars().all()
-    def_map = {d.id: d for d in definitions}
+    definitions = [
+        d for d in await get_cached_definitions(
+            db, organization_id=organization_id, entity_type=entity_type
+        )
+        if d["is_active"]
+    ]
 
     # Get values for this entity
     val_result = await db.execute(
@@ -161,32 +224,124 @@ async def get_values(
         .where(CustomFieldValue.entity_id == entity_id)
     )
     values = val_result.scalars().all()
-    val_map = {v.field_definition_id: v for v in values}
+    val_map = {str(v.field_definition_id): v for v in values}
 
     # Build response with definition metadata included
     result = []
     for defn in definitions:
-        val = val_map.get(defn.id)
+        val = val_map.get(defn["id"])
         result.append({
             "id": str(val.id) if val else None,
-            "field_definition_id": str(defn.id),
-            "field_name": defn.field_name,
-            "field_key": defn.field_key,
-            "field_type": defn.field_type,
-            "description": defn.description,
-            "is_required": defn.is_required,
-            "options": defn.options,
-            "default_value": defn.default_value,
-            "show_in_list": defn.show_in_list,
-            "show_in_detail": defn.show_in_detail,
+            "field_definition_id": defn["id"],
+            "field_name": defn["field_name"],
+            "field_key": defn["field_key"],
+            "field_type": defn["field_type"],
+            "description": defn["description"],
+            "is_required": defn["is_required"],
+            "options": defn["options"],
+            "default_value": defn["default_value"],
+            "show_in_list": defn["show_in_list"],
+            "show_in_detail": defn["show_in_detail"],
             "entity_id": str(entity_id),
             "entity_type": entity_type,
-            "value": val.value if val else defn.default_value,
+            "value": val.value if val else defn["default_value"],
         })
 
     return result
 
 
+async def get_values_bulk(
+    db: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    entity_type: str,
+    entity_ids: Sequence[uuid.UUID],
+    list_only: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get custom field values for a page of entities in one query.
+
+    Returns {entity_id: {field_key: value}} with defaults applied. With
+    list_only=True only show_in_list fields are included (table columns).
+    """
+    definitions = [
+        d for d in await get_cached_definitions(
+            db, organization_id=organization_id, entity_type=entity_type
+        )
+        if d["is_active"] and (d["show_in_list"] or not list_only)
+    ]
+    out: Dict[str, Dict[str, Any]] = {
+        str(eid): {d["field_key"]: d["default_value"] for d in definitions}
+        for eid in entity_ids
+    }
+    if not definitions or not entity_ids:
+        return out
+
+    key_by_def = {d["id"]: d["field_key"] for d in definitions}
+    val_result = await db.execute(
+        select(
+            CustomFieldValue.entity_id,
+            CustomFieldValue.field_definition_id,
+            CustomFieldValue.value,
+        )
+        .where(CustomFieldValue.organization_id == organization_id)
+        .where(CustomFieldValue.entity_type == entity_type)
+        .where(CustomFieldValue.entity_id.in_(list(entity_ids)))
+        .where(
+            CustomFieldValue.field_definition_id.in_(
+                [uuid.UUID(d["id"]) for d in definitions]
+            )
+        )
+    )
+    for entity_id, definition_id, value in val_result.all():
+        out[str(entity_id)][key_by_def[str(definition_id)]] = value
+
+    return out
+
+
+_REPROJECT_SQL = text("""
+    UPDATE custom_field_values SET
+        value_number = CASE WHEN :field_type = 'number'
+            AND value ~ '^\\s*-?[0-9]+(\\.[0-9]+)?\\s*$' THEN trim(value)::numeric END,
+        value_date = CASE WHEN :field_type = 'date'
+            AND value ~ '^[0-9]{4}-[0-9]{2}-[0-9]{2}' THEN left(value, 10)::date END,
+        value_bool = CASE WHEN :field_type <> 'boolean' THEN NULL
+            WHEN lower(trim(value)) IN ('true', '1', 'yes') THEN TRUE
+            WHEN lower(trim(value)) IN ('false', '0', 'no') THEN FALSE END
+    WHERE field_definition_id = :definition_id
+""")
+
+
+def _typed_projection(field_type: Optional[str], raw: Optional[str]) -> Dict[str, Any]:
+    """Derive the indexed typed columns for a raw text value."""
+    typed: Dict[str, Any] = {
+        "value_key": raw if raw is not None and len(raw) <= 255 else None,
+        "value_number": None,
+        "value_date": None,
+        "value_bool": None,
+    }
+    if raw is None or raw == "":
+        return typed
+
+    if field_type == "number":
+        try:
+            typed["value_number"] = Decimal(raw.strip())
+        except InvalidOperation:
+            pass
+    elif field_type == "date":
+        try:
+            typed["value_date"] = date.fromisoformat(raw.strip()[:10])
+        except ValueError:
+            pass
+    elif field_type == "boolean":
+        lowered = raw.strip().lower()
+        if lowered in ("true", "1", "yes"):
+            typed["value_bool"] = True
+        elif lowered in ("false", "0", "no"):
+            typed["value_bool"] = False
+    return typed
+
+
 async def save_values(
     db: AsyncSession,
     *,
@@ -196,24 +351,33 @@ async def save_values(
     values: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
     """Bulk save/update custom field values for an entity."""
-    for item in values:
-        field_def_id = uuid.UUID(item["field_definition_id"])
+    definitions = await get_cached_definitions(
+        db, organization_id=organization_id, entity_type=entity_type
+    )
+    type_by_def = {d["id"]: d["field_type"] for d in definitions}
 
-        # Check if value already exists
-        result = await db.execute(
-            select(CustomFieldValue).where(
-                and_(
-                    CustomFieldValue.organization_id == organization_id,
-                    CustomFieldValue.field_definition_id == field_def_id,
-                    CustomFieldValue.entity_id == entity_id,
-                    CustomFieldValue.entity_type == entity_type,
-                )
+    # Load every existing value for the entity in one query
+    result = await db.execute(
+        select(CustomFieldValue).where(
+            and_(
+                CustomFieldValue.organization_id == organization_id,
+                CustomFieldValue.entity_id == entity_id,
+                CustomFieldValue.entity_type == entity_type,
             )
         )
-        existing = result.scalar_one_or_none()
+    )
+    existing_map = {v.field_definition_id: v for v in result.scalars().all()}
+
+    for item in values:
+        field_def_id = uuid.UUID(item["field_definition_id"])
+        raw = item.get("value")
+        typed = _typed_projection(type_by_def.get(str(field_def_id)), raw)
 
+        existing = existing_map.get(field_def_id)
         if existing:
-            existing.value = item.get("value")
+            existing.value = raw
+            for key, typed_value in typed.items():
+                setattr(existing, key, typed_value)
             existing.updated_at = datetime.utcnow()
         else:
             new_value = CustomFieldValue(
@@ -222,9 +386,11 @@ async def save_values(
                 field_definition_id=field_def_id,
                 entity_id=entity_id,
                 entity_type=entity_type,
-                value=item.get("value"),
+                value=raw,
+                **typed,
             )
             db.add(new_value)
+            existing_map[field_def_id] = new_value
 
     await db.commit()
 
@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+
 
 # ---------------------------------------------------------------------------
 # Table creation (idempotent, raw SQL)
@@ -32,10 +34,17 @@ CREATE TABLE IF NOT EXISTS dietary_restrictions (
 """
 
 
+register_ddl(
+    "dietary",
+    _CREATE_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_dietary_restrictions_org_id ON dietary_restrictions(org_id)",
+    "CREATE INDEX IF NOT EXISTS idx_dietary_restrictions_camper_id ON dietary_restrictions(camper_id)",
+)
+
+
 async def _ensure_tables(db: AsyncSession) -> None:
-    """Create the dietary_restrictions table if it does not exist."""
-    await db.execute(text(_CREATE_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 # ---------------------------------------------------------------------------
@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+
 
 # ---------------------------------------------------------------------------
 # Table creation (idempotent)
@@ -38,10 +40,16 @@ CREATE TABLE IF NOT EXISTS feedback_entries (
 """
 
 
+register_ddl(
+    "feedback",
+    _CREATE_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_feedback_entries_org_id ON feedback_entries(org_id)",
+)
+
+
 async def _ensure_table(db: AsyncSession) -> None:
-    """Create the feedback_entries table if it does not exist."""
-    await db.execute(text(_CREATE_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 # ---------------------------------------------------------------------------
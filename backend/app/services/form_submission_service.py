@@ -0,0 +1,404 @@
+"""
+Camp Connect - Form Submission Service
+Listing, answer filtering, per-field statistics and CSV export for
+form-builder submissions.
+
+- Listing is one query joined to the template name, keyset-paginated on
+  ``(created_at, id)`` newest first. ``skip`` is kept for older clients.
+- ``answers`` filters (``field_id:value``) become JSONB containment
+  (``answers @> {"field_id": "value"}``), served by the
+  ``jsonb_path_ops`` GIN index. A value also matches multi-choice answers
+  that contain it (``{"field_id": ["value"]}``).
+- Choice-field statistics are counted in Postgres (one GROUP BY over the
+  answers of the chosen fields) and merged with the template's option list,
+  so options nobody picked still show up with zero.
+- The CSV export streams rows from a server-side cursor and writes one
+  column per input field, in template order, so memory stays flat however
+  many submissions a template has.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import csv
+import io
+import json
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.form_builder import FormSubmission, FormTemplate
+from app.utils.pagination import estimate_count
+
+# Field types whose answers are picked from a fixed option list
+CHOICE_TYPES = frozenset({"select", "radio", "checkbox", "multiselect", "toggle"})
+# Builder elements that carry no answer
+_DISPLAY_TYPES = frozenset(
+    {"section", "heading", "paragraph", "divider", "custom_html"}
+)
+
+_FIXED_CSV_COLUMNS = [
+    "submission_id",
+    "status",
+    "submitted_at",
+    "submitted_by_email",
+    "related_entity_type",
+    "related_entity_id",
+]
+
+_CHOICE_COUNTS_SQL = text(
+    """
+    SELECT k.field_id, v.value, count(*) AS n
+    FROM form_submissions s
+    CROSS JOIN unnest(CAST(:field_ids AS text[])) AS k(field_id)
+    CROSS JOIN LATERAL jsonb_array_elements_text(
+        CASE jsonb_typeof(s.answers -> k.field_id)
+            WHEN 'array' THEN s.answers -> k.field_id
+            WHEN 'null' THEN '[]'::jsonb
+            ELSE jsonb_build_array(s.answers -> k.field_id)
+        END
+    ) AS v(value)
+    WHERE s.organization_id = CAST(:org_id AS uuid)
+      AND s.template_id = CAST(:template_id AS uuid)
+      AND s.status <> 'draft'
+      AND s.answers ? k.field_id
+    GROUP BY k.field_id, v.value
+    """
+)
+
+_RESPONSE_COUNTS_SQL = text(
+    """
+    SELECT k.field_id, count(*) AS n
+    FROM form_submissions s
+    CROSS JOIN unnest(CAST(:field_ids AS text[])) AS k(field_id)
+    WHERE s.organization_id = CAST(:org_id AS uuid)
+      AND s.template_id = CAST(:template_id AS uuid)
+      AND s.status <> 'draft'
+      AND s.answers ? k.field_id
+      AND jsonb_typeof(s.answers -> k.field_id) <> 'null'
+      AND s.answers -> k.field_id NOT IN ('""'::jsonb, '[]'::jsonb)
+    GROUP BY k.field_id
+    """
+)
+
+
+# ---------------------------------------------------------------------------
+# Filters
+# ---------------------------------------------------------------------------
+
+
+def _encode_cursor(created_at: datetime, submission_id: uuid.UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(submission_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, submission_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), uuid.UUID(submission_id)
+    except (ValueError, TypeError, binascii.Error):
+        raise ValueError("Invalid cursor")
+
+
+def parse_answer_filters(raw: Sequence[str]) -> List[Tuple[str, str]]:
+    """Parse ``field_id:value`` query values."""
+    parsed = []
+    for item in raw:
+        field_id, sep, value = item.partition(":")
+        if not sep or not field_id:
+            raise ValueError(f"Invalid answer filter '{item}', expected field_id:value")
+        parsed.append((field_id, value))
+    return parsed
+
+
+def _answer_clause(field_id: str, value: str):
+    """Containment match for one answer, scalar or inside a multi-choice list."""
+    candidates: List[Any] = [value]
+    try:
+        typed = json.loads(value)
+    except ValueError:
+        typed = None
+    if isinstance(typed, (bool, int, float)):
+        candidates.append(typed)
+    return or_(
+        *[FormSubmission.answers.contains({field_id: v}) for v in candidates],
+        *[FormSubmission.answers.contains({field_id: [v]}) for v in candidates],
+    )
+
+
+def submission_filters(
+    organization_id: uuid.UUID,
+    *,
+    template_id: Optional[uuid.UUID] = None,
+    status: Optional[str] = None,
+    contact_id: Optional[uuid.UUID] = None,
+    camper_id: Optional[uuid.UUID] = None,
+    answers: Sequence[Tuple[str, str]] = (),
+) -> list:
+    """WHERE clauses shared by the list and the export."""
+    filters = [FormSubmission.organization_id == organization_id]
+    if template_id:
+        filters.append(FormSubmission.template_id == template_id)
+    if status:
+        filters.append(FormSubmission.status == status)
+    if contact_id:
+        filters.append(FormSubmission.submitted_by_contact_id == contact_id)
+    if camper_id:
+        filters.append(or_(
+            (FormSubmission.related_entity_type == "camper")
+            & (FormSubmission.related_entity_id == camper_id),
+            FormSubmission.submitted_by_contact_id == camper_id,
+        ))
+    for field_id, value in answers:
+        filters.append(_answer_clause(field_id, value))
+    return filters
+
+
+# ---------------------------------------------------------------------------
+# List
+# ---------------------------------------------------------------------------
+
+
+async def list_submissions(
+    db: AsyncSession,
+    *,
+    filters: list,
+    cursor: Optional[str] = None,
+    count: str = "exact",
+    skip: int = 0,
+    limit: int = 50,
+) -> Dict[str, Any]:
+    """One page of submissions with template names, newest first.
+
+    Pass the returned ``next_cursor`` as ``cursor`` for the next page;
+    ``skip`` is ignored with a cursor. ``count`` is exact, estimate or none.
+    """
+    query = (
+        select(FormSubmission, FormTemplate.name.label("template_name"))
+        .outerjoin(FormTemplate, FormTemplate.id == FormSubmission.template_id)
+        .where(*filters)
+        .order_by(FormSubmission.created_at.desc(), FormSubmission.id.desc())
+        .limit(limit + 1)
+    )
+    if cursor:
+        created_at, submission_id = _decode_cursor(cursor)
+        query = query.where(or_(
+            FormSubmission.created_at < created_at,
+            and_(
+                FormSubmission.created_at == created_at,
+                FormSubmission.id < submission_id,
+            ),
+        ))
+    elif skip:
+        query = query.offset(skip)
+
+    rows = (await db.execute(query)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1].FormSubmission
+        next_cursor = _encode_cursor(last.created_at, last.id)
+
+    total: Optional[int] = None
+    total_is_estimate = False
+    if count == "exact":
+        total = (
+            await db.execute(
+                select(func.count()).select_from(FormSubmission).where(*filters)
+            )
+        ).scalar() or 0
+    elif count == "estimate":
+        total = await estimate_count(db, select(FormSubmission.id).where(*filters))
+        total_is_estimate = True
+
+    return {
+        "items": [(row.FormSubmission, row.template_name) for row in rows],
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+        "next_cursor": next_cursor,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------
+
+
+def _input_fields(fields: Any) -> List[Dict[str, Any]]:
+    """Answer-carrying fields of a template, in display order."""
+    items = [
+        f for f in (fields if isinstance(fields, list) else [])
+        if isinstance(f, dict) and f.get("id") and f.get("type") not in _DISPLAY_TYPES
+    ]
+    return sorted(items, key=lambda f: f.get("order") or 0)
+
+
+def _option_labels(field: Dict[str, Any]) -> List[Tuple[str, str]]:
+    if field.get("type") == "toggle" and not field.get("options"):
+        return [("true", "Yes"), ("false", "No")]
+    labels = []
+    for option in field.get("options") or []:
+        if isinstance(option, dict):
+            value = option.get("value", option.get("label"))
+            label = option.get("label", value)
+        else:
+            value = label = option
+        if value is not None:
+            labels.append((str(value), str(label)))
+    return labels
+
+
+async def choice_field_stats(
+    db: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    template_id: uuid.UUID,
+) -> Optional[Dict[str, Any]]:
+    """Per-option answer counts for every choice field of a template."""
+    template = (
+        await db.execute(
+            select(FormTemplate.name, FormTemplate.fields)
+            .where(FormTemplate.id == template_id)
+            .where(FormTemplate.organization_id == organization_id)
+            .where(FormTemplate.deleted_at.is_(None))
+        )
+    ).one_or_none()
+    if template is None:
+        return None
+
+    choice_fields = [
+        f for f in _input_fields(template.fields) if f.get("type") in CHOICE_TYPES
+    ]
+    params = {
+        "org_id": organization_id,
+        "template_id": template_id,
+        "field_ids": [str(f["id"]) for f in choice_fields],
+    }
+
+    submissions = (
+        await db.execute(
+            select(func.count())
+            .select_from(FormSubmission)
+            .where(FormSubmission.organization_id == organization_id)
+            .where(FormSubmission.template_id == template_id)
+            .where(FormSubmission.status != "draft")
+        )
+    ).scalar() or 0
+
+    counts: Dict[str, Dict[str, int]] = {}
+    responses: Dict[str, int] = {}
+    if choice_fields:
+        for row in await db.execute(_CHOICE_COUNTS_SQL, params):
+            counts.setdefault(row.field_id, {})[row.value] = row.n
+        for row in await db.execute(_RESPONSE_COUNTS_SQL, params):
+            responses[row.field_id] = row.n
+
+    stats = []
+    for field in choice_fields:
+        field_id = str(field["id"])
+        field_counts = dict(counts.get(field_id, {}))
+        options = [
+            {"value": value, "label": label, "count": field_counts.pop(value, 0)}
+            for value, label in _option_labels(field)
+        ]
+        # Answers no longer among the options (edited template, free input)
+        options.extend(
+            {"value": value, "label": value, "count": n}
+            for value, n in sorted(field_counts.items(), key=lambda kv: -kv[1])
+        )
+        stats.append({
+            "field_id": field_id,
+            "label": field.get("label") or "",
+            "type": field.get("type"),
+            "responses": responses.get(field_id, 0),
+            "options": options,
+        })
+
+    return {
+        "template_id": template_id,
+        "template_name": template.name,
+        "submissions": submissions,
+        "fields": stats,
+    }
+
+
+# ---------------------------------------------------------------------------
+# CSV export
+# ---------------------------------------------------------------------------
+
+
+def _csv_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, list):
+        return "; ".join(_csv_value(v) for v in value)
+    if isinstance(value, dict):
+        if value.get("type") == "signature":
+            return value.get("signer_name") or "signed"
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+async def export_csv(
+    session_factory,
+    *,
+    fields: Any,
+    filters: list,
+    batch_size: int = 500,
+) -> AsyncIterator[str]:
+    """Yield CSV text for the filtered submissions, one row at a time.
+
+    Runs in its own session (the request one is closed before streaming
+    starts) on a server-side cursor, oldest first.
+    """
+    columns = _input_fields(fields)
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(
+        _FIXED_CSV_COLUMNS + [c.get("label") or c["id"] for c in columns]
+    )
+    yield buf.getvalue()
+    buf.seek(0)
+    buf.truncate(0)
+
+    query = (
+        select(
+            FormSubmission.id,
+            FormSubmission.status,
+            FormSubmission.submitted_at,
+            FormSubmission.submitted_by_email,
+            FormSubmission.related_entity_type,
+            FormSubmission.related_entity_id,
+            FormSubmission.answers,
+        )
+        .where(*filters)
+        .order_by(FormSubmission.created_at, FormSubmission.id)
+        .execution_options(yield_per=batch_size)
+    )
+    async with session_factory() as session:
+        result = await session.stream(query)
+        async for row in result:
+            answers = row.answers or {}
+            if isinstance(answers, str):
+                answers = json.loads(answers)
+            writer.writerow([
+                str(row.id),
+                row.status,
+                row.submitted_at.isoformat() if row.submitted_at else "",
+                row.submitted_by_email or "",
+                row.related_entity_type or "",
+                str(row.related_entity_id) if row.related_entity_id else "",
+                *[_csv_value(answers.get(c["id"])) for c in columns],
+            ])
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
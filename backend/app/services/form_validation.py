@@ -0,0 +1,378 @@
+"""
+Camp Connect - Form Submission Validation
+Compiles a template's field list into a validation function, cached per
+(template kind, template id, version).
+
+Both health form templates and form-builder templates store their fields as
+a JSONB array of definitions (``id``, ``type``, ``label``, ``required``,
+``options``, ``validation``, ``conditional``). Compiling walks that array
+once: option lists become sets, ``pattern`` rules become compiled regexes,
+and each field gets a small checker for its type. Validating a submission
+is then a single pass over those checkers.
+
+Templates bump ``version`` whenever their fields change, so a cached
+validator never goes stale; old versions simply age out of the LRU.
+
+Rules mirror the form renderers:
+
+- display-only fields (section, heading, paragraph, divider, custom_html)
+  are ignored;
+- a field with ``conditional: {"field_id", "value"}`` is only checked when
+  the referenced answer matches ``value`` (case-insensitive), exactly as
+  the health form modal decides visibility;
+- empty values (None, "", [], {}) fail ``required`` and pass otherwise;
+- a required ``signature`` field is also satisfied by a signature captured
+  outside the answers (``signed=True``);
+- answer keys that match no field are left alone.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Tuple
+
+Checker = Callable[[Any], Optional[str]]
+Validator = Callable[..., List[Dict[str, str]]]
+
+_MAX_VALIDATORS = 1024
+
+_DISPLAY_TYPES = frozenset(
+    {"section", "heading", "paragraph", "divider", "custom_html"}
+)
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_PHONE_DIGITS_RE = re.compile(r"\D")
+
+# (kind, template_id, version) -> validator
+_validators: "OrderedDict[Hashable, Validator]" = OrderedDict()
+
+
+class FormValidationError(ValueError):
+    """Raised when submitted answers do not satisfy the template.
+
+    ``errors`` holds one ``{"field_id", "label", "message"}`` dict per
+    failing field.
+    """
+
+    def __init__(self, errors: List[Dict[str, str]]):
+        self.errors = errors
+        summary = "; ".join(
+            f"{e['label'] or e['field_id']}: {e['message']}" for e in errors[:5]
+        )
+        if len(errors) > 5:
+            summary += f" (+{len(errors) - 5} more)"
+        super().__init__(f"Form validation failed: {summary}")
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def get_validator(
+    kind: str,
+    template_id: Hashable,
+    version: Optional[int],
+    fields: Any,
+) -> Validator:
+    """Return the compiled validator for a template version, compiling once."""
+    key = (kind, template_id, version)
+    validator = _validators.get(key)
+    if validator is not None:
+        _validators.move_to_end(key)
+        return validator
+
+    validator = compile_fields(fields)
+    _validators[key] = validator
+    if len(_validators) > _MAX_VALIDATORS:
+        _validators.popitem(last=False)
+    return validator
+
+
+def validate_answers(
+    kind: str,
+    template_id: Hashable,
+    version: Optional[int],
+    fields: Any,
+    answers: Optional[Mapping[str, Any]],
+    *,
+    signed: bool = False,
+) -> None:
+    """Validate ``answers`` against a template, raising FormValidationError."""
+    errors = get_validator(kind, template_id, version, fields)(
+        answers or {}, signed=signed
+    )
+    if errors:
+        raise FormValidationError(errors)
+
+
+def compile_fields(fields: Any) -> Validator:
+    """Compile a JSONB field list into ``validator(answers, signed=False)``."""
+    compiled: List[Tuple[str, str, bool, bool, Optional[Tuple[str, frozenset]], Checker]] = []
+    for field in fields if isinstance(fields, list) else []:
+        if not isinstance(field, dict) or not field.get("id"):
+            continue
+        field_type = field.get("type") or "text"
+        if field_type in _DISPLAY_TYPES:
+            continue
+        compiled.append((
+            str(field["id"]),
+            str(field.get("label") or ""),
+            bool(field.get("required")),
+            field_type == "signature",
+            _compile_condition(field.get("conditional")),
+            _compile_checker(field_type, field),
+        ))
+
+    def validator(
+        answers: Mapping[str, Any], signed: bool = False
+    ) -> List[Dict[str, str]]:
+        errors: List[Dict[str, str]] = []
+        for field_id, label, required, is_signature, condition, check in compiled:
+            if condition is not None:
+                dep_id, expected = condition
+                if _as_text(answers.get(dep_id)) not in expected:
+                    continue
+            value = answers.get(field_id)
+            if _is_empty(value):
+                if required and not (is_signature and signed):
+                    errors.append(
+                        {"field_id": field_id, "label": label,
+                         "message": "This field is required"}
+                    )
+                continue
+            message = check(value)
+            if message:
+                errors.append(
+                    {"field_id": field_id, "label": label, "message": message}
+                )
+        return errors
+
+    return validator
+
+
+def clear_cache() -> None:
+    """Drop every compiled validator (used after bulk template imports)."""
+    _validators.clear()
+
+
+# ---------------------------------------------------------------------------
+# Compilation helpers
+# ---------------------------------------------------------------------------
+
+
+def _compile_condition(
+    conditional: Any,
+) -> Optional[Tuple[str, frozenset]]:
+    if not isinstance(conditional, dict) or not conditional.get("field_id"):
+        return None
+    expected = conditional.get("value")
+    values = expected if isinstance(expected, list) else [expected]
+    return (
+        str(conditional["field_id"]),
+        frozenset(_as_text(v) for v in values),
+    )
+
+
+def _compile_checker(field_type: str, field: Dict[str, Any]) -> Checker:
+    rules = field.get("validation") or {}
+    if not isinstance(rules, dict):
+        rules = {}
+    options = _option_values(field.get("options"))
+
+    if field_type in ("text", "textarea"):
+        return _text_checker(rules)
+    if field_type == "email":
+        text_check = _text_checker(rules)
+
+        def check_email(value: Any) -> Optional[str]:
+            if not isinstance(value, str) or not _EMAIL_RE.match(value.strip()):
+                return "Enter a valid email address"
+            return text_check(value)
+
+        return check_email
+    if field_type == "phone":
+        def check_phone(value: Any) -> Optional[str]:
+            if not isinstance(value, str):
+                return "Enter a valid phone number"
+            digits = _PHONE_DIGITS_RE.sub("", value)
+            if not 7 <= len(digits) <= 15:
+                return "Enter a valid phone number"
+            return None
+
+        return check_phone
+    if field_type == "number":
+        return _number_checker(rules)
+    if field_type == "date":
+        return _date_checker(rules)
+    if field_type in ("select", "radio"):
+        def check_choice(value: Any) -> Optional[str]:
+            if isinstance(value, (list, dict)):
+                return "Choose a single option"
+            if options and str(value) not in options:
+                return "Choose one of the listed options"
+            return None
+
+        return check_choice
+    if field_type == "multiselect":
+        return _multi_checker(options)
+    if field_type == "checkbox":
+        # Health checkboxes are a single yes/no; builder checkboxes with
+        # options are a multi-choice group.
+        if options:
+            return _multi_checker(options)
+        return _bool_checker
+    if field_type == "toggle":
+        return _bool_checker
+    return _accept
+
+
+def _option_values(options: Any) -> frozenset:
+    values = []
+    for option in options if isinstance(options, list) else []:
+        if isinstance(option, dict):
+            option = option.get("value", option.get("label"))
+        if option is not None:
+            values.append(str(option))
+    return frozenset(values)
+
+
+def _text_checker(rules: Dict[str, Any]) -> Checker:
+    min_len = _int_rule(rules, "minLength", "min_length")
+    max_len = _int_rule(rules, "maxLength", "max_length")
+    pattern = rules.get("pattern")
+    regex = None
+    if isinstance(pattern, str) and pattern:
+        try:
+            regex = re.compile(pattern)
+        except re.error:
+            regex = None
+
+    def check_text(value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return "Expected text"
+        if min_len is not None and len(value) < min_len:
+            return f"Must be at least {min_len} characters"
+        if max_len is not None and len(value) > max_len:
+            return f"Must be at most {max_len} characters"
+        if regex is not None and not regex.fullmatch(value):
+            return "Invalid format"
+        return None
+
+    return check_text
+
+
+def _number_checker(rules: Dict[str, Any]) -> Checker:
+    low = _float_rule(rules, "min")
+    high = _float_rule(rules, "max")
+
+    def check_number(value: Any) -> Optional[str]:
+        if isinstance(value, bool):
+            return "Expected a number"
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return "Expected a number"
+        if low is not None and number < low:
+            return f"Must be at least {rules.get('min')}"
+        if high is not None and number > high:
+            return f"Must be at most {rules.get('max')}"
+        return None
+
+    return check_number
+
+
+def _date_checker(rules: Dict[str, Any]) -> Checker:
+    low = _parse_date(rules.get("min"))
+    high = _parse_date(rules.get("max"))
+
+    def check_date(value: Any) -> Optional[str]:
+        parsed = _parse_date(value)
+        if parsed is None:
+            return "Expected a date (YYYY-MM-DD)"
+        if low is not None and parsed < low:
+            return f"Must be on or after {low.isoformat()}"
+        if high is not None and parsed > high:
+            return f"Must be on or before {high.isoformat()}"
+        return None
+
+    return check_date
+
+
+def _multi_checker(options: frozenset) -> Checker:
+    def check_multi(value: Any) -> Optional[str]:
+        values = value if isinstance(value, list) else [value]
+        if any(isinstance(v, (list, dict)) for v in values):
+            return "Choose from the listed options"
+        if options and any(str(v) not in options for v in values):
+            return "Choose from the listed options"
+        return None
+
+    return check_multi
+
+
+def _bool_checker(value: Any) -> Optional[str]:
+    if isinstance(value, bool) or value in ("true", "false"):
+        return None
+    return "Expected true or false"
+
+
+def _accept(value: Any) -> Optional[str]:
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Value helpers
+# ---------------------------------------------------------------------------
+
+
+def _is_empty(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    if isinstance(value, (list, dict)):
+        return not value
+    return False
+
+
+def _as_text(value: Any) -> str:
+    """Stringify like the renderers' ``String(value).toLowerCase()``."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return ",".join(_as_text(v) for v in value)
+    if value is None:
+        return ""
+    return str(value).lower()
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if isinstance(value, date):
+        return value
+    if not isinstance(value, str) or len(value) < 10:
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def _int_rule(rules: Dict[str, Any], *names: str) -> Optional[int]:
+    for name in names:
+        if rules.get(name) is not None:
+            try:
+                return int(rules[name])
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def _float_rule(rules: Dict[str, Any], name: str) -> Optional[float]:
+    if rules.get(name) is None:
+        return None
+    try:
+        return float(rules[name])
+    except (TypeError, ValueError):
+        return None
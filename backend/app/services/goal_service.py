@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+
 
 # ---------------------------------------------------------------------------
 # Table creation (idempotent)
@@ -37,10 +39,17 @@ CREATE TABLE IF NOT EXISTS camper_goals (
 """
 
 
+register_ddl(
+    "goal",
+    _CREATE_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_camper_goals_org_id ON camper_goals(org_id)",
+    "CREATE INDEX IF NOT EXISTS idx_camper_goals_camper_id ON camper_goals(camper_id)",
+)
+
+
 async def _ensure_table(db: AsyncSession) -> None:
-    """Create the camper_goals table if it does not exist."""
-    await db.execute(text(_CREATE_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 def _row_to_dict(row_mapping: Any) -> Dict[str, Any]:
@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+
 
 # ---------------------------------------------------------------------------
 # Table creation (idempotent)
@@ -32,10 +34,16 @@ CREATE TABLE IF NOT EXISTS group_notes (
 """
 
 
+register_ddl(
+    "group_notes",
+    _CREATE_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_group_notes_org_id ON group_notes(org_id)",
+)
+
+
 async def _ensure_table(db: AsyncSession) -> None:
-    """Create the group_notes table if it does not exist."""
-    await db.execute(text(_CREATE_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 # ---------------------------------------------------------------------------
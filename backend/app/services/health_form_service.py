@@ -5,21 +5,32 @@ Business logic for health form templates, form assignments, submissions, and rev
 
 from __future__ import annotations
 
+import logging
 import uuid
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import select, func as sqlfunc
+from sqlalchemy import insert, select, text, update, func as sqlfunc
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.camper import Camper
+from app.models.camper_contact import CamperContact
+from app.models.contact import Contact
 from app.models.event import Event
 from app.models.health_form import (
     HealthForm,
     HealthFormSubmission,
     HealthFormTemplate,
 )
+from app.models.notification_config import NotificationConfig
+from app.services import form_validation
+
+logger = logging.getLogger(__name__)
+
+# Submissions loaded per round trip when revalidating a template
+_REVALIDATE_BATCH = 1000
 
 
 # ─── Template Functions ────────────────────────────────────────
@@ -227,12 +238,235 @@ async def assign_form(
         due_date=due_date,
     )
     db.add(form)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise ValueError("Form already assigned to this camper")
     await db.refresh(form)
 
     return _form_to_dict(form, template, camper, event)
 
 
+# Live-assignment key, matching uq_health_forms_live_assignment: a missing
+# event folds to the nil UUID so "no event" is a single key.
+_ASSIGNMENT_CONFLICT = (
+    "ON CONFLICT (template_id, camper_id, "
+    "(COALESCE(event_id, '00000000-0000-0000-0000-000000000000'::uuid))) "
+    "WHERE deleted_at IS NULL DO NOTHING"
+)
+
+
+def _bulk_assign_sql(*, by_event: bool, by_campers: bool) -> str:
+    """Build the roster x templates INSERT ... SELECT for bulk assignment.
+
+    The roster is every live camper registered (not cancelled) for the event
+    and/or in the given camper id list. The outer SELECT always yields at
+    least one row carrying the roster size, plus one row per created form.
+    """
+    roster_joins = ""
+    roster_filters = ""
+    if by_event:
+        roster_joins = (
+            "JOIN registrations r ON r.camper_id = c.id "
+            "AND r.event_id = CAST(:event_id AS uuid) "
+            "AND r.deleted_at IS NULL AND r.status <> 'cancelled'"
+        )
+    if by_campers:
+        roster_filters = "AND c.id = ANY(CAST(:camper_ids AS uuid[]))"
+
+    return f"""
+        WITH roster AS (
+            SELECT DISTINCT c.id
+            FROM campers c
+            {roster_joins}
+            WHERE c.organization_id = CAST(:org_id AS uuid)
+              AND c.deleted_at IS NULL
+              {roster_filters}
+        ),
+        ins AS (
+            INSERT INTO health_forms (
+                id, organization_id, template_id, camper_id, event_id,
+                status, due_date, is_deleted
+            )
+            SELECT gen_random_uuid(), CAST(:org_id AS uuid), t.id, roster.id,
+                   CAST(:event_id AS uuid), 'pending', CAST(:due_date AS date),
+                   false
+            FROM unnest(CAST(:template_ids AS uuid[])) AS t(id)
+            CROSS JOIN roster
+            {_ASSIGNMENT_CONFLICT}
+            RETURNING camper_id, template_id
+        )
+        SELECT n.roster_size, ins.camper_id, ins.template_id
+        FROM (SELECT count(*) AS roster_size FROM roster) AS n
+        LEFT JOIN ins ON true
+    """
+
+
+async def bulk_assign_forms(
+    db: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Assign several templates to a whole roster in one statement.
+
+    The roster is the campers registered for ``event_id``, the explicit
+    ``camper_ids``, or their intersection when both are given. Missing
+    (template, camper, event) assignments are inserted with a single
+    ``INSERT ... SELECT ... ON CONFLICT DO NOTHING``; existing live ones are
+    left untouched and counted as already assigned.
+
+    Returns counts plus ``reminders``: per camper, the names of the newly
+    assigned templates, for ``send_assignment_reminders``.
+    """
+    template_ids = list(dict.fromkeys(data["template_ids"]))
+    camper_ids = data.get("camper_ids")
+    event_id = data.get("event_id")
+    due_date = data.get("due_date")
+    if event_id is None and camper_ids is None:
+        raise ValueError("Provide event_id or camper_ids")
+
+    # Verify templates exist (one query for the whole set)
+    template_result = await db.execute(
+        select(HealthFormTemplate.id, HealthFormTemplate.name)
+        .where(HealthFormTemplate.id.in_(template_ids))
+        .where(HealthFormTemplate.organization_id == organization_id)
+        .where(HealthFormTemplate.deleted_at.is_(None))
+    )
+    template_names = {row.id: row.name for row in template_result}
+    if len(template_names) != len(template_ids):
+        raise ValueError("Template not found")
+
+    event_name = None
+    if event_id:
+        event_name = (
+            await db.execute(
+                select(Event.name)
+                .where(Event.id == event_id)
+                .where(Event.organization_id == organization_id)
+                .where(Event.deleted_at.is_(None))
+            )
+        ).scalar_one_or_none()
+        if event_name is None:
+            raise ValueError("Event not found")
+
+    result = await db.execute(
+        text(_bulk_assign_sql(
+            by_event=event_id is not None,
+            by_campers=camper_ids is not None,
+        )),
+        {
+            "org_id": organization_id,
+            "event_id": event_id,
+            "camper_ids": list(camper_ids) if camper_ids is not None else None,
+            "template_ids": template_ids,
+            "due_date": due_date,
+        },
+    )
+    rows = result.all()
+    await db.commit()
+
+    roster_size = rows[0].roster_size if rows else 0
+    new_forms: Dict[uuid.UUID, List[str]] = {}
+    for row in rows:
+        if row.camper_id is not None:
+            new_forms.setdefault(row.camper_id, []).append(
+                template_names[row.template_id]
+            )
+    created = sum(len(names) for names in new_forms.values())
+    requested = roster_size * len(template_ids)
+
+    return {
+        "campers": roster_size,
+        "templates": len(template_ids),
+        "requested": requested,
+        "created": created,
+        "already_assigned": requested - created,
+        "event_id": event_id,
+        "event_name": event_name,
+        "due_date": due_date,
+        "reminders": new_forms,
+    }
+
+
+async def send_assignment_reminders(
+    *,
+    organization_id: uuid.UUID,
+    reminders: Dict[uuid.UUID, List[str]],
+    event_name: Optional[str] = None,
+    due_date: Optional[date] = None,
+) -> int:
+    """Send ``health_form_reminder`` notifications after a bulk assignment.
+
+    Runs after the response (own session): one query loads the primary
+    contact of every camper, then one notification per camper lists all of
+    its newly assigned forms. Returns the number of campers notified.
+    """
+    from app.database import async_session_factory
+    from app.services import notification_service
+
+    if not reminders or async_session_factory is None:
+        return 0
+
+    sent = 0
+    async with async_session_factory() as db:
+        has_config = (
+            await db.execute(
+                select(sqlfunc.count())
+                .select_from(NotificationConfig)
+                .where(NotificationConfig.organization_id == organization_id)
+                .where(NotificationConfig.trigger_type == "health_form_reminder")
+                .where(NotificationConfig.is_active.is_(True))
+            )
+        ).scalar_one()
+        if not has_config:
+            return 0
+
+        result = await db.execute(
+            select(
+                Camper.id,
+                Camper.first_name,
+                Camper.last_name,
+                Contact.email,
+                Contact.phone,
+            )
+            .outerjoin(
+                CamperContact,
+                (CamperContact.camper_id == Camper.id)
+                & CamperContact.is_primary.is_(True),
+            )
+            .outerjoin(Contact, Contact.id == CamperContact.contact_id)
+            .where(Camper.id.in_(list(reminders)))
+            .where(Camper.organization_id == organization_id)
+        )
+        seen: set = set()
+        for row in result:
+            if row.id in seen:
+                continue
+            seen.add(row.id)
+            try:
+                await notification_service.trigger_notification(
+                    db,
+                    organization_id=organization_id,
+                    trigger_type="health_form_reminder",
+                    context={
+                        "camper_name": f"{row.first_name} {row.last_name}",
+                        "event_name": event_name or "",
+                        "form_names": ", ".join(reminders[row.id]),
+                        "due_date": due_date.isoformat() if due_date else "",
+                        "parent_email": row.email,
+                        "parent_phone": row.phone,
+                    },
+                )
+                sent += 1
+            except Exception:
+                logger.exception(
+                    "Health form reminder failed for camper %s", row.id
+                )
+    return sent
+
+
 async def list_forms(
     db: AsyncSession,
     *,
@@ -307,20 +541,25 @@ async def submit_form(
     submitted_by: Optional[uuid.UUID] = None,
     ip_address: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Submit form data for a health form."""
-    # Get the form
+    """Submit form data for a health form.
+
+    Answers are checked against the template's cached validator
+    (``form_validation``); failures raise ``FormValidationError``. Only the
+    columns needed here are loaded, not the form's eager relationships.
+    """
     result = await db.execute(
-        select(HealthForm)
-        .options(
-            selectinload(HealthForm.template),
-            selectinload(HealthForm.camper),
-            selectinload(HealthForm.event),
+        select(
+            HealthForm.status,
+            HealthForm.template_id,
+            HealthFormTemplate.version,
+            HealthFormTemplate.fields,
         )
+        .join(HealthFormTemplate, HealthFormTemplate.id == HealthForm.template_id)
         .where(HealthForm.id == form_id)
         .where(HealthForm.organization_id == organization_id)
         .where(HealthForm.deleted_at.is_(None))
     )
-    form = result.scalar_one_or_none()
+    form = result.one_or_none()
     if form is None:
         raise ValueError("Form not found")
 
@@ -333,47 +572,66 @@ async def submit_form(
     form_data = data.get("data", {})
     signature = data.get("signature")
 
-    # Create or update submission
-    existing_sub = await db.execute(
-        select(HealthFormSubmission)
-        .where(HealthFormSubmission.form_id == form_id)
-        .where(HealthFormSubmission.organization_id == organization_id)
+    form_validation.validate_answers(
+        "health",
+        form.template_id,
+        form.version,
+        form.fields,
+        form_data,
+        signed=bool(signature),
     )
-    submission = existing_sub.scalar_one_or_none()
 
     now = datetime.utcnow()
+    values = {
+        "data": form_data,
+        "signature": signature,
+        "signed_at": now if signature else None,
+        "submitted_by": submitted_by,
+        "ip_address": ip_address,
+    }
+    returning = (
+        HealthFormSubmission.id,
+        HealthFormSubmission.signed_at,
+        HealthFormSubmission.created_at,
+    )
 
-    if submission:
-        submission.data = form_data
-        submission.signature = signature
-        submission.signed_at = now if signature else None
-        submission.submitted_by = submitted_by
-        submission.ip_address = ip_address
-    else:
-        submission = HealthFormSubmission(
-            id=uuid.uuid4(),
-            organization_id=organization_id,
-            form_id=form_id,
-            submitted_by=submitted_by,
-            data=form_data,
-            signature=signature,
-            signed_at=now if signature else None,
-            ip_address=ip_address,
+    # Create or update submission
+    submission = (
+        await db.execute(
+            update(HealthFormSubmission)
+            .where(HealthFormSubmission.form_id == form_id)
+            .where(HealthFormSubmission.organization_id == organization_id)
+            .values(**values)
+            .returning(*returning)
         )
-        db.add(submission)
+    ).first()
+    if submission is None:
+        submission = (
+            await db.execute(
+                insert(HealthFormSubmission)
+                .values(
+                    id=uuid.uuid4(),
+                    organization_id=organization_id,
+                    form_id=form_id,
+                    **values,
+                )
+                .returning(*returning)
+            )
+        ).one()
 
     # Update form status
-    form.status = "submitted"
-    form.submitted_at = now
-
+    await db.execute(
+        update(HealthForm)
+        .where(HealthForm.id == form_id)
+        .values(status="submitted", submitted_at=now)
+    )
     await db.commit()
-    await db.refresh(submission)
 
     return {
         "id": submission.id,
-        "form_id": submission.form_id,
-        "data": submission.data,
-        "signature": submission.signature,
+        "form_id": form_id,
+        "data": form_data,
+        "signature": signature,
         "signed_at": submission.signed_at,
         "created_at": submission.created_at,
     }
@@ -452,6 +710,83 @@ async def get_submission(
 # ─── Default Template Seeding ─────────────────────────────────
 
 
+async def revalidate_submissions(
+    db: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    template_id: uuid.UUID,
+    max_results: int = 500,
+) -> Optional[Dict[str, Any]]:
+    """Re-check every stored submission of a template against its current fields.
+
+    Meant for after a template edit. Submissions are read in id-ordered
+    batches of plain columns and run through the template's compiled
+    validator; the first ``max_results`` failures are returned.
+    """
+    template = (
+        await db.execute(
+            select(HealthFormTemplate.version, HealthFormTemplate.fields)
+            .where(HealthFormTemplate.id == template_id)
+            .where(HealthFormTemplate.organization_id == organization_id)
+            .where(HealthFormTemplate.deleted_at.is_(None))
+        )
+    ).one_or_none()
+    if template is None:
+        return None
+
+    validator = form_validation.get_validator(
+        "health", template_id, template.version, template.fields
+    )
+    checked = 0
+    invalid: List[Dict[str, Any]] = []
+    invalid_count = 0
+    after: Optional[uuid.UUID] = None
+    while True:
+        query = (
+            select(
+                HealthFormSubmission.id,
+                HealthFormSubmission.form_id,
+                HealthFormSubmission.data,
+                HealthFormSubmission.signature,
+                HealthForm.camper_id,
+                HealthForm.status,
+            )
+            .join(HealthForm, HealthForm.id == HealthFormSubmission.form_id)
+            .where(HealthForm.template_id == template_id)
+            .where(HealthForm.organization_id == organization_id)
+            .where(HealthForm.deleted_at.is_(None))
+            .order_by(HealthFormSubmission.id)
+            .limit(_REVALIDATE_BATCH)
+        )
+        if after is not None:
+            query = query.where(HealthFormSubmission.id > after)
+        rows = (await db.execute(query)).all()
+        if not rows:
+            break
+        for row in rows:
+            checked += 1
+            errors = validator(row.data or {}, signed=bool(row.signature))
+            if errors:
+                invalid_count += 1
+                if len(invalid) < max_results:
+                    invalid.append({
+                        "submission_id": row.id,
+                        "form_id": row.form_id,
+                        "camper_id": row.camper_id,
+                        "status": row.status,
+                        "errors": errors,
+                    })
+        after = rows[-1].id
+
+    return {
+        "template_id": template_id,
+        "version": template.version,
+        "checked": checked,
+        "invalid": invalid_count,
+        "results": invalid,
+    }
+
+
 async def seed_default_templates(
     db: AsyncSession,
     *,
@@ -12,8 +12,23 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import response_cache
 from app.models.job_listing import JobListing, JobApplication
 
+CACHE_NAMESPACE = "job_listings"
+
+
+async def _public_listings_version(db: AsyncSession, tenant: Optional[str]) -> tuple:
+    """Changes whenever a published listing is added, edited or removed."""
+    result = await db.execute(
+        select(func.max(JobListing.updated_at), func.count())
+        .where(JobListing.status == "published")
+    )
+    return tuple(result.one())
+
+
+response_cache.register_namespace(CACHE_NAMESPACE, _public_listings_version)
+
 
 # ─── Listings ─────────────────────────────────────────────────
 
@@ -97,6 +112,7 @@ async def create_listing(
     db.add(listing)
     await db.commit()
     await db.refresh(listing)
+    response_cache.invalidate(CACHE_NAMESPACE)
     return _listing_to_dict(listing, 0)
 
 
@@ -122,6 +138,7 @@ async def update_listing(
 
     await db.commit()
     await db.refresh(listing)
+    response_cache.invalidate(CACHE_NAMESPACE)
     return _listing_to_dict(listing, 0)
 
 
@@ -150,6 +167,7 @@ async def delete_listing(
 
     await db.delete(listing)
     await db.commit()
+    response_cache.invalidate(CACHE_NAMESPACE)
     return True
 
 
@@ -172,6 +190,7 @@ async def publish_listing(
     listing.status = "published"
     await db.commit()
     await db.refresh(listing)
+    response_cache.invalidate(CACHE_NAMESPACE)
     return _listing_to_dict(listing, 0)
 
 
@@ -194,6 +213,7 @@ async def close_listing(
     listing.status = "closed"
     await db.commit()
     await db.refresh(listing)
+    response_cache.invalidate(CACHE_NAMESPACE)
     return _listing_to_dict(listing, 0)
 
 
@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+
 
 # ---------------------------------------------------------------------------
 # Table creation (idempotent)
@@ -36,9 +38,16 @@ CREATE TABLE IF NOT EXISTS lost_found_items (
 """
 
 
+register_ddl(
+    "lost_found",
+    _CREATE_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_lost_found_items_org_id ON lost_found_items(org_id)",
+)
+
+
 async def _ensure_table(db: AsyncSession) -> None:
-    await db.execute(text(_CREATE_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 # ---------------------------------------------------------------------------
@@ -15,9 +15,9 @@ from sqlalchemy import func as sqlfunc
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from supabase import create_client
 
 from app.config import settings
+from app.metrics import track_provider
 from app.models.staff_onboarding import (
     PolicyAcknowledgment,
     StaffCertification,
@@ -48,6 +48,8 @@ def _get_supabase():
     """Lazy-init Supabase client for storage operations."""
     global _supabase_client
     if _supabase_client is None:
+        from supabase import create_client
+
         _supabase_client = create_client(
             settings.supabase_url,
             settings.supabase_service_role_key,
@@ -399,11 +401,12 @@ async def upload_document(
     # Upload to Supabase Storage
     try:
         supabase = _get_supabase()
-        supabase.storage.from_(STORAGE_BUCKET).upload(
-            path=storage_path,
-            file=file_content,
-            file_options={"content-type": content_type},
-        )
+        with track_provider("supabase_storage", "upload"):
+            supabase.storage.from_(STORAGE_BUCKET).upload(
+                path=storage_path,
+                file=file_content,
+                file_options={"content-type": content_type},
+            )
     except Exception as e:
         logger.error(f"Supabase Storage upload failed: {e}")
         raise ValueError(f"Failed to upload file to storage: {e}")
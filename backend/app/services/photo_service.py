@@ -6,29 +6,42 @@ Business logic for photo upload, retrieval, and management via Supabase Storage.
 from __future__ import annotations
 
 import logging
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from fastapi import UploadFile
 from sqlalchemy import extract, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from supabase import create_client
 
 from app.config import settings
+from app.metrics import record_cache, track_provider
 from app.models.photo import Photo
 from app.models.photo_face_tag import PhotoFaceTag
+from app.services import photo_visibility_service
 
 logger = logging.getLogger(__name__)
 
 # Supabase client for storage operations
 _supabase_client = None
 
+# Signed URLs are valid for an hour; batch-signed ones are reused for most
+# of that so feed reloads don't go back to storage
+_SIGNED_URL_SECONDS = 3600
+_SIGNED_URL_REUSE_SECONDS = 3000
+_MAX_SIGNED_URLS = 20000
+# (bucket, file_path) -> (signed_at, url)
+_signed_urls: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+
 
 def _get_supabase():
     """Lazy-init Supabase client."""
     global _supabase_client
     if _supabase_client is None:
+        from supabase import create_client
+
         _supabase_client = create_client(
             settings.supabase_url,
             settings.supabase_service_role_key,
@@ -103,9 +116,10 @@ def get_public_url(file_path: str, bucket: str) -> str:
     """Generate a signed URL for viewing a photo (1 hour expiry)."""
     try:
         supabase = _get_supabase()
-        result = supabase.storage.from_(bucket).create_signed_url(
-            file_path, 3600  # 1 hour
-        )
+        with track_provider("supabase_storage", "create_signed_url"):
+            result = supabase.storage.from_(bucket).create_signed_url(
+                file_path, 3600  # 1 hour
+            )
         if result and ("signedURL" in result or "signedUrl" in result):
             return result.get("signedURL") or result.get("signedUrl")
         # Fallback: construct a public URL
@@ -115,6 +129,53 @@ def get_public_url(file_path: str, bucket: str) -> str:
         return f"{settings.supabase_url}/storage/v1/object/public/{bucket}/{file_path}"
 
 
+def get_signed_urls(items: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+    """
+    Signed URLs for many ``(bucket, file_path)`` pairs: cached ones are
+    reused, the rest are signed with one storage call per bucket. Falls back
+    to the public URL for anything storage could not sign.
+    """
+    now = time.monotonic()
+    urls: Dict[Tuple[str, str], str] = {}
+    missing: Dict[str, List[str]] = {}
+    for key in dict.fromkeys(items):
+        cached = _signed_urls.get(key)
+        hit = bool(cached and now - cached[0] < _SIGNED_URL_REUSE_SECONDS)
+        record_cache("photo_signed_url", hit)
+        if hit:
+            urls[key] = cached[1]
+        else:
+            missing.setdefault(key[0], []).append(key[1])
+
+    for bucket, paths in missing.items():
+        signed: Dict[str, str] = {}
+        try:
+            supabase = _get_supabase()
+            with track_provider("supabase_storage", "create_signed_urls"):
+                results = supabase.storage.from_(bucket).create_signed_urls(
+                    paths, _SIGNED_URL_SECONDS
+                )
+            for entry in results or []:
+                url = entry.get("signedURL") or entry.get("signedUrl")
+                if url and entry.get("path"):
+                    signed[entry["path"]] = url
+        except Exception as e:
+            logger.warning(f"Failed to batch-sign {len(paths)} URL(s) in {bucket}: {e}")
+
+        for path in paths:
+            url = signed.get(path)
+            if url:
+                _signed_urls[(bucket, path)] = (now, url)
+                _signed_urls.move_to_end((bucket, path))
+            else:
+                url = f"{settings.supabase_url}/storage/v1/object/public/{bucket}/{path}"
+            urls[(bucket, path)] = url
+
+    while len(_signed_urls) > _MAX_SIGNED_URLS:
+        _signed_urls.popitem(last=False)
+    return urls
+
+
 async def upload_photo(
     db: AsyncSession,
     *,
@@ -183,11 +244,12 @@ async def upload_photo(
     # Upload to Supabase Storage
     try:
         supabase = _get_supabase()
-        supabase.storage.from_(bucket).upload(
-            path=storage_path,
-            file=file_content,
-            file_options={"content-type": content_type},
-        )
+        with track_provider("supabase_storage", "upload"):
+            supabase.storage.from_(bucket).upload(
+                path=storage_path,
+                file=file_content,
+                file_options={"content-type": content_type},
+            )
     except Exception as e:
         logger.error(f"Supabase Storage upload failed: {e}")
         raise ValueError(f"Failed to upload file to storage: {e}")
@@ -225,6 +287,7 @@ async def upload_photo(
         is_profile_photo=False,
     )
     db.add(photo)
+    await photo_visibility_service.sync_photos(db, [photo.id])
     await db.commit()
     await db.refresh(photo)
 
@@ -281,11 +344,12 @@ async def upload_profile_photo(
     try:
         supabase = _get_supabase()
         # Use upsert=True to overwrite if a profile photo already exists
-        supabase.storage.from_(bucket).upload(
-            path=storage_path,
-            file=file_content,
-            file_options={"content-type": content_type, "upsert": "true"},
-        )
+        with track_provider("supabase_storage", "upload"):
+            supabase.storage.from_(bucket).upload(
+                path=storage_path,
+                file=file_content,
+                file_options={"content-type": content_type, "upsert": "true"},
+            )
     except Exception as e:
         logger.error(f"Profile photo upload failed: {e}")
         raise ValueError(f"Failed to upload profile photo: {e}")
@@ -421,7 +485,8 @@ async def delete_photo(
     try:
         bucket = _get_bucket(photo.category)
         supabase = _get_supabase()
-        supabase.storage.from_(bucket).remove([photo.file_path])
+        with track_provider("supabase_storage", "remove"):
+            supabase.storage.from_(bucket).remove([photo.file_path])
     except Exception as e:
         logger.warning(f"Failed to delete file from storage: {e}")
         # Continue with soft-delete even if storage deletion fails
@@ -429,6 +494,7 @@ async def delete_photo(
     # Soft-delete the database record
     photo.is_deleted = True
     photo.deleted_at = datetime.utcnow()
+    await photo_visibility_service.sync_photos(db, [photo.id])
     await db.commit()
     return True
 
@@ -474,6 +540,7 @@ async def _auto_tag_faces(
         )
         db.add(tag)
 
+    await photo_visibility_service.sync_photos(db, [photo.id])
     await db.commit()
     logger.info(f"Auto-tagged {len(matches)} face(s) in photo {photo.id}")
 
@@ -0,0 +1,150 @@
+"""
+Camp Connect - Portal Photo Visibility Index
+Precomputed "which camper appears in which photo" rows for the parent feed.
+
+``portal_photo_visibility`` holds one row per (camper, photo) a parent of
+that camper may see: photos with a face tag for the camper, and photos
+filed directly under the camper (category ``camper``, ``entity_id``).
+It carries the photo's ``created_at`` so the feed is a range read on
+``(camper_id, photo_created_at, photo_id)`` instead of a join through
+face tags on every request.
+
+Writers call ``sync_photos(db, photo_ids)`` in the same transaction as any
+change to a photo's face tags, its upload or its deletion; it recomputes
+those photos' rows from the source tables, so it is idempotent.
+
+The feed (``list_feed``) takes a family's linked campers, reads the newest
+``limit`` rows per camper from the index (one LATERAL range scan each),
+merges and de-duplicates them, and keyset-paginates on
+``(created_at, photo_id)``.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_DELETE_ROWS = text(
+    "DELETE FROM portal_photo_visibility "
+    "WHERE photo_id = ANY(CAST(:photo_ids AS uuid[]))"
+)
+
+_INSERT_ROWS = text(
+    """
+    INSERT INTO portal_photo_visibility (
+        organization_id, camper_id, photo_id, photo_created_at
+    )
+    SELECT p.organization_id, v.camper_id, p.id, p.created_at
+    FROM photos p
+    CROSS JOIN LATERAL (
+        SELECT t.camper_id
+        FROM photo_face_tags t
+        WHERE t.photo_id = p.id AND t.camper_id IS NOT NULL
+        UNION
+        SELECT p.entity_id
+        WHERE p.category = 'camper' AND p.entity_id IS NOT NULL
+    ) AS v
+    JOIN campers c ON c.id = v.camper_id
+    WHERE p.id = ANY(CAST(:photo_ids AS uuid[]))
+      AND p.deleted_at IS NULL
+    ON CONFLICT DO NOTHING
+    """
+)
+
+
+def _feed_sql(with_cursor: bool) -> str:
+    after = (
+        "AND (v.photo_created_at, v.photo_id) "
+        "< (CAST(:cursor_ts AS timestamptz), CAST(:cursor_id AS uuid))"
+        if with_cursor else ""
+    )
+    return f"""
+        SELECT p.id, p.file_name, p.file_path, p.caption, p.category,
+               f.created_at, f.camper_ids
+        FROM (
+            SELECT v.photo_id, max(v.photo_created_at) AS created_at,
+                   array_agg(v.camper_id) AS camper_ids
+            FROM unnest(CAST(:camper_ids AS uuid[])) AS c(camper_id)
+            CROSS JOIN LATERAL (
+                SELECT v.photo_id, v.camper_id, v.photo_created_at
+                FROM portal_photo_visibility v
+                WHERE v.camper_id = c.camper_id
+                  AND v.organization_id = CAST(:org_id AS uuid)
+                  {after}
+                ORDER BY v.photo_created_at DESC, v.photo_id DESC
+                LIMIT :limit
+            ) AS v
+            GROUP BY v.photo_id
+            ORDER BY created_at DESC, v.photo_id DESC
+            LIMIT :limit
+        ) AS f
+        JOIN photos p ON p.id = f.photo_id AND p.deleted_at IS NULL
+        ORDER BY f.created_at DESC, f.photo_id DESC
+    """
+
+
+def _encode_cursor(created_at: datetime, photo_id: uuid.UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(photo_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, photo_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), uuid.UUID(photo_id)
+    except (ValueError, TypeError, binascii.Error):
+        raise ValueError("Invalid cursor")
+
+
+async def sync_photos(db: AsyncSession, photo_ids: Iterable[uuid.UUID]) -> None:
+    """Recompute visibility rows for these photos (caller commits)."""
+    ids = list(dict.fromkeys(photo_ids))
+    if not ids:
+        return
+    await db.flush()
+    await db.execute(_DELETE_ROWS, {"photo_ids": ids})
+    await db.execute(_INSERT_ROWS, {"photo_ids": ids})
+
+
+async def list_feed(
+    db: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    camper_ids: Iterable[uuid.UUID],
+    cursor: Optional[str] = None,
+    limit: int = 50,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    One page of photos showing any of ``camper_ids``, newest first.
+    Returns (rows, next_cursor); rows carry ``file_path`` for URL signing
+    and the subset of ``camper_ids`` seen in each photo.
+    """
+    camper_ids = list(camper_ids)
+    if not camper_ids:
+        return [], None
+
+    params: Dict[str, Any] = {
+        "org_id": organization_id,
+        "camper_ids": camper_ids,
+        "limit": limit + 1,
+    }
+    if cursor:
+        params["cursor_ts"], params["cursor_id"] = _decode_cursor(cursor)
+
+    result = await db.execute(text(_feed_sql(bool(cursor))), params)
+    rows = [dict(row._mapping) for row in result]
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = _encode_cursor(last["created_at"], last["id"])
+    return rows, next_cursor
@@ -3,24 +3,47 @@ Camp Connect - Parent Portal Service
 Scoped queries that let parents view their campers, photos, invoices,
 and submit health forms.  All queries are restricted to the parent's
 linked campers and organization.
+
+Portal context (the caller's contact, portal_access flag and linked camper
+ids) is resolved in one query and cached per Supabase user for
+``settings.portal_context_cache_ttl`` seconds. Writers that change a
+contact or its camper links call ``invalidate_portal_context`` after
+committing, which drops this process's entries at once; other workers
+catch up when their entry expires.
 """
 
 from __future__ import annotations
 
+import json
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.config import settings
+from app.metrics import record_cache
 from app.models.camper import Camper
 from app.models.camper_contact import CamperContact
+from app.models.contact import Contact
 from app.models.health_form import HealthForm, HealthFormSubmission
 from app.models.payment import Invoice
-from app.models.photo import Photo
-from app.models.photo_face_tag import PhotoFaceTag
+from app.models.user import User
+from app.schema_bootstrap import ensure_schema
+from app.services import announcement_service  # noqa: F401  (registers announcements DDL)
+from app.services import photo_visibility_service
+from app.services.photo_service import _get_bucket, get_signed_urls
+
+_MAX_CONTEXTS = 10000
+
+# supabase user id -> (cached_at, context)
+_contexts: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+# contact id -> supabase user id, for invalidation
+_by_contact: Dict[uuid.UUID, str] = {}
 
 
 # ---------------------------------------------------------------------------
@@ -36,14 +59,167 @@ def _calculate_age(dob: Optional[Any]) -> Optional[int]:
     return today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
 
 
-def _photo_url(file_path: str, category: str) -> str:
-    """Generate a public/signed URL for a photo, best-effort."""
-    try:
-        from app.services.photo_service import get_public_url
-        bucket = "event-photos" if category == "event" else "camper-photos"
-        return get_public_url(file_path, bucket)
-    except Exception:
-        return ""
+# ---------------------------------------------------------------------------
+# Portal context
+# ---------------------------------------------------------------------------
+
+async def resolve_portal_context(
+    db: AsyncSession,
+    supabase_user_id: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    Return the portal context for a Supabase user, or None if there is no
+    live User with a linked Contact. ``portal_access`` is returned, not
+    enforced. Served from the short-TTL cache when possible.
+    """
+    now = time.monotonic()
+    cached = _contexts.get(supabase_user_id)
+    hit = bool(cached and now - cached[0] < settings.portal_context_cache_ttl)
+    record_cache("portal_context", hit)
+    if hit:
+        _contexts.move_to_end(supabase_user_id)
+        return cached[1]
+
+    row = (
+        await db.execute(
+            select(
+                User.id.label("user_id"),
+                Contact.id.label("contact_id"),
+                Contact.organization_id,
+                Contact.first_name,
+                Contact.last_name,
+                Contact.email,
+                Contact.portal_access,
+                func.array_agg(CamperContact.camper_id)
+                .filter(CamperContact.camper_id.isnot(None))
+                .label("camper_ids"),
+            )
+            .join(Contact, Contact.user_id == User.id)
+            .outerjoin(CamperContact, CamperContact.contact_id == Contact.id)
+            .where(User.supabase_user_id == supabase_user_id)
+            .where(User.deleted_at.is_(None))
+            .where(Contact.deleted_at.is_(None))
+            .group_by(User.id, Contact.id)
+            .order_by(Contact.created_at)
+            .limit(1)
+        )
+    ).one_or_none()
+    if row is None:
+        _forget(supabase_user_id)
+        return None
+
+    context = {
+        "user_id": row.user_id,
+        "contact_id": row.contact_id,
+        "organization_id": row.organization_id,
+        "first_name": row.first_name,
+        "last_name": row.last_name,
+        "email": row.email,
+        "portal_access": bool(row.portal_access),
+        "linked_camper_ids": tuple(row.camper_ids or ()),
+    }
+    _forget(supabase_user_id)
+    _contexts[supabase_user_id] = (now, context)
+    _by_contact[row.contact_id] = supabase_user_id
+    if len(_contexts) > _MAX_CONTEXTS:
+        _, (_, old) = _contexts.popitem(last=False)
+        _by_contact.pop(old["contact_id"], None)
+    return context
+
+
+def invalidate_portal_context(contact_ids: Iterable[uuid.UUID]) -> None:
+    """Drop cached portal contexts for these contacts (call after commit)."""
+    for contact_id in contact_ids:
+        supabase_user_id = _by_contact.pop(contact_id, None)
+        if supabase_user_id is not None:
+            _contexts.pop(supabase_user_id, None)
+
+
+def _forget(supabase_user_id: str) -> None:
+    entry = _contexts.pop(supabase_user_id, None)
+    if entry is not None:
+        _by_contact.pop(entry[1]["contact_id"], None)
+
+
+# ---------------------------------------------------------------------------
+# Dashboard
+# ---------------------------------------------------------------------------
+
+_DASHBOARD_SQL = text("""
+    SELECT
+        (SELECT COALESCE(json_agg(x ORDER BY x.first_name), '[]'::json) FROM (
+            SELECT c.id, c.first_name, c.last_name, c.date_of_birth,
+                   c.reference_photo_url AS photo_url, b.name AS bunk_name
+            FROM campers c
+            LEFT JOIN LATERAL (
+                SELECT ba.bunk_id FROM bunk_assignments ba
+                WHERE ba.camper_id = c.id
+                ORDER BY ba.end_date DESC
+                LIMIT 1
+            ) cur ON true
+            LEFT JOIN bunks b ON b.id = cur.bunk_id
+            WHERE c.id = ANY(CAST(:camper_ids AS uuid[]))
+              AND c.organization_id = CAST(:org_id AS uuid)
+              AND c.deleted_at IS NULL
+            ORDER BY c.first_name
+            LIMIT 10
+        ) x) AS campers,
+        (SELECT COALESCE(json_agg(y ORDER BY y.start_date), '[]'::json) FROM (
+            SELECT ev.id, ev.name, ev.start_date, ev.end_date, l.name AS location
+            FROM events ev
+            LEFT JOIN locations l ON l.id = ev.location_id
+            WHERE ev.organization_id = CAST(:org_id AS uuid)
+              AND ev.start_date >= CURRENT_DATE
+              AND ev.deleted_at IS NULL
+            ORDER BY ev.start_date
+            LIMIT 5
+        ) y) AS upcoming_events,
+        (SELECT count(*) FROM photos p
+         WHERE p.organization_id = CAST(:org_id AS uuid)
+           AND p.created_at >= CURRENT_DATE - INTERVAL '7 days'
+           AND p.deleted_at IS NULL
+        ) AS recent_photos_count,
+        (SELECT COALESCE(
+            json_agg(z ORDER BY z.is_pinned DESC, z.created_at DESC), '[]'::json
+         ) FROM (
+            SELECT an.id, an.title AS subject, an.content AS body, an.created_at,
+                   an.is_pinned
+            FROM announcements an
+            WHERE an.org_id = CAST(:org_id AS uuid)
+              AND an.target_audience IN ('all', 'parents')
+              AND (an.expires_at IS NULL OR an.expires_at > now())
+            ORDER BY an.is_pinned DESC, an.created_at DESC
+            LIMIT 3
+        ) z) AS announcements
+""")
+
+
+async def get_dashboard(
+    db: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    camper_ids: Iterable[uuid.UUID],
+) -> Dict[str, Any]:
+    """Portal landing page aggregates, assembled in one round trip."""
+    await ensure_schema()
+    row = (
+        await db.execute(
+            _DASHBOARD_SQL,
+            {"org_id": organization_id, "camper_ids": list(camper_ids)},
+        )
+    ).one()
+
+    def _json(value: Any) -> List[Dict[str, Any]]:
+        return json.loads(value) if isinstance(value, str) else (value or [])
+
+    return {
+        "campers": _json(row.campers),
+        "upcoming_events": _json(row.upcoming_events),
+        "recent_photos_count": row.recent_photos_count or 0,
+        # No parent inbox exists yet (camper_messages flow parent -> camper)
+        "unread_messages_count": 0,
+        "announcements": _json(row.announcements),
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -171,69 +347,38 @@ async def list_my_photos(
     *,
     organization_id: uuid.UUID,
     camper_ids: List[uuid.UUID],
-) -> List[Dict[str, Any]]:
+    cursor: Optional[str] = None,
+    limit: int = 50,
+) -> Dict[str, Any]:
     """
-    List photos for all linked campers.  Uses face-tag records to find
-    photos where the camper appears, plus any photos directly categorised
-    as 'camper' with entity_id matching.
+    One page of photos showing any linked camper (face tag or filed under
+    the camper), newest first, from the precomputed visibility index.
+    URLs for the page are signed in one batch. Pass the returned
+    ``next_cursor`` as ``cursor`` for the next page.
     """
-    if not camper_ids:
-        return []
-
-    # Photos via face tags (AI-matched)
-    tag_result = await db.execute(
-        select(PhotoFaceTag)
-        .options(selectinload(PhotoFaceTag.photo))
-        .where(PhotoFaceTag.organization_id == organization_id)
-        .where(PhotoFaceTag.camper_id.in_(camper_ids))
-        .order_by(PhotoFaceTag.created_at.desc())
-    )
-    face_tags = tag_result.scalars().all()
-
-    seen_ids: set = set()
-    items: List[Dict[str, Any]] = []
-
-    for tag in face_tags:
-        photo = tag.photo
-        if photo is None or photo.deleted_at is not None:
-            continue
-        if photo.id in seen_ids:
-            continue
-        seen_ids.add(photo.id)
-        items.append({
-            "id": photo.id,
-            "url": _photo_url(photo.file_path, photo.category),
-            "file_name": photo.file_name,
-            "caption": photo.caption,
-            "category": photo.category,
-            "created_at": photo.created_at,
-        })
-
-    # Also include photos directly linked by entity_id (category='camper')
-    direct_result = await db.execute(
-        select(Photo)
-        .where(Photo.organization_id == organization_id)
-        .where(Photo.category == "camper")
-        .where(Photo.entity_id.in_(camper_ids))
-        .where(Photo.deleted_at.is_(None))
-        .order_by(Photo.created_at.desc())
+    rows, next_cursor = await photo_visibility_service.list_feed(
+        db,
+        organization_id=organization_id,
+        camper_ids=camper_ids,
+        cursor=cursor,
+        limit=limit,
     )
-    direct_photos = direct_result.scalars().all()
-
-    for photo in direct_photos:
-        if photo.id in seen_ids:
-            continue
-        seen_ids.add(photo.id)
-        items.append({
-            "id": photo.id,
-            "url": _photo_url(photo.file_path, photo.category),
-            "file_name": photo.file_name,
-            "caption": photo.caption,
-            "category": photo.category,
-            "created_at": photo.created_at,
-        })
-
-    return items
+    keys = [(_get_bucket(row["category"]), row["file_path"]) for row in rows]
+    urls = get_signed_urls(keys)
+
+    items = [
+        {
+            "id": row["id"],
+            "url": urls[key],
+            "file_name": row["file_name"],
+            "caption": row["caption"],
+            "category": row["category"],
+            "camper_ids": row["camper_ids"] or [],
+            "created_at": row["created_at"],
+        }
+        for row, key in zip(rows, keys)
+    ]
+    return {"items": items, "next_cursor": next_cursor}
 
 
 # ---------------------------------------------------------------------------
@@ -10,6 +10,7 @@ Uses AWS Rekognition to:
 
 Note: boto3 is synchronous, so all functions in this module are regular
 (non-async). Call from async code via asyncio.to_thread() or run_in_executor().
+boto3/botocore are imported on first use to keep them off the startup path.
 """
 
 from __future__ import annotations
@@ -17,10 +18,8 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional
 
-import boto3
-from botocore.exceptions import ClientError
-
 from app.config import settings
+from app.metrics import track_provider
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +35,8 @@ def _get_rekognition_client():
     """
     global _rekognition_client
     if _rekognition_client is None:
+        import boto3
+
         _rekognition_client = boto3.client(
             "rekognition",
             aws_access_key_id=settings.aws_access_key_id,
@@ -67,6 +68,8 @@ def ensure_collection(organization_id) -> str:
     Returns:
         The Rekognition collection ID string.
     """
+    from botocore.exceptions import ClientError
+
     client = _get_rekognition_client()
     collection = _collection_id(organization_id)
 
@@ -104,18 +107,21 @@ def index_camper_face(
         The FaceId string from Rekognition if a face was detected,
         or None if no face was found in the image.
     """
+    from botocore.exceptions import ClientError
+
     client = _get_rekognition_client()
     collection = ensure_collection(organization_id)
 
     try:
-        response = client.index_faces(
-            CollectionId=collection,
-            Image={"Bytes": image_bytes},
-            ExternalImageId=str(camper_id),
-            MaxFaces=1,
-            QualityFilter="AUTO",
-            DetectionAttributes=["DEFAULT"],
-        )
+        with track_provider("rekognition", "index_faces"):
+            response = client.index_faces(
+                CollectionId=collection,
+                Image={"Bytes": image_bytes},
+                ExternalImageId=str(camper_id),
+                MaxFaces=1,
+                QualityFilter="AUTO",
+                DetectionAttributes=["DEFAULT"],
+            )
 
         face_records = response.get("FaceRecords", [])
         if not face_records:
@@ -163,16 +169,19 @@ def search_faces_in_photo(
             - similarity: Match similarity percentage
             - bounding_box: Dict with Width, Height, Left, Top
     """
+    from botocore.exceptions import ClientError
+
     client = _get_rekognition_client()
     collection = _collection_id(organization_id)
 
     try:
-        response = client.search_faces_by_image(
-            CollectionId=collection,
-            Image={"Bytes": image_bytes},
-            FaceMatchThreshold=threshold,
-            MaxFaces=20,
-        )
+        with track_provider("rekognition", "search_faces"):
+            response = client.search_faces_by_image(
+                CollectionId=collection,
+                Image={"Bytes": image_bytes},
+                FaceMatchThreshold=threshold,
+                MaxFaces=20,
+            )
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
         if error_code == "InvalidParameterException":
@@ -233,14 +242,17 @@ def delete_faces_for_camper(
     if not face_ids:
         return
 
+    from botocore.exceptions import ClientError
+
     client = _get_rekognition_client()
     collection = _collection_id(organization_id)
 
     try:
-        response = client.delete_faces(
-            CollectionId=collection,
-            FaceIds=face_ids,
-        )
+        with track_provider("rekognition", "delete_faces"):
+            response = client.delete_faces(
+                CollectionId=collection,
+                FaceIds=face_ids,
+            )
         deleted = response.get("DeletedFaces", [])
         logger.info(
             f"Deleted {len(deleted)} face(s) from collection {collection}"
@@ -1,19 +1,35 @@
 """
 Camp Connect - Resource Booking Service
 Business logic for resource and booking management.
+
+Overlaps are enforced by the ex_resource_bookings_no_overlap exclusion
+constraint; see app.services.booking_engine.
 """
 
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, time, timezone
+from typing import Any, Dict, List, Optional, Sequence
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import DateTime, and_, func, insert, literal, literal_column, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.resource_booking import Resource, ResourceBooking
 from app.models.user import User
+from app.services.booking_engine import (
+    Slot,
+    availability_windows,
+    compute_free_slots,
+    find_batch_overlaps,
+    is_overlap_violation,
+)
+
+_CONFLICT_MESSAGE = (
+    "Time conflict: this resource is already booked during the requested period."
+)
 
 
 # ========================================================================
@@ -211,8 +227,9 @@ async def create_booking(
     data: Dict[str, Any],
 ) -> Dict[str, Any]:
     """
-    Create a new booking after checking for conflicts.
-    Raises ValueError if the resource is double-booked.
+    Create a new booking.
+    Raises ValueError if the resource is double-booked; the exclusion
+    constraint makes the check race-free.
     """
     resource_id = data["resource_id"]
     start_time = data["start_time"]
@@ -221,31 +238,9 @@ async def create_booking(
     if end_time <= start_time:
         raise ValueError("End time must be after start time.")
 
-    # Verify the resource exists and belongs to the org
-    res_result = await db.execute(
-        select(Resource)
-        .where(Resource.id == resource_id)
-        .where(Resource.organization_id == organization_id)
-        .where(Resource.deleted_at.is_(None))
+    resource = await _get_bookable_resource(
+        db, organization_id=organization_id, resource_id=resource_id
     )
-    resource = res_result.scalar_one_or_none()
-    if resource is None:
-        raise ValueError("Resource not found.")
-    if not resource.available:
-        raise ValueError("Resource is currently unavailable.")
-
-    # Conflict detection: overlapping non-cancelled bookings
-    conflict = await _check_booking_conflict(
-        db,
-        resource_id=resource_id,
-        start_time=start_time,
-        end_time=end_time,
-        exclude_booking_id=None,
-    )
-    if conflict:
-        raise ValueError(
-            "Time conflict: this resource is already booked during the requested period."
-        )
 
     booking = ResourceBooking(
         id=uuid.uuid4(),
@@ -254,12 +249,17 @@ async def create_booking(
         **data,
     )
     db.add(booking)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if is_overlap_violation(exc):
+            raise ValueError(_CONFLICT_MESSAGE)
+        raise
     await db.refresh(booking)
 
-    resource_name = await _get_resource_name(db, booking.resource_id)
     booked_by_name = await _get_user_name(db, booking.booked_by)
-    return _booking_to_dict(booking, resource_name, booked_by_name)
+    return _booking_to_dict(booking, resource.name, booked_by_name)
 
 
 async def update_booking(
@@ -280,29 +280,21 @@ async def update_booking(
     if booking is None:
         return None
 
-    # If times are being updated, check for conflicts
     new_start = data.get("start_time", booking.start_time)
     new_end = data.get("end_time", booking.end_time)
     if new_end <= new_start:
         raise ValueError("End time must be after start time.")
 
-    if "start_time" in data or "end_time" in data:
-        conflict = await _check_booking_conflict(
-            db,
-            resource_id=booking.resource_id,
-            start_time=new_start,
-            end_time=new_end,
-            exclude_booking_id=booking_id,
-        )
-        if conflict:
-            raise ValueError(
-                "Time conflict: this resource is already booked during the requested period."
-            )
-
     for key, value in data.items():
         setattr(booking, key, value)
 
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if is_overlap_violation(exc):
+            raise ValueError(_CONFLICT_MESSAGE)
+        raise
     await db.refresh(booking)
 
     resource_name = await _get_resource_name(db, booking.resource_id)
@@ -333,6 +325,222 @@ async def delete_booking(
     return True
 
 
+# ========================================================================
+# Bulk reservation & availability
+# ========================================================================
+
+async def find_conflicts(
+    db: AsyncSession,
+    *,
+    resource_id: uuid.UUID,
+    slots: Sequence[Slot],
+    exclude_booking_id: Optional[uuid.UUID] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Return every live booking that overlaps any of the given slots.
+
+    All occurrences are checked in one round trip: the slots are unnested
+    into a derived table and joined on ``period &&``, which is served by
+    the GiST index behind the exclusion constraint.
+    """
+    if not slots:
+        return []
+
+    ts_array = ARRAY(DateTime(timezone=True))
+    occ = (
+        func.unnest(
+            literal([s for s, _ in slots], ts_array),
+            literal([e for _, e in slots], ts_array),
+        )
+        .table_valued("start_time", "end_time", with_ordinality="idx")
+        .render_derived(name="occ")
+    )
+    query = (
+        select(
+            occ.c.idx,
+            ResourceBooking.id,
+            ResourceBooking.title,
+            ResourceBooking.start_time,
+            ResourceBooking.end_time,
+        )
+        .select_from(occ)
+        .join(
+            ResourceBooking,
+            and_(
+                ResourceBooking.resource_id == resource_id,
+                ResourceBooking.period.overlaps(
+                    func.tstzrange(
+                        occ.c.start_time, occ.c.end_time, literal_column("'[)'")
+                    )
+                ),
+                ResourceBooking.status != "cancelled",
+                ResourceBooking.deleted_at.is_(None),
+            ),
+        )
+        .order_by(occ.c.idx, ResourceBooking.start_time)
+    )
+    if exclude_booking_id:
+        query = query.where(ResourceBooking.id != exclude_booking_id)
+
+    result = await db.execute(query)
+    return [
+        {
+            "occurrence_index": row.idx - 1,
+            "start_time": slots[row.idx - 1][0],
+            "end_time": slots[row.idx - 1][1],
+            "conflicting_booking_id": row.id,
+            "conflicting_title": row.title,
+            "conflicting_start_time": row.start_time,
+            "conflicting_end_time": row.end_time,
+        }
+        for row in result.all()
+    ]
+
+
+async def reserve_occurrences(
+    db: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    booked_by: uuid.UUID,
+    resource_id: uuid.UUID,
+    title: str,
+    slots: Sequence[Slot],
+    notes: Optional[str] = None,
+    status: str = "pending",
+    allow_partial: bool = False,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Check and reserve many occurrences of a booking at once.
+
+    Conflicts (against existing bookings and within the batch itself) are
+    collected in a single query. By default the batch is all-or-nothing;
+    with ``allow_partial`` the conflict-free occurrences are still booked.
+    ``dry_run`` reports conflicts without writing anything.
+    """
+    resource = await _get_bookable_resource(
+        db, organization_id=organization_id, resource_id=resource_id
+    )
+
+    conflicts = (
+        await find_conflicts(db, resource_id=resource_id, slots=slots)
+        if status != "cancelled"
+        else []
+    )
+    if status != "cancelled":
+        for idx, other in find_batch_overlaps(slots):
+            conflicts.append({
+                "occurrence_index": idx,
+                "start_time": slots[idx][0],
+                "end_time": slots[idx][1],
+                "conflicting_booking_id": None,
+                "conflicting_title": f"Occurrence #{other + 1} in this request",
+                "conflicting_start_time": slots[other][0],
+                "conflicting_end_time": slots[other][1],
+            })
+    conflicts.sort(key=lambda c: c["occurrence_index"])
+
+    blocked = {c["occurrence_index"] for c in conflicts}
+    to_create = [i for i in range(len(slots)) if i not in blocked]
+    out: Dict[str, Any] = {
+        "requested": len(slots),
+        "created": [],
+        "conflicts": conflicts,
+    }
+    if dry_run or not to_create or (conflicts and not allow_partial):
+        return out
+
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "organization_id": organization_id,
+            "resource_id": resource_id,
+            "booked_by": booked_by,
+            "title": title,
+            "notes": notes,
+            "status": status,
+            "start_time": slots[i][0],
+            "end_time": slots[i][1],
+        }
+        for i in to_create
+    ]
+    try:
+        result = await db.execute(insert(ResourceBooking).returning(ResourceBooking), rows)
+        bookings = list(result.scalars().all())
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if not is_overlap_violation(exc):
+            raise
+        # Another request won the race for one of the slots; report it
+        out["conflicts"] = await find_conflicts(
+            db, resource_id=resource_id, slots=slots
+        )
+        return out
+
+    booked_by_name = await _get_user_name(db, booked_by)
+    out["created"] = [
+        _booking_to_dict(b, resource.name, booked_by_name)
+        for b in sorted(bookings, key=lambda b: b.start_time)
+    ]
+    return out
+
+
+async def get_availability(
+    db: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    resource_id: uuid.UUID,
+    day: date,
+    span: str = "day",
+    tz: str = "UTC",
+    day_start: time = time(0, 0),
+    day_end: Optional[time] = None,
+    min_minutes: int = 0,
+) -> Optional[Dict[str, Any]]:
+    """
+    Compute free slots for a resource over a day or ISO week.
+
+    Busy ranges are fetched in one indexed range query, already sorted,
+    and subtracted from each day's bookable window.
+    """
+    resource_result = await db.execute(
+        select(Resource.id)
+        .where(Resource.id == resource_id)
+        .where(Resource.organization_id == organization_id)
+        .where(Resource.deleted_at.is_(None))
+    )
+    if resource_result.scalar_one_or_none() is None:
+        return None
+
+    windows = availability_windows(
+        day=day, span=span, tz=tz, day_start=day_start, day_end=day_end
+    )
+    range_start, range_end = windows[0][0], windows[-1][1]
+
+    result = await db.execute(
+        select(ResourceBooking.start_time, ResourceBooking.end_time)
+        .where(ResourceBooking.resource_id == resource_id)
+        .where(
+            ResourceBooking.period.overlaps(
+                func.tstzrange(range_start, range_end, literal_column("'[)'"))
+            )
+        )
+        .where(ResourceBooking.status != "cancelled")
+        .where(ResourceBooking.deleted_at.is_(None))
+        .order_by(ResourceBooking.start_time)
+    )
+    busy = [(row.start_time, row.end_time) for row in result.all()]
+
+    return {
+        "resource_id": resource_id,
+        "range_start": range_start,
+        "range_end": range_end,
+        "busy": [{"start_time": s, "end_time": e} for s, e in busy],
+        "free": compute_free_slots(windows, busy, min_minutes=min_minutes),
+    }
+
+
 # ========================================================================
 # Stats
 # ========================================================================
@@ -398,33 +606,25 @@ async def get_stats(
 # Helpers
 # ========================================================================
 
-async def _check_booking_conflict(
+async def _get_bookable_resource(
     db: AsyncSession,
     *,
+    organization_id: uuid.UUID,
     resource_id: uuid.UUID,
-    start_time: datetime,
-    end_time: datetime,
-    exclude_booking_id: Optional[uuid.UUID],
-) -> bool:
-    """Return True if there is an overlapping non-cancelled booking."""
-    query = (
-        select(func.count(ResourceBooking.id))
-        .where(ResourceBooking.resource_id == resource_id)
-        .where(ResourceBooking.deleted_at.is_(None))
-        .where(ResourceBooking.status != "cancelled")
-        .where(
-            and_(
-                ResourceBooking.start_time < end_time,
-                ResourceBooking.end_time > start_time,
-            )
-        )
+) -> Resource:
+    """Load a resource for booking, raising ValueError if it cannot be booked."""
+    result = await db.execute(
+        select(Resource)
+        .where(Resource.id == resource_id)
+        .where(Resource.organization_id == organization_id)
+        .where(Resource.deleted_at.is_(None))
     )
-    if exclude_booking_id:
-        query = query.where(ResourceBooking.id != exclude_booking_id)
-
-    result = await db.execute(query)
-    count = result.scalar() or 0
-    return count > 0
+    resource = result.scalar_one_or_none()
+    if resource is None:
+        raise ValueError("Resource not found.")
+    if not resource.available:
+        raise ValueError("Resource is currently unavailable.")
+    return resource
 
 
 async def _count_bookings_for_resource(
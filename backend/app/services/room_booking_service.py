@@ -2,17 +2,35 @@
 Camp Connect - Room Booking Service
 Business logic for room/space booking management using raw SQL.
 Tables: rooms, room_bookings.
+
+Overlaps are enforced by the ex_room_bookings_no_overlap exclusion
+constraint on room_bookings.period; see app.services.booking_engine.
 """
 
 from __future__ import annotations
 
 import json
 import uuid
-from typing import Any, Dict, List, Optional
+from datetime import date, time
+from typing import Any, Dict, List, Optional, Sequence
 
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+from app.services.booking_engine import (
+    Slot,
+    availability_windows,
+    compute_free_slots,
+    find_batch_overlaps,
+    is_overlap_violation,
+)
+
+_CONFLICT_MESSAGE = (
+    "Time conflict: this room is already booked during the requested period."
+)
+
 
 # ---------------------------------------------------------------------------
 # Table creation (idempotent)
@@ -45,17 +63,31 @@ CREATE TABLE IF NOT EXISTS room_bookings (
     recurrence_pattern VARCHAR(255),
     status VARCHAR(20) NOT NULL DEFAULT 'confirmed',
     notes TEXT,
+    period TSTZRANGE GENERATED ALWAYS AS (tstzrange(start_time, end_time, '[)')) STORED,
     created_at TIMESTAMPTZ DEFAULT NOW(),
-    updated_at TIMESTAMPTZ DEFAULT NOW()
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    CONSTRAINT ex_room_bookings_no_overlap EXCLUDE USING gist
+        (room_id WITH =, period WITH &&) WHERE (status <> 'cancelled')
 );
 """
 
+_CREATE_BTREE_GIST = "CREATE EXTENSION IF NOT EXISTS btree_gist"
+
+
+register_ddl(
+    "room_booking",
+    _CREATE_BTREE_GIST,
+    _CREATE_ROOMS_TABLE,
+    _CREATE_ROOM_BOOKINGS_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_rooms_org_id ON rooms(org_id)",
+    "CREATE INDEX IF NOT EXISTS idx_room_bookings_org_id ON room_bookings(org_id)",
+    "CREATE INDEX IF NOT EXISTS idx_room_bookings_room_id ON room_bookings(room_id)",
+)
+
 
 async def _ensure_tables(db: AsyncSession) -> None:
-    """Create tables if they do not exist."""
-    await db.execute(text(_CREATE_ROOMS_TABLE))
-    await db.execute(text(_CREATE_ROOM_BOOKINGS_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 # ---------------------------------------------------------------------------
@@ -121,7 +153,7 @@ async def create_room(
 
     q = text("""
         INSERT INTO rooms (id, org_id, name, type, capacity, amenities, is_active)
-        VALUES (:id, :org_id, :name, :type, :capacity, :amenities::jsonb, :is_active)
+        VALUES (:id, :org_id, :name, :type, :capacity, CAST(:amenities AS jsonb), :is_active)
         RETURNING *
     """)
     result = await db.execute(q, {
@@ -165,7 +197,7 @@ async def update_room(
         set_parts.append("capacity = :capacity")
         params["capacity"] = data["capacity"]
     if "amenities" in data:
-        set_parts.append("amenities = :amenities::jsonb")
+        set_parts.append("amenities = CAST(:amenities AS jsonb)")
         params["amenities"] = json.dumps(data["amenities"] or [])
     if "is_active" in data:
         set_parts.append("is_active = :is_active")
@@ -269,73 +301,54 @@ async def create_booking(
     org_id: uuid.UUID,
     data: Dict[str, Any],
 ) -> Dict[str, Any]:
-    """Create a new room booking with conflict detection."""
+    """
+    Create a new room booking.
+    Raises ValueError if the room is double-booked; the exclusion
+    constraint makes the check race-free.
+    """
     await _ensure_tables(db)
 
     room_id_str = str(data["room_id"])
-    start_time = data["start_time"]
-    end_time = data["end_time"]
-
-    # Check for overlapping non-cancelled bookings
-    conflict_q = text("""
-        SELECT COUNT(*) FROM room_bookings
-        WHERE room_id = :room_id
-          AND org_id = :org_id
-          AND status != 'cancelled'
-          AND start_time < :end_time
-          AND end_time > :start_time
-    """)
-    conflict_result = await db.execute(conflict_q, {
-        "room_id": room_id_str,
-        "org_id": str(org_id),
-        "start_time": start_time,
-        "end_time": end_time,
-    })
-    conflict_count = conflict_result.scalar() or 0
-    if conflict_count > 0:
-        raise ValueError(
-            "Time conflict: this room is already booked during the requested period."
-        )
+    if data["end_time"] <= data["start_time"]:
+        raise ValueError("End time must be after start time.")
 
     booking_id = uuid.uuid4()
     q = text("""
-        INSERT INTO room_bookings
-            (id, org_id, room_id, booked_by, purpose, start_time, end_time,
-             recurring, recurrence_pattern, status, notes)
-        VALUES
-            (:id, :org_id, :room_id, :booked_by, :purpose, :start_time, :end_time,
-             :recurring, :recurrence_pattern, :status, :notes)
-        RETURNING *
+        WITH inserted AS (
+            INSERT INTO room_bookings
+                (id, org_id, room_id, booked_by, purpose, start_time, end_time,
+                 recurring, recurrence_pattern, status, notes)
+            VALUES
+                (:id, :org_id, :room_id, :booked_by, :purpose, :start_time, :end_time,
+                 :recurring, :recurrence_pattern, :status, :notes)
+            RETURNING *
+        )
+        SELECT inserted.*, r.name AS room_name
+        FROM inserted
+        LEFT JOIN rooms r ON r.id = inserted.room_id
     """)
-    result = await db.execute(q, {
-        "id": str(booking_id),
-        "org_id": str(org_id),
-        "room_id": room_id_str,
-        "booked_by": data["booked_by"],
-        "purpose": data["purpose"],
-        "start_time": start_time,
-        "end_time": end_time,
-        "recurring": data.get("recurring", False),
-        "recurrence_pattern": data.get("recurrence_pattern"),
-        "status": data.get("status", "confirmed"),
-        "notes": data.get("notes"),
-    })
-    await db.commit()
-    row = result.first()
-    if not row:
-        return {}
-
-    booking_dict = dict(row._mapping)
-
-    # Fetch room name
-    name_result = await db.execute(
-        text("SELECT name FROM rooms WHERE id = :room_id"),
-        {"room_id": room_id_str},
-    )
-    name_row = name_result.first()
-    booking_dict["room_name"] = name_row[0] if name_row else None
-
-    return booking_dict
+    try:
+        result = await db.execute(q, {
+            "id": str(booking_id),
+            "org_id": str(org_id),
+            "room_id": room_id_str,
+            "booked_by": data["booked_by"],
+            "purpose": data["purpose"],
+            "start_time": data["start_time"],
+            "end_time": data["end_time"],
+            "recurring": data.get("recurring", False),
+            "recurrence_pattern": data.get("recurrence_pattern"),
+            "status": data.get("status", "confirmed"),
+            "notes": data.get("notes"),
+        })
+        row = result.first()
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if is_overlap_violation(exc):
+            raise ValueError(_CONFLICT_MESSAGE)
+        raise
+    return dict(row._mapping) if row else {}
 
 
 async def update_booking(
@@ -381,30 +394,25 @@ async def update_booking(
     set_clause = ", ".join(set_parts)
 
     q = text(f"""
-        UPDATE room_bookings SET {set_clause}
-        WHERE id = :booking_id AND org_id = :org_id
-        RETURNING *
-    """)
-    result = await db.execute(q, params)
-    await db.commit()
-    row = result.first()
-    if not row:
-        return None
-
-    booking_dict = dict(row._mapping)
-    # Fetch room name
-    rid = booking_dict.get("room_id")
-    if rid:
-        name_result = await db.execute(
-            text("SELECT name FROM rooms WHERE id = :room_id"),
-            {"room_id": str(rid)},
+        WITH updated AS (
+            UPDATE room_bookings SET {set_clause}
+            WHERE id = :booking_id AND org_id = :org_id
+            RETURNING *
         )
-        name_row = name_result.first()
-        booking_dict["room_name"] = name_row[0] if name_row else None
-    else:
-        booking_dict["room_name"] = None
-
-    return booking_dict
+        SELECT updated.*, r.name AS room_name
+        FROM updated
+        LEFT JOIN rooms r ON r.id = updated.room_id
+    """)
+    try:
+        result = await db.execute(q, params)
+        row = result.first()
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if is_overlap_violation(exc):
+            raise ValueError(_CONFLICT_MESSAGE)
+        raise
+    return dict(row._mapping) if row else None
 
 
 async def delete_booking(
@@ -424,6 +432,201 @@ async def delete_booking(
     return (result.rowcount or 0) > 0
 
 
+# ---------------------------------------------------------------------------
+# Bulk reservation & availability
+# ---------------------------------------------------------------------------
+
+
+async def find_conflicts(
+    db: AsyncSession,
+    *,
+    org_id: uuid.UUID,
+    room_id: uuid.UUID,
+    slots: Sequence[Slot],
+) -> List[Dict[str, Any]]:
+    """
+    Return every live booking that overlaps any of the given slots, in one
+    query: the slots are unnested and joined on ``period &&`` (GiST).
+    """
+    if not slots:
+        return []
+    q = text("""
+        SELECT o.idx - 1 AS occurrence_index,
+               rb.id AS conflicting_booking_id,
+               rb.purpose AS conflicting_title,
+               rb.start_time AS conflicting_start_time,
+               rb.end_time AS conflicting_end_time
+        FROM unnest(CAST(:starts AS timestamptz[]), CAST(:ends AS timestamptz[]))
+             WITH ORDINALITY AS o(start_time, end_time, idx)
+        JOIN room_bookings rb
+          ON rb.room_id = :room_id
+         AND rb.org_id = :org_id
+         AND rb.status <> 'cancelled'
+         AND rb.period && tstzrange(o.start_time, o.end_time, '[)')
+        ORDER BY o.idx, rb.start_time
+    """)
+    result = await db.execute(q, {
+        "starts": [s for s, _ in slots],
+        "ends": [e for _, e in slots],
+        "room_id": str(room_id),
+        "org_id": str(org_id),
+    })
+    out = []
+    for r in result:
+        conflict = dict(r._mapping)
+        idx = conflict["occurrence_index"]
+        conflict["start_time"], conflict["end_time"] = slots[idx]
+        out.append(conflict)
+    return out
+
+
+async def reserve_occurrences(
+    db: AsyncSession,
+    *,
+    org_id: uuid.UUID,
+    data: Dict[str, Any],
+    slots: Sequence[Slot],
+    allow_partial: bool = False,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Check and reserve many occurrences of a room booking at once.
+
+    Conflicts are collected in one query; the batch is all-or-nothing
+    unless ``allow_partial`` is set. Accepted occurrences are written with
+    a single INSERT ... SELECT over the unnested slots.
+    """
+    await _ensure_tables(db)
+    room = await get_room(db, org_id=org_id, room_id=data["room_id"])
+    if room is None:
+        raise ValueError("Room not found.")
+
+    status = data.get("status", "confirmed")
+    conflicts: List[Dict[str, Any]] = []
+    if status != "cancelled":
+        conflicts = await find_conflicts(
+            db, org_id=org_id, room_id=data["room_id"], slots=slots
+        )
+        for idx, other in find_batch_overlaps(slots):
+            conflicts.append({
+                "occurrence_index": idx,
+                "start_time": slots[idx][0],
+                "end_time": slots[idx][1],
+                "conflicting_booking_id": None,
+                "conflicting_title": f"Occurrence #{other + 1} in this request",
+                "conflicting_start_time": slots[other][0],
+                "conflicting_end_time": slots[other][1],
+            })
+        conflicts.sort(key=lambda c: c["occurrence_index"])
+
+    blocked = {c["occurrence_index"] for c in conflicts}
+    to_create = [slots[i] for i in range(len(slots)) if i not in blocked]
+    out: Dict[str, Any] = {
+        "requested": len(slots),
+        "created": [],
+        "conflicts": conflicts,
+    }
+    if dry_run or not to_create or (conflicts and not allow_partial):
+        return out
+
+    q = text("""
+        WITH inserted AS (
+            INSERT INTO room_bookings
+                (org_id, room_id, booked_by, purpose, start_time, end_time,
+                 recurring, recurrence_pattern, status, notes)
+            SELECT CAST(:org_id AS uuid), CAST(:room_id AS uuid),
+                   CAST(:booked_by AS varchar), CAST(:purpose AS varchar),
+                   o.start_time, o.end_time,
+                   CAST(:recurring AS boolean), CAST(:recurrence_pattern AS varchar),
+                   CAST(:status AS varchar), CAST(:notes AS text)
+            FROM unnest(CAST(:starts AS timestamptz[]), CAST(:ends AS timestamptz[]))
+                 AS o(start_time, end_time)
+            RETURNING *
+        )
+        SELECT * FROM inserted ORDER BY start_time
+    """)
+    try:
+        result = await db.execute(q, {
+            "org_id": str(org_id),
+            "room_id": str(data["room_id"]),
+            "booked_by": data["booked_by"],
+            "purpose": data["purpose"],
+            "recurring": len(slots) > 1,
+            "recurrence_pattern": data.get("recurrence_pattern"),
+            "status": status,
+            "notes": data.get("notes"),
+            "starts": [s for s, _ in to_create],
+            "ends": [e for _, e in to_create],
+        })
+        created = [{**r._mapping, "room_name": room["name"]} for r in result]
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if not is_overlap_violation(exc):
+            raise
+        # Another request won the race for one of the slots; report it
+        out["conflicts"] = await find_conflicts(
+            db, org_id=org_id, room_id=data["room_id"], slots=slots
+        )
+        return out
+
+    out["created"] = created
+    return out
+
+
+async def get_availability(
+    db: AsyncSession,
+    *,
+    org_id: uuid.UUID,
+    room_id: uuid.UUID,
+    day: date,
+    span: str = "day",
+    tz: str = "UTC",
+    day_start: time = time(0, 0),
+    day_end: Optional[time] = None,
+    min_minutes: int = 0,
+) -> Optional[Dict[str, Any]]:
+    """
+    Compute free slots for a room over a day or ISO week from one indexed
+    range query over the busy periods.
+    """
+    await _ensure_tables(db)
+    room = await get_room(db, org_id=org_id, room_id=room_id)
+    if room is None:
+        return None
+
+    windows = availability_windows(
+        day=day, span=span, tz=tz, day_start=day_start, day_end=day_end
+    )
+    range_start, range_end = windows[0][0], windows[-1][1]
+
+    result = await db.execute(
+        text("""
+            SELECT start_time, end_time FROM room_bookings
+            WHERE room_id = :room_id
+              AND org_id = :org_id
+              AND status <> 'cancelled'
+              AND period && tstzrange(:range_start, :range_end, '[)')
+            ORDER BY start_time
+        """),
+        {
+            "room_id": str(room_id),
+            "org_id": str(org_id),
+            "range_start": range_start,
+            "range_end": range_end,
+        },
+    )
+    busy = [(r.start_time, r.end_time) for r in result]
+
+    return {
+        "room_id": room_id,
+        "range_start": range_start,
+        "range_end": range_end,
+        "busy": [{"start_time": s, "end_time": e} for s, e in busy],
+        "free": compute_free_slots(windows, busy, min_minutes=min_minutes),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Stats
 # ---------------------------------------------------------------------------
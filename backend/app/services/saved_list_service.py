@@ -0,0 +1,492 @@
+"""
+Camp Connect - Saved List Service
+Filter evaluation and materialized membership for dynamic saved lists.
+
+Dynamic lists keep a snapshot of their members in saved_list_snapshot_members.
+Each snapshot records a fingerprint of the source data (max updated_at plus
+row count of the entity table and its custom field values for the org), so a
+list is only re-evaluated when campers or contacts actually changed since the
+last refresh.
+"""
+
+from __future__ import annotations
+
+import base64
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import String as SAString, and_, cast, delete, exists, func, insert, literal, null, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.camper import Camper
+from app.models.contact import Contact
+from app.models.custom_field import CustomFieldValue
+from app.models.saved_list import SavedList, SavedListSnapshotMember
+from app.schemas.saved_list import FilterCriteria
+from app.services import custom_field_service
+
+
+# ─── Allowed filterable fields per entity type ────────────────
+
+CONTACT_FIELDS = {
+    "first_name", "last_name", "email", "phone", "address",
+    "city", "state", "zip_code", "relationship_type",
+    "notification_preferences", "account_status",
+    "communication_preference", "family_id", "portal_access",
+    "created_at", "updated_at",
+}
+CAMPER_FIELDS = {
+    "first_name", "last_name", "date_of_birth", "gender",
+    "grade", "school", "city", "state",
+    "allergies", "dietary_restrictions", "custom_fields",
+    "family_id", "created_at", "updated_at",
+}
+
+# Filter fields of the form "cf.<field_key>" target custom field values
+CUSTOM_FIELD_PREFIX = "cf."
+
+_NEGATED_OPERATORS = {
+    "not_equals": "equals",
+    "not_contains": "contains",
+    "is_empty": "is_not_empty",
+}
+
+
+def get_model_and_fields(entity_type: str):
+    """Return the SQLAlchemy model and allowed field set for an entity type."""
+    if entity_type == "camper":
+        return Camper, CAMPER_FIELDS
+    return Contact, CONTACT_FIELDS
+
+
+def build_filter_query(
+    entity_type: str,
+    criteria: FilterCriteria,
+    organization_id: uuid.UUID,
+    custom_fields: Optional[Dict[str, Dict[str, Any]]] = None,
+):
+    """
+    Build a SQLAlchemy SELECT query from FilterCriteria.
+    Returns (query, model) so callers can execute and interpret results.
+
+    custom_fields maps field_key -> definition (custom_field_service
+    .get_definition_map) and enables "cf.<field_key>" filters.
+    """
+    model, allowed_fields = get_model_and_fields(entity_type)
+
+    base_query = (
+        select(model)
+        .where(model.organization_id == organization_id)
+        .where(model.deleted_at.is_(None))
+    )
+
+    if not criteria.groups:
+        return base_query, model
+
+    group_conditions = []
+    for group in criteria.groups:
+        if not group.filters:
+            continue
+        filter_conditions = []
+        for f in group.filters:
+            if f.field.startswith(CUSTOM_FIELD_PREFIX):
+                definition = (custom_fields or {}).get(f.field[len(CUSTOM_FIELD_PREFIX):])
+                if definition is None:
+                    continue
+                cond = build_custom_field_condition(model, definition, f.operator, f.value)
+                if cond is not None:
+                    filter_conditions.append(cond)
+                continue
+            if f.field not in allowed_fields:
+                continue
+            col = getattr(model, f.field, None)
+            if col is None:
+                continue
+
+            cond = build_single_condition(col, f.operator, f.value)
+            if cond is not None:
+                filter_conditions.append(cond)
+
+        if filter_conditions:
+            if group.operator.upper() == "OR":
+                group_conditions.append(or_(*filter_conditions))
+            else:
+                group_conditions.append(and_(*filter_conditions))
+
+    if group_conditions:
+        if criteria.group_operator.upper() == "AND":
+            base_query = base_query.where(and_(*group_conditions))
+        else:
+            base_query = base_query.where(or_(*group_conditions))
+
+    return base_query, model
+
+
+def build_single_condition(col, operator: str, value):
+    """Translate a single filter operator into a SQLAlchemy condition."""
+    op = operator.lower()
+    if op == "equals":
+        return col == value
+    elif op == "not_equals":
+        return col != value
+    elif op == "contains":
+        return cast(col, SAString).ilike(f"%{value}%")
+    elif op == "not_contains":
+        return ~cast(col, SAString).ilike(f"%{value}%")
+    elif op == "starts_with":
+        return cast(col, SAString).ilike(f"{value}%")
+    elif op == "greater_than":
+        return col > value
+    elif op == "less_than":
+        return col < value
+    elif op == "after":
+        return col > value
+    elif op == "before":
+        return col < value
+    elif op == "is_empty":
+        return or_(col.is_(None), cast(col, SAString) == "")
+    elif op == "is_not_empty":
+        return and_(col.isnot(None), cast(col, SAString) != "")
+    elif op == "in_list":
+        if isinstance(value, list):
+            return col.in_(value)
+        return col.in_([v.strip() for v in str(value).split(",")])
+    return None
+
+
+def _custom_field_column(definition: Dict[str, Any], operator: str, value: Any):
+    """Pick the indexed typed column and coerce the filter value to match."""
+    field_type = definition["field_type"]
+    op = operator.lower()
+    if op in ("is_empty", "is_not_empty"):
+        return CustomFieldValue.value, value
+    if field_type == "number":
+        return CustomFieldValue.value_number, _coerce(value, lambda v: float(v))
+    if field_type == "date":
+        return CustomFieldValue.value_date, _coerce(value, lambda v: date.fromisoformat(str(v)[:10]))
+    if field_type == "boolean":
+        return CustomFieldValue.value_bool, _coerce(
+            value, lambda v: v if isinstance(v, bool) else str(v).strip().lower() in ("true", "1", "yes")
+        )
+    if op in ("equals", "not_equals", "in_list"):
+        values = value if isinstance(value, list) else [value]
+        if all(v is not None and len(str(v)) <= 255 for v in values):
+            return CustomFieldValue.value_key, value
+    return CustomFieldValue.value, value
+
+
+def _coerce(value: Any, convert):
+    """Apply convert to a scalar or each list item; None on bad input."""
+    try:
+        if isinstance(value, str) and "," in value:
+            value = [v.strip() for v in value.split(",")]
+        if isinstance(value, list):
+            return [convert(v) for v in value]
+        return convert(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def build_custom_field_condition(model, definition: Dict[str, Any], operator: str, value):
+    """
+    EXISTS condition over custom_field_values for one definition.
+    Lookups hit the (field_definition_id, value_*) indexes; negated
+    operators become NOT EXISTS so entities without a value match too.
+    """
+    op = operator.lower()
+    positive_op = _NEGATED_OPERATORS.get(op, op)
+    col, coerced = _custom_field_column(definition, positive_op, value)
+    if coerced is None and positive_op != "is_not_empty":
+        return None
+    cond = build_single_condition(col, positive_op, coerced)
+    if cond is None:
+        return None
+
+    matches = exists(
+        select(CustomFieldValue.id)
+        .where(CustomFieldValue.field_definition_id == uuid.UUID(definition["id"]))
+        .where(CustomFieldValue.entity_id == model.id)
+        .where(cond)
+    )
+    return ~matches if op in _NEGATED_OPERATORS else matches
+
+
+def custom_field_sort_expression(model, definition: Dict[str, Any]):
+    """Correlated scalar subquery returning the typed value to ORDER BY."""
+    field_type = definition["field_type"]
+    col = {
+        "number": CustomFieldValue.value_number,
+        "date": CustomFieldValue.value_date,
+        "boolean": CustomFieldValue.value_bool,
+    }.get(field_type, CustomFieldValue.value)
+    return (
+        select(col)
+        .where(CustomFieldValue.field_definition_id == uuid.UUID(definition["id"]))
+        .where(CustomFieldValue.entity_id == model.id)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+def member_projection(entity_type: str, model) -> List[Any]:
+    """
+    Columns written to a snapshot row: (entity_id, sort_key, name, email, extra).
+    Shared by the materializer and the ad-hoc preview so both render alike.
+    """
+    sort_key = func.lower(
+        func.coalesce(model.last_name, "") + " " + func.coalesce(model.first_name, "")
+    )
+    name = model.first_name + " " + model.last_name
+    if entity_type == "camper":
+        email = cast(null(), SAString)
+        extra = func.jsonb_strip_nulls(
+            func.jsonb_build_object("grade", model.grade, "gender", model.gender)
+        )
+    else:
+        email = model.email
+        extra = func.jsonb_strip_nulls(
+            func.jsonb_build_object("city", model.city, "state", model.state)
+        )
+    return [
+        model.id.label("entity_id"),
+        sort_key.label("sort_key"),
+        name.label("name"),
+        email.label("email"),
+        extra.label("extra"),
+    ]
+
+
+# ─── Cursors ──────────────────────────────────────────────────
+
+
+def encode_cursor(sort_key: str, entity_id: uuid.UUID) -> str:
+    """Encode a keyset position as an opaque URL-safe cursor."""
+    raw = f"{sort_key}\x1f{entity_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, uuid.UUID]:
+    """Decode a cursor produced by encode_cursor. Raises ValueError if invalid."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        sort_key, entity_id = raw.split("\x1f", 1)
+        return sort_key, uuid.UUID(entity_id)
+    except Exception as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+# ─── Materialization ──────────────────────────────────────────
+
+
+async def get_source_version(
+    db: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    entity_type: str,
+) -> str:
+    """
+    Fingerprint the source data for an org in one round trip: max(updated_at)
+    and row count of the entity table and of its custom field values.
+    Edits and soft-deletes bump updated_at; hard deletes change the counts.
+    """
+    model, _ = get_model_and_fields(entity_type)
+    values_scope = and_(
+        CustomFieldValue.organization_id == organization_id,
+        CustomFieldValue.entity_type == entity_type,
+    )
+    result = await db.execute(
+        select(
+            select(func.max(model.updated_at))
+            .where(model.organization_id == organization_id)
+            .scalar_subquery(),
+            select(func.count())
+            .select_from(model)
+            .where(model.organization_id == organization_id)
+            .scalar_subquery(),
+            select(func.max(CustomFieldValue.updated_at))
+            .where(values_scope)
+            .scalar_subquery(),
+            select(func.count())
+            .select_from(CustomFieldValue)
+            .where(values_scope)
+            .scalar_subquery(),
+        )
+    )
+    max_updated, row_count, max_value_updated, value_count = result.one()
+    stamp = max_updated.isoformat() if max_updated else "empty"
+    value_stamp = max_value_updated.isoformat() if max_value_updated else "empty"
+    return f"{stamp}|{row_count}|{value_stamp}|{value_count}"
+
+
+async def refresh_list(
+    db: AsyncSession,
+    saved_list: SavedList,
+    *,
+    source_version: Optional[str] = None,
+    force: bool = False,
+) -> bool:
+    """
+    Re-materialize a dynamic list's members if its source table changed.
+    Returns True when the snapshot was rebuilt. Commits on rebuild.
+    """
+    if saved_list.list_type != "dynamic":
+        return False
+
+    if source_version is None:
+        source_version = await get_source_version(
+            db,
+            organization_id=saved_list.organization_id,
+            entity_type=saved_list.entity_type,
+        )
+
+    if (
+        not force
+        and saved_list.materialized_at is not None
+        and saved_list.source_version == source_version
+    ):
+        return False
+
+    await db.execute(
+        delete(SavedListSnapshotMember)
+        .where(SavedListSnapshotMember.list_id == saved_list.id)
+    )
+
+    if saved_list.filter_criteria:
+        criteria = FilterCriteria(**saved_list.filter_criteria)
+        custom_fields = await custom_field_service.get_definition_map(
+            db,
+            organization_id=saved_list.organization_id,
+            entity_type=saved_list.entity_type,
+        )
+        query, model = build_filter_query(
+            saved_list.entity_type, criteria, saved_list.organization_id, custom_fields
+        )
+        source = query.with_only_columns(
+            literal(saved_list.id, PGUUID(as_uuid=True)).label("list_id"),
+            *member_projection(saved_list.entity_type, model),
+        )
+        await db.execute(
+            insert(SavedListSnapshotMember).from_select(
+                ["list_id", "entity_id", "sort_key", "name", "email", "extra"],
+                source,
+            )
+        )
+
+    count_result = await db.execute(
+        select(func.count())
+        .select_from(SavedListSnapshotMember)
+        .where(SavedListSnapshotMember.list_id == saved_list.id)
+    )
+    saved_list.member_count = count_result.scalar() or 0
+    saved_list.materialized_at = datetime.now(timezone.utc)
+    saved_list.source_version = source_version
+    await db.commit()
+    return True
+
+
+async def refresh_stale_lists(
+    db: AsyncSession,
+    *,
+    organization_id: Optional[uuid.UUID] = None,
+) -> Dict[str, int]:
+    """
+    Refresh every dynamic list whose source table changed since its snapshot.
+    The source fingerprint is computed once per (org, entity_type).
+    """
+    query = (
+        select(SavedList)
+        .where(SavedList.list_type == "dynamic")
+        .where(SavedList.deleted_at.is_(None))
+    )
+    if organization_id is not None:
+        query = query.where(SavedList.organization_id == organization_id)
+    result = await db.execute(query)
+    lists = result.scalars().all()
+
+    versions: Dict[Tuple[uuid.UUID, str], str] = {}
+    refreshed = 0
+    for saved_list in lists:
+        key = (saved_list.organization_id, saved_list.entity_type)
+        if key not in versions:
+            versions[key] = await get_source_version(
+                db,
+                organization_id=saved_list.organization_id,
+                entity_type=saved_list.entity_type,
+            )
+        if await refresh_list(db, saved_list, source_version=versions[key]):
+            refreshed += 1
+
+    return {
+        "checked": len(lists),
+        "refreshed": refreshed,
+        "skipped": len(lists) - refreshed,
+    }
+
+
+async def get_members_page(
+    db: AsyncSession,
+    saved_list: SavedList,
+    *,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    refresh: bool = True,
+) -> Dict[str, Any]:
+    """
+    Return one keyset page of a dynamic list's materialized members,
+    ordered by (sort_key, entity_id), with staleness metadata.
+
+    With refresh=True the snapshot is rebuilt first if the source table
+    changed; with refresh=False the existing snapshot is served as-is.
+    """
+    source_version = await get_source_version(
+        db,
+        organization_id=saved_list.organization_id,
+        entity_type=saved_list.entity_type,
+    )
+    if refresh:
+        await refresh_list(db, saved_list, source_version=source_version)
+
+    query = (
+        select(SavedListSnapshotMember)
+        .where(SavedListSnapshotMember.list_id == saved_list.id)
+        .order_by(SavedListSnapshotMember.sort_key, SavedListSnapshotMember.entity_id)
+        .limit(limit + 1)
+    )
+    if cursor:
+        after_key, after_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(SavedListSnapshotMember.sort_key, SavedListSnapshotMember.entity_id)
+            > tuple_(literal(after_key), literal(after_id, PGUUID(as_uuid=True)))
+        )
+    result = await db.execute(query)
+    rows = result.scalars().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].sort_key, rows[-1].entity_id)
+
+    materialized_at = saved_list.materialized_at
+    age_seconds = None
+    if materialized_at is not None:
+        age_seconds = int((datetime.now(timezone.utc) - materialized_at).total_seconds())
+
+    return {
+        "total_count": saved_list.member_count or 0,
+        "results": [
+            {
+                "id": r.entity_id,
+                "name": r.name,
+                "email": r.email,
+                "extra": r.extra or None,
+            }
+            for r in rows
+        ],
+        "entity_type": saved_list.entity_type,
+        "next_cursor": next_cursor,
+        "materialized_at": materialized_at,
+        "age_seconds": age_seconds,
+        "is_stale": saved_list.source_version != source_version,
+    }
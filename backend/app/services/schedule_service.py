@@ -11,10 +11,12 @@ from collections import defaultdict
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, cast, extract, func, select, true
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.models.activity import Activity
 from app.models.schedule import Schedule, ScheduleAssignment
 from app.models.user import User
 from app.models.camper import Camper
@@ -167,6 +169,9 @@ async def create_schedule(
             "overlapping this time slot on this date"
         )
 
+    if data.get("staff_user_ids") is not None:
+        data["staff_user_ids"] = _normalize_staff_ids(data["staff_user_ids"])
+
     schedule = Schedule(
         id=uuid.uuid4(),
         organization_id=organization_id,
@@ -201,6 +206,9 @@ async def update_schedule(
     if schedule is None:
         return None
 
+    if data.get("staff_user_ids") is not None:
+        data["staff_user_ids"] = _normalize_staff_ids(data["staff_user_ids"])
+
     for key, value in data.items():
         setattr(schedule, key, value)
 
@@ -436,6 +444,19 @@ async def delete_assignment(
 # ---------------------------------------------------------------------------
 
 
+def _normalize_staff_ids(staff_user_ids: List[Any]) -> List[str]:
+    """
+    Store staff IDs as canonical UUID strings so JSONB containment
+    (staff_user_ids @> '["<uuid>"]') matches via the GIN index.
+    """
+    return [str(uuid.UUID(str(uid))) for uid in staff_user_ids]
+
+
+def _staff_ids_contain(staff_user_id: uuid.UUID):
+    """Indexed containment predicate: schedule is staffed by this user."""
+    return Schedule.staff_user_ids.contains([str(staff_user_id)])
+
+
 def _schedule_to_dict(schedule: Schedule) -> Dict[str, Any]:
     """Convert a Schedule model to a response dict."""
     activity = schedule.activity
@@ -493,70 +514,113 @@ async def get_staff_schedule_view(
 
     For each staff member who appears in staff_user_ids of any schedule
     on the given event/date, return their name and the list of sessions
-    they are assigned to.
+    they are assigned to. The staff arrays are unnested and joined to users
+    in SQL, so this is a single query.
     """
-    # 1. Get all schedules for this event + date
+    staff = func.jsonb_array_elements_text(Schedule.staff_user_ids).table_valued("value").lateral("staff")
+    staff_id = cast(staff.c.value, PGUUID(as_uuid=True))
     query = (
-        select(Schedule)
-        .options(selectinload(Schedule.activity))
+        select(
+            User.id,
+            User.first_name,
+            User.last_name,
+            Schedule.id,
+            Activity.name,
+            Schedule.start_time,
+            Schedule.end_time,
+            Schedule.location,
+        )
+        .select_from(Schedule)
+        .join(staff, true())
+        .join(User, User.id == staff_id)
+        .outerjoin(Activity, Activity.id == Schedule.activity_id)
         .where(Schedule.organization_id == organization_id)
         .where(Schedule.event_id == event_id)
         .where(Schedule.date == date)
         .where(Schedule.deleted_at.is_(None))
         .where(Schedule.is_cancelled.is_(False))
-        .order_by(Schedule.start_time)
+        .where(User.organization_id == organization_id)
+        .order_by(User.last_name, User.first_name, User.id, Schedule.start_time)
     )
     result = await db.execute(query)
-    schedules = result.scalars().all()
 
-    # 2. Collect all unique staff user_ids and map userId -> list of sessions
-    staff_sessions: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    all_user_ids: set = set()
+    entries: List[Dict[str, Any]] = []
+    by_user: Dict[str, Dict[str, Any]] = {}
+    for user_id, first_name, last_name, schedule_id, activity_name, start_time, end_time, location in result.all():
+        uid = str(user_id)
+        entry = by_user.get(uid)
+        if entry is None:
+            entry = {
+                "user_id": uid,
+                "first_name": first_name,
+                "last_name": last_name,
+                "sessions": [],
+            }
+            by_user[uid] = entry
+            entries.append(entry)
+        entry["sessions"].append({
+            "schedule_id": str(schedule_id),
+            "activity_name": activity_name or "Activity",
+            "start_time": start_time,
+            "end_time": end_time,
+            "location": location,
+        })
 
-    for s in schedules:
-        if not s.staff_user_ids:
-            continue
-        for uid_str in s.staff_user_ids:
-            uid = str(uid_str)
-            all_user_ids.add(uid)
-            staff_sessions[uid].append({
-                "schedule_id": str(s.id),
-                "activity_name": s.activity.name if s.activity else "Activity",
-                "start_time": s.start_time,
-                "end_time": s.end_time,
-                "location": s.location,
-            })
-
-    if not all_user_ids:
-        return []
-
-    # 3. Fetch user names for all staff user IDs
-    user_uuids = [uuid.UUID(uid) for uid in all_user_ids]
-    user_query = (
-        select(User)
-        .where(User.id.in_(user_uuids))
+    return entries
+
+
+async def get_staff_weekly_hours(
+    db: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    event_id: uuid.UUID,
+    start_date: date,
+) -> List[Dict[str, Any]]:
+    """
+    Per-staff scheduled hours and session counts for a 7-day range,
+    aggregated in SQL. Same counting rules as get_staff_weekly_schedule:
+    non-deleted sessions, and only slots whose end is after their start.
+    """
+    end_date = start_date + timedelta(days=6)
+    staff = func.jsonb_array_elements_text(Schedule.staff_user_ids).table_valued("value").lateral("staff")
+    staff_id = cast(staff.c.value, PGUUID(as_uuid=True))
+    duration_minutes = extract("epoch", Schedule.end_time - Schedule.start_time) / 60
+    minutes = func.sum(duration_minutes).filter(Schedule.end_time > Schedule.start_time)
+
+    query = (
+        select(
+            User.id,
+            User.first_name,
+            User.last_name,
+            func.coalesce(minutes, 0).label("total_minutes"),
+            func.count(Schedule.id).label("session_count"),
+        )
+        .select_from(Schedule)
+        .join(staff, true())
+        .join(User, User.id == staff_id)
+        .where(Schedule.organization_id == organization_id)
+        .where(Schedule.event_id == event_id)
+        .where(Schedule.date >= start_date)
+        .where(Schedule.date <= end_date)
+        .where(Schedule.deleted_at.is_(None))
         .where(User.organization_id == organization_id)
+        .group_by(User.id, User.first_name, User.last_name)
+        .order_by(User.last_name, User.first_name)
     )
-    user_result = await db.execute(user_query)
-    users = user_result.scalars().all()
-    user_map = {str(u.id): u for u in users}
-
-    # 4. Build response
-    entries = []
-    for uid in sorted(all_user_ids):
-        user = user_map.get(uid)
-        if user is None:
-            continue
-        entries.append({
-            "user_id": uid,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "sessions": staff_sessions[uid],
-        })
+    result = await db.execute(query)
 
-    # Sort by last name, then first name
-    entries.sort(key=lambda e: (e["last_name"], e["first_name"]))
-    return entries
+    return [
+        {
+            "staff_user_id": user_id,
+            "first_name": first_name,
+            "last_name": last_name,
+            "week_start": start_date,
+            "week_end": end_date,
+            "total_hours": round(float(total_minutes) / 60.0, 1),
+            "session_count": session_count,
+        }
+        for user_id, first_name, last_name, total_minutes, session_count in result.all()
+    ]
 
 
 # Scheduling v2 -- Staff and Camper Assignment Service Methods
@@ -585,7 +649,7 @@ async def assign_staff_to_schedule(
     str_ids = [str(uid) for uid in current_ids]
     if str(staff_user_id) in str_ids:
         raise ValueError("Staff member is already assigned")
-    new_ids = list(current_ids) + [str(staff_user_id)]
+    new_ids = _normalize_staff_ids(list(current_ids) + [staff_user_id])
     schedule.staff_user_ids = new_ids
     await db.commit()
     activity = schedule.activity
@@ -641,18 +705,14 @@ async def get_staff_weekly_schedule(
         .where(Schedule.event_id == event_id)
         .where(Schedule.date >= start_date).where(Schedule.date <= end_date)
         .where(Schedule.deleted_at.is_(None))
+        .where(_staff_ids_contain(staff_user_id))
         .order_by(Schedule.date, Schedule.start_time)
     )
     result = await db.execute(query)
-    all_schedules = result.scalars().all()
-    staff_id_str = str(staff_user_id)
+    staff_schedules = result.scalars().all()
     slots = []
     total_minutes = 0.0
-    for s in all_schedules:
-        if not s.staff_user_ids:
-            continue
-        if staff_id_str not in [str(uid) for uid in s.staff_user_ids]:
-            continue
+    for s in staff_schedules:
         activity = s.activity
         slots.append({
             "schedule_id": s.id, "activity_id": s.activity_id,
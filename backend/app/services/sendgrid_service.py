@@ -6,23 +6,26 @@ Sends emails via the SendGrid Web API.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
-
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Content, Email, Mail, To
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from app.config import settings
+from app.metrics import track_provider
+
+if TYPE_CHECKING:
+    from sendgrid import SendGridAPIClient
 
 logger = logging.getLogger(__name__)
 
 
 def _get_client() -> SendGridAPIClient:
-    """Create and return a SendGrid API client."""
+    """Create and return a SendGrid API client (the SDK is imported on first use)."""
     if not settings.sendgrid_api_key:
         raise ValueError(
             "SendGrid API key not configured. "
             "Set SENDGRID_API_KEY in your environment."
         )
+    from sendgrid import SendGridAPIClient
+
     return SendGridAPIClient(settings.sendgrid_api_key)
 
 
@@ -48,6 +51,8 @@ async def send_email(
         ValueError: If SendGrid API key is not configured.
         Exception: If the SendGrid API returns a non-2xx status.
     """
+    from sendgrid.helpers.mail import Content, Email, Mail, To
+
     message = Mail(
         from_email=Email(settings.sendgrid_from_email, settings.sendgrid_from_name),
         to_emails=To(to_email),
@@ -65,7 +70,8 @@ async def send_email(
     sg = _get_client()
 
     try:
-        response = sg.send(message)
+        with track_provider("sendgrid", "send_email"):
+            response = sg.send(message)
         message_id = response.headers.get("X-Message-Id", "")
 
         logger.info(
@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+
 
 # ---------------------------------------------------------------------------
 # Table bootstrap (idempotent)
@@ -35,9 +37,16 @@ CREATE TABLE IF NOT EXISTS staff_shifts (
 """
 
 
+register_ddl(
+    "staff_schedule",
+    _CREATE_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_staff_shifts_org_id ON staff_shifts(organization_id)",
+)
+
+
 async def _ensure_table(db: AsyncSession) -> None:
-    await db.execute(text(_CREATE_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 # ---------------------------------------------------------------------------
@@ -1,7 +1,7 @@
 """
 Camp Connect - Stripe Service
 Stripe integration for checkout sessions, webhooks, and refunds.
-Conditionally imports stripe so the app works without the SDK installed.
+Imports stripe on first use, so the app starts (and works) without the SDK.
 """
 
 from __future__ import annotations
@@ -10,19 +10,19 @@ import logging
 from typing import Any, Dict, List, Optional
 
 from app.config import settings
+from app.metrics import track_provider
 
 logger = logging.getLogger(__name__)
 
-# Conditional import — allows the app to run when stripe is not installed.
-try:
-    import stripe
-except ImportError:
-    stripe = None  # type: ignore[assignment]
 
-
-def _ensure_stripe() -> None:
-    """Raise if the stripe SDK is not available or not configured."""
-    if stripe is None:
+def _ensure_stripe():
+    """
+    Import and configure the stripe SDK.
+    Raise if it is not installed or not configured.
+    """
+    try:
+        import stripe
+    except ImportError:
         raise RuntimeError(
             "The 'stripe' package is not installed. "
             "Install it with: pip install stripe"
@@ -33,6 +33,7 @@ def _ensure_stripe() -> None:
             "Set STRIPE_SECRET_KEY in your environment."
         )
     stripe.api_key = settings.stripe_secret_key
+    return stripe
 
 
 async def create_checkout_session(
@@ -56,7 +57,7 @@ async def create_checkout_session(
     Returns:
         Dict with "session_id" and "checkout_url".
     """
-    _ensure_stripe()
+    stripe = _ensure_stripe()
 
     stripe_line_items = [
         {
@@ -70,17 +71,18 @@ async def create_checkout_session(
         for item in line_items
     ]
 
-    session = stripe.checkout.Session.create(
-        payment_method_types=["card"],
-        mode="payment",
-        line_items=stripe_line_items,
-        success_url=success_url,
-        cancel_url=cancel_url,
-        metadata={
-            "organization_id": str(organization_id),
-            "invoice_id": str(invoice_id),
-        },
-    )
+    with track_provider("stripe", "create_checkout_session"):
+        session = stripe.checkout.Session.create(
+            payment_method_types=["card"],
+            mode="payment",
+            line_items=stripe_line_items,
+            success_url=success_url,
+            cancel_url=cancel_url,
+            metadata={
+                "organization_id": str(organization_id),
+                "invoice_id": str(invoice_id),
+            },
+        )
 
     logger.info(
         "Created Stripe Checkout session %s for invoice %s",
@@ -115,7 +117,7 @@ async def create_ach_checkout_session(
     Returns:
         Dict with "session_id" and "checkout_url".
     """
-    _ensure_stripe()
+    stripe = _ensure_stripe()
 
     stripe_line_items = [
         {
@@ -129,18 +131,19 @@ async def create_ach_checkout_session(
         for item in line_items
     ]
 
-    session = stripe.checkout.Session.create(
-        payment_method_types=["us_bank_account"],
-        mode="payment",
-        line_items=stripe_line_items,
-        success_url=return_url + "?payment=success",
-        cancel_url=return_url + "?payment=cancelled",
-        metadata={
-            "organization_id": str(organization_id),
-            "invoice_id": str(invoice_id),
-            "payment_method": "ach",
-        },
-    )
+    with track_provider("stripe", "create_ach_checkout_session"):
+        session = stripe.checkout.Session.create(
+            payment_method_types=["us_bank_account"],
+            mode="payment",
+            line_items=stripe_line_items,
+            success_url=return_url + "?payment=success",
+            cancel_url=return_url + "?payment=cancelled",
+            metadata={
+                "organization_id": str(organization_id),
+                "invoice_id": str(invoice_id),
+                "payment_method": "ach",
+            },
+        )
 
     logger.info(
         "Created Stripe ACH Checkout session %s for invoice %s",
@@ -172,7 +175,7 @@ async def process_webhook(
     Returns:
         Dict with "event_type" and relevant data from the event.
     """
-    _ensure_stripe()
+    stripe = _ensure_stripe()
 
     webhook_secret = settings.stripe_webhook_secret
     if not webhook_secret:
@@ -226,7 +229,7 @@ async def create_refund(
     Returns:
         Dict with refund details.
     """
-    _ensure_stripe()
+    stripe = _ensure_stripe()
 
     refund_params: Dict[str, Any] = {
         "payment_intent": payment_intent_id,
@@ -234,7 +237,8 @@ async def create_refund(
     if amount is not None:
         refund_params["amount"] = amount
 
-    refund = stripe.Refund.create(**refund_params)
+    with track_provider("stripe", "create_refund"):
+        refund = stripe.Refund.create(**refund_params)
 
     logger.info(
         "Created Stripe refund %s for payment_intent %s (amount=%s)",
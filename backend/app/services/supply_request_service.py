@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schema_bootstrap import ensure_schema, register_ddl
+
 
 # ---------------------------------------------------------------------------
 # Table bootstrap (idempotent)
@@ -38,9 +40,16 @@ CREATE TABLE IF NOT EXISTS supply_requests (
 """
 
 
+register_ddl(
+    "supply_request",
+    _CREATE_TABLE,
+    "CREATE INDEX IF NOT EXISTS idx_supply_requests_org_id ON supply_requests(organization_id)",
+)
+
+
 async def _ensure_table(db: AsyncSession) -> None:
-    await db.execute(text(_CREATE_TABLE))
-    await db.flush()
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
 
 
 # ---------------------------------------------------------------------------
@@ -1,28 +1,154 @@
 """
 Camp Connect - Team Chat Service
 Business logic for channels and messages.
-Uses in-memory storage (no dedicated DB table) for MVP.
+
+Channels, messages and per-user read markers live in raw-SQL tables:
+
+- history pages by keyset on (created_at, id) over the
+  (channel_id, created_at, id) index
+- unread counts are index range counts of messages newer than the user's
+  read marker for each channel
+- search is a trigram-indexed ILIKE over message content
+
+New messages, pins and reactions are published to every worker through
+``app.realtime`` (NOTIFY on commit) and pushed to the org's chat sockets.
 """
 
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import realtime
+from app.schema_bootstrap import ensure_schema, register_ddl
+
+
+# ---------------------------------------------------------------------------
+# Table creation (idempotent)
+# ---------------------------------------------------------------------------
+
+_CREATE_CHANNELS = """
+CREATE TABLE IF NOT EXISTS team_chat_channels (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    org_id UUID NOT NULL,
+    name VARCHAR(120) NOT NULL,
+    description VARCHAR(500) NOT NULL DEFAULT '',
+    channel_type VARCHAR(20) NOT NULL DEFAULT 'general',
+    members TEXT[] NOT NULL DEFAULT '{}',
+    created_by VARCHAR(64) NOT NULL,
+    is_archived BOOLEAN NOT NULL DEFAULT false,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_message_at TIMESTAMPTZ,
+    last_message_preview VARCHAR(80)
+);
+"""
+
+_CREATE_MESSAGES = """
+CREATE TABLE IF NOT EXISTS team_chat_messages (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    channel_id UUID NOT NULL REFERENCES team_chat_channels(id) ON DELETE CASCADE,
+    org_id UUID NOT NULL,
+    sender_id VARCHAR(64) NOT NULL,
+    sender_name VARCHAR(255) NOT NULL,
+    sender_avatar TEXT,
+    content TEXT NOT NULL,
+    message_type VARCHAR(20) NOT NULL DEFAULT 'text',
+    attachments JSONB NOT NULL DEFAULT '[]'::jsonb,
+    reactions JSONB NOT NULL DEFAULT '[]'::jsonb,
+    is_pinned BOOLEAN NOT NULL DEFAULT false,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp(),
+    updated_at TIMESTAMPTZ
+);
+"""
+
+_CREATE_READ_MARKERS = """
+CREATE TABLE IF NOT EXISTS team_chat_read_markers (
+    user_id VARCHAR(64) NOT NULL,
+    channel_id UUID NOT NULL REFERENCES team_chat_channels(id) ON DELETE CASCADE,
+    last_read_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (user_id, channel_id)
+);
+"""
+
+
+register_ddl(
+    "team_chat",
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    _CREATE_CHANNELS,
+    _CREATE_MESSAGES,
+    _CREATE_READ_MARKERS,
+    "CREATE INDEX IF NOT EXISTS idx_team_chat_channels_org ON team_chat_channels(org_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_team_chat_messages_channel_created "
+    "ON team_chat_messages(channel_id, created_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_team_chat_messages_pinned "
+    "ON team_chat_messages(channel_id, created_at) WHERE is_pinned",
+    "CREATE INDEX IF NOT EXISTS idx_team_chat_messages_content_trgm "
+    "ON team_chat_messages USING gin (content gin_trgm_ops)",
+)
+
+
+async def _ensure_table(db: AsyncSession) -> None:
+    """No-op once the schema bootstrap has run (see app.schema_bootstrap)."""
+    await ensure_schema()
+
+
+def _uuid(value: Any) -> Optional[str]:
+    """Normalize an ID from the path; None when it is not a UUID (-> not found)."""
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        return None
+
 
+def _iso(value: Any) -> Optional[str]:
+    return value.isoformat() if isinstance(value, datetime) else value
 
-# In-memory stores keyed by org_id
-_channels_store: Dict[str, List[Dict[str, Any]]] = {}
-_messages_store: Dict[str, List[Dict[str, Any]]] = {}  # keyed by channel_id
-_read_cursors: Dict[str, Dict[str, str]] = {}  # {user_id: {channel_id: last_read_at}}
 
+def _json(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) else value
 
-def _org_key(org_id: uuid.UUID) -> str:
-    return str(org_id)
 
+def _channel_to_dict(row_mapping: Any) -> Dict[str, Any]:
+    d = dict(row_mapping)
+    d["id"] = str(d["id"])
+    d["org_id"] = str(d["org_id"])
+    d["members"] = list(d.get("members") or [])
+    d["created_at"] = _iso(d["created_at"])
+    d["last_message_at"] = _iso(d.get("last_message_at"))
+    return d
 
-def _ch_key(channel_id: str) -> str:
-    return channel_id
+
+def _message_to_dict(row_mapping: Any) -> Dict[str, Any]:
+    d = dict(row_mapping)
+    d.pop("org_id", None)
+    d["id"] = str(d["id"])
+    d["channel_id"] = str(d["channel_id"])
+    d["attachments"] = _json(d.get("attachments")) or []
+    d["reactions"] = _json(d.get("reactions")) or []
+    d["created_at"] = _iso(d["created_at"])
+    d["updated_at"] = _iso(d.get("updated_at"))
+    return d
+
+
+def _encode_cursor(created_at: str, message_id: str) -> str:
+    raw = json.dumps([created_at, message_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, message_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(uuid.UUID(message_id))
+    except (ValueError, TypeError, binascii.Error):
+        raise ValueError("Invalid cursor")
 
 
 # ---------------------------------------------------------------------------
@@ -30,63 +156,102 @@ def _ch_key(channel_id: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-async def list_channels(org_id: uuid.UUID) -> List[Dict[str, Any]]:
+async def list_channels(db: AsyncSession, org_id: uuid.UUID) -> List[Dict[str, Any]]:
     """List all non-archived channels for an org."""
-    key = _org_key(org_id)
-    channels = _channels_store.get(key, [])
-    return [c for c in channels if not c.get("is_archived", False)]
-
-
-async def get_channel(org_id: uuid.UUID, channel_id: str) -> Optional[Dict[str, Any]]:
-    key = _org_key(org_id)
-    for ch in _channels_store.get(key, []):
-        if ch["id"] == channel_id:
-            return ch
-    return None
+    await _ensure_table(db)
+    result = await db.execute(
+        text("""
+            SELECT * FROM team_chat_channels
+            WHERE org_id = :org_id AND NOT is_archived
+            ORDER BY created_at
+        """),
+        {"org_id": str(org_id)},
+    )
+    return [_channel_to_dict(r._mapping) for r in result]
+
+
+async def get_channel(
+    db: AsyncSession, org_id: uuid.UUID, channel_id: str,
+) -> Optional[Dict[str, Any]]:
+    await _ensure_table(db)
+    channel_id = _uuid(channel_id)
+    if channel_id is None:
+        return None
+    result = await db.execute(
+        text("SELECT * FROM team_chat_channels WHERE id = :id AND org_id = :org_id"),
+        {"id": channel_id, "org_id": str(org_id)},
+    )
+    row = result.first()
+    return _channel_to_dict(row._mapping) if row else None
 
 
 async def create_channel(
-    org_id: uuid.UUID, data: Dict[str, Any], created_by: str,
+    db: AsyncSession, org_id: uuid.UUID, data: Dict[str, Any], created_by: str,
 ) -> Dict[str, Any]:
-    key = _org_key(org_id)
-    channel = {
-        "id": str(uuid.uuid4()),
-        "org_id": str(org_id),
-        "created_by": created_by,
-        "is_archived": False,
-        "created_at": datetime.utcnow().isoformat(),
-        "last_message_at": None,
-        "last_message_preview": None,
-        **data,
-    }
+    await _ensure_table(db)
+    members = list(data.get("members") or [])
     # Ensure the creator is in members
-    if created_by not in channel.get("members", []):
-        channel.setdefault("members", []).append(created_by)
-    _channels_store.setdefault(key, []).append(channel)
-    return channel
+    if created_by not in members:
+        members.append(created_by)
+    result = await db.execute(
+        text("""
+            INSERT INTO team_chat_channels
+                (org_id, name, description, channel_type, members, created_by)
+            VALUES (:org_id, :name, :description, :channel_type, :members, :created_by)
+            RETURNING *
+        """),
+        {
+            "org_id": str(org_id),
+            "name": data["name"],
+            "description": data.get("description", ""),
+            "channel_type": data.get("channel_type", "general"),
+            "members": members,
+            "created_by": created_by,
+        },
+    )
+    await db.commit()
+    return _channel_to_dict(result.first()._mapping)
 
 
 async def update_channel(
-    org_id: uuid.UUID, channel_id: str, data: Dict[str, Any],
+    db: AsyncSession, org_id: uuid.UUID, channel_id: str, data: Dict[str, Any],
 ) -> Optional[Dict[str, Any]]:
-    key = _org_key(org_id)
-    for ch in _channels_store.get(key, []):
-        if ch["id"] == channel_id:
-            for k, v in data.items():
-                if v is not None:
-                    ch[k] = v
-            return ch
-    return None
-
-
-async def delete_channel(org_id: uuid.UUID, channel_id: str) -> bool:
-    key = _org_key(org_id)
-    channels = _channels_store.get(key, [])
-    before = len(channels)
-    _channels_store[key] = [c for c in channels if c["id"] != channel_id]
-    # Also remove messages
-    _messages_store.pop(_ch_key(channel_id), None)
-    return len(_channels_store[key]) < before
+    await _ensure_table(db)
+    channel_id = _uuid(channel_id)
+    if channel_id is None:
+        return None
+    sets = []
+    params: Dict[str, Any] = {"id": channel_id, "org_id": str(org_id)}
+    for field in ["name", "description", "channel_type", "members", "is_archived"]:
+        if data.get(field) is not None:
+            sets.append(f"{field} = :{field}")
+            params[field] = data[field]
+    if not sets:
+        return await get_channel(db, org_id, channel_id)
+    result = await db.execute(
+        text(
+            f"UPDATE team_chat_channels SET {', '.join(sets)} "
+            "WHERE id = :id AND org_id = :org_id RETURNING *"
+        ),
+        params,
+    )
+    await db.commit()
+    row = result.first()
+    return _channel_to_dict(row._mapping) if row else None
+
+
+async def delete_channel(db: AsyncSession, org_id: uuid.UUID, channel_id: str) -> bool:
+    """Delete a channel; its messages and read markers cascade."""
+    await _ensure_table(db)
+    channel_id = _uuid(channel_id)
+    if channel_id is None:
+        return False
+    result = await db.execute(
+        text("DELETE FROM team_chat_channels WHERE id = :id AND org_id = :org_id"),
+        {"id": channel_id, "org_id": str(org_id)},
+    )
+    await db.commit()
+    return result.rowcount > 0
 
 
 # ---------------------------------------------------------------------------
@@ -95,97 +260,205 @@ async def delete_channel(org_id: uuid.UUID, channel_id: str) -> bool:
 
 
 async def get_messages(
+    db: AsyncSession,
+    org_id: uuid.UUID,
     channel_id: str,
     before: Optional[str] = None,
+    cursor: Optional[str] = None,
     limit: int = 50,
-) -> List[Dict[str, Any]]:
-    """Get messages for a channel, newest last, with pagination."""
-    ch_key = _ch_key(channel_id)
-    msgs = _messages_store.get(ch_key, [])
-    if before:
-        msgs = [m for m in msgs if m["created_at"] < before]
-    # Return last N messages, sorted oldest first
-    msgs = sorted(msgs, key=lambda m: m["created_at"])
-    return msgs[-limit:]
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Get a page of messages for a channel, oldest first, and the cursor for
+    the page before it (None at the start of the history).
+
+    ``cursor`` (from a previous page) pages by keyset on (created_at, id);
+    ``before`` (ISO timestamp) is still accepted. Raises ValueError for a
+    malformed cursor or timestamp.
+    """
+    await _ensure_table(db)
+    channel_id = _uuid(channel_id)
+    if channel_id is None:
+        return [], None
+    clauses = ["channel_id = :channel_id", "org_id = :org_id"]
+    params: Dict[str, Any] = {"channel_id": channel_id, "org_id": str(org_id), "lim": limit + 1}
+    if cursor:
+        params["after_at"], params["after_id"] = _decode_cursor(cursor)
+        clauses.append("(created_at, id) < (:after_at, CAST(:after_id AS uuid))")
+    elif before:
+        params["before"] = datetime.fromisoformat(before)
+        clauses.append("created_at < :before")
+
+    result = await db.execute(
+        text(f"""
+            SELECT * FROM team_chat_messages
+            WHERE {' AND '.join(clauses)}
+            ORDER BY created_at DESC, id DESC
+            LIMIT :lim
+        """),
+        params,
+    )
+    rows = [_message_to_dict(r._mapping) for r in result]
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more:
+        next_cursor = _encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+    rows.reverse()
+    return rows, next_cursor
 
 
 async def send_message(
+    db: AsyncSession,
     channel_id: str,
     org_id: uuid.UUID,
     sender_id: str,
     sender_name: str,
     sender_avatar: Optional[str],
     data: Dict[str, Any],
-) -> Dict[str, Any]:
-    """Send a message to a channel."""
-    now = datetime.utcnow().isoformat()
-    msg = {
-        "id": str(uuid.uuid4()),
-        "channel_id": channel_id,
-        "sender_id": sender_id,
-        "sender_name": sender_name,
-        "sender_avatar": sender_avatar,
-        "content": data.get("content", ""),
-        "message_type": data.get("message_type", "text"),
-        "attachments": data.get("attachments", []),
-        "reactions": [],
-        "is_pinned": False,
-        "created_at": now,
-        "updated_at": None,
-    }
-    ch_key = _ch_key(channel_id)
-    _messages_store.setdefault(ch_key, []).append(msg)
-
-    # Update channel last_message info
-    org_key = _org_key(org_id)
-    for ch in _channels_store.get(org_key, []):
-        if ch["id"] == channel_id:
-            ch["last_message_at"] = now
-            preview = data.get("content", "")
-            ch["last_message_preview"] = preview[:80] if preview else ""
-            break
-
+) -> Optional[Dict[str, Any]]:
+    """Send a message to a channel; None if the channel does not exist."""
+    await _ensure_table(db)
+    channel_id = _uuid(channel_id)
+    if channel_id is None:
+        return None
+    content = data.get("content", "")
+    # Update channel last_message info; doubles as the existence check
+    channel = await db.execute(
+        text("""
+            UPDATE team_chat_channels
+            SET last_message_at = clock_timestamp(), last_message_preview = :preview
+            WHERE id = :channel_id AND org_id = :org_id
+            RETURNING id
+        """),
+        {"channel_id": channel_id, "org_id": str(org_id), "preview": content[:80]},
+    )
+    if channel.first() is None:
+        return None
+
+    result = await db.execute(
+        text("""
+            INSERT INTO team_chat_messages
+                (channel_id, org_id, sender_id, sender_name, sender_avatar,
+                 content, message_type, attachments)
+            VALUES (:channel_id, :org_id, :sender_id, :sender_name, :sender_avatar,
+                    :content, :message_type, CAST(:attachments AS jsonb))
+            RETURNING *
+        """),
+        {
+            "channel_id": channel_id,
+            "org_id": str(org_id),
+            "sender_id": sender_id,
+            "sender_name": sender_name,
+            "sender_avatar": sender_avatar,
+            "content": content,
+            "message_type": data.get("message_type", "text"),
+            "attachments": json.dumps(data.get("attachments", [])),
+        },
+    )
+    msg = _message_to_dict(result.first()._mapping)
+    await realtime.publish_chat_event(
+        db, event="message.created", org_id=org_id, channel_id=channel_id, message=msg,
+    )
+    await db.commit()
     return msg
 
 
-async def pin_message(channel_id: str, message_id: str, pinned: bool = True) -> Optional[Dict[str, Any]]:
+async def pin_message(
+    db: AsyncSession, org_id: uuid.UUID, channel_id: str, message_id: str, pinned: bool = True,
+) -> Optional[Dict[str, Any]]:
     """Pin or unpin a message."""
-    ch_key = _ch_key(channel_id)
-    for msg in _messages_store.get(ch_key, []):
-        if msg["id"] == message_id:
-            msg["is_pinned"] = pinned
-            msg["updated_at"] = datetime.utcnow().isoformat()
-            return msg
-    return None
+    await _ensure_table(db)
+    channel_id, message_id = _uuid(channel_id), _uuid(message_id)
+    if channel_id is None or message_id is None:
+        return None
+    result = await db.execute(
+        text("""
+            UPDATE team_chat_messages
+            SET is_pinned = :pinned, updated_at = NOW()
+            WHERE id = :id AND channel_id = :channel_id AND org_id = :org_id
+            RETURNING *
+        """),
+        {"pinned": pinned, "id": message_id, "channel_id": channel_id, "org_id": str(org_id)},
+    )
+    row = result.first()
+    if row is None:
+        return None
+    msg = _message_to_dict(row._mapping)
+    await realtime.publish_chat_event(
+        db, event="message.pinned", org_id=org_id, channel_id=channel_id, message=msg,
+    )
+    await db.commit()
+    return msg
 
 
 async def add_reaction(
-    channel_id: str, message_id: str, emoji: str, user_id: str,
+    db: AsyncSession, org_id: uuid.UUID, channel_id: str, message_id: str, emoji: str, user_id: str,
 ) -> Optional[Dict[str, Any]]:
     """Toggle a reaction on a message."""
-    ch_key = _ch_key(channel_id)
-    for msg in _messages_store.get(ch_key, []):
-        if msg["id"] == message_id:
-            # Find existing reaction for this emoji
-            for reaction in msg["reactions"]:
-                if reaction["emoji"] == emoji:
-                    if user_id in reaction["user_ids"]:
-                        reaction["user_ids"].remove(user_id)
-                        if not reaction["user_ids"]:
-                            msg["reactions"].remove(reaction)
-                    else:
-                        reaction["user_ids"].append(user_id)
-                    return msg
-            # New reaction
-            msg["reactions"].append({"emoji": emoji, "user_ids": [user_id]})
-            return msg
-    return None
-
-
-async def get_pinned_messages(channel_id: str) -> List[Dict[str, Any]]:
+    await _ensure_table(db)
+    channel_id, message_id = _uuid(channel_id), _uuid(message_id)
+    if channel_id is None or message_id is None:
+        return None
+    params = {"id": message_id, "channel_id": channel_id, "org_id": str(org_id)}
+    # Row lock so concurrent toggles on the same message don't lose updates
+    result = await db.execute(
+        text("""
+            SELECT reactions FROM team_chat_messages
+            WHERE id = :id AND channel_id = :channel_id AND org_id = :org_id
+            FOR UPDATE
+        """),
+        params,
+    )
+    row = result.first()
+    if row is None:
+        return None
+
+    reactions: List[Dict[str, Any]] = _json(row[0]) or []
+    for reaction in reactions:
+        if reaction["emoji"] == emoji:
+            if user_id in reaction["user_ids"]:
+                reaction["user_ids"].remove(user_id)
+                if not reaction["user_ids"]:
+                    reactions.remove(reaction)
+            else:
+                reaction["user_ids"].append(user_id)
+            break
+    else:
+        # New reaction
+        reactions.append({"emoji": emoji, "user_ids": [user_id]})
+
+    result = await db.execute(
+        text("""
+            UPDATE team_chat_messages SET reactions = CAST(:reactions AS jsonb)
+            WHERE id = :id RETURNING *
+        """),
+        {"id": message_id, "reactions": json.dumps(reactions)},
+    )
+    msg = _message_to_dict(result.first()._mapping)
+    await realtime.publish_chat_event(
+        db, event="reaction.updated", org_id=org_id, channel_id=channel_id, message=msg,
+    )
+    await db.commit()
+    return msg
+
+
+async def get_pinned_messages(
+    db: AsyncSession, org_id: uuid.UUID, channel_id: str,
+) -> List[Dict[str, Any]]:
     """Get all pinned messages for a channel."""
-    ch_key = _ch_key(channel_id)
-    return [m for m in _messages_store.get(ch_key, []) if m.get("is_pinned")]
+    await _ensure_table(db)
+    channel_id = _uuid(channel_id)
+    if channel_id is None:
+        return []
+    result = await db.execute(
+        text("""
+            SELECT * FROM team_chat_messages
+            WHERE channel_id = :channel_id AND org_id = :org_id AND is_pinned
+            ORDER BY created_at
+        """),
+        {"channel_id": channel_id, "org_id": str(org_id)},
+    )
+    return [_message_to_dict(r._mapping) for r in result]
 
 
 # ---------------------------------------------------------------------------
@@ -193,27 +466,51 @@ async def get_pinned_messages(channel_id: str) -> List[Dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
-async def get_unread_counts(user_id: str, org_id: uuid.UUID) -> List[Dict[str, Any]]:
+async def get_unread_counts(
+    db: AsyncSession, user_id: str, org_id: uuid.UUID,
+) -> List[Dict[str, Any]]:
     """Get unread message counts per channel for a user."""
-    org_key = _org_key(org_id)
-    channels = _channels_store.get(org_key, [])
-    cursors = _read_cursors.get(user_id, {})
-    result = []
-    for ch in channels:
-        if ch.get("is_archived"):
-            continue
-        ch_id = ch["id"]
-        last_read = cursors.get(ch_id, "")
-        ch_key = _ch_key(ch_id)
-        msgs = _messages_store.get(ch_key, [])
-        count = sum(1 for m in msgs if m["created_at"] > last_read) if last_read else len(msgs)
-        result.append({"channel_id": ch_id, "count": count})
-    return result
-
-
-async def mark_as_read(user_id: str, channel_id: str) -> None:
+    await _ensure_table(db)
+    # One range count per channel on (channel_id, created_at)
+    result = await db.execute(
+        text("""
+            SELECT c.id AS channel_id,
+                   (SELECT count(*) FROM team_chat_messages m
+                    WHERE m.channel_id = c.id
+                      AND m.created_at > COALESCE(r.last_read_at, '-infinity'::timestamptz)
+                   ) AS count
+            FROM team_chat_channels c
+            LEFT JOIN team_chat_read_markers r
+                   ON r.channel_id = c.id AND r.user_id = :user_id
+            WHERE c.org_id = :org_id AND NOT c.is_archived
+            ORDER BY c.created_at
+        """),
+        {"user_id": user_id, "org_id": str(org_id)},
+    )
+    return [{"channel_id": str(r.channel_id), "count": r.count} for r in result]
+
+
+async def mark_as_read(
+    db: AsyncSession, user_id: str, org_id: uuid.UUID, channel_id: str,
+) -> None:
     """Mark a channel as read for a user."""
-    _read_cursors.setdefault(user_id, {})[channel_id] = datetime.utcnow().isoformat()
+    await _ensure_table(db)
+    channel_id = _uuid(channel_id)
+    if channel_id is None:
+        return
+    await db.execute(
+        text("""
+            INSERT INTO team_chat_read_markers (user_id, channel_id, last_read_at)
+            SELECT :user_id, id, clock_timestamp() FROM team_chat_channels
+            WHERE id = :channel_id AND org_id = :org_id
+            ON CONFLICT (user_id, channel_id)
+            DO UPDATE SET last_read_at = GREATEST(
+                team_chat_read_markers.last_read_at, EXCLUDED.last_read_at
+            )
+        """),
+        {"user_id": user_id, "channel_id": channel_id, "org_id": str(org_id)},
+    )
+    await db.commit()
 
 
 # ---------------------------------------------------------------------------
@@ -222,17 +519,18 @@ async def mark_as_read(user_id: str, channel_id: str) -> None:
 
 
 async def search_messages(
-    org_id: uuid.UUID, query: str, limit: int = 20,
+    db: AsyncSession, org_id: uuid.UUID, query: str, limit: int = 20,
 ) -> List[Dict[str, Any]]:
-    """Search messages across all channels in an org."""
-    org_key = _org_key(org_id)
-    channels = _channels_store.get(org_key, [])
-    q = query.lower()
-    results: List[Dict[str, Any]] = []
-    for ch in channels:
-        ch_key = _ch_key(ch["id"])
-        for msg in _messages_store.get(ch_key, []):
-            if q in msg.get("content", "").lower():
-                results.append(msg)
-    results.sort(key=lambda m: m["created_at"], reverse=True)
-    return results[:limit]
+    """Search messages across all channels in an org (trigram-indexed ILIKE)."""
+    await _ensure_table(db)
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    result = await db.execute(
+        text("""
+            SELECT * FROM team_chat_messages
+            WHERE org_id = :org_id AND content ILIKE :pattern
+            ORDER BY created_at DESC
+            LIMIT :lim
+        """),
+        {"org_id": str(org_id), "pattern": f"%{escaped}%", "lim": limit},
+    )
+    return [_message_to_dict(r._mapping) for r in result]
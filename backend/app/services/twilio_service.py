@@ -6,23 +6,26 @@ Sends SMS messages via the Twilio REST API.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
-
-from twilio.rest import Client
-from twilio.base.exceptions import TwilioRestException
+from typing import TYPE_CHECKING, Any, Dict
 
 from app.config import settings
+from app.metrics import track_provider
+
+if TYPE_CHECKING:
+    from twilio.rest import Client
 
 logger = logging.getLogger(__name__)
 
 
 def _get_client() -> Client:
-    """Create and return a Twilio REST client."""
+    """Create and return a Twilio REST client (the SDK is imported on first use)."""
     if not settings.twilio_account_sid or not settings.twilio_auth_token:
         raise ValueError(
             "Twilio credentials not configured. "
             "Set TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN in your environment."
         )
+    from twilio.rest import Client
+
     return Client(settings.twilio_account_sid, settings.twilio_auth_token)
 
 
@@ -47,14 +50,17 @@ async def send_sms(to_number: str, body: str) -> Dict[str, Any]:
             "Set TWILIO_FROM_NUMBER in your environment."
         )
 
+    from twilio.base.exceptions import TwilioRestException
+
     client = _get_client()
 
     try:
-        message = client.messages.create(
-            body=body,
-            from_=settings.twilio_from_number,
-            to=to_number,
-        )
+        with track_provider("twilio", "send_sms"):
+            message = client.messages.create(
+                body=body,
+                from_=settings.twilio_from_number,
+                to=to_number,
+            )
         logger.info(
             "SMS sent successfully: sid=%s, to=%s, status=%s",
             message.sid,
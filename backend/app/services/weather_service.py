@@ -3,33 +3,48 @@ Camp Connect - Weather Service
 Real weather data via Open-Meteo API (free, no API key required).
 Pulls camp location from the organization's primary Location record.
 Falls back to mock data if location not set or API unavailable.
+
+Caching is two-tier so the weather widget is a cache read:
+
+- a per-process dict in front of
+- the shared ``weather_cache`` table (one row per key), so every worker
+  sees a value fetched by any other.
+
+Conditions and forecasts are keyed by rounded coordinates, so camps at the
+same place share entries. Concurrent misses for the same key in a process
+share one Open-Meteo call (single flight), all calls go through one pooled
+``httpx.AsyncClient``, and the background prefetcher (``start_prefetcher``)
+refreshes entries for orgs with a session in progress before they expire.
+When a refresh fails the last stored value is served rather than mock data.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import time
 import uuid
 import random
 import math
-from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timezone, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.metrics import record_cache, track_provider
+from app.models.event import Event
 from app.models.location import Location
+from app.schema_bootstrap import ensure_schema, register_ddl
 
 logger = logging.getLogger(__name__)
 
 # ─── In-memory alert store (keyed by org_id) ───────────────────────────
 _alerts: Dict[str, List[Dict[str, Any]]] = {}
 
-# ─── Geocode + weather cache (15 min TTL) ──────────────────────────────
-_coord_cache: Dict[str, Dict[str, Any]] = {}   # org_id → {lat, lon, name, fetched_at}
-_weather_cache: Dict[str, Dict[str, Any]] = {}  # org_id → {data, fetched_at}
-_forecast_cache: Dict[str, Dict[str, Any]] = {}
-
 CACHE_TTL = 900  # 15 minutes
 
 
@@ -39,20 +54,163 @@ def _get_org_alerts(org_id: str) -> List[Dict[str, Any]]:
     return _alerts[org_id]
 
 
-# ─── Location lookup ───────────────────────────────────────────────────
+# ─── Shared cache ──────────────────────────────────────────────────────
 
-async def _get_camp_coords(org_id: str, db: AsyncSession) -> Optional[Dict[str, Any]]:
-    """Look up the org's primary location and geocode it. Cached 15 min."""
-    now = datetime.now(timezone.utc).timestamp()
+register_ddl(
+    "weather_cache",
+    """
+    CREATE TABLE IF NOT EXISTS weather_cache (
+        cache_key VARCHAR(120) PRIMARY KEY,
+        data JSONB NOT NULL,
+        fetched_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+    """,
+)
+
+# cache_key → (fetched_at epoch seconds, data)
+_local_cache: Dict[str, Tuple[float, Any]] = {}
+# cache_key → in-flight refresh shared by concurrent callers
+_inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+
+def _coord_key(lat: float, lon: float) -> str:
+    # ~1 km grid: nearby camps share an entry
+    return f"{lat:.2f},{lon:.2f}"
+
+
+async def _shared_get(key: str) -> Optional[Tuple[float, Any]]:
+    from app.database import engine
+
+    if engine is None:
+        return None
+    try:
+        await ensure_schema()
+        async with engine.connect() as conn:
+            row = (await conn.execute(
+                text(
+                    "SELECT data, EXTRACT(EPOCH FROM fetched_at) "
+                    "FROM weather_cache WHERE cache_key = :key"
+                ),
+                {"key": key},
+            )).first()
+    except Exception as e:
+        logger.warning(f"Weather cache read failed for {key}: {e}")
+        return None
+    if row is None:
+        return None
+    return float(row[1]), row[0]
+
+
+async def _shared_put(key: str, fetched_at: float, data: Any) -> None:
+    from app.database import engine
+
+    if engine is None:
+        return
+    try:
+        await ensure_schema()
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO weather_cache (cache_key, data, fetched_at) "
+                    "VALUES (:key, CAST(:data AS JSONB), to_timestamp(:fetched_at)) "
+                    "ON CONFLICT (cache_key) DO UPDATE "
+                    "SET data = EXCLUDED.data, fetched_at = EXCLUDED.fetched_at"
+                ),
+                {"key": key, "data": json.dumps(data), "fetched_at": fetched_at},
+            )
+    except Exception as e:
+        logger.warning(f"Weather cache write failed for {key}: {e}")
+
+
+async def _cache_lookup(key: str, max_age: float) -> Optional[Tuple[float, Any]]:
+    """Newest known entry for ``key``: local first, shared when local is stale."""
+    entry = _local_cache.get(key)
+    if entry and time.time() - entry[0] < max_age:
+        return entry
+    shared = await _shared_get(key)
+    if shared and (entry is None or shared[0] > entry[0]):
+        _local_cache[key] = shared
+        entry = shared
+    return entry
 
-    # Normalize org_id to string for cache lookup
-    org_id_str = str(org_id)
 
-    # Check cache
-    cached = _coord_cache.get(org_id_str)
-    if cached and (now - cached["fetched_at"]) < CACHE_TTL:
-        return cached
+async def _cached(
+    cache: str,
+    key: str,
+    fetch: Callable[[], Awaitable[Any]],
+    *,
+    max_age: float = CACHE_TTL,
+) -> Any:
+    """
+    Return the cached value for ``key`` if younger than ``max_age``,
+    otherwise refresh it through ``fetch`` (single flight per key).
+
+    ``fetch`` returning None means "nothing to cache". If it raises, the
+    stale value is returned when there is one; otherwise the error propagates.
+    """
+    entry = await _cache_lookup(key, max_age)
+    hit = bool(entry and time.time() - entry[0] < max_age)
+    record_cache(cache, hit)
+    if hit:
+        return entry[1]
+
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_refresh(key, fetch, entry))
+        _inflight[key] = future
+        future.add_done_callback(lambda _f: _inflight.pop(key, None))
+    # shield: a cancelled caller must not cancel the refresh others await
+    return await asyncio.shield(future)
+
+
+async def _refresh(
+    key: str,
+    fetch: Callable[[], Awaitable[Any]],
+    stale: Optional[Tuple[float, Any]],
+) -> Any:
+    try:
+        data = await fetch()
+    except Exception as e:
+        if stale is not None:
+            logger.warning(f"Weather refresh failed for {key}, serving stale value: {e}")
+            return stale[1]
+        raise
+    if data is None:
+        return None
+    fetched_at = time.time()
+    _local_cache[key] = (fetched_at, data)
+    await _shared_put(key, fetched_at, data)
+    return data
 
+
+# ─── Pooled HTTP client ────────────────────────────────────────────────
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http() -> httpx.AsyncClient:
+    """Process-wide Open-Meteo client (keep-alive connection pool)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the pooled client (application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# ─── Location lookup ───────────────────────────────────────────────────
+
+async def _geocode_org(org_id: str, db: AsyncSession) -> Optional[Dict[str, Any]]:
+    """Look up the org's primary location and geocode it (uncached)."""
     # Query primary location (prefer is_primary=True, fallback to first)
     try:
         result = await db.execute(
@@ -102,29 +260,40 @@ async def _get_camp_coords(org_id: str, db: AsyncSession) -> Optional[Dict[str,
 
     # Geocode using Open-Meteo geocoding API
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
+        with track_provider("open_meteo", "geocode"):
+            resp = await _http().get(
                 "https://geocoding-api.open-meteo.com/v1/search",
                 params={"name": search_term, "count": 1, "language": "en", "format": "json"},
             )
             resp.raise_for_status()
             data = resp.json()
-            results = data.get("results", [])
-            if not results:
-                logger.warning(f"No geocoding results for: {search_term}")
-                return None
-            lat = results[0]["latitude"]
-            lon = results[0]["longitude"]
-            # Use the geocoded name if we didn't have a good one
-            if not location_name or location_name == location.zip_code:
-                location_name = results[0].get("name", location_name)
+        results = data.get("results", [])
+        if not results:
+            logger.warning(f"No geocoding results for: {search_term}")
+            return None
+        lat = results[0]["latitude"]
+        lon = results[0]["longitude"]
+        # Use the geocoded name if we didn't have a good one
+        if not location_name or location_name == location.zip_code:
+            location_name = results[0].get("name", location_name)
     except Exception as e:
         logger.warning(f"Geocoding failed for org {org_id}: {e}")
         return None
 
-    entry = {"lat": lat, "lon": lon, "name": location_name, "fetched_at": now}
-    _coord_cache[org_id_str] = entry
-    return entry
+    return {"lat": lat, "lon": lon, "name": location_name}
+
+
+async def _get_camp_coords(
+    org_id: str, db: AsyncSession, max_age: float = CACHE_TTL,
+) -> Optional[Dict[str, Any]]:
+    """Coordinates and display name of the org's camp. Cached 15 min."""
+    org_id_str = str(org_id)
+    return await _cached(
+        "weather_coords",
+        f"coords:{org_id_str}",
+        lambda: _geocode_org(org_id_str, db),
+        max_age=max_age,
+    )
 
 
 # ─── WMO weather code → condition string ──────────────────────────────
@@ -151,56 +320,110 @@ _WIND_DIRS = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
 
 # ─── Real weather fetchers ─────────────────────────────────────────────
 
+async def _fetch_conditions(coords: Dict[str, Any]) -> Dict[str, Any]:
+    with track_provider("open_meteo", "current"):
+        resp = await _http().get(
+            "https://api.open-meteo.com/v1/forecast",
+            params={
+                "latitude": coords["lat"],
+                "longitude": coords["lon"],
+                "current": "temperature_2m,relative_humidity_2m,apparent_temperature,weather_code,wind_speed_10m,wind_direction_10m,uv_index",
+                "temperature_unit": "fahrenheit",
+                "wind_speed_unit": "mph",
+                "timezone": "auto",
+            },
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+    current = data.get("current", {})
+    wmo_code = current.get("weather_code", 0)
+    wind_deg = current.get("wind_direction_10m", 0)
+    wind_dir = _WIND_DIRS[int((wind_deg + 22.5) / 45) % 8]
+
+    return {
+        "temperature": round(current.get("temperature_2m", 72), 1),
+        "feels_like": round(current.get("apparent_temperature", 72), 1),
+        "humidity": int(current.get("relative_humidity_2m", 50)),
+        "wind_speed": round(current.get("wind_speed_10m", 5), 1),
+        "wind_direction": wind_dir,
+        "conditions": _WMO_CONDITIONS.get(wmo_code, "sunny"),
+        "uv_index": int(current.get("uv_index", 0)),
+        "precipitation_chance": 0,
+    }
+
+
+async def _fetch_forecast(coords: Dict[str, Any]) -> List[Dict[str, Any]]:
+    with track_provider("open_meteo", "forecast"):
+        resp = await _http().get(
+            "https://api.open-meteo.com/v1/forecast",
+            params={
+                "latitude": coords["lat"],
+                "longitude": coords["lon"],
+                "daily": "temperature_2m_max,temperature_2m_min,weather_code,precipitation_probability_max",
+                "temperature_unit": "fahrenheit",
+                "timezone": "auto",
+                "forecast_days": 7,
+            },
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+    daily = data.get("daily", {})
+    dates = daily.get("time", [])
+    highs = daily.get("temperature_2m_max", [])
+    lows = daily.get("temperature_2m_min", [])
+    codes = daily.get("weather_code", [])
+    precip = daily.get("precipitation_probability_max", [])
+
+    days_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    forecast = []
+    for i in range(len(dates)):
+        d = datetime.strptime(dates[i], "%Y-%m-%d")
+        cond = _WMO_CONDITIONS.get(codes[i] if i < len(codes) else 0, "sunny")
+        forecast.append({
+            "date": dates[i],
+            "day": "Today" if i == 0 else days_names[d.weekday()],
+            "high": round(highs[i], 1) if i < len(highs) else 75,
+            "low": round(lows[i], 1) if i < len(lows) else 60,
+            "conditions": cond,
+            "precipitation_chance": precip[i] if i < len(precip) else 0,
+            "icon": _ICON_MAP.get(cond, "Sun"),
+        })
+    return forecast
+
+
+async def _conditions_for(coords: Dict[str, Any], max_age: float = CACHE_TTL) -> Dict[str, Any]:
+    return await _cached(
+        "weather_current",
+        f"current:{_coord_key(coords['lat'], coords['lon'])}",
+        lambda: _fetch_conditions(coords),
+        max_age=max_age,
+    )
+
+
+async def _forecast_for(coords: Dict[str, Any], max_age: float = CACHE_TTL) -> List[Dict[str, Any]]:
+    return await _cached(
+        "weather_forecast",
+        f"forecast:{_coord_key(coords['lat'], coords['lon'])}",
+        lambda: _fetch_forecast(coords),
+        max_age=max_age,
+    )
+
+
 async def get_current_conditions(org_id: str, db: AsyncSession) -> Dict[str, Any]:
     """Get real current weather conditions from Open-Meteo."""
     coords = await _get_camp_coords(org_id, db)
     if not coords:
         return _mock_conditions("")
 
-    now = datetime.now(timezone.utc).timestamp()
-    cached = _weather_cache.get(org_id)
-    if cached and (now - cached["fetched_at"]) < CACHE_TTL:
-        return cached["data"]
-
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                "https://api.open-meteo.com/v1/forecast",
-                params={
-                    "latitude": coords["lat"],
-                    "longitude": coords["lon"],
-                    "current": "temperature_2m,relative_humidity_2m,apparent_temperature,weather_code,wind_speed_10m,wind_direction_10m,uv_index",
-                    "temperature_unit": "fahrenheit",
-                    "wind_speed_unit": "mph",
-                    "timezone": "auto",
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-        current = data.get("current", {})
-        wmo_code = current.get("weather_code", 0)
-        wind_deg = current.get("wind_direction_10m", 0)
-        wind_dir = _WIND_DIRS[int((wind_deg + 22.5) / 45) % 8]
-
-        result = {
-            "temperature": round(current.get("temperature_2m", 72), 1),
-            "feels_like": round(current.get("apparent_temperature", 72), 1),
-            "humidity": int(current.get("relative_humidity_2m", 50)),
-            "wind_speed": round(current.get("wind_speed_10m", 5), 1),
-            "wind_direction": wind_dir,
-            "conditions": _WMO_CONDITIONS.get(wmo_code, "sunny"),
-            "uv_index": int(current.get("uv_index", 0)),
-            "precipitation_chance": 0,
-            "location_name": coords["name"],
-        }
-
-        _weather_cache[org_id] = {"data": result, "fetched_at": now}
-        return result
-
+        conditions = await _conditions_for(coords)
     except Exception as e:
         logger.warning(f"Open-Meteo current weather failed for org {org_id}: {e}")
         return _mock_conditions(coords["name"])
+    # Entries are shared by coordinate; the display name is per org
+    return {**conditions, "location_name": coords["name"]}
 
 
 async def get_forecast(org_id: str, db: AsyncSession) -> List[Dict[str, Any]]:
@@ -209,57 +432,123 @@ async def get_forecast(org_id: str, db: AsyncSession) -> List[Dict[str, Any]]:
     if not coords:
         return _mock_forecast()
 
-    now = datetime.now(timezone.utc).timestamp()
-    cached = _forecast_cache.get(org_id)
-    if cached and (now - cached["fetched_at"]) < CACHE_TTL:
-        return cached["data"]
-
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                "https://api.open-meteo.com/v1/forecast",
-                params={
-                    "latitude": coords["lat"],
-                    "longitude": coords["lon"],
-                    "daily": "temperature_2m_max,temperature_2m_min,weather_code,precipitation_probability_max",
-                    "temperature_unit": "fahrenheit",
-                    "timezone": "auto",
-                    "forecast_days": 7,
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-        daily = data.get("daily", {})
-        dates = daily.get("time", [])
-        highs = daily.get("temperature_2m_max", [])
-        lows = daily.get("temperature_2m_min", [])
-        codes = daily.get("weather_code", [])
-        precip = daily.get("precipitation_probability_max", [])
-
-        days_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        forecast = []
-        for i in range(len(dates)):
-            d = datetime.strptime(dates[i], "%Y-%m-%d")
-            cond = _WMO_CONDITIONS.get(codes[i] if i < len(codes) else 0, "sunny")
-            forecast.append({
-                "date": dates[i],
-                "day": "Today" if i == 0 else days_names[d.weekday()],
-                "high": round(highs[i], 1) if i < len(highs) else 75,
-                "low": round(lows[i], 1) if i < len(lows) else 60,
-                "conditions": cond,
-                "precipitation_chance": precip[i] if i < len(precip) else 0,
-                "icon": _ICON_MAP.get(cond, "Sun"),
-            })
-
-        _forecast_cache[org_id] = {"data": forecast, "fetched_at": now}
-        return forecast
-
+        return await _forecast_for(coords)
     except Exception as e:
         logger.warning(f"Open-Meteo forecast failed for org {org_id}: {e}")
         return _mock_forecast()
 
 
+# ─── Prefetcher ────────────────────────────────────────────────────────
+# Refreshes conditions and forecasts for orgs with a session in progress
+# shortly before they expire, so the widget never waits on Open-Meteo.
+# One worker per cycle does the work (Postgres advisory lock).
+
+_PREFETCH_LOCK_ID = 0x57454154  # "WEAT"
+_PREFETCH_CONCURRENCY = 5
+
+_prefetch_task: Optional["asyncio.Task[None]"] = None
+
+
+async def _active_org_ids(db: AsyncSession) -> List[str]:
+    """Orgs with a published session running today or starting tomorrow."""
+    today = date.today()
+    result = await db.execute(
+        select(Event.organization_id)
+        .where(
+            Event.is_deleted == False,
+            Event.status.in_(("published", "full")),
+            Event.start_date <= today + timedelta(days=1),
+            Event.end_date >= today,
+        )
+        .distinct()
+    )
+    return [str(org_id) for org_id in result.scalars().all()]
+
+
+async def prefetch_active_orgs() -> Dict[str, int]:
+    """
+    One prefetch pass over coordinates, conditions and forecasts. Entries
+    younger than ``CACHE_TTL - interval`` are left alone, so each is
+    refreshed once per cycle, before it expires.
+    Returns counts of orgs seen and coordinates refreshed.
+    """
+    from app.database import async_session_factory, engine
+
+    if engine is None or async_session_factory is None:
+        return {"orgs": 0, "locations": 0}
+
+    refresh_after = max(CACHE_TTL - settings.weather_prefetch_interval - 60, 0)
+    async with engine.connect() as lock_conn:
+        locked = (await lock_conn.execute(
+            text("SELECT pg_try_advisory_lock(:id)"), {"id": _PREFETCH_LOCK_ID}
+        )).scalar()
+        if not locked:
+            return {"orgs": 0, "locations": 0}
+        try:
+            async with async_session_factory() as db:
+                org_ids = await _active_org_ids(db)
+                coords_by_key: Dict[str, Dict[str, Any]] = {}
+                for org_id in org_ids:
+                    coords = await _get_camp_coords(org_id, db, max_age=refresh_after)
+                    if coords:
+                        coords_by_key[_coord_key(coords["lat"], coords["lon"])] = coords
+
+            semaphore = asyncio.Semaphore(_PREFETCH_CONCURRENCY)
+
+            async def refresh(coords: Dict[str, Any]) -> None:
+                async with semaphore:
+                    try:
+                        await _conditions_for(coords, max_age=refresh_after)
+                        await _forecast_for(coords, max_age=refresh_after)
+                    except Exception as e:
+                        logger.warning(f"Weather prefetch failed for {coords['name']}: {e}")
+
+            await asyncio.gather(*(refresh(c) for c in coords_by_key.values()))
+        finally:
+            await lock_conn.execute(
+                text("SELECT pg_advisory_unlock(:id)"), {"id": _PREFETCH_LOCK_ID}
+            )
+            await lock_conn.commit()
+    return {"orgs": len(org_ids), "locations": len(coords_by_key)}
+
+
+async def _prefetch_loop() -> None:
+    while True:
+        try:
+            report = await prefetch_active_orgs()
+            if report["locations"]:
+                logger.info(
+                    f"Weather prefetch: {report['locations']} locations "
+                    f"for {report['orgs']} orgs"
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Weather prefetch cycle failed: {e}")
+        await asyncio.sleep(settings.weather_prefetch_interval)
+
+
+def start_prefetcher() -> None:
+    """Start the background prefetch loop (application startup)."""
+    global _prefetch_task
+    if _prefetch_task is None or _prefetch_task.done():
+        _prefetch_task = asyncio.create_task(_prefetch_loop())
+
+
+async def stop_prefetcher() -> None:
+    """Cancel the prefetch loop and close the pooled client (shutdown)."""
+    global _prefetch_task
+    if _prefetch_task is not None:
+        _prefetch_task.cancel()
+        try:
+            await _prefetch_task
+        except asyncio.CancelledError:
+            pass
+        _prefetch_task = None
+    await close_client()
+
+
 # ─── Mock fallbacks ────────────────────────────────────────────────────
 
 def _mock_conditions(location_name: str) -> Dict[str, Any]:
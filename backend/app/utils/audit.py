@@ -34,6 +34,9 @@ async def log_audit(
     transaction. This ensures the audit log is atomic with the
     operation it's logging.
 
+    For request-path logging that need not be transactional, prefer
+    ``audit_service.log_action``, which is buffered and batch-inserted.
+
     Args:
         session: Active database session.
         organization_id: Tenant ID.
@@ -0,0 +1,41 @@
+"""
+Camp Connect - List Pagination Helpers
+Shared pieces of the keyset-paginated list endpoints.
+"""
+
+from __future__ import annotations
+
+import json
+
+from sqlalchemy import literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <query>``, executed with bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, query) -> None:
+        self.query = query
+
+
+@compiles(Explain)
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.query, **kw)
+
+
+async def estimate_count(db: AsyncSession, query) -> int:
+    """
+    Planner row estimate for ``query`` (no scan). Parameters are bound, not
+    inlined, so any filter the query itself can run with (JSONB, arrays,
+    IN lists) works here too.
+    """
+    # Wrapped so the result carries no typed columns of ``query``
+    wrapped = select(literal_column("1")).select_from(query.subquery())
+    plan = (await db.execute(Explain(wrapped))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
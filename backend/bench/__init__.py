@@ -0,0 +1,5 @@
+"""
+Camp Connect - Benchmarks
+Standalone performance scripts; run from the backend directory with
+``python -m bench.<name>`` against a DATABASE_URL you can write to.
+"""
@@ -0,0 +1,89 @@
+"""
+Per-request cost of the old ``_ensure_table`` DDL versus the startup
+schema bootstrap.
+
+Both variants run the same representative read (``SELECT ... FROM
+allergy_entries WHERE org_id = ...``) in a fresh session. The "legacy"
+variant first re-executes the service's CREATE TABLE / CREATE INDEX
+statements, as every call used to; the "bootstrap" variant goes through
+``ensure_schema()``, which is a no-op once ``run_bootstrap`` has run.
+
+    python -m bench.ddl_overhead --iterations 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy import text
+
+from app.database import async_session_factory, engine
+from app.schema_bootstrap import ensure_schema, registered, run_bootstrap
+from app.services import allergy_service  # noqa: F401  (registers its DDL)
+
+_READ = text("SELECT count(*) FROM allergy_entries WHERE org_id = :org_id")
+
+
+async def _legacy_request(org_id: str) -> None:
+    async with async_session_factory() as db:
+        for statement in registered()["allergy"]:
+            await db.execute(text(statement))
+        await db.flush()
+        await db.execute(_READ, {"org_id": org_id})
+        await db.commit()
+
+
+async def _bootstrap_request(org_id: str) -> None:
+    async with async_session_factory() as db:
+        await ensure_schema()
+        await db.execute(_READ, {"org_id": org_id})
+        await db.commit()
+
+
+async def _measure(
+    fn: Callable[[str], Awaitable[None]], iterations: int, org_id: str
+) -> Dict[str, float]:
+    samples: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await fn(org_id)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p50_ms": round(samples[len(samples) // 2], 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+    }
+
+
+async def main(iterations: int) -> None:
+    if engine is None or async_session_factory is None:
+        raise SystemExit("DATABASE_URL is not configured.")
+
+    report = await run_bootstrap(engine)
+    print(f"bootstrap: {report}")
+
+    org_id = str(uuid.uuid4())
+    # Warm the pool and plan caches for both paths
+    await _measure(_legacy_request, 10, org_id)
+    await _measure(_bootstrap_request, 10, org_id)
+
+    legacy = await _measure(_legacy_request, iterations, org_id)
+    boot = await _measure(_bootstrap_request, iterations, org_id)
+    saved = legacy["mean_ms"] - boot["mean_ms"]
+    print(f"legacy    ({len(registered()['allergy'])} DDL/request): {legacy}")
+    print(f"bootstrap (0 DDL/request): {boot}")
+    print(f"saved per request: {saved:.3f} ms ({saved / legacy['mean_ms']:.0%})")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
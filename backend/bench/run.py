@@ -0,0 +1,298 @@
+"""
+In-process load benchmark for the hot API paths.
+
+Drives the FastAPI app through ``httpx.ASGITransport`` (no server, no
+network) against the org created by ``bench.seed``, authenticated as its
+Camp Director. Each request is wrapped in ``track_queries()`` so the report
+carries SQL statements per request next to latency.
+
+    python -m bench.run                                   # all scenarios
+    python -m bench.run --scenarios dashboard,nurse_view --requests 500
+    python -m bench.run --save-baseline bench/baseline.json
+    python -m bench.run --baseline bench/baseline.json    # exit 1 on regression
+
+A scenario regresses when its p95 grows by more than ``--tolerance``
+(default 20%) or it issues more queries per request than the baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# The bench measures queries itself; keep the middleware from resetting the
+# per-request stats context underneath it.
+os.environ["SQL_INSTRUMENTATION_ENABLED"] = "false"
+
+import httpx  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from app.database import async_session_factory, engine  # noqa: E402
+from app.middleware.auth import verify_supabase_token  # noqa: E402
+from app.middleware.query_stats import install_query_stats, track_queries  # noqa: E402
+from app.models.camper import Camper  # noqa: E402
+from app.models.event import Event  # noqa: E402
+from app.models.organization import Organization  # noqa: E402
+from app.models.registration import Registration  # noqa: E402
+from bench.seed import BENCH_SLUG, director_sub  # noqa: E402
+
+API = "/api/v1"
+
+
+@dataclass
+class BenchContext:
+    """IDs sampled from the seeded org, shared by all scenarios."""
+
+    organization_id: uuid.UUID
+    events: List[Event]
+    camper_ids: List[uuid.UUID]
+    # (camper_id, event_id) pairs with no registration yet
+    open_pairs: List[Tuple[uuid.UUID, uuid.UUID]] = field(default_factory=list)
+    rng: random.Random = field(default_factory=lambda: random.Random(7))
+
+
+Request = Tuple[str, str, Optional[Dict[str, Any]]]
+Scenario = Callable[[BenchContext], Request]
+
+
+# ---------------------------------------------------------------------------
+# Scenarios: each returns (method, path, json body) for one request
+# ---------------------------------------------------------------------------
+
+def registration_rush(ctx: BenchContext) -> Request:
+    if not ctx.open_pairs:
+        raise RuntimeError("registration_rush ran out of unregistered camper/event pairs")
+    camper_id, event_id = ctx.open_pairs.pop()
+    return "POST", f"{API}/registrations", {"camper_id": str(camper_id), "event_id": str(event_id)}
+
+
+def dashboard(ctx: BenchContext) -> Request:
+    return "GET", f"{API}/dashboard/stats", None
+
+
+def camper_profile(ctx: BenchContext) -> Request:
+    return "GET", f"{API}/campers/{ctx.rng.choice(ctx.camper_ids)}/profile", None
+
+
+def photo_gallery(ctx: BenchContext) -> Request:
+    event = ctx.rng.choice(ctx.events)
+    return "GET", f"{API}/photos?event_id={event.id}", None
+
+
+def nurse_view(ctx: BenchContext) -> Request:
+    event = ctx.rng.choice(ctx.events)
+    day = event.start_date + timedelta(days=ctx.rng.randint(0, 6))
+    return "GET", f"{API}/medicine/nurse-view/{day.isoformat()}?event_id={event.id}", None
+
+
+def report_export(ctx: BenchContext) -> Request:
+    event = ctx.rng.choice(ctx.events)
+    return "GET", f"{API}/reports/camper-roster?event_id={event.id}", None
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "registration_rush": registration_rush,
+    "dashboard": dashboard,
+    "camper_profile": camper_profile,
+    "photo_gallery": photo_gallery,
+    "nurse_view": nurse_view,
+    "report_export": report_export,
+}
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _percentile(sorted_samples: List[float], pct: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    k = max(0, min(len(sorted_samples) - 1, round(pct / 100 * len(sorted_samples)) - 1))
+    return round(sorted_samples[k], 2)
+
+
+async def load_context(slug: str, rush_size: int) -> BenchContext:
+    async with async_session_factory() as db:
+        org_id = (
+            await db.execute(select(Organization.id).where(Organization.slug == slug))
+        ).scalar_one_or_none()
+        if org_id is None:
+            raise SystemExit(f"No organization with slug {slug!r}; run `python -m bench.seed` first.")
+
+        events = list((await db.execute(
+            select(Event).where(Event.organization_id == org_id).order_by(Event.start_date)
+        )).scalars().all())
+        camper_ids = list((await db.execute(
+            select(Camper.id).where(Camper.organization_id == org_id, Camper.deleted_at.is_(None))
+        )).scalars().all())
+
+        rng = random.Random(11)
+        rush_campers = rng.sample(camper_ids, k=min(rush_size, len(camper_ids)))
+        taken = set((await db.execute(
+            select(Registration.camper_id, Registration.event_id)
+            .where(Registration.camper_id.in_(rush_campers))
+        )).tuples().all())
+        open_pairs = []
+        for camper_id in rush_campers:
+            free = [e.id for e in events if (camper_id, e.id) not in taken]
+            if free:
+                open_pairs.append((camper_id, rng.choice(free)))
+
+    return BenchContext(
+        organization_id=org_id,
+        events=events,
+        camper_ids=camper_ids,
+        open_pairs=open_pairs,
+    )
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    ctx: BenchContext,
+    name: str,
+    *,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> Dict[str, Any]:
+    scenario = SCENARIOS[name]
+    latencies: List[float] = []
+    queries: List[int] = []
+    errors: Dict[int, int] = {}
+    remaining = requests
+
+    async def one(record: bool) -> None:
+        method, path, body = scenario(ctx)
+        with track_queries() as stats:
+            started = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            elapsed = (time.perf_counter() - started) * 1000
+        if not record:
+            return
+        latencies.append(elapsed)
+        queries.append(stats.count)
+        if response.status_code >= 400:
+            errors[response.status_code] = errors.get(response.status_code, 0) + 1
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await one(True)
+
+    for _ in range(warmup if name != "registration_rush" else 0):
+        await one(False)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "p50_ms": _percentile(latencies, 50),
+        "p95_ms": _percentile(latencies, 95),
+        "p99_ms": _percentile(latencies, 99),
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else 0.0,
+        "throughput_rps": round(len(latencies) / wall, 1) if wall else 0.0,
+        "errors": errors,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Return human-readable regressions of ``results`` against ``baseline``."""
+    regressions = []
+    for name, current in results["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        if before["p95_ms"] and current["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {current['p95_ms']}ms vs baseline {before['p95_ms']}ms"
+            )
+        if current["queries_per_request"] > before["queries_per_request"]:
+            regressions.append(
+                f"{name}: {current['queries_per_request']} queries/request "
+                f"vs baseline {before['queries_per_request']}"
+            )
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    if engine is None:
+        raise SystemExit("DATABASE_URL is not configured.")
+
+    from app.main import app
+
+    names = list(SCENARIOS) if args.scenarios == "all" else args.scenarios.split(",")
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"Unknown scenario(s): {', '.join(unknown)}")
+
+    ctx = await load_context(args.slug, rush_size=args.requests)
+    sub = director_sub(args.slug)
+    app.dependency_overrides[verify_supabase_token] = lambda: {"sub": sub}
+    install_query_stats(engine)
+
+    results: Dict[str, Any] = {"slug": args.slug, "scenarios": {}}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name in names:
+            results["scenarios"][name] = await run_scenario(
+                client,
+                ctx,
+                name,
+                requests=args.requests,
+                concurrency=args.concurrency,
+                warmup=args.warmup,
+            )
+            r = results["scenarios"][name]
+            print(
+                f"{name:<18} p50 {r['p50_ms']:>8}ms  p95 {r['p95_ms']:>8}ms  "
+                f"p99 {r['p99_ms']:>8}ms  q/req {r['queries_per_request']:>6}  "
+                f"{r['throughput_rps']:>7} rps  errors {r['errors'] or 0}"
+            )
+
+    await engine.dispose()
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(results, fh, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as fh:
+            json.dump(results, fh, indent=2)
+        print(f"Baseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            regressions = compare(results, json.load(fh), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the in-process load benchmark.")
+    parser.add_argument("--scenarios", default="all", help=f"Comma-separated: {', '.join(SCENARIOS)}")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--slug", default=BENCH_SLUG)
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--baseline", help="Compare against this results JSON")
+    parser.add_argument("--save-baseline", help="Write results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95 growth (0.2 = 20%%)")
+    sys.exit(asyncio.run(main(parser.parse_args())))
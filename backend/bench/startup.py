@@ -0,0 +1,166 @@
+"""
+Cold-start import report based on ``python -X importtime``.
+
+Imports the application in a fresh interpreter, parses the importtime
+trace and reports total boot time plus the slowest modules (self and
+cumulative). Third-party packages are rolled up to their top-level name so
+an SDK shows up as one line.
+
+    python -m bench.startup                           # report only
+    python -m bench.startup --runs 5 --top 25
+    python -m bench.startup --save-baseline bench/startup_baseline.json
+    python -m bench.startup --baseline bench/startup_baseline.json --threshold 0.15
+
+With ``--baseline`` the command exits 1 when the median boot time grows by
+more than ``--threshold`` (default 15%) or a module that was not imported at
+startup before now costs more than ``--new-module-ms``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+# "import time: self [us] | cumulative | imported package"
+_HEADER = "import time: self [us]"
+
+
+def parse_importtime(trace: str) -> List[Tuple[str, int, int]]:
+    """Return (module, self_us, cumulative_us) rows from an importtime trace."""
+    rows = []
+    for line in trace.splitlines():
+        if not line.startswith("import time:") or line.startswith(_HEADER):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue
+        rows.append((parts[2].strip(), self_us, cumulative_us))
+    return rows
+
+
+def _rollup(name: str) -> str:
+    """Collapse third-party modules to their top-level package."""
+    return name if name == "app" or name.startswith("app.") else name.split(".")[0]
+
+
+def measure(module: str, env: Dict[str, str]) -> Dict[str, Any]:
+    """Import ``module`` in a fresh interpreter and summarise the trace."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(l for l in proc.stderr.splitlines() if not l.startswith("import time:"))
+        raise SystemExit(f"Importing {module} failed:\n{tail[-2000:]}")
+
+    rows = parse_importtime(proc.stderr)
+    total_us = sum(self_us for _, self_us, _ in rows)
+    packages: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        packages[_rollup(name)] += self_us
+    return {
+        "total_ms": round(total_us / 1000, 1),
+        "modules": len(rows),
+        "packages_ms": {k: round(v / 1000, 2) for k, v in packages.items()},
+        "cumulative_ms": {name: round(cum / 1000, 2) for name, _, cum in rows},
+    }
+
+
+def run(module: str, runs: int) -> Dict[str, Any]:
+    env = dict(os.environ)
+    env.setdefault("PYTHONDONTWRITEBYTECODE", "1")
+    samples = [measure(module, env) for _ in range(runs)]
+    median_of = lambda key: statistics.median(s[key] for s in samples)  # noqa: E731
+
+    packages: Dict[str, float] = {}
+    for name in samples[0]["packages_ms"]:
+        packages[name] = round(statistics.median(s["packages_ms"].get(name, 0.0) for s in samples), 2)
+    return {
+        "module": module,
+        "runs": runs,
+        "total_ms": round(median_of("total_ms"), 1),
+        "modules": int(median_of("modules")),
+        "packages_ms": dict(sorted(packages.items(), key=lambda kv: kv[1], reverse=True)),
+        "cumulative_ms": samples[-1]["cumulative_ms"],
+    }
+
+
+def compare(
+    result: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    threshold: float,
+    new_module_ms: float,
+) -> List[str]:
+    regressions = []
+    if result["total_ms"] > baseline["total_ms"] * (1 + threshold):
+        regressions.append(
+            f"boot {result['total_ms']}ms vs baseline {baseline['total_ms']}ms "
+            f"(+{(result['total_ms'] / baseline['total_ms'] - 1) * 100:.0f}%)"
+        )
+    known = baseline.get("packages_ms", {})
+    for name, ms in result["packages_ms"].items():
+        if name not in known and ms > new_module_ms:
+            regressions.append(f"new at startup: {name} ({ms}ms)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report application import time.")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters; the median is reported")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--baseline", help="Compare against this report JSON")
+    parser.add_argument("--save-baseline", help="Write the report JSON here")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed boot-time growth")
+    parser.add_argument("--new-module-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    result = run(args.module, args.runs)
+    print(f"{args.module}: {result['total_ms']}ms across {result['modules']} modules (median of {args.runs})")
+    print("\nSlowest packages (self time, third-party rolled up):")
+    for name, ms in list(result["packages_ms"].items())[: args.top]:
+        print(f"  {ms:>9.2f}ms  {name}")
+    print("\nSlowest app modules (cumulative):")
+    app_modules = sorted(
+        ((n, ms) for n, ms in result["cumulative_ms"].items() if n.startswith("app.")),
+        key=lambda kv: kv[1],
+        reverse=True,
+    )
+    for name, ms in app_modules[: args.top]:
+        print(f"  {ms:>9.2f}ms  {name}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as fh:
+            json.dump({k: v for k, v in result.items() if k != "cumulative_ms"}, fh, indent=2)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            regressions = compare(
+                result,
+                json.load(fh),
+                threshold=args.threshold,
+                new_module_ms=args.new_module_ms,
+            )
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
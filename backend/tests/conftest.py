@@ -0,0 +1,53 @@
+"""
+Shared test helpers. The suite runs without a database: statements are
+compiled for the asyncpg dialect the app uses, which catches compile
+errors and bad column references before anything reaches Postgres.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, List, Optional
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+
+DIALECT = asyncpg.dialect()
+
+
+class FakeResult:
+    def __init__(self, rows: Optional[List[Any]] = None, scalar: Any = None) -> None:
+        self._rows = rows or []
+        self._scalar = scalar
+
+    def all(self) -> List[Any]:
+        return list(self._rows)
+
+    def one(self) -> Any:
+        assert len(self._rows) == 1
+        return self._rows[0]
+
+    def scalar(self) -> Any:
+        return self._scalar
+
+
+class FakeSession:
+    """
+    Stands in for AsyncSession: compiles every executed statement for
+    asyncpg and answers it with ``respond(sql)`` (a FakeResult).
+    """
+
+    def __init__(self, respond: Callable[[str], FakeResult]) -> None:
+        self.respond = respond
+        self.statements: List[str] = []
+
+    async def execute(self, statement: Any, params: Any = None) -> FakeResult:
+        sql = str(statement.compile(dialect=DIALECT))
+        self.statements.append(sql)
+        return self.respond(sql)
+
+
+@pytest.fixture
+def fake_session() -> Callable[[Callable[[str], FakeResult]], FakeSession]:
+    return FakeSession
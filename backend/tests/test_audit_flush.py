@@ -0,0 +1,63 @@
+import asyncio
+import contextlib
+import uuid
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.exc import DataError
+
+import app.database
+from app.schemas.audit_log import AuditLogCreate
+from app.services import audit_service
+
+
+class _Conn:
+    def __init__(self, written):
+        self.written = written
+
+    async def execute(self, statement, params=None):
+        if params is None:  # partition DDL
+            return None
+        if any(len(row["resource_type"]) > 100 for row in params):
+            raise DataError(str(statement), params, Exception("value too long"))
+        self.written.extend(params)
+
+    @contextlib.asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+
+class _Engine:
+    def __init__(self):
+        self.written = []
+
+    @contextlib.asynccontextmanager
+    async def begin(self):
+        yield _Conn(self.written)
+
+
+def _queue(resource_type):
+    return asyncio.run(audit_service.log_action(
+        org_id=uuid.uuid4(), user_id=uuid.uuid4(), user_name="Test",
+        action="update", resource_type=resource_type,
+    ))
+
+
+def test_bad_event_is_dropped_not_requeued(monkeypatch):
+    engine = _Engine()
+    monkeypatch.setattr(app.database, "engine", engine)
+    audit_service._buffer.clear()
+    _queue("camper")
+    _queue("x" * 200)
+    _queue("event")
+
+    assert asyncio.run(audit_service.flush()) == 2
+    assert [row["resource_type"] for row in engine.written] == ["camper", "event"]
+    assert audit_service._buffer == []
+
+
+def test_create_schema_enforces_column_lengths():
+    with pytest.raises(ValidationError):
+        AuditLogCreate(action="update", resource_type="x" * 101)
+    with pytest.raises(ValidationError):
+        AuditLogCreate(action="update", resource_type="camper", resource_id="x" * 256)
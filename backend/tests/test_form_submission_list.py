@@ -0,0 +1,26 @@
+import asyncio
+import uuid
+
+from app.services import form_submission_service
+from tests.conftest import FakeResult
+
+
+def test_estimate_count_with_answer_filter(fake_session):
+    def respond(sql):
+        if sql.startswith("EXPLAIN (FORMAT JSON)"):
+            return FakeResult(scalar='[{"Plan": {"Plan Rows": 42}}]')
+        return FakeResult()
+
+    db = fake_session(respond)
+    filters = form_submission_service.submission_filters(
+        uuid.uuid4(),
+        answers=form_submission_service.parse_answer_filters(["shirt:M", "age:9"]),
+    )
+    page = asyncio.run(
+        form_submission_service.list_submissions(db, filters=filters, count="estimate")
+    )
+
+    assert page["total"] == 42
+    assert page["total_is_estimate"] is True
+    explain = db.statements[-1]
+    assert "form_submissions.answers @> $" in explain
@@ -0,0 +1,13 @@
+from app.metrics import scrape_authorized
+
+
+def test_metrics_closed_without_token():
+    assert not scrape_authorized("", "")
+    assert not scrape_authorized("Bearer ", "")
+    assert not scrape_authorized("Bearer anything", "")
+
+
+def test_metrics_require_matching_bearer_token():
+    assert not scrape_authorized("", "s3cret")
+    assert not scrape_authorized("Bearer wrong", "s3cret")
+    assert scrape_authorized("Bearer s3cret", "s3cret")
@@ -0,0 +1,62 @@
+import asyncio
+import re
+import uuid
+from types import SimpleNamespace
+
+from app.models.base import Base
+from app.schema_bootstrap import registered
+from app.services import portal_service
+from tests.conftest import FakeResult
+
+_TABLE_ALIAS = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)\s+(\w+)", re.IGNORECASE)
+_COLUMN_REF = re.compile(r"\b(\w+)\.(\w+)\b")
+_DDL_COLUMN = re.compile(r"^\s+(\w+)\s+[A-Z]", re.MULTILINE)
+
+
+def _columns() -> dict:
+    """Columns of every model table, plus raw-SQL tables from registered DDL."""
+    tables = {name: set(t.c.keys()) for name, t in Base.metadata.tables.items()}
+    for statements in registered().values():
+        for ddl in statements:
+            match = re.search(r"CREATE TABLE IF NOT EXISTS (\w+)", ddl)
+            if match:
+                tables.setdefault(match.group(1), set(_DDL_COLUMN.findall(ddl)))
+    return tables
+
+
+def test_dashboard_sql_references_existing_columns():
+    sql = portal_service._DASHBOARD_SQL.text
+    tables = _columns()
+    aliases = {
+        alias: table for table, alias in _TABLE_ALIAS.findall(sql) if table in tables
+    }
+    assert {"campers", "events", "locations", "photos", "announcements"} <= set(
+        aliases.values()
+    )
+
+    missing = [
+        f"{alias}.{column}"
+        for alias, column in _COLUMN_REF.findall(sql)
+        if alias in aliases and column not in tables[aliases[alias]]
+    ]
+    assert missing == []
+
+
+def test_dashboard_returns_frontend_keys(fake_session):
+    row = SimpleNamespace(
+        campers=[{"id": "c1", "photo_url": None, "bunk_name": None}],
+        upcoming_events=[{"id": "e1", "location": "Lakeside"}],
+        recent_photos_count=3,
+        announcements=[],
+    )
+    db = fake_session(lambda sql: FakeResult(rows=[row]))
+
+    dashboard = asyncio.run(
+        portal_service.get_dashboard(db, organization_id=uuid.uuid4(), camper_ids=[])
+    )
+
+    assert "c.reference_photo_url AS photo_url" in db.statements[0]
+    assert "l.name AS location" in db.statements[0]
+    assert dashboard["campers"][0]["photo_url"] is None
+    assert dashboard["upcoming_events"][0]["location"] == "Lakeside"
+    assert dashboard["unread_messages_count"] == 0
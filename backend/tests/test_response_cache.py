@@ -0,0 +1,20 @@
+from datetime import datetime, timezone
+
+from app import response_cache
+
+_KEY = ("/api/v1/camps", "state=CA", None)
+_VERSION = (datetime(2026, 10, 1, tzinfo=timezone.utc), 12)
+
+
+def test_etag_ignores_local_generation():
+    before = response_cache._etag("camp_directory", _KEY, _VERSION)
+    response_cache.invalidate("camp_directory")
+    assert response_cache._etag("camp_directory", _KEY, _VERSION) == before
+    response_cache.clear()
+    assert response_cache._etag("camp_directory", _KEY, _VERSION) == before
+
+
+def test_etag_changes_with_version_and_key():
+    etag = response_cache._etag("camp_directory", _KEY, _VERSION)
+    assert response_cache._etag("camp_directory", _KEY, (_VERSION[0], 13)) != etag
+    assert response_cache._etag("camp_directory", ("/api/v1/camps", "", None), _VERSION) != etag
@@ -8,7 +8,8 @@ import { Camera, Loader2, X } from 'lucide-react'
 import { usePortalPhotos } from '@/hooks/usePortal'
 
 export function PortalPhotos() {
-  const { data: photos = [], isLoading } = usePortalPhotos()
+  const { data, isLoading, hasNextPage, fetchNextPage, isFetchingNextPage } = usePortalPhotos()
+  const photos = data?.pages.flatMap((page) => page.items) ?? []
   const [lightboxPhoto, setLightboxPhoto] = useState<any>(null)
 
   if (isLoading) {
@@ -54,6 +55,19 @@ export function PortalPhotos() {
         ))}
       </div>
 
+      {hasNextPage && (
+        <div className="flex justify-center">
+          <button
+            onClick={() => fetchNextPage()}
+            disabled={isFetchingNextPage}
+            className="inline-flex items-center gap-2 rounded-lg border border-gray-200 bg-white px-4 py-2 text-sm font-medium text-gray-700 shadow-sm hover:bg-gray-50 disabled:opacity-50"
+          >
+            {isFetchingNextPage && <Loader2 className="h-4 w-4 animate-spin" />}
+            Load more
+          </button>
+        </div>
+      )}
+
       {/* Lightbox */}
       {lightboxPhoto && (
         <div
@@ -3,7 +3,7 @@
  * Hooks for the parent-facing portal using /portal/* endpoints.
  */
 
-import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
+import { useInfiniteQuery, useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
 import { api } from '../lib/api'
 
 // ─── Portal Queries ─────────────────────────────────────────
@@ -30,10 +30,20 @@ export function usePortalInvoices() {
   })
 }
 
+export interface PortalPhotoPage {
+  items: any[]
+  next_cursor: string | null
+}
+
 export function usePortalPhotos() {
-  return useQuery<any[]>({
+  return useInfiniteQuery<PortalPhotoPage>({
     queryKey: ['portal', 'photos'],
-    queryFn: () => api.get('/portal/photos').then((r) => r.data),
+    queryFn: ({ pageParam }) =>
+      api
+        .get('/portal/photos', { params: pageParam ? { cursor: pageParam } : undefined })
+        .then((r) => r.data),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
   })
 }
 